@@ -3,13 +3,7 @@ ModelLab EvalHarness
 A comprehensive evaluation framework for ML models with standardized outputs.
 """
 
-from .core.interfaces import BaseEvaluator
-from .metrics import classification, regression
-from .plots import classification as classification_plots
-from .slicing import slicer
-from .failures import selector
-from .ci import bootstrap
-from .stress import corruption
+from .lazy import attach
 
 __version__ = "1.0.0"
 
@@ -24,28 +18,73 @@ __all__ = [
     'corruption'
 ]
 
+# Everything is imported on first access, so that importing the package (or
+# one of its modules) doesn't load sklearn, pandas or matplotlib up front
+__getattr__, __dir__ = attach(__name__, {
+    'BaseEvaluator': 'core.interfaces:BaseEvaluator',
+    'classification': 'metrics.classification',
+    'regression': 'metrics.regression',
+    'classification_plots': 'plots.classification',
+    'slicer': 'slicing.slicer',
+    'selector': 'failures.selector',
+    'bootstrap': 'ci.bootstrap',
+    'corruption': 'stress.corruption',
+    'ci': 'ci',
+    'core': 'core',
+    'evaluators': 'evaluators',
+    'failures': 'failures',
+    'metrics': 'metrics',
+    'plots': 'plots',
+    'slicing': 'slicing',
+    'stress': 'stress'
+})
 
-def evaluate(task_type, predictions, labels, data=None, output_dir=None, config=None):
+
+def evaluate(task_type, predictions, labels, data=None, output_dir=None, config=None, predictions_proba=None,
+             time_budget_s=None):
     """
     Main entry point for evaluation.
 
+    Any input may also be a path to a `.npy` or `.parquet` file, or an iterator
+    of array batches. Such inputs are evaluated in chunked (out-of-core) mode,
+    which is supported for classification.
+
     Args:
         task_type: Type of ML task ('classification', 'regression', 'ranking')
-        predictions: Model predictions (array-like)
-        labels: Ground truth labels (array-like)
+        predictions: Model predictions (array-like, file path, or iterator of batches)
+        labels: Ground truth labels (array-like, file path, or iterator of batches)
         data: Input features (optional, needed for slicing)
         output_dir: Directory to save evaluation artifacts
         config: Configuration dict for evaluation options
+        predictions_proba: Predicted probabilities (optional, classification only)
+        time_budget_s: Wall-clock budget in seconds (optional). Optional work is
+            reduced or skipped to fit, and recorded in the report's degradations.
 
     Returns:
         EvaluationReport object with all metrics, plots, and analysis
     """
     if config is None:
         config = {}
+    if time_budget_s is not None:
+        config = {**config, 'time_budget_s': time_budget_s}
+
+    from .core.sources import is_streaming_input
+    streaming = any(is_streaming_input(x) for x in (predictions, labels, data, predictions_proba))
+
+    if streaming and task_type != 'classification':
+        raise ValueError(f"Chunked evaluation from files or iterators is only supported for classification, not {task_type}.")
 
     if task_type == 'classification':
-        from .evaluators.classification import ClassificationEvaluator
-        evaluator = ClassificationEvaluator(predictions, labels, data, output_dir, config)
+        if streaming:
+            from .evaluators.streaming import StreamingClassificationEvaluator
+            evaluator = StreamingClassificationEvaluator(
+                predictions, labels, data, output_dir, config, predictions_proba=predictions_proba
+            )
+        else:
+            from .evaluators.classification import ClassificationEvaluator
+            evaluator = ClassificationEvaluator(
+                predictions, labels, data, output_dir, config, predictions_proba=predictions_proba
+            )
         return evaluator.evaluate()
     elif task_type == 'regression':
         from .evaluators.regression import RegressionEvaluator
@@ -57,3 +96,24 @@ def evaluate(task_type, predictions, labels, data=None, output_dir=None, config=
         return evaluator.evaluate()
     else:
         raise ValueError(f"Unknown task_type: {task_type}. Must be 'classification', 'regression', or 'ranking'.")
+
+
+def evaluate_many(models, labels, data=None, output_dir=None, config=None):
+    """
+    Evaluate several classification models against the same test set.
+
+    Label- and feature-derived state (label encoding, class counts, feature
+    slices, missingness, bootstrap indices) is computed once and shared.
+
+    Args:
+        models: Dict mapping model names to predictions or (predictions, predictions_proba)
+        labels: Ground truth labels (array-like)
+        data: Input features (optional, needed for slicing)
+        output_dir: Directory to save evaluation artifacts
+        config: Configuration dict shared by all models
+
+    Returns:
+        ModelComparison with one EvaluationReport per model and a comparison table
+    """
+    from .evaluators.multi_model import evaluate_many as _evaluate_many
+    return _evaluate_many(models, labels, data, output_dir, config)
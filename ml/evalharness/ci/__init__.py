@@ -1,5 +1,9 @@
 """Confidence interval computation via bootstrapping."""
 
-from . import bootstrap
+from ..lazy import attach
 
 __all__ = ['bootstrap']
+
+__getattr__, __dir__ = attach(__name__, {
+    'bootstrap': 'bootstrap'
+})
@@ -4,8 +4,13 @@ Bootstrap confidence intervals for metrics.
 Provides robust uncertainty estimates via resampling.
 """
 
+import warnings
 import numpy as np
-from typing import Dict, Tuple, Callable, Any
+from typing import Dict, List, Tuple, Callable, Any, Optional, TYPE_CHECKING
+from ..core.rng import make_rng
+
+if TYPE_CHECKING:
+    from ..core.context import EvalContext
 
 
 def bootstrap_confidence_interval(
@@ -13,7 +18,10 @@ def bootstrap_confidence_interval(
     metric_fn: Callable,
     n_iterations: int = 1000,
     confidence: float = 0.95,
-    seed: int = 42
+    seed: int = 42,
+    indices: Optional[np.ndarray] = None,
+    ctx: Optional['EvalContext'] = None,
+    rng: Optional[np.random.Generator] = None
 ) -> Dict[str, float]:
     """
     Compute bootstrap confidence interval for a metric.
@@ -24,11 +32,18 @@ def bootstrap_confidence_interval(
         n_iterations: Number of bootstrap iterations
         confidence: Confidence level (e.g., 0.95 for 95%)
         seed: Random seed for reproducibility
+        indices: Precomputed resample indices, shape (n_iterations, n_samples)
+            (optional, e.g. shared across models via LabelContext)
+        ctx: Shared evaluation context (optional, supplies cached resample
+            indices for seed; not used when rng is given)
+        rng: Optional random generator to draw resamples from (overrides seed)
 
     Returns:
         Dictionary with mean, lower, upper, confidence, n_bootstraps, seed
     """
-    np.random.seed(seed)
+    if indices is None and ctx is not None and rng is None:
+        indices = ctx.label_context.bootstrap_indices(n_iterations, seed)
+    rng = make_rng(seed, rng)
 
     predictions, labels = data
     n_samples = len(predictions)
@@ -36,11 +51,15 @@ def bootstrap_confidence_interval(
     # Store bootstrap metric values
     bootstrap_metrics = []
 
-    for _ in range(n_iterations):
+    for i in range(n_iterations):
         # Resample with replacement
-        indices = np.random.choice(n_samples, size=n_samples, replace=True)
-        predictions_boot = predictions[indices]
-        labels_boot = labels[indices]
+        if indices is not None:
+            boot_indices = indices[i]
+        else:
+            # Same random stream as drawing the full (n_iterations, n_samples) matrix
+            boot_indices = rng.integers(0, n_samples, size=n_samples)
+        predictions_boot = predictions[boot_indices]
+        labels_boot = labels[boot_indices]
 
         # Compute metric on bootstrap sample
         try:
@@ -73,7 +92,9 @@ def bootstrap_multiple_metrics(
     metric_fns: Dict[str, Callable],
     n_iterations: int = 1000,
     confidence: float = 0.95,
-    seed: int = 42
+    seed: int = 42,
+    ctx: Optional['EvalContext'] = None,
+    rng: Optional[np.random.Generator] = None
 ) -> Dict[str, Dict[str, float]]:
     """
     Compute bootstrap confidence intervals for multiple metrics.
@@ -84,15 +105,151 @@ def bootstrap_multiple_metrics(
         n_iterations: Number of bootstrap iterations
         confidence: Confidence level
         seed: Random seed
+        ctx: Shared evaluation context (optional, resample indices are reused across metrics)
+        rng: Optional random generator (overrides seed); one seed is drawn
+            from it so that all metrics use the same resamples
 
     Returns:
         Dictionary mapping metric names to CI results
     """
+    if rng is not None:
+        seed = int(rng.integers(2 ** 32))
+
     results = {}
 
     for metric_name, metric_fn in metric_fns.items():
         results[metric_name] = bootstrap_confidence_interval(
-            data, metric_fn, n_iterations, confidence, seed
+            data, metric_fn, n_iterations, confidence, seed, ctx=ctx
         )
 
     return results
+
+
+# Upper bound on (iteration, slice member) elements counted per bincount block
+SLICE_BOOTSTRAP_BLOCK_ELEMENTS = 2 ** 23
+
+
+def bootstrap_slice_metrics(
+    slices: Dict[str, np.ndarray],
+    y_true_codes: np.ndarray,
+    y_pred_codes: np.ndarray,
+    n_classes: int,
+    n_iterations: int = 1000,
+    seed: int = 42,
+    average: str = 'weighted',
+    metric_names: Tuple[str, ...] = ('accuracy',),
+    indices: Optional[np.ndarray] = None,
+    rng: Optional[np.random.Generator] = None
+) -> Tuple[List[str], Dict[str, np.ndarray]]:
+    """
+    Bootstrap metrics of every slice at once.
+
+    Each bootstrap iteration resamples the whole dataset once; a row drawn k
+    times gets weight k in every slice it belongs to. Weighted confusion
+    counts for all (iteration, slice, class) cells are accumulated with one
+    np.bincount per block of iterations, and metrics are derived from the
+    counts, so the cost does not grow with one metric computation per slice.
+    Iteration i uses the same resample as bootstrap_confidence_interval with
+    the same seed, so slice and overall intervals are consistent.
+
+    Args:
+        slices: Dictionary (or SliceIndex) of slice names to row indices
+        y_true_codes: Encoded true labels per row (see slicing.engine.encode_labels)
+        y_pred_codes: Encoded predictions per row
+        n_classes: Number of classes
+        n_iterations: Number of bootstrap iterations
+        seed: Random seed
+        average: Averaging strategy for precision, recall and F1
+        metric_names: Metrics to compute (any key of compute_metrics_from_counts)
+        indices: Precomputed resample indices, shape (n_iterations, n_samples) (optional)
+        rng: Optional random generator (overrides seed)
+
+    Returns:
+        Tuple of (slice names, dictionary of metric name to an array of shape
+        (n_iterations, n_slices)); entries are NaN where a resample drew no
+        rows of the slice
+    """
+    from ..metrics.classification import compute_metrics_from_counts
+    from ..slicing.engine import membership_from_slices
+
+    names, slice_ids, rows = membership_from_slices(slices)
+    n_slices = len(names)
+    n_samples = len(y_true_codes)
+    size = n_slices * n_classes
+
+    # Static (slice, class) keys per member; resampling only changes the weights
+    base = slice_ids * n_classes
+    true_keys = base + y_true_codes[rows]
+    pred_keys = base + y_pred_codes[rows]
+    correct = y_true_codes[rows] == y_pred_codes[rows]
+
+    tp = np.zeros((n_iterations, size))
+    pred_count = np.zeros((n_iterations, size))
+    true_count = np.zeros((n_iterations, size))
+
+    rng = make_rng(seed, rng)
+    block = max(1, min(n_iterations, SLICE_BOOTSTRAP_BLOCK_ELEMENTS // max(len(rows), n_samples, 1)))
+
+    for start in range(0, n_iterations, block):
+        stop = min(start + block, n_iterations)
+        n_block = stop - start
+        if indices is not None:
+            block_indices = indices[start:stop]
+        else:
+            # Same random stream as drawing the full (n_iterations, n_samples) matrix
+            block_indices = rng.integers(0, n_samples, size=(n_block, n_samples))
+
+        # Multinomial resample weights: how often each row was drawn per iteration
+        offsets = (np.arange(n_block) * n_samples)[:, None]
+        weights = np.bincount((block_indices + offsets).ravel(), minlength=n_block * n_samples)
+        member_weights = weights.reshape(n_block, n_samples)[:, rows]
+
+        cell_offsets = (np.arange(n_block) * size)[:, None]
+        cells = n_block * size
+        true_count[start:stop] = np.bincount(
+            (true_keys + cell_offsets).ravel(), weights=member_weights.ravel(), minlength=cells
+        ).reshape(n_block, size)
+        pred_count[start:stop] = np.bincount(
+            (pred_keys + cell_offsets).ravel(), weights=member_weights.ravel(), minlength=cells
+        ).reshape(n_block, size)
+        tp[start:stop] = np.bincount(
+            (true_keys[correct] + cell_offsets).ravel(),
+            weights=member_weights[:, correct].ravel(),
+            minlength=cells
+        ).reshape(n_block, size)
+
+    shape = (n_iterations, n_slices, n_classes)
+    tp, pred_count, true_count = tp.reshape(shape), pred_count.reshape(shape), true_count.reshape(shape)
+    metrics = compute_metrics_from_counts(tp, pred_count, true_count, average=average)
+
+    empty = true_count.sum(axis=-1) == 0
+    replicates = {}
+    for name in metric_names:
+        if name not in metrics:
+            raise ValueError(f"Unknown count-based metric: {name}")
+        replicates[name] = np.where(empty, np.nan, metrics[name])
+
+    return names, replicates
+
+
+def percentile_intervals(
+    replicates: np.ndarray,
+    confidence: float = 0.95
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Percentile confidence intervals along the iteration axis.
+
+    Args:
+        replicates: Bootstrap values, shape (n_iterations, ...); NaNs are ignored
+        confidence: Confidence level
+
+    Returns:
+        Tuple of (lower, upper) arrays with the trailing shape of replicates
+    """
+    alpha = 1 - confidence
+    with warnings.catch_warnings():
+        # All-NaN columns (slices never drawn) yield NaN bounds
+        warnings.simplefilter('ignore', RuntimeWarning)
+        lower = np.nanpercentile(replicates, (alpha / 2) * 100, axis=0)
+        upper = np.nanpercentile(replicates, (1 - alpha / 2) * 100, axis=0)
+    return lower, upper
@@ -1,8 +1,6 @@
 """Core evaluation interfaces and utilities."""
 
-from .interfaces import BaseEvaluator
-from .artifact_writer import ArtifactWriter
-from .schemas import EvaluationReport, MetricResult, SliceResult, FailureExample
+from ..lazy import attach
 
 __all__ = [
     'BaseEvaluator',
@@ -10,5 +8,16 @@ __all__ = [
     'EvaluationReport',
     'MetricResult',
     'SliceResult',
-    'FailureExample'
+    'FailureExample',
+    'ModelComparison'
 ]
+
+__getattr__, __dir__ = attach(__name__, {
+    'BaseEvaluator': 'interfaces:BaseEvaluator',
+    'ArtifactWriter': 'artifact_writer:ArtifactWriter',
+    'EvaluationReport': 'schemas:EvaluationReport',
+    'MetricResult': 'schemas:MetricResult',
+    'SliceResult': 'schemas:SliceResult',
+    'FailureExample': 'schemas:FailureExample',
+    'ModelComparison': 'schemas:ModelComparison'
+})
@@ -4,10 +4,14 @@ Writes evaluation outputs in standardized format.
 Standard directory structure:
     artifacts/<run_id>/eval/
     ├── eval_summary.json
+    ├── comparison.json (multi-model runs only)
     ├── metrics.json
     ├── confidence_intervals.json
     ├── slices.json
     ├── failure_examples.json
+    ├── failure_clusters.json
+    ├── failures/ (columnar failure store: one .npy per column,
+    │              features.npy or features.parquet, store.json)
     ├── takeaway.txt (exactly 5 sentences)
     ├── plots/
     │   ├── confusion_matrix.png
@@ -20,7 +24,8 @@ import json
 import os
 from pathlib import Path
 from typing import Any, Dict
-from .schemas import EvaluationReport
+from .schemas import EvaluationReport, ModelComparison
+from ..failures.store import FailureStore
 
 
 class ArtifactWriter:
@@ -59,20 +64,49 @@ class ArtifactWriter:
         if report.slices:
             self._write_json('slices.json', report.slices)
 
-        # Write failure_examples.json
+        # Write the failure store; the JSON files only reference its feature rows
+        failure_examples = [
+            {name: value for name, value in example.items() if name != 'features'}
+            for example in report.failure_examples
+        ]
         if report.failure_examples:
-            self._write_json('failure_examples.json', report.failure_examples)
+            store = report.failure_store
+            if store is None:
+                store = FailureStore.from_examples(report.failure_examples)
+            report.failure_artifacts = store.save(self.eval_dir / 'failures', base_dir=self.eval_dir)
+            self._write_json('failure_examples.json', failure_examples)
+
+        # Write failure_clusters.json
+        if report.failure_clusters:
+            self._write_json('failure_clusters.json', report.failure_clusters)
 
         # Write takeaway.txt (exactly 5 sentences)
         takeaway = report.get_takeaway()
         self._write_text('takeaway.txt', takeaway)
 
         # Write eval_summary.json (complete report)
-        self._write_json('eval_summary.json', report.to_dict())
+        summary = report.to_dict()
+        summary['failure_examples'] = failure_examples
+        self._write_json('eval_summary.json', summary)
 
         # Note: plots are written directly by plot generators
         # Note: repro.md is generated separately by repro pack system
 
+    def write_comparison(self, comparison: ModelComparison):
+        """
+        Write a multi-model comparison table.
+
+        Per-model reports are written by their own evaluators; this writes
+        only comparison.json with one row per model.
+
+        Args:
+            comparison: ModelComparison from evaluate_many
+        """
+        self._write_json('comparison.json', {
+            'comparison_metric': comparison.comparison_metric,
+            'models': comparison.comparison
+        })
+
     def _write_json(self, filename: str, data: Any):
         """Write JSON file."""
         filepath = self.eval_dir / filename
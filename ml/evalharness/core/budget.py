@@ -0,0 +1,168 @@
+"""
+Time-budgeted evaluation planning.
+
+Estimates the cost of each evaluation stage from the input size and, when
+the full evaluation would not fit in the time budget, degrades optional work
+in a fixed order until it does:
+
+1. Skip stress tests
+2. Skip failure clustering
+3. Skip per-class metrics
+4. Subsample rows used for plots
+5. Reduce bootstrap iterations (down to MIN_BOOTSTRAP), then skip CIs
+6. Drop categorical feature slices
+7. Skip plots
+
+Every degradation is recorded so the report states what was cut.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+
+# Rough per-stage cost constants in seconds, measured on a laptop-class CPU
+COST_METRICS_PER_ROW = 3e-6
+COST_PER_CLASS_PER_ROW = 3e-7
+COST_BOOTSTRAP_PER_ROW = 1.5e-7
+COST_BOOTSTRAP_PER_ITERATION = 1e-3
+COST_PER_SLICE = 0.02
+COST_SLICE_PER_ROW = 5e-6
+COST_SLICE_BOOTSTRAP_PER_ROW = 1e-7
+COST_PER_PLOT = 0.8
+COST_PLOT_PER_ROW = 2e-6
+COST_STRESS_TESTS = 1.0
+COST_CLUSTER_PER_ROW = 1e-6
+COST_LABEL_ERRORS_PER_ELEMENT = 1e-8
+COST_STREAMING_PER_ROW = 5e-7
+COST_STREAMING_BOOTSTRAP_PER_ROW = 2e-8
+
+MIN_BOOTSTRAP = 100
+# Class count assumed when the inputs do not reveal it before reading
+DEFAULT_N_CLASSES = 2
+PLOT_MAX_SAMPLES = 50_000
+
+
+def estimate_stage_costs(profile: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Estimate the run time of each stage.
+
+    Args:
+        profile: Input profile (n_samples, n_classes, has_proba, streaming, and
+            n_slices / n_feature_slices: number of confidence+missingness and
+            categorical feature slices); n_classes is None when unknown
+        config: Evaluation config
+
+    Returns:
+        Dictionary of stage names to estimated seconds
+    """
+    n = profile['n_samples']
+    n_classes = profile.get('n_classes') or DEFAULT_N_CLASSES
+    n_ci_metrics = len(config.get('ci_metrics', ['accuracy']))
+    n_bootstrap = config.get('n_bootstrap', 1000) if config.get('compute_cis', True) else 0
+    plot_rows = min(n, config.get('plot_max_samples', n))
+    n_plots = 5 if profile.get('has_proba') else 1
+    # Plots render concurrently with plot_workers; plot data is written without rendering
+    plot_rounds = -(-n_plots // max(1, min(config.get('plot_workers') or 1, n_plots)))
+    if config.get('plot_format', 'png') == 'data':
+        plot_rounds = 0
+    n_slices = profile.get('n_slices', 0)
+    if config.get('categorical_features') or config.get('numeric_features'):
+        n_slices += profile.get('n_feature_slices', 0)
+
+    if profile.get('streaming'):
+        # Everything is accumulated in one pass, charged to the metrics stage
+        costs = {'metrics': n * (COST_STREAMING_PER_ROW + COST_STREAMING_BOOTSTRAP_PER_ROW * n_bootstrap * n_classes)}
+        costs['plots'] = 2 * COST_PER_PLOT if config.get('generate_plots', True) and plot_rounds else 0.0
+        return costs
+
+    costs = {
+        'metrics': COST_METRICS_PER_ROW * n,
+        'confidence_intervals': n_bootstrap * n_ci_metrics * (COST_BOOTSTRAP_PER_ITERATION + COST_BOOTSTRAP_PER_ROW * n),
+        'slices': COST_PER_SLICE * n_slices + COST_SLICE_PER_ROW * n,
+        'failures': 1e-7 * n,
+        'plots': (plot_rounds * COST_PER_PLOT + COST_PLOT_PER_ROW * plot_rows) if config.get('generate_plots', True) else 0.0,
+        'stress_tests': COST_STRESS_TESTS if config.get('run_stress_tests', False) else 0.0,
+        'failure_clusters': COST_CLUSTER_PER_ROW * n if config.get('cluster_failures', False) else 0.0
+    }
+    if config.get('compute_per_class', False):
+        costs['metrics'] += COST_PER_CLASS_PER_ROW * n * n_classes
+    if config.get('detect_label_errors', False):
+        costs['failures'] += COST_LABEL_ERRORS_PER_ELEMENT * n * n_classes
+    if config.get('slice_cis', False):
+        costs['slices'] += COST_SLICE_BOOTSTRAP_PER_ROW * n_bootstrap * n
+
+    return costs
+
+
+def plan_evaluation(
+    profile: Dict[str, Any],
+    config: Dict[str, Any],
+    time_budget_s: float
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Degrade an evaluation config until its estimated cost fits a time budget.
+
+    Args:
+        profile: Input profile (see estimate_stage_costs)
+        config: Requested evaluation config (not modified)
+        time_budget_s: Time budget in seconds
+
+    Returns:
+        Tuple of (planned config, list of degradation records)
+    """
+    planned = dict(config)
+    degradations: List[Dict[str, Any]] = []
+
+    if profile.get('n_samples') is None:
+        degradations.append({
+            'stage': 'all',
+            'action': 'not_planned',
+            'reason': 'input size unknown before reading; only the runtime deadline applies'
+        })
+        return planned, degradations
+
+    def total():
+        return sum(estimate_stage_costs(profile, planned).values())
+
+    def degrade(stage, key, value, action):
+        degradations.append({
+            'stage': stage,
+            'action': action,
+            'config_key': key,
+            'from': planned.get(key),
+            'to': value,
+            'reason': f'estimated cost {total():.1f}s exceeds time budget {time_budget_s:.1f}s'
+        })
+        planned[key] = value
+
+    if total() > time_budget_s and planned.get('run_stress_tests', False):
+        degrade('stress_tests', 'run_stress_tests', False, 'skipped')
+
+    if total() > time_budget_s and planned.get('cluster_failures', False):
+        degrade('failure_clusters', 'cluster_failures', False, 'skipped')
+
+    if total() > time_budget_s and planned.get('compute_per_class', False):
+        degrade('metrics', 'compute_per_class', False, 'skipped_per_class_metrics')
+
+    if total() > time_budget_s and profile['n_samples'] > planned.get('plot_max_samples', PLOT_MAX_SAMPLES):
+        degrade('plots', 'plot_max_samples', PLOT_MAX_SAMPLES, 'subsampled')
+
+    if total() > time_budget_s and planned.get('compute_cis', True):
+        overshoot = total() - time_budget_s
+        without_cis = sum(estimate_stage_costs(profile, {**planned, 'compute_cis': False}).values())
+        ci_cost = total() - without_cis
+        if ci_cost > 0:
+            per_iteration = ci_cost / planned.get('n_bootstrap', 1000)
+            affordable = int((ci_cost - overshoot) / per_iteration)
+            if affordable >= MIN_BOOTSTRAP:
+                degrade('confidence_intervals', 'n_bootstrap', affordable, 'reduced_iterations')
+            else:
+                degrade('confidence_intervals', 'compute_cis', False, 'skipped')
+
+    for key in ('categorical_features', 'numeric_features'):
+        if total() > time_budget_s and planned.get(key):
+            degrade('slices', key, None, 'skipped_feature_slices')
+
+    if total() > time_budget_s and planned.get('generate_plots', True):
+        degrade('plots', 'generate_plots', False, 'skipped')
+
+    return planned, degradations
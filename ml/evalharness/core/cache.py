@@ -0,0 +1,172 @@
+"""
+On-disk cache for evaluation stage outputs.
+
+Stage outputs are keyed by a content hash of the evaluation inputs plus the
+config keys the stage depends on, so re-running an evaluation after changing
+unrelated config only recomputes the affected stages.
+
+Cache layout:
+    <cache_dir>/
+    ├── <stage_key>.pkl
+    └── ...
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_MAX_BYTES = 1024 ** 3
+
+
+def hash_array(array: Optional[np.ndarray]) -> str:
+    """
+    Compute a content hash of an array.
+
+    Args:
+        array: Array to hash (None hashes to a fixed value)
+
+    Returns:
+        Hex digest covering dtype, shape and contents
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if array is None:
+        digest.update(b'none')
+        return digest.hexdigest()
+
+    if isinstance(array, pd.DataFrame):
+        # Hash column by column (no object-array conversion)
+        digest.update(f"frame|{array.shape}|{list(array.columns)}|{list(array.dtypes.astype(str))}".encode())
+        digest.update(memoryview(pd.util.hash_pandas_object(array, index=False).to_numpy()).cast('B'))
+        return digest.hexdigest()
+
+    array = np.asarray(array)
+    digest.update(f"{array.dtype.str}|{array.shape}".encode())
+    if array.dtype.hasobject:
+        digest.update(pickle.dumps(array.tolist(), protocol=4))
+    else:
+        digest.update(memoryview(np.ascontiguousarray(array)).cast('B'))
+    return digest.hexdigest()
+
+
+def _config_value(value: Any) -> str:
+    """Serialize a non-JSON config value for a cache key (arrays by content)."""
+    if isinstance(value, (np.ndarray, pd.DataFrame)):
+        return hash_array(value)
+    return str(value)
+
+
+def make_stage_key(stage: str, input_hash: str, config: Dict[str, Any], config_keys: Iterable[str]) -> str:
+    """
+    Build the cache key for one stage.
+
+    Args:
+        stage: Stage name (e.g. 'metrics', 'slices')
+        input_hash: Content hash of the evaluation inputs
+        config: Evaluation config
+        config_keys: Config keys the stage output depends on
+
+    Returns:
+        Hex cache key
+    """
+    relevant = {key: config.get(key) for key in sorted(set(config_keys))}
+    payload = json.dumps([stage, input_hash, relevant], sort_keys=True, default=_config_value)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class EvalCache:
+    """
+    Size-bounded on-disk cache with least-recently-used eviction.
+
+    Entries are pickled to one file each; reads refresh the file's
+    modification time, which is used as the recency order for eviction.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_bytes: Maximum total size of all entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, key: str) -> Any:
+        """
+        Look up an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key: str, value: Any):
+        """
+        Store an entry, then evict old entries if the cache is over its size bound.
+
+        Args:
+            key: Cache key
+            value: Picklable value
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._evict()
+
+    def _evict(self):
+        """Remove least recently used entries until the total size fits."""
+        entries = []
+        for path in self.cache_dir.glob('*.pkl'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove all entries."""
+        for path in self.cache_dir.glob('*.pkl'):
+            path.unlink()
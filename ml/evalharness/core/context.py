@@ -0,0 +1,326 @@
+"""
+Shared precomputation for evaluation stages.
+
+LabelContext holds everything derived only from the labels and input
+features: label encoding, class counts, feature-based slices, missingness
+and bootstrap resample indices. It does not depend on model outputs, so one
+context can be shared by every model evaluated against the same test set.
+
+EvalContext adds the arrays derived from one model's outputs (confidences,
+correctness mask, confidence sort order, ...) so that metrics, slicing,
+failure selection, plots and CIs compute each of them once per evaluation.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from ..slicing.index import SliceIndex
+
+
+# Largest bootstrap index matrix (n_iterations * n_samples) kept in memory
+MAX_BOOTSTRAP_INDEX_ELEMENTS = 50_000_000
+
+# Probability elements processed at once when computing margins and entropies
+UNCERTAINTY_CHUNK_ELEMENTS = 2 ** 22
+
+
+class LabelContext:
+    """
+    Lazily computed, cached label- and feature-derived state.
+
+    Every property is computed on first access and reused afterwards.
+    """
+
+    def __init__(self, labels: np.ndarray, data: Optional[np.ndarray] = None):
+        """
+        Initialize label context.
+
+        Args:
+            labels: Ground truth labels
+            data: Input features (optional, for slicing; array or DataFrame)
+        """
+        self.labels = np.asarray(labels)
+        self.data = data
+        self._cache: Dict[Any, Any] = {}
+
+    def _cached(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    @property
+    def n_samples(self) -> int:
+        return len(self.labels)
+
+    @property
+    def classes(self) -> np.ndarray:
+        """Sorted unique labels."""
+        return self._encoding[0]
+
+    @property
+    def labels_encoded(self) -> np.ndarray:
+        """Labels as indices into `classes`."""
+        return self._encoding[1]
+
+    @property
+    def class_counts(self) -> np.ndarray:
+        """Number of samples per class, aligned with `classes`."""
+        return self._encoding[2]
+
+    @property
+    def _encoding(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return self._cached('encoding', lambda: np.unique(self.labels, return_inverse=True, return_counts=True))
+
+    @property
+    def rows_with_missing(self) -> Optional[np.ndarray]:
+        """Boolean mask of rows with at least one missing feature value (None without data)."""
+        def compute():
+            if self.data is None:
+                return None
+            from ..slicing.missingness import pack_missing
+            return pack_missing(self.data).any(axis=1)
+
+        return self._cached('rows_with_missing', compute)
+
+    def data_slices(
+        self,
+        categorical_features: Optional[List[int]] = None,
+        feature_names: Optional[List[str]] = None,
+        numeric_features: Optional[List[int]] = None,
+        missing_patterns: int = 0
+    ) -> 'SliceIndex':
+        """
+        Get slices that depend only on the input features (missingness, feature values and ranges).
+
+        Args:
+            categorical_features: List of indices of categorical features
+            feature_names: Optional list of feature names
+            numeric_features: List of indices of numeric features (quantile buckets)
+            missing_patterns: Number of most frequent missingness patterns to slice by
+
+        Returns:
+            SliceIndex of slice names to indices
+        """
+        from ..slicing import slicer
+        from ..slicing.index import SliceIndex
+
+        def compute():
+            return SliceIndex.from_slices(slicer.create_all_slices(
+                data=self.data,
+                predictions_proba=None,
+                categorical_features=categorical_features,
+                feature_names=feature_names,
+                numeric_features=numeric_features,
+                missing_patterns=missing_patterns
+            ), self.n_samples)
+
+        key = (
+            'data_slices',
+            tuple(categorical_features or ()),
+            tuple(feature_names or ()),
+            tuple(numeric_features or ()),
+            missing_patterns
+        )
+        return self._cached(key, compute)
+
+    def bootstrap_indices(self, n_iterations: int, seed: int = 42) -> Optional[np.ndarray]:
+        """
+        Get bootstrap resample indices, shape (n_iterations, n_samples).
+
+        Produces the same resamples as bootstrap_confidence_interval with the
+        same seed. Returns None when the matrix would exceed
+        MAX_BOOTSTRAP_INDEX_ELEMENTS; callers then resample on the fly.
+
+        Args:
+            n_iterations: Number of bootstrap iterations
+            seed: Random seed
+
+        Returns:
+            Integer index matrix, or None if too large to keep
+        """
+        if n_iterations * self.n_samples > MAX_BOOTSTRAP_INDEX_ELEMENTS:
+            return None
+
+        def compute():
+            indices = np.random.default_rng(seed).integers(0, self.n_samples, size=(n_iterations, self.n_samples))
+            return indices.astype(np.int32 if self.n_samples < 2 ** 31 else np.int64)
+
+        return self._cached(('bootstrap_indices', n_iterations, seed), compute)
+
+    def input_hash(self, name: str, array: Optional[np.ndarray]) -> str:
+        """
+        Get a content hash of a shared input (labels or data), computed once.
+
+        Args:
+            name: Input name
+            array: The input array
+
+        Returns:
+            Hex digest
+        """
+        from .cache import hash_array
+        return self._cached(('hash', name), lambda: hash_array(array))
+
+
+def uncertainty(proba: np.ndarray, chunk_elements: int = UNCERTAINTY_CHUNK_ELEMENTS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute per-row margins and normalized entropies of predicted probabilities.
+
+    Args:
+        proba: Predicted probabilities, shape (n_samples, n_classes), or
+            (n_samples,) for binary tasks
+        chunk_elements: Probability elements processed per chunk
+
+    Returns:
+        Tuple of (top-1 minus top-2 probability, entropy / log(n_classes))
+    """
+    from scipy.special import entr
+
+    proba = np.asarray(proba)
+    if proba.ndim == 1:
+        p = proba.astype(float)
+        return np.abs(2.0 * p - 1.0), (entr(p) + entr(1.0 - p)) / np.log(2)
+
+    n, n_classes = proba.shape
+    margins, entropies = np.empty(n), np.empty(n)
+    if n_classes < 2:
+        margins[:], entropies[:] = 1.0, 0.0
+        return margins, entropies
+
+    step = max(1, chunk_elements // n_classes)
+    for start in range(0, n, step):
+        chunk = proba[start:start + step]
+        top_two = np.partition(chunk, n_classes - 2, axis=1)[:, -2:]
+        margins[start:start + len(chunk)] = top_two[:, 1] - top_two[:, 0]
+        entropies[start:start + len(chunk)] = entr(chunk).sum(axis=1) / np.log(n_classes)
+    return margins, entropies
+
+
+class EvalContext:
+    """
+    Lazily computed, cached arrays derived from one model's outputs.
+
+    Functions that accept an optional `ctx` read these arrays instead of
+    recomputing them; the arrays are identical to what the functions would
+    compute themselves.
+    """
+
+    def __init__(
+        self,
+        labels: np.ndarray,
+        predictions: np.ndarray,
+        predictions_proba: Optional[np.ndarray] = None,
+        label_context: Optional[LabelContext] = None
+    ):
+        """
+        Initialize evaluation context.
+
+        Args:
+            labels: Ground truth labels
+            predictions: Predicted labels
+            predictions_proba: Predicted probabilities (optional)
+            label_context: Shared label/feature precomputation (optional)
+        """
+        self.labels = np.asarray(labels)
+        self.predictions = np.asarray(predictions)
+        self.predictions_proba = predictions_proba
+        self.label_context = label_context if label_context is not None else LabelContext(self.labels)
+        self._cache: Dict[Any, Any] = {}
+
+    def _cached(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    @property
+    def n_samples(self) -> int:
+        return len(self.labels)
+
+    @property
+    def classes(self) -> np.ndarray:
+        """Sorted unique labels."""
+        return self.label_context.classes
+
+    @property
+    def correct(self) -> np.ndarray:
+        """Boolean mask of rows where the predicted label equals the true label."""
+        return self._cached('correct', lambda: self.predictions == self.labels)
+
+    @property
+    def confidences(self) -> Optional[np.ndarray]:
+        """Max class probability per row (1-D probabilities are used as is)."""
+        def compute():
+            proba = self.predictions_proba
+            if proba is None:
+                return None
+            return proba if proba.ndim == 1 else np.max(proba, axis=1)
+
+        return self._cached('confidences', compute)
+
+    @property
+    def margins(self) -> Optional[np.ndarray]:
+        """Difference between the two largest class probabilities per row."""
+        return self._uncertainty('margins')
+
+    @property
+    def entropies(self) -> Optional[np.ndarray]:
+        """Entropy of the class probabilities per row, normalized to [0, 1]."""
+        return self._uncertainty('entropies')
+
+    def _uncertainty(self, key: str) -> Optional[np.ndarray]:
+        """Compute margins and entropies together in one chunked pass."""
+        if key not in self._cache:
+            values = uncertainty(self.predictions_proba) if self.predictions_proba is not None else (None, None)
+            self._cache['margins'], self._cache['entropies'] = values
+        return self._cache[key]
+
+    @property
+    def proba_predictions(self) -> Optional[np.ndarray]:
+        """Labels implied by the probabilities (argmax, or > 0.5 for 1-D)."""
+        def compute():
+            proba = self.predictions_proba
+            if proba is None:
+                return None
+            return (proba > 0.5).astype(int) if proba.ndim == 1 else np.argmax(proba, axis=1)
+
+        return self._cached('proba_predictions', compute)
+
+    @property
+    def label_codes(self) -> Tuple[np.ndarray, np.ndarray, int]:
+        """True and predicted labels encoded into one class index space (see slicing.engine)."""
+        def compute():
+            from ..slicing.engine import encode_labels
+            return encode_labels(self.labels, self.predictions)
+
+        return self._cached('label_codes', compute)
+
+    @property
+    def calibration(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """(confidences, predictions) used for calibration metrics."""
+        def compute():
+            if self.predictions_proba is None:
+                return None
+            from ..metrics.classification import calibration_confidences
+            return calibration_confidences(self.predictions_proba)
+
+        return self._cached('calibration', compute)
+
+    def take(self, rows: np.ndarray) -> 'EvalContext':
+        """
+        Get a context for a subset of rows, reusing already computed per-row arrays.
+
+        Args:
+            rows: Row indices
+
+        Returns:
+            EvalContext over the selected rows
+        """
+        proba = self.predictions_proba[rows] if self.predictions_proba is not None else None
+        subset = EvalContext(self.labels[rows], self.predictions[rows], proba)
+        for key in ('correct', 'confidences', 'proba_predictions', 'margins', 'entropies'):
+            if self._cache.get(key) is not None:
+                subset._cache[key] = self._cache[key][rows]
+        if self._cache.get('calibration') is not None:
+            subset._cache['calibration'] = tuple(values[rows] for values in self._cache['calibration'])
+        return subset
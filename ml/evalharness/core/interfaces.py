@@ -2,9 +2,14 @@
 Base interfaces for evaluation framework.
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
 import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from .context import EvalContext, LabelContext
 
 
 class BaseEvaluator(ABC):
@@ -14,13 +19,29 @@ class BaseEvaluator(ABC):
     All task-specific evaluators (Classification, Regression, Ranking) inherit from this.
     """
 
+    # Config keys each stage's output depends on (used as stage cache keys).
+    # Stages that consume another stage's output also list that stage's keys.
+    STAGE_CONFIG_KEYS: Dict[str, List[str]] = {
+        'metrics': [],
+        'confidence_intervals': ['compute_cis', 'ci_metrics', 'n_bootstrap', 'confidence_level', 'seed'],
+        'slices': [],
+        'failures': [],
+        'failure_clusters': [],
+        'plots': [],
+        'stress_tests': ['run_stress_tests', 'seed']
+    }
+
+    # Evaluator attributes set as a side effect of a stage, restored on cache hits
+    STAGE_STATE: Dict[str, List[str]] = {}
+
     def __init__(
         self,
         predictions: np.ndarray,
         labels: np.ndarray,
-        data: Optional[np.ndarray] = None,
+        data: Optional[Union[np.ndarray, pd.DataFrame]] = None,
         output_dir: Optional[str] = None,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        label_context: Optional['LabelContext'] = None
     ):
         """
         Initialize evaluator.
@@ -28,15 +49,22 @@ class BaseEvaluator(ABC):
         Args:
             predictions: Model predictions
             labels: Ground truth labels
-            data: Input features (optional, for slicing)
+            data: Input features (optional, for slicing); an array, or a DataFrame
+                whose columns are addressed by name in the feature config keys
             output_dir: Directory to save evaluation artifacts
             config: Configuration options
+            label_context: Shared label/feature precomputation (optional, e.g. from evaluate_many)
         """
         self.predictions = np.array(predictions)
         self.labels = np.array(labels)
-        self.data = np.array(data) if data is not None else None
+        # Not copied: data can be large and is shared between evaluators in evaluate_many.
+        # DataFrames are kept as is, so mixed-type columns are sliced by name
+        # without an object-array conversion
+        self.data = data if data is None or isinstance(data, pd.DataFrame) else np.asarray(data)
         self.output_dir = output_dir
         self.config = config or {}
+        self._label_context = label_context
+        self._eval_context = None
 
         # Validate inputs
         self._validate_inputs()
@@ -45,8 +73,16 @@ class BaseEvaluator(ABC):
         self.metrics = {}
         self.slices = []
         self.failure_examples = []
+        self.failure_store = None
+        self.failure_codes = None
+        self.failure_category_counts = {}
+        self.failure_clusters = []
         self.plots = []
 
+        # Stage name -> 'hit' or 'miss' when a stage cache is configured
+        self.cache_status = {}
+        self._input_hash = None
+
     def _validate_inputs(self):
         """Validate input arrays have consistent shapes."""
         if len(self.predictions) != len(self.labels):
@@ -60,6 +96,32 @@ class BaseEvaluator(ABC):
                     f"Data ({len(self.data)}) and labels ({len(self.labels)}) must have same length"
                 )
 
+        if self._label_context is not None and self._label_context.n_samples != len(self.labels):
+            raise ValueError(
+                f"Label context ({self._label_context.n_samples}) and labels ({len(self.labels)}) must have same length"
+            )
+
+    @property
+    def label_context(self) -> 'LabelContext':
+        """Label- and feature-derived state, created on first use if not shared."""
+        if self._label_context is None:
+            from .context import LabelContext
+            self._label_context = LabelContext(self.labels, self.data)
+        return self._label_context
+
+    @property
+    def eval_context(self) -> 'EvalContext':
+        """Arrays derived from this model's outputs, shared by all stages."""
+        if self._eval_context is None:
+            from .context import EvalContext
+            self._eval_context = EvalContext(
+                self.labels,
+                self.predictions,
+                getattr(self, 'predictions_proba', None),
+                self.label_context
+            )
+        return self._eval_context
+
     @abstractmethod
     def compute_metrics(self) -> Dict[str, float]:
         """
@@ -100,6 +162,17 @@ class BaseEvaluator(ABC):
         """
         pass
 
+    def cluster_failures(self) -> List[Dict[str, Any]]:
+        """
+        Group misclassified rows into clusters.
+
+        Optional: can be overridden by subclasses.
+
+        Returns:
+            List of failure clusters
+        """
+        return []
+
     def run_stress_tests(self) -> Dict[str, Any]:
         """
         Run stress tests to measure robustness.
@@ -116,7 +189,8 @@ class BaseEvaluator(ABC):
         return corruption.run_stress_test_suite(
             self.data,
             self.predictions,
-            self.labels
+            self.labels,
+            seed=self.config.get('seed', 42)
         )
 
     def compute_confidence_intervals(self) -> Dict[str, Dict[str, float]]:
@@ -135,15 +209,19 @@ class BaseEvaluator(ABC):
         cis = {}
         primary_metrics = self.config.get('ci_metrics', ['accuracy'])
 
+        n_iterations = self.config.get('n_bootstrap', 1000)
+        seed = self.config.get('seed', 42)
+
         for metric_name in primary_metrics:
             if metric_name in self.metrics:
                 # Bootstrap on the metric
                 cis[metric_name] = bootstrap.bootstrap_confidence_interval(
                     data=(self.predictions, self.labels),
                     metric_fn=self._get_metric_function(metric_name),
-                    n_iterations=self.config.get('n_bootstrap', 1000),
+                    n_iterations=n_iterations,
                     confidence=self.config.get('confidence_level', 0.95),
-                    seed=self.config.get('seed', 42)
+                    seed=seed,
+                    ctx=self.eval_context
                 )
 
         return cis
@@ -161,30 +239,232 @@ class BaseEvaluator(ABC):
         """
         pass
 
+    def _rng(self) -> np.random.Generator:
+        """
+        Get a new random generator seeded from config['seed'].
+
+        Each consumer (failure sampling, plot subsampling, ...) gets its own
+        generator, so its draws don't depend on which stages ran before it
+        or came from the cache, and no global random state is shared with
+        other evaluations in the process.
+
+        Returns:
+            Random generator
+        """
+        from .rng import make_rng
+        return make_rng(self.config.get('seed', 42))
+
+    def _input_arrays(self) -> Dict[str, Any]:
+        """
+        Get the evaluation inputs that stage outputs depend on.
+
+        Returns:
+            Dictionary of input names to arrays
+        """
+        return {'predictions': self.predictions, 'labels': self.labels, 'data': self.data}
+
+    def _compute_input_hash(self) -> Optional[str]:
+        """
+        Compute a content hash of all evaluation inputs.
+
+        Returns:
+            Hex digest, or None if the inputs cannot be hashed
+        """
+        from .cache import hash_array
+        import hashlib
+
+        digest = hashlib.blake2b(digest_size=16)
+        for name, array in sorted(self._input_arrays().items()):
+            if name in ('labels', 'data'):
+                # Shared inputs are hashed once per LabelContext
+                array_hash = self.label_context.input_hash(name, array)
+            else:
+                array_hash = hash_array(array)
+            digest.update(f"{name}={array_hash};".encode())
+        return digest.hexdigest()
+
+    def _get_cache(self):
+        """Get the stage cache configured by 'cache_dir', or None."""
+        cache_dir = self.config.get('cache_dir')
+        if not cache_dir:
+            return None
+
+        from .cache import EvalCache, DEFAULT_MAX_BYTES
+        return EvalCache(cache_dir, max_bytes=self.config.get('cache_max_bytes', DEFAULT_MAX_BYTES))
+
+    def _run_stage(self, stage: str, compute, cache=None):
+        """
+        Run a pipeline stage, reusing a cached output when its inputs are unchanged.
+
+        Args:
+            stage: Stage name (key of STAGE_CONFIG_KEYS)
+            compute: Zero-argument function computing the stage output
+            cache: EvalCache, or None to always compute
+
+        Returns:
+            Stage output
+        """
+        if cache is None:
+            return compute()
+
+        if self._input_hash is None:
+            self._input_hash = self._compute_input_hash()
+        if self._input_hash is None:
+            return compute()
+
+        from .cache import make_stage_key
+        key = make_stage_key(stage, self._input_hash, self.config, self.STAGE_CONFIG_KEYS.get(stage, []))
+
+        cached = cache.get(key)
+        if cached is not None:
+            output, state = cached
+            for name, value in state.items():
+                setattr(self, name, value)
+            self.cache_status[stage] = 'hit'
+            return output
+
+        output = compute()
+        state = {name: getattr(self, name) for name in self.STAGE_STATE.get(stage, [])}
+        cache.put(key, (output, state))
+        self.cache_status[stage] = 'miss'
+        return output
+
+    def _run_plot_stage(self, cache=None) -> List[str]:
+        """
+        Generate plots, restoring cached plot files when plot inputs are unchanged.
+
+        Args:
+            cache: EvalCache, or None to always render
+
+        Returns:
+            List of paths to plot files
+        """
+        if cache is None or not self.output_dir:
+            return self.generate_plots()
+
+        from pathlib import Path
+        from .artifact_writer import ArtifactWriter
+
+        def render():
+            paths = self.generate_plots()
+            return {Path(path).name: Path(path).read_bytes() for path in paths}
+
+        files = self._run_stage('plots', render, cache)
+
+        plots_dir = ArtifactWriter(self.output_dir).get_plots_dir()
+        paths = []
+        for name, content in files.items():
+            path = plots_dir / name
+            if self.cache_status.get('plots') == 'hit':
+                path.write_bytes(content)
+            paths.append(str(path))
+        return paths
+
+    def _budget_profile(self) -> Dict[str, Any]:
+        """
+        Describe the inputs for stage cost estimation.
+
+        Returns:
+            Profile dict consumed by core.budget.estimate_stage_costs
+        """
+        return {
+            'n_samples': len(self.labels),
+            'n_classes': len(self.label_context.classes),
+            'has_proba': False,
+            'n_slices': 3 if self.data is not None else 0,
+            'n_feature_slices': 0
+        }
+
+    def _timed_stage(self, stage: str, run, skipped: Any = None):
+        """
+        Run a stage, recording its wall time.
+
+        Optional stages (those with a `skipped` value) are not started once
+        the time budget deadline has passed.
+
+        Args:
+            stage: Stage name
+            run: Zero-argument function running the stage
+            skipped: Output to use if the stage is skipped (None for required stages)
+
+        Returns:
+            Stage output
+        """
+        if skipped is not None and self._deadline is not None and time.perf_counter() > self._deadline:
+            self.degradations.append({
+                'stage': stage,
+                'action': 'skipped',
+                'reason': 'time budget exhausted before stage started'
+            })
+            return skipped
+
+        start = time.perf_counter()
+        output = run()
+        self.stage_timings[stage] = time.perf_counter() - start
+        return output
+
     def evaluate(self) -> 'EvaluationReport':
         """
         Run complete evaluation pipeline.
 
+        If config['cache_dir'] is set, each stage output is cached on disk and
+        reused on later runs with the same inputs and stage config.
+
+        If config['time_budget_s'] is set, optional work is scaled down up front
+        to fit the budget (see core.budget), and optional stages still pending
+        when the deadline passes are skipped. Both are recorded in the report's
+        `degradations`.
+
         Returns:
             EvaluationReport with all results
         """
+        cache = self._get_cache()
+        self.stage_timings = {}
+        self.degradations = []
+        self._deadline = None
+
+        time_budget_s = self.config.get('time_budget_s')
+        if time_budget_s is not None:
+            from .budget import plan_evaluation
+            self.config, self.degradations = plan_evaluation(self._budget_profile(), self.config, time_budget_s)
+            self._deadline = time.perf_counter() + time_budget_s
+
         # 1. Compute metrics
-        self.metrics = self.compute_metrics()
+        self.metrics = self._timed_stage(
+            'metrics', lambda: self._run_stage('metrics', self.compute_metrics, cache)
+        )
 
         # 2. Compute confidence intervals
-        confidence_intervals = self.compute_confidence_intervals()
+        confidence_intervals = self._timed_stage(
+            'confidence_intervals',
+            lambda: self._run_stage('confidence_intervals', self.compute_confidence_intervals, cache),
+            skipped={}
+        )
 
         # 3. Compute slices
-        self.slices = self.compute_slices()
+        self.slices = self._timed_stage(
+            'slices', lambda: self._run_stage('slices', self.compute_slices, cache), skipped=[]
+        )
 
         # 4. Find failure examples
-        self.failure_examples = self.find_failure_examples()
+        self.failure_examples = self._timed_stage(
+            'failures', lambda: self._run_stage('failures', self.find_failure_examples, cache), skipped=[]
+        )
+
+        # 4b. Cluster all misclassified rows (if configured)
+        self.failure_clusters = self._timed_stage(
+            'failure_clusters',
+            lambda: self._run_stage('failure_clusters', self.cluster_failures, cache),
+            skipped=[]
+        )
 
         # 5. Generate plots
-        self.plots = self.generate_plots()
+        self.plots = self._timed_stage('plots', lambda: self._run_plot_stage(cache), skipped=[])
 
         # 6. Run stress tests (if configured)
-        stress_results = self.run_stress_tests()
+        stress_results = self._timed_stage(
+            'stress_tests', lambda: self._run_stage('stress_tests', self.run_stress_tests, cache), skipped={}
+        )
 
         # 7. Create report
         from .schemas import EvaluationReport
@@ -193,9 +473,14 @@ class BaseEvaluator(ABC):
             confidence_intervals=confidence_intervals,
             slices=self.slices,
             failure_examples=self.failure_examples,
+            failure_store=self.failure_store,
+            failure_clusters=self.failure_clusters,
+            failure_category_counts=self.failure_category_counts,
             plots=self.plots,
             stress_tests=stress_results,
-            config=self.config
+            config=self.config,
+            degradations=self.degradations,
+            stage_timings=self.stage_timings
         )
 
         # 8. Write artifacts to disk
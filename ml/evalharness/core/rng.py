@@ -0,0 +1,25 @@
+"""
+Random number generation.
+
+All sampling in the harness (bootstrap resamples, data corruption, plot
+subsampling, failure sampling) draws from an explicit np.random.Generator
+instead of NumPy's global state. Results then depend only on the seed, and
+evaluations running concurrently in one process do not disturb each other.
+"""
+
+import numpy as np
+from typing import Optional
+
+
+def make_rng(seed: Optional[int] = 42, rng: Optional[np.random.Generator] = None) -> np.random.Generator:
+    """
+    Get the generator to draw from.
+
+    Args:
+        seed: Seed for a new generator (used when rng is not given)
+        rng: Existing generator to use as-is
+
+    Returns:
+        rng if given, otherwise a new generator seeded with seed
+    """
+    return rng if rng is not None else np.random.default_rng(seed)
@@ -52,9 +52,15 @@ class EvaluationReport(BaseModel):
     confidence_intervals: Dict[str, Dict[str, float]] = Field(default_factory=dict)
     slices: List[Dict[str, Any]] = Field(default_factory=list)
     failure_examples: List[Dict[str, Any]] = Field(default_factory=list)
+    failure_store: Optional[Any] = Field(default=None, exclude=True)  # FailureStore with the feature rows
+    failure_artifacts: Dict[str, Any] = Field(default_factory=dict)  # Files the failure store was written to
+    failure_clusters: List[Dict[str, Any]] = Field(default_factory=list)
+    failure_category_counts: Dict[str, int] = Field(default_factory=dict)  # Predictions per taxonomy category
     plots: List[str] = Field(default_factory=list)
     stress_tests: Dict[str, Any] = Field(default_factory=dict)
     config: Dict[str, Any] = Field(default_factory=dict)
+    degradations: List[Dict[str, Any]] = Field(default_factory=list)  # Work cut to fit a time budget
+    stage_timings: Dict[str, float] = Field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert report to dictionary."""
@@ -82,7 +88,18 @@ class EvaluationReport(BaseModel):
         sentences.append(f"The model achieved {primary_metric}.")
 
         # Sentence 2: Best/worst slices
-        if self.slices:
+        significant = [s for s in self.slices if s.get('significantly_worse')]
+        if significant:
+            # Only slices that are significantly worse than the rest (FDR-controlled) count as worst
+            best_slice = max(self.slices, key=lambda s: s.get('accuracy', s.get('f1_score', 0)))
+            worst_slice = min(significant, key=lambda s: s.get('accuracy', s.get('f1_score', 0)))
+            sentences.append(
+                f"Performance varied across slices, with best results on {best_slice['slice_name']} "
+                f"and {len(significant)} significantly worse slice(s), the worst being {worst_slice['slice_name']}."
+            )
+        elif self.slices and any('significantly_worse' in s for s in self.slices):
+            sentences.append("No slice performed significantly worse than the rest of the data.")
+        elif self.slices:
             best_slice = max(self.slices, key=lambda s: s.get('accuracy', s.get('f1_score', 0)))
             worst_slice = min(self.slices, key=lambda s: s.get('accuracy', s.get('f1_score', 0)))
             sentences.append(
@@ -140,5 +157,22 @@ class EvaluationReport(BaseModel):
             "n_failures": len(self.failure_examples),
             "n_plots": len(self.plots),
             "stress_tests_run": bool(self.stress_tests),
+            "degraded": bool(self.degradations),
             "takeaway": self.get_takeaway()
         }
+
+
+class ModelComparison(BaseModel):
+    """
+    Reports for several models evaluated on the same test set.
+
+    Produced by evaluate_many: one full report per model plus a comparison
+    table with one row per model, ranked by the comparison metric.
+    """
+    reports: Dict[str, EvaluationReport]
+    comparison: List[Dict[str, Any]] = Field(default_factory=list)
+    comparison_metric: str = 'accuracy'
+
+    def get_best_model(self) -> Optional[str]:
+        """Get the name of the top-ranked model."""
+        return self.comparison[0]['model'] if self.comparison else None
@@ -0,0 +1,195 @@
+"""
+Chunked array sources for out-of-core evaluation.
+
+An evaluation input can be an in-memory array, a path to a `.npy` file
+(memory-mapped), a path to a `.parquet` file (read row group by row group),
+or an iterator yielding array batches. All sources are re-chunked to a common
+batch size so predictions, probabilities, labels and features stay aligned.
+"""
+
+import os
+from typing import Any, Dict, Iterator, List, Optional
+import numpy as np
+
+
+DEFAULT_BATCH_SIZE = 65536
+
+
+def is_streaming_input(value: Any) -> bool:
+    """
+    Check whether an input must be evaluated in chunked mode.
+
+    Args:
+        value: Evaluation input (array-like, path, or iterator)
+
+    Returns:
+        True for file paths and batch iterators
+    """
+    if value is None:
+        return False
+    if isinstance(value, (str, os.PathLike)):
+        return True
+    return hasattr(value, '__next__')
+
+
+class ArraySource:
+    """
+    A sequence of array batches read from memory, disk, or an iterator.
+
+    File-backed and in-memory sources can be iterated repeatedly; iterator
+    sources are single-pass.
+    """
+
+    def __init__(self, value: Any):
+        """
+        Initialize array source.
+
+        Args:
+            value: Array-like, `.npy`/`.parquet` path, or iterator of batches
+        """
+        self.value = value
+        self.path = None
+        self._array = None
+
+        if isinstance(value, (str, os.PathLike)):
+            self.path = str(value)
+            suffix = os.path.splitext(self.path)[1].lower()
+            if suffix == '.npy':
+                self._array = np.load(self.path, mmap_mode='r')
+            elif suffix not in ('.parquet', '.pq'):
+                raise ValueError(f"Unsupported file type for evaluation input: {self.path}. Must be .npy or .parquet.")
+        elif not hasattr(value, '__next__'):
+            self._array = np.asarray(value)
+
+        self._consumed = False
+
+    @property
+    def reiterable(self) -> bool:
+        """Whether the source can be read more than once."""
+        return self._array is not None or self.path is not None
+
+    def __len__(self) -> int:
+        if self._array is not None:
+            return len(self._array)
+        if self.path is not None:
+            return _parquet_file(self.path).metadata.num_rows
+        raise TypeError("Length of an iterator source is unknown until it is consumed")
+
+    @property
+    def n_columns(self) -> Optional[int]:
+        """Number of columns (1 for 1-D inputs), or None for iterator sources."""
+        if self._array is not None:
+            return 1 if self._array.ndim == 1 else int(np.prod(self._array.shape[1:]))
+        if self.path is not None:
+            return _parquet_file(self.path).metadata.num_columns
+        return None
+
+    def iter_raw(self) -> Iterator[np.ndarray]:
+        """
+        Iterate over the source in its native chunking.
+
+        Yields:
+            Array batches (1-D for single-column inputs, 2-D otherwise)
+        """
+        if self._array is not None:
+            yield self._array
+            return
+
+        if self.path is not None:
+            parquet_file = _parquet_file(self.path)
+            for i in range(parquet_file.num_row_groups):
+                yield _table_to_array(parquet_file.read_row_group(i))
+            return
+
+        if self._consumed:
+            raise RuntimeError("Iterator source has already been consumed")
+        self._consumed = True
+        for batch in self.value:
+            yield np.asarray(batch)
+
+    def iter_batches(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[np.ndarray]:
+        """
+        Iterate over the source in fixed-size batches.
+
+        Memory-mapped arrays are sliced without copying the whole file; only
+        the current batch is materialized.
+
+        Args:
+            batch_size: Number of rows per batch (the last batch may be shorter)
+
+        Yields:
+            Array batches
+        """
+        buffer: List[np.ndarray] = []
+        buffered = 0
+
+        for chunk in self.iter_raw():
+            start = 0
+            while start < len(chunk):
+                take = min(batch_size - buffered, len(chunk) - start)
+                buffer.append(chunk[start:start + take])
+                buffered += take
+                start += take
+                if buffered == batch_size:
+                    yield _concat(buffer)
+                    buffer, buffered = [], 0
+
+        if buffered:
+            yield _concat(buffer)
+
+
+def iter_aligned_batches(
+    sources: Dict[str, Optional[ArraySource]],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Iterate over several sources in lockstep.
+
+    Args:
+        sources: Dictionary of input names to sources (None entries are skipped)
+        batch_size: Number of rows per batch
+
+    Yields:
+        Dictionary of input names to aligned batches
+    """
+    active = {name: source for name, source in sources.items() if source is not None}
+    iterators = {name: source.iter_batches(batch_size) for name, source in active.items()}
+
+    while True:
+        batch = {}
+        for name, iterator in iterators.items():
+            chunk = next(iterator, None)
+            if chunk is not None:
+                batch[name] = chunk
+
+        if not batch:
+            return
+        if len(batch) != len(iterators) or len({len(chunk) for chunk in batch.values()}) != 1:
+            lengths = {name: len(chunk) for name, chunk in batch.items()}
+            raise ValueError(f"Evaluation inputs have different lengths (batch sizes: {lengths})")
+
+        yield batch
+
+
+def _concat(chunks: List[np.ndarray]) -> np.ndarray:
+    """Concatenate buffered chunks into one in-memory batch."""
+    if len(chunks) == 1:
+        return np.asarray(chunks[0])
+    return np.concatenate(chunks)
+
+
+def _parquet_file(path: str):
+    """Open a Parquet file (requires pyarrow)."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Reading .parquet evaluation inputs requires pyarrow. Install with: pip install pyarrow")
+    return pq.ParquetFile(path)
+
+
+def _table_to_array(table) -> np.ndarray:
+    """Convert a pyarrow table (one row group) to a 1-D or 2-D numpy array."""
+    columns = [column.to_numpy() for column in table.columns]
+    if len(columns) == 1:
+        return columns[0]
+    return np.column_stack(columns)
@@ -1,10 +1,21 @@
 """Task-specific evaluator implementations."""
 
-from .classification import ClassificationEvaluator
+from ..lazy import attach
 
-try:
-    from .regression import RegressionEvaluator
-except ImportError:
-    RegressionEvaluator = None
+__all__ = ['ClassificationEvaluator', 'StreamingClassificationEvaluator', 'RegressionEvaluator', 'evaluate_many']
 
-__all__ = ['ClassificationEvaluator', 'RegressionEvaluator']
+_getattr, __dir__ = attach(__name__, {
+    'ClassificationEvaluator': 'classification:ClassificationEvaluator',
+    'StreamingClassificationEvaluator': 'streaming:StreamingClassificationEvaluator',
+    'RegressionEvaluator': 'regression:RegressionEvaluator',
+    'evaluate_many': 'multi_model:evaluate_many'
+})
+
+
+def __getattr__(name):
+    if name == 'RegressionEvaluator':
+        try:
+            return _getattr(name)
+        except ImportError:
+            return None
+    return _getattr(name)
@@ -8,10 +8,13 @@ import numpy as np
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from ..core.interfaces import BaseEvaluator
+from ..core.context import LabelContext
 from ..metrics import classification as metrics
-from ..plots import classification as plots
-from ..slicing import slicer
-from ..failures import selector
+from ..ci import bootstrap
+from ..slicing import engine, slicer
+from ..slicing.index import SliceIndex
+from ..failures import clustering, label_errors, selector
+from ..failures.store import FailureStore
 
 
 class ClassificationEvaluator(BaseEvaluator):
@@ -27,6 +30,34 @@ class ClassificationEvaluator(BaseEvaluator):
     - Deterministic plots
     """
 
+    STAGE_CONFIG_KEYS = {
+        **BaseEvaluator.STAGE_CONFIG_KEYS,
+        'metrics': ['average', 'compute_per_class', 'class_names'],
+        'confidence_intervals': BaseEvaluator.STAGE_CONFIG_KEYS['confidence_intervals'] + ['average'],
+        'slices': [
+            'categorical_features', 'numeric_features', 'missing_patterns', 'feature_names', 'min_slice_samples',
+            'discover_slices', 'discovery', 'slice_fdr_alpha', 'slice_test', 'slice_pairs', 'max_pair_cells',
+            'slice_cis', 'compute_cis', 'ci_metrics', 'n_bootstrap', 'confidence_level', 'seed'
+        ],
+        'failures': [
+            'n_failures_per_type', 'categorize_failures', 'detect_label_errors', 'n_label_errors',
+            'taxonomy_margin_threshold', 'taxonomy_entropy_threshold',
+            'categorical_features', 'numeric_features', 'missing_patterns', 'feature_names', 'min_slice_samples',
+            'discover_slices', 'discovery', 'slice_fdr_alpha', 'slice_test', 'slice_pairs', 'max_pair_cells',
+            'slice_cis', 'compute_cis', 'ci_metrics', 'n_bootstrap', 'confidence_level', 'seed'
+        ],
+        'failure_clusters': [
+            'cluster_failures', 'cluster_embedding', 'cluster_batch_size', 'n_cluster_representatives',
+            'feature_names', 'seed'
+        ],
+        'plots': ['class_names', 'seed', 'generate_plots', 'plot_max_samples', 'plot_format']
+    }
+
+    STAGE_STATE = {
+        'slices': ['slice_indices'],
+        'failures': ['failure_store', 'failure_codes', 'failure_category_counts']
+    }
+
     def __init__(
         self,
         predictions: np.ndarray,
@@ -34,7 +65,8 @@ class ClassificationEvaluator(BaseEvaluator):
         data: Optional[np.ndarray] = None,
         output_dir: Optional[str] = None,
         config: Optional[Dict[str, Any]] = None,
-        predictions_proba: Optional[np.ndarray] = None
+        predictions_proba: Optional[np.ndarray] = None,
+        label_context: Optional[LabelContext] = None
     ):
         """
         Initialize classification evaluator.
@@ -46,14 +78,49 @@ class ClassificationEvaluator(BaseEvaluator):
             output_dir: Directory to save artifacts
             config: Configuration options
             predictions_proba: Predicted probabilities (optional, for probabilistic metrics)
+            label_context: Shared label/feature precomputation (optional, e.g. from evaluate_many)
         """
-        super().__init__(predictions, labels, data, output_dir, config)
+        super().__init__(predictions, labels, data, output_dir, config, label_context)
         self.predictions_proba = np.array(predictions_proba) if predictions_proba is not None else None
 
         # Ensure predictions are integers
         self.predictions = self.predictions.astype(int)
         self.labels = self.labels.astype(int)
 
+        # Slice name -> row indices, filled by compute_slices
+        self.slice_indices = SliceIndex(len(self.labels))
+
+    def _input_arrays(self) -> Dict[str, Any]:
+        """
+        Get the evaluation inputs that stage outputs depend on.
+
+        Returns:
+            Dictionary of input names to arrays
+        """
+        return {**super()._input_arrays(), 'predictions_proba': self.predictions_proba}
+
+    def _budget_profile(self) -> Dict[str, Any]:
+        """
+        Describe the inputs for stage cost estimation.
+
+        Returns:
+            Profile dict consumed by core.budget.estimate_stage_costs
+        """
+        profile = super()._budget_profile()
+        profile['has_proba'] = self.predictions_proba is not None
+        profile['n_slices'] = 10 if self.predictions_proba is not None else 0
+        if self.data is not None:
+            data_slices = self.label_context.data_slices(
+                categorical_features=self.config.get('categorical_features'),
+                feature_names=self.config.get('feature_names'),
+                numeric_features=self.config.get('numeric_features'),
+                missing_patterns=self.config.get('missing_patterns', 0)
+            )
+            n_missing = sum(1 for name in data_slices if name.startswith(('missingness_', 'missing_pattern=')))
+            profile['n_slices'] += n_missing
+            profile['n_feature_slices'] = len(data_slices) - n_missing
+        return profile
+
     def compute_metrics(self) -> Dict[str, float]:
         """
         Compute all classification metrics.
@@ -66,7 +133,9 @@ class ClassificationEvaluator(BaseEvaluator):
             self.labels,
             self.predictions,
             self.predictions_proba,
-            average=self.config.get('average', 'weighted')
+            average=self.config.get('average', 'weighted'),
+            classes=self.label_context.classes,
+            ctx=self.eval_context
         )
 
         # Add per-class metrics if requested
@@ -74,7 +143,8 @@ class ClassificationEvaluator(BaseEvaluator):
             per_class = metrics.compute_per_class_metrics(
                 self.labels,
                 self.predictions,
-                class_names=self.config.get('class_names')
+                class_names=self.config.get('class_names'),
+                classes=self.label_context.classes
             )
             all_metrics['per_class'] = per_class
 
@@ -87,154 +157,337 @@ class ClassificationEvaluator(BaseEvaluator):
         Returns:
             List of slice results
         """
-        # Create slices
-        all_slices = slicer.create_all_slices(
-            data=self.data,
-            predictions_proba=self.predictions_proba,
-            categorical_features=self.config.get('categorical_features'),
-            feature_names=self.config.get('feature_names')
-        )
-
-        # Evaluate slices using accuracy
-        from sklearn.metrics import accuracy_score
+        # Automatically discovered feature crosses with elevated error rates
+        discovered = {}
+        if self.config.get('discover_slices', False) and self.data is not None:
+            from ..slicing import discovery
+            discovered = discovery.discover_slices(
+                self.data,
+                self.eval_context.correct,
+                feature_names=self.config.get('feature_names'),
+                **self.config.get('discovery', {})
+            )
 
-        slice_results = slicer.evaluate_slices(
-            all_slices,
-            self.labels,
-            self.predictions,
-            metric_fn=accuracy_score,
-            min_samples=self.config.get('min_slice_samples', 10)
-        )
+        # Two-way interactions of categorical features, counted one bincount per pair
+        pair_counts, pair_slices = None, {}
+        pair_features = self.config.get('slice_pairs', False)
+        if pair_features is True:
+            pair_features = self.config.get('categorical_features') or []
+        if pair_features and self.data is not None and self.data.ndim == 2:
+            from ..slicing import interactions
+            *pair_counts, pair_slices = interactions.evaluate_feature_pairs(
+                self.data,
+                pair_features,
+                *self.eval_context.label_codes,
+                feature_names=self.config.get('feature_names'),
+                max_cells=self.config.get('max_pair_cells', interactions.DEFAULT_MAX_PAIR_CELLS),
+                min_samples=self.config.get('min_slice_samples', 10)
+            )
 
-        # Add slice-specific metrics
-        for slice_result in slice_results:
-            indices = np.array(slice_result['indices'])
-            y_true_slice = self.labels[indices]
-            y_pred_slice = self.predictions[indices]
-            y_proba_slice = self.predictions_proba[indices] if self.predictions_proba is not None else None
-
-            # Compute detailed metrics for each slice
-            slice_metrics = metrics.compute_all_metrics(
-                y_true_slice,
-                y_pred_slice,
-                y_proba_slice,
-                average='weighted'
+        n_workers = self.config.get('slice_workers')
+        if n_workers and self.data is not None and (
+            not isinstance(self.data, np.ndarray) or self.data.dtype.hasobject
+        ):
+            print("Warning: slice_workers needs a numeric array; evaluating slices in-process")
+            n_workers = None
+
+        if n_workers:
+            # Slice families fan out to a process pool over shared memory
+            from ..slicing import parallel
+            slice_results, all_slices = parallel.evaluate_slices_parallel(
+                self.eval_context.label_codes,
+                data=self.data,
+                predictions_proba=self.predictions_proba,
+                categorical_features=self.config.get('categorical_features'),
+                numeric_features=self.config.get('numeric_features'),
+                feature_names=self.config.get('feature_names'),
+                missing_patterns=self.config.get('missing_patterns', 0),
+                extra_slices=discovered,
+                extra_counts=pair_counts,
+                n_workers=n_workers,
+                min_samples=self.config.get('min_slice_samples', 10),
+                average='weighted',
+                alpha=self.config.get('slice_fdr_alpha', 0.05),
+                test=self.config.get('slice_test', 'binomial')
+            )
+        else:
+            # Create slices (feature-based slices are shared through the label context)
+            all_slices = SliceIndex(len(self.labels))
+            if self.predictions_proba is not None:
+                all_slices.update(slicer.slice_by_confidence(self.predictions_proba, ctx=self.eval_context))
+            all_slices.update(self.label_context.data_slices(
+                categorical_features=self.config.get('categorical_features'),
+                feature_names=self.config.get('feature_names'),
+                numeric_features=self.config.get('numeric_features'),
+                missing_patterns=self.config.get('missing_patterns', 0)
+            ))
+            all_slices.update(discovered)
+
+            # Per-slice metrics for all slices at once from bincount confusion counts
+            slice_results = engine.evaluate_slices_by_counts(
+                all_slices,
+                self.labels,
+                self.predictions,
+                min_samples=self.config.get('min_slice_samples', 10),
+                average='weighted',
+                label_codes=self.eval_context.label_codes,
+                alpha=self.config.get('slice_fdr_alpha', 0.05),
+                test=self.config.get('slice_test', 'binomial'),
+                extra_counts=pair_counts
             )
 
-            slice_result.update({
-                'accuracy': slice_metrics['accuracy'],
-                'precision': slice_metrics.get('precision', 0),
-                'recall': slice_metrics.get('recall', 0),
-                'f1_score': slice_metrics.get('f1_score', 0)
-            })
+        # Reported pair slices (slices with the same name keep their rows)
+        for name, rows in pair_slices.items():
+            if name not in all_slices:
+                all_slices.add(name, rows)
 
-            # Remove indices from output (can be large)
-            del slice_result['indices']
+        # Slice CIs share the overall CI settings (and are skipped with them)
+        if self.config.get('slice_cis', False) and self.config.get('compute_cis', True) and slice_results:
+            self._add_slice_confidence_intervals(slice_results, all_slices)
+
+        # Indices stay out of the results (can be large); keep the compact index for
+        # failure selection and slice intersection queries
+        self.slice_indices = all_slices
 
         return slice_results
 
+    def _add_slice_confidence_intervals(
+        self,
+        slice_results: List[Dict[str, Any]],
+        all_slices: SliceIndex
+    ):
+        """
+        Add bootstrap confidence intervals to every reported slice.
+
+        All slices share the resamples of the overall confidence intervals and
+        are bootstrapped together from weighted confusion counts.
+
+        Args:
+            slice_results: Slice results (updated in place)
+            all_slices: Index of all slices
+        """
+        n_iterations = self.config.get('n_bootstrap', 1000)
+        seed = self.config.get('seed', 42)
+        count_metrics = {'accuracy', 'precision', 'recall', 'f1_score'}
+        metric_names = tuple(m for m in self.config.get('ci_metrics', ['accuracy']) if m in count_metrics)
+        if not metric_names:
+            metric_names = ('accuracy',)
+
+        y_true_codes, y_pred_codes, n_classes = self.eval_context.label_codes
+        names, replicates = bootstrap.bootstrap_slice_metrics(
+            {s['slice_name']: all_slices[s['slice_name']] for s in slice_results},
+            y_true_codes,
+            y_pred_codes,
+            n_classes,
+            n_iterations=n_iterations,
+            seed=seed,
+            average='weighted',
+            metric_names=metric_names,
+            indices=self.label_context.bootstrap_indices(n_iterations, seed)
+        )
+
+        confidence = self.config.get('confidence_level', 0.95)
+        bounds = {m: bootstrap.percentile_intervals(replicates[m], confidence) for m in metric_names}
+        for i, result in enumerate(slice_results):
+            result['confidence_intervals'] = {
+                m: {'lower': float(lower[i]), 'upper': float(upper[i]), 'confidence': confidence}
+                for m, (lower, upper) in bounds.items()
+            }
+
     def find_failure_examples(self) -> List[Dict[str, Any]]:
         """
         Identify failure examples for investigation.
 
+        The examples are kept in a columnar FailureStore (self.failure_store)
+        holding their feature rows as one block; the returned dictionaries
+        carry no features.
+
         Returns:
             List of failure examples
         """
         n_per_type = self.config.get('n_failures_per_type', 10)
 
-        failures = selector.select_all_failure_examples(
+        store = selector.select_failure_store(
             y_true=self.labels,
             y_pred=self.predictions,
             y_proba=self.predictions_proba,
-            slices=self.slices,
+            slices=[
+                {**s, 'indices': self.slice_indices[s['slice_name']]}
+                for s in self.slices
+            ],
             data=self.data,
-            n_per_type=n_per_type
+            n_per_type=n_per_type,
+            ctx=self.eval_context,
+            rng=self._rng()
         )
-
-        # Categorize failures using taxonomy (if requested)
+        found = self._find_label_errors() if self.config.get('detect_label_errors', False) else None
+        if found is not None:
+            store = FailureStore.concat([store, FailureStore.from_selection(
+                'label_error', found['indices'][:self.config.get('n_label_errors', n_per_type)],
+                self.labels, self.predictions, confidences=self.eval_context.confidences, data=self.data
+            )])
+        failures = store.to_examples(include_features=False)
+
+        # Categorize every prediction at once using taxonomy (if requested)
         if self.config.get('categorize_failures', False):
             from ..failures import taxonomy
-            for failure in failures:
-                category = taxonomy.categorize_failure(failure)
+            self.failure_codes, self.failure_category_counts = taxonomy.categorize_failures(
+                self.eval_context,
+                slice_rows=self._underperforming_slice_rows(),
+                label_error_rows=found['indices'] if found is not None else None,
+                margin_threshold=self.config.get('taxonomy_margin_threshold', taxonomy.DEFAULT_MARGIN_THRESHOLD),
+                entropy_threshold=self.config.get('taxonomy_entropy_threshold', taxonomy.DEFAULT_ENTROPY_THRESHOLD)
+            )
+            for failure, code in zip(failures, self.failure_codes[store.columns['index']]):
+                # Selected rows that are not failures by the bulk signals keep the per-type heuristic
+                category = taxonomy.category_of(code) or taxonomy.categorize_failure(failure)
                 failure['taxonomy_category'] = category.value
+            store.columns['taxonomy_category'] = np.array([f['taxonomy_category'] for f in failures], dtype=str)
 
+        self.failure_store = store
         return failures
 
+    def _underperforming_slice_rows(self) -> Optional[np.ndarray]:
+        """Rows of the significantly worse slices (or of the worst slice when slices were not tested)."""
+        if not self.slices:
+            return None
+        if any('significantly_worse' in s for s in self.slices):
+            names = [s['slice_name'] for s in self.slices if s.get('significantly_worse')]
+        else:
+            names = [self.slices[-1]['slice_name']]
+        if not names:
+            return None
+        return np.concatenate([self.slice_indices[name] for name in names])
+
+    def _find_label_errors(self) -> Optional[Dict[str, Any]]:
+        """
+        Find likely mislabeled rows with confident learning.
+
+        Returns:
+            Output of failures.label_errors.find_label_errors, or None without
+            usable probabilities
+        """
+        proba = self.predictions_proba
+        if proba is None:
+            print("Warning: Label error detection needs predicted probabilities; skipping")
+            return None
+
+        # Probability columns follow the sorted classes; integer labels may
+        # also index the columns directly when some class never occurs
+        n_classes = 2 if proba.ndim == 1 else proba.shape[1]
+        if len(self.label_context.classes) == n_classes:
+            label_codes = self.label_context.labels_encoded
+        elif np.issubdtype(self.labels.dtype, np.integer) and self.labels.min() >= 0 and self.labels.max() < n_classes:
+            label_codes = self.labels
+        else:
+            print(f"Warning: Labels do not match the {n_classes} probability columns; skipping label error detection")
+            return None
+
+        return label_errors.find_label_errors(label_codes, proba, n_classes)
+
+    def cluster_failures(self) -> List[Dict[str, Any]]:
+        """
+        Cluster all misclassified rows with mini-batch k-means.
+
+        config['cluster_failures'] enables the stage (True, or the number of
+        clusters). Rows are clustered in standardized numeric feature space,
+        or in config['cluster_embedding'] (an (n_samples, n_dims) array or
+        .npy path) when given.
+
+        Returns:
+            List of failure clusters (see failures.clustering.cluster_failures)
+        """
+        n_clusters = self.config.get('cluster_failures', False)
+        if not n_clusters:
+            return []
+        if n_clusters is True:
+            n_clusters = clustering.DEFAULT_N_CLUSTERS
+
+        embedding = self.config.get('cluster_embedding')
+        center = scale = names = None
+        if embedding is not None:
+            # Kept memory-mapped; clustering converts and cleans one batch of rows at a time
+            points = np.load(embedding, mmap_mode='r') if isinstance(embedding, (str, Path)) else np.asarray(embedding)
+            points = points.reshape(len(self.labels), -1)
+        elif self.data is not None:
+            matrix, names = clustering.feature_matrix(self.data, self.config.get('feature_names'))
+            points, center, scale = clustering.standardize(matrix)
+        else:
+            print("Warning: Failure clustering needs input data or config['cluster_embedding']; skipping")
+            return []
+
+        return clustering.cluster_failures(
+            points,
+            ~self.eval_context.correct,
+            self.labels,
+            self.predictions,
+            n_clusters=n_clusters,
+            batch_size=self.config.get('cluster_batch_size', clustering.DEFAULT_BATCH_SIZE),
+            n_representatives=self.config.get('n_cluster_representatives', clustering.DEFAULT_N_REPRESENTATIVES),
+            seed=self.config.get('seed', 42),
+            dimension_names=names,
+            center=center,
+            scale=scale
+        )
+
     def generate_plots(self) -> List[str]:
         """
         Generate all evaluation plots.
 
+        config['plot_max_samples'] caps the rows drawn in the ROC, PR,
+        calibration and confidence plots (a seeded random subsample); the
+        confusion matrix always uses every row. config['plot_workers'] > 1
+        renders the plots in that many worker processes.
+        config['plot_format'] = 'data' writes each plot's data (thinned
+        curve points, bin counts, confusion counts) as JSON instead of
+        rendering PNGs, without importing matplotlib.
+
         Returns:
             List of paths to generated plots
         """
-        if not self.output_dir:
+        if not self.output_dir or not self.config.get('generate_plots', True):
             return []
 
         from ..core.artifact_writer import ArtifactWriter
+        from ..plots import data as plot_data
         writer = ArtifactWriter(self.output_dir)
         plots_dir = writer.get_plots_dir()
+        plot_format = self.config.get('plot_format', 'png')
+        resolution = plot_data.DATA_CURVE_RESOLUTION if plot_format == 'data' else plot_data.CURVE_RESOLUTION
 
-        plot_paths = []
-        seed = self.config.get('seed', 42)
+        # Only the small plot data is kept for rendering or writing
+        plots = []
 
         # 1. Confusion matrix
         cm = metrics.compute_confusion_matrix(self.labels, self.predictions)
-        cm_path = plots_dir / 'confusion_matrix.png'
-        plots.plot_confusion_matrix(
-            cm,
-            class_names=self.config.get('class_names'),
-            output_path=str(cm_path),
-            seed=seed
-        )
-        plot_paths.append(str(cm_path))
+        plots.append(('confusion_matrix', plot_data.confusion_matrix_data(cm, self.config.get('class_names'))))
 
         # 2. ROC curve (if probabilities available)
         if self.predictions_proba is not None:
-            roc_path = plots_dir / 'roc_curve.png'
-            plots.plot_roc_curve(
-                self.labels,
-                self.predictions_proba,
-                output_path=str(roc_path),
-                seed=seed
-            )
-            plot_paths.append(str(roc_path))
+            labels, proba, ctx = self.labels, self.predictions_proba, self.eval_context
+            max_samples = self.config.get('plot_max_samples')
+            if max_samples is not None and len(labels) > max_samples:
+                rows = np.sort(self._rng().choice(len(labels), max_samples, replace=False))
+                labels, proba, ctx = labels[rows], proba[rows], ctx.take(rows)
+
+            plots.append(('roc_curve', plot_data.roc_curve_data(labels, proba, resolution)))
 
             # 3. PR curve
-            pr_path = plots_dir / 'pr_curve.png'
-            plots.plot_pr_curve(
-                self.labels,
-                self.predictions_proba,
-                output_path=str(pr_path),
-                seed=seed
-            )
-            plot_paths.append(str(pr_path))
+            plots.append(('pr_curve', plot_data.pr_curve_data(labels, proba, resolution)))
 
-            # 4. Calibration curve
-            mean_probs, frac_pos = metrics.compute_calibration_curve(
-                self.labels,
-                self.predictions_proba,
-                n_bins=10
-            )
-            calib_path = plots_dir / 'calibration_curve.png'
-            plots.plot_calibration_curve(
-                mean_probs,
-                frac_pos,
-                output_path=str(calib_path),
-                seed=seed
-            )
-            plot_paths.append(str(calib_path))
+            # 4. Calibration curve (binary only, as in chunked mode)
+            if proba.ndim == 1 or proba.shape[1] == 2:
+                mean_probs, frac_pos = metrics.compute_calibration_curve(
+                    labels,
+                    proba,
+                    n_bins=10
+                )
+                plots.append(('calibration_curve', plot_data.calibration_curve_data(mean_probs, frac_pos)))
 
             # 5. Confidence histogram
-            conf_path = plots_dir / 'confidence_histogram.png'
-            plots.plot_confidence_histogram(
-                self.labels,
-                self.predictions_proba,
-                output_path=str(conf_path),
-                seed=seed
-            )
-            plot_paths.append(str(conf_path))
+            plots.append(('confidence_histogram', plot_data.confidence_histogram_data(labels, proba, ctx)))
 
-        return plot_paths
+        return plot_data.save_plots(plots, plots_dir, plot_format, self.config.get('plot_workers'))
 
     def _get_metric_function(self, metric_name: str):
         """
@@ -0,0 +1,135 @@
+"""
+Multi-model evaluation.
+
+Evaluates several models against one test set, sharing all label- and
+feature-derived precomputation (label encoding, class counts, feature slices,
+missingness, bootstrap resample indices) across models.
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+from .classification import ClassificationEvaluator
+from ..core.context import LabelContext
+from ..core.schemas import EvaluationReport, ModelComparison
+from ..slicing import significance
+
+
+# Metrics reported in the comparison table (when present in the reports)
+COMPARISON_METRICS = [
+    'accuracy', 'precision', 'recall', 'f1_score', 'matthews_corr_coef',
+    'cohen_kappa', 'roc_auc', 'pr_auc', 'log_loss', 'expected_calibration_error'
+]
+
+# Metrics where lower values are better
+LOWER_IS_BETTER = {'log_loss', 'expected_calibration_error'}
+
+
+ModelOutputs = Union[np.ndarray, Tuple[np.ndarray, Optional[np.ndarray]]]
+
+
+def evaluate_many(
+    models: Dict[str, ModelOutputs],
+    labels: np.ndarray,
+    data: Optional[Union[np.ndarray, pd.DataFrame]] = None,
+    output_dir: Optional[str] = None,
+    config: Optional[Dict[str, Any]] = None
+) -> ModelComparison:
+    """
+    Evaluate several classification models on the same labels and data.
+
+    Args:
+        models: Dictionary mapping model names to predictions or to
+            (predictions, predictions_proba) tuples
+        labels: Ground truth labels
+        data: Input features (optional, needed for slicing)
+        output_dir: Directory to save artifacts; each model is written to
+            <output_dir>/models/<name>/ and the comparison to <output_dir>/eval/
+        config: Configuration dict shared by all models
+            ('comparison_metric' sets the ranking metric, default 'accuracy')
+
+    Returns:
+        ModelComparison with one report per model and a comparison table
+    """
+    if not models:
+        raise ValueError("At least one model is required")
+
+    config = config or {}
+    labels = np.asarray(labels).astype(int)
+    if data is not None and not isinstance(data, pd.DataFrame):
+        data = np.asarray(data)
+    context = LabelContext(labels, data)
+
+    reports = {}
+    for name, outputs in models.items():
+        if isinstance(outputs, tuple):
+            predictions, predictions_proba = outputs
+        else:
+            predictions, predictions_proba = outputs, None
+
+        evaluator = ClassificationEvaluator(
+            predictions,
+            labels,
+            data,
+            output_dir=os.path.join(output_dir, 'models', str(name)) if output_dir else None,
+            config=config,
+            predictions_proba=predictions_proba,
+            label_context=context
+        )
+        reports[name] = evaluator.evaluate()
+
+    comparison_metric = config.get('comparison_metric', 'accuracy')
+    result = ModelComparison(
+        reports=reports,
+        comparison=build_comparison_table(reports, comparison_metric),
+        comparison_metric=comparison_metric
+    )
+
+    if output_dir:
+        from ..core.artifact_writer import ArtifactWriter
+        ArtifactWriter(output_dir).write_comparison(result)
+
+    return result
+
+
+def build_comparison_table(
+    reports: Dict[str, EvaluationReport],
+    comparison_metric: str = 'accuracy'
+) -> List[Dict[str, Any]]:
+    """
+    Build a comparison table with one row per model.
+
+    Args:
+        reports: Dictionary mapping model names to evaluation reports
+        comparison_metric: Metric used to rank models
+
+    Returns:
+        List of rows (model name, metrics, CI bounds, worst slice), best model first
+    """
+    rows = []
+    for name, report in reports.items():
+        row = {'model': name}
+
+        for metric in COMPARISON_METRICS:
+            if metric in report.metrics:
+                row[metric] = report.metrics[metric]
+            if metric in report.confidence_intervals:
+                row[f'{metric}_lower'] = report.confidence_intervals[metric]['lower']
+                row[f'{metric}_upper'] = report.confidence_intervals[metric]['upper']
+
+        worst_slice = significance.worst_slice(report.slices)
+        if worst_slice is not None:
+            row['worst_slice'] = worst_slice['slice_name']
+            row['worst_slice_accuracy'] = worst_slice.get('accuracy', worst_slice.get('metric_value'))
+
+        row['n_failures'] = len(report.failure_examples)
+        rows.append(row)
+
+    sign = 1 if comparison_metric in LOWER_IS_BETTER else -1
+    rows.sort(key=lambda row: (comparison_metric not in row, sign * row.get(comparison_metric, 0)))
+
+    for rank, row in enumerate(rows, start=1):
+        row['rank'] = rank
+
+    return rows
@@ -0,0 +1,357 @@
+"""
+Streaming Classification Evaluator.
+
+Chunked, out-of-core evaluation pipeline for classification tasks whose
+inputs are `.npy`/`.parquet` files or iterators of batches.
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional
+from .classification import ClassificationEvaluator
+from ..core.sources import ArraySource, iter_aligned_batches, DEFAULT_BATCH_SIZE
+from ..metrics.streaming import StreamingClassificationMetrics
+from ..slicing import significance
+from ..slicing.streaming import StreamingSliceStats
+from ..failures.reservoir import TopK
+from ..failures.store import FailureStore
+
+
+class StreamingClassificationEvaluator(ClassificationEvaluator):
+    """
+    Classification evaluator that reads its inputs in chunks.
+
+    All stages are fed from a single pass over the inputs:
+    - Metrics and bootstrap CIs from streaming count accumulators
+    - Slices from streaming per-slice counts
+    - Failure examples from bounded top-k trackers and per-slice reservoirs
+
+    Memory use is bounded by the batch size, the number of classes and the
+    number of slices, not by the number of rows. Stress tests need the full
+    feature matrix and are not run in this mode.
+    """
+
+    # Slices are computed from the accumulators and leave no row indices behind
+    STAGE_STATE = {
+        'failures': ['failure_store']
+    }
+
+    def __init__(
+        self,
+        predictions: Any,
+        labels: Any,
+        data: Any = None,
+        output_dir: Optional[str] = None,
+        config: Optional[Dict[str, Any]] = None,
+        predictions_proba: Any = None
+    ):
+        """
+        Initialize streaming classification evaluator.
+
+        Args:
+            predictions: Predicted class labels (array, .npy/.parquet path, or iterator of batches)
+            labels: True labels (array, path, or iterator)
+            data: Input features (optional, array, path, or iterator)
+            output_dir: Directory to save artifacts
+            config: Configuration options
+            predictions_proba: Predicted probabilities (optional, array, path, or iterator)
+        """
+        # Inputs are never materialized, so BaseEvaluator.__init__ is not used
+        self.sources = {
+            'predictions': ArraySource(predictions),
+            'labels': ArraySource(labels),
+            'predictions_proba': ArraySource(predictions_proba) if predictions_proba is not None else None,
+            'data': ArraySource(data) if data is not None else None
+        }
+        self.predictions = self.labels = self.data = self.predictions_proba = None
+        self.output_dir = output_dir
+        self.config = config or {}
+
+        self._validate_inputs()
+
+        self.metrics = {}
+        self.slices = []
+        self.failure_examples = []
+        self.failure_store = None
+        self.failure_category_counts = {}
+        self.failure_clusters = []
+        self.plots = []
+        self.n_samples = 0
+        self._consumed = False
+        self.cache_status = {}
+        self._input_hash = None
+        self._label_context = None
+
+    def _validate_inputs(self):
+        """Validate input lengths where they are known without reading the data."""
+        lengths = {
+            name: len(source)
+            for name, source in self.sources.items()
+            if source is not None and source.reiterable
+        }
+        if len(set(lengths.values())) > 1:
+            raise ValueError(f"Evaluation inputs must have the same length (got {lengths})")
+
+    def _budget_profile(self) -> Dict[str, Any]:
+        """
+        Describe the inputs for stage cost estimation.
+
+        The row count is only known up front for array and file inputs, and
+        the class count when probabilities are (or class names are configured).
+
+        Returns:
+            Profile dict consumed by core.budget.estimate_stage_costs
+        """
+        labels, proba = self.sources['labels'], self.sources['predictions_proba']
+        n_columns = proba.n_columns if proba is not None else None
+        if n_columns is not None:
+            n_classes = 2 if n_columns == 1 else n_columns
+        else:
+            n_classes = len(self.config['class_names']) if self.config.get('class_names') else None
+        return {
+            'n_samples': len(labels) if labels.reiterable else None,
+            'n_classes': n_classes,
+            'has_proba': proba is not None,
+            'streaming': True
+        }
+
+    def _compute_input_hash(self) -> Optional[str]:
+        """
+        Fingerprint file inputs by path, size and modification time.
+
+        Hashing the contents would mean an extra full pass over the data, so
+        file stats stand in for it. Iterator inputs cannot be fingerprinted.
+
+        Returns:
+            Hex digest, or None if any input is an iterator
+        """
+        import hashlib
+        import os
+        from ..core.cache import hash_array
+
+        digest = hashlib.blake2b(digest_size=16)
+        for name, source in sorted(self.sources.items()):
+            if source is None:
+                fingerprint = 'none'
+            elif source.path is not None:
+                stat = os.stat(source.path)
+                fingerprint = f"{os.path.abspath(source.path)}:{stat.st_size}:{stat.st_mtime_ns}"
+            elif source.reiterable:
+                fingerprint = hash_array(source._array)
+            else:
+                return None
+            digest.update(f"{name}={fingerprint};".encode())
+        return digest.hexdigest()
+
+    def _consume(self):
+        """Run the single pass over all inputs, feeding every accumulator."""
+        if self._consumed:
+            return
+        self._consumed = True
+
+        seed = self.config.get('seed', 42)
+        n_per_type = self.config.get('n_failures_per_type', 10)
+        n_bootstrap = self.config.get('n_bootstrap', 1000) if self.config.get('compute_cis', True) else 0
+
+        self.stream_metrics = StreamingClassificationMetrics(
+            average=self.config.get('average', 'weighted'),
+            n_bootstrap=n_bootstrap,
+            seed=seed
+        )
+        self.slice_stats = StreamingSliceStats(
+            categorical_features=self.config.get('categorical_features'),
+            numeric_features=self.config.get('numeric_features'),
+            feature_names=self.config.get('feature_names'),
+            missing_patterns=self.config.get('missing_patterns', 0),
+            n_examples=n_per_type,
+            seed=seed
+        )
+        self.confident_wrong = TopK(n_per_type, largest=True)
+        self.unconfident_correct = TopK(n_per_type, largest=False)
+
+        batch_size = self.config.get('batch_size', DEFAULT_BATCH_SIZE)
+        offset = 0
+
+        for batch in iter_aligned_batches(self.sources, batch_size):
+            y_true = np.asarray(batch['labels']).astype(np.int64)
+            y_pred = np.asarray(batch['predictions']).astype(np.int64)
+            y_proba = np.asarray(batch['predictions_proba'], dtype=float) if 'predictions_proba' in batch else None
+            data = np.asarray(batch['data']) if 'data' in batch else None
+
+            self.stream_metrics.update(y_true, y_pred, y_proba)
+            self.slice_stats.update(y_true, y_pred, y_proba, data, offset=offset)
+
+            if y_proba is not None:
+                confidences = y_proba if y_proba.ndim == 1 else np.max(y_proba, axis=1)
+                for tracker, mask in ((self.confident_wrong, y_true != y_pred),
+                                      (self.unconfident_correct, y_true == y_pred)):
+                    payload = {
+                        'index': offset + np.flatnonzero(mask),
+                        'true_label': y_true[mask],
+                        'predicted_label': y_pred[mask]
+                    }
+                    if data is not None:
+                        payload['features'] = data[mask]
+                    tracker.update(confidences[mask], **payload)
+
+            offset += len(y_true)
+
+        self.n_samples = offset
+        if self.n_samples == 0:
+            raise ValueError("Evaluation inputs are empty")
+
+    def compute_metrics(self) -> Dict[str, float]:
+        """
+        Compute all classification metrics from the streaming accumulators.
+
+        Returns:
+            Dictionary of metrics
+        """
+        self._consume()
+        all_metrics = self.stream_metrics.compute()
+
+        if self.config.get('compute_per_class', False):
+            tp, pred_count, true_count = (
+                self.stream_metrics.tp, self.stream_metrics.pred_count, self.stream_metrics.true_count
+            )
+            classes = np.flatnonzero(true_count > 0)
+            class_names = self.config.get('class_names') or [f"class_{i}" for i in classes]
+            per_class = {}
+            for i, class_label in enumerate(classes):
+                tp_k, pred_k, true_k = tp[class_label], pred_count[class_label], true_count[class_label]
+                class_name = class_names[i] if i < len(class_names) else f"class_{class_label}"
+                per_class[class_name] = {
+                    'precision': float(tp_k / pred_k) if pred_k else 0.0,
+                    'recall': float(tp_k / true_k),
+                    'f1_score': float(2 * tp_k / (pred_k + true_k)),
+                    'support': int(true_k)
+                }
+            all_metrics['per_class'] = per_class
+
+        return all_metrics
+
+    def compute_confidence_intervals(self) -> Dict[str, Dict[str, float]]:
+        """
+        Compute Poisson bootstrap confidence intervals accumulated during the pass.
+
+        Returns:
+            Dictionary of metric names to CI results
+        """
+        if not self.config.get('compute_cis', True):
+            return {}
+
+        self._consume()
+        return self.stream_metrics.compute_confidence_intervals(
+            [name for name in self.config.get('ci_metrics', ['accuracy']) if name in self.metrics],
+            confidence=self.config.get('confidence_level', 0.95),
+            seed=self.config.get('seed', 42)
+        )
+
+    def compute_slices(self) -> List[Dict[str, Any]]:
+        """
+        Compute performance on data slices from the streaming slice counts.
+
+        Returns:
+            List of slice results
+        """
+        self._consume()
+        return self.slice_stats.compute(
+            min_samples=self.config.get('min_slice_samples', 10),
+            average='weighted',
+            alpha=self.config.get('slice_fdr_alpha', 0.05),
+            test=self.config.get('slice_test', 'binomial')
+        )
+
+    def find_failure_examples(self) -> List[Dict[str, Any]]:
+        """
+        Collect failure examples kept by the bounded trackers.
+
+        The tracker columns are kept as a FailureStore (self.failure_store);
+        the returned dictionaries carry no features.
+
+        Returns:
+            List of failure examples
+        """
+        self._consume()
+        stores = []
+
+        for tracker, failure_type in ((self.confident_wrong, 'high_confidence_wrong'),
+                                      (self.unconfident_correct, 'low_confidence_correct')):
+            rows = tracker.result()
+            stores.append(self._failure_store(rows, failure_type, confidence=rows['score']))
+
+        worst_slice = significance.worst_slice(self.slices)
+        if worst_slice is not None:
+            rows = self.slice_stats.sample_errors(worst_slice['slice_name'])
+            stores.append(self._failure_store(
+                rows, 'worst_slice_error',
+                confidence=rows.get('confidence'),
+                slice_name=np.full(len(rows.get('index', ())), worst_slice['slice_name'])
+            ))
+
+        store = FailureStore.concat(stores)
+        failures = store.to_examples(include_features=False)
+
+        if self.config.get('categorize_failures', False):
+            from ..failures import taxonomy
+            for failure in failures:
+                failure['taxonomy_category'] = taxonomy.categorize_failure(failure).value
+            store.columns['taxonomy_category'] = np.array([f['taxonomy_category'] for f in failures], dtype=str)
+
+        self.failure_store = store
+        return failures
+
+    @staticmethod
+    def _failure_store(rows: Dict[str, np.ndarray], failure_type: str, **extra: Optional[np.ndarray]) -> FailureStore:
+        """Build a failure store from tracker columns."""
+        if 'index' not in rows:
+            # Nothing was tracked (e.g. no probabilities)
+            return FailureStore.from_examples([])
+        columns = {
+            'index': rows['index'],
+            'true_label': rows['true_label'],
+            'predicted_label': rows['predicted_label'],
+            'failure_type': np.full(len(rows['index']), failure_type),
+            **{name: values for name, values in extra.items() if values is not None}
+        }
+        return FailureStore(columns, rows.get('features'))
+
+    def generate_plots(self) -> List[str]:
+        """
+        Generate plots that can be drawn from the streaming accumulators.
+
+        Returns:
+            List of paths to generated plots
+        """
+        if not self.output_dir or not self.config.get('generate_plots', True):
+            return []
+
+        self._consume()
+        from ..core.artifact_writer import ArtifactWriter
+        from ..plots import data as plot_data
+        plots_dir = ArtifactWriter(self.output_dir).get_plots_dir()
+        plots = [(
+            'confusion_matrix',
+            plot_data.confusion_matrix_data(self.stream_metrics.confusion.astype(int), self.config.get('class_names'))
+        )]
+
+        if self.stream_metrics.has_proba and self.stream_metrics.pos_hist.shape[0] == 1:
+            mean_probs, frac_pos = self.stream_metrics.compute_calibration_curve()
+            plots.append(('calibration_curve', plot_data.calibration_curve_data(mean_probs, frac_pos)))
+
+        return plot_data.save_plots(
+            plots,
+            plots_dir,
+            self.config.get('plot_format', 'png'),
+            self.config.get('plot_workers')
+        )
+
+    def run_stress_tests(self) -> Dict[str, Any]:
+        """
+        Stress tests corrupt the full feature matrix and are skipped in chunked mode.
+
+        Returns:
+            Dictionary of stress test results
+        """
+        if not self.config.get('run_stress_tests', False):
+            return {}
+        return {'results': [], 'summary': 'Stress tests are not supported in chunked evaluation'}
@@ -1,6 +1,15 @@
 """Failure analysis and taxonomy."""
 
-from . import selector
-from . import taxonomy
+from ..lazy import attach
 
-__all__ = ['selector', 'taxonomy']
+__all__ = ['selector', 'taxonomy', 'reservoir', 'store', 'clustering', 'label_errors', 'FailureStore']
+
+__getattr__, __dir__ = attach(__name__, {
+    'selector': 'selector',
+    'taxonomy': 'taxonomy',
+    'reservoir': 'reservoir',
+    'store': 'store',
+    'clustering': 'clustering',
+    'label_errors': 'label_errors',
+    'FailureStore': 'store:FailureStore'
+})
@@ -0,0 +1,270 @@
+"""
+Failure clustering.
+
+Groups all misclassified rows (not only the selected examples) with
+mini-batch k-means, in standardized feature space or in a user-supplied
+embedding space. Fitting costs depend on the batch size and number of
+steps, not on the number of errors. Every row, correct or not, is then assigned to its nearest
+centroid in batches, so each cluster reports its error rate over the region
+of the space it covers, along with its size, centroid and the errors closest
+to the centroid as representative examples.
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+from ..slicing import columns
+
+
+DEFAULT_N_CLUSTERS = 8
+DEFAULT_BATCH_SIZE = 4096
+DEFAULT_N_REPRESENTATIVES = 3
+DEFAULT_N_STEPS = 100
+
+# Rows sampled for k-means++ initialization (per cluster)
+INIT_ROWS_PER_CLUSTER = 100
+
+# Rows per block when assigning rows to centroids
+ASSIGN_BLOCK_ROWS = 65536
+
+
+def feature_matrix(
+    data: Any,
+    feature_names: Optional[List[str]] = None
+) -> Tuple[np.ndarray, List[str]]:
+    """
+    Get the numeric feature columns as a float matrix.
+
+    Non-numeric DataFrame columns are left out; missing values are NaN.
+
+    Args:
+        data: Input data array or DataFrame, shape (n_samples, n_features)
+        feature_names: Optional list of feature names
+
+    Returns:
+        Tuple of (matrix of shape (n_samples, n_used), names of the used columns)
+    """
+    if columns.is_frame(data):
+        keys = [key for key in columns.feature_keys(data) if columns.is_numeric_column(data[key])]
+        matrix = np.column_stack([columns.column_values(data[key], float) for key in keys]) if keys else np.zeros((len(data), 0))
+    else:
+        data = np.asarray(data)
+        if not np.issubdtype(data.dtype, np.number):
+            raise ValueError("Failure clustering needs numeric features; pass cluster_embedding for other data")
+        matrix = data.reshape(len(data), -1).astype(float)
+        keys = list(range(matrix.shape[1]))
+    names = [columns.feature_label(data, key, feature_names) for key in keys]
+    return matrix, names
+
+
+def standardize(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Scale columns to zero mean and unit variance.
+
+    Args:
+        matrix: Float matrix, shape (n_samples, n_columns); may contain NaN
+
+    Returns:
+        Tuple of (scaled matrix with NaN set to 0, column means, column scales)
+    """
+    with np.errstate(invalid='ignore'):
+        mean = np.nanmean(matrix, axis=0) if len(matrix) else np.zeros(matrix.shape[1])
+        scale = np.nanstd(matrix, axis=0) if len(matrix) else np.ones(matrix.shape[1])
+    mean = np.nan_to_num(mean)
+    scale = np.where(np.isfinite(scale) & (scale > 0), scale, 1.0)
+    scaled = (matrix - mean) / scale
+    np.nan_to_num(scaled, copy=False, nan=0.0)
+    return scaled, mean, scale
+
+
+def _float_rows(rows: np.ndarray) -> np.ndarray:
+    """Convert a block of rows to float64 with NaN set to 0 (copies only the block)."""
+    return np.nan_to_num(np.asarray(rows, dtype=float))
+
+
+def assign_clusters(points: np.ndarray, centroids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assign rows to their nearest centroid, in blocks of rows.
+
+    Args:
+        points: Matrix of shape (n_samples, n_dims), of any numeric dtype
+            (e.g. a float32 memmap); NaN counts as 0
+        centroids: Matrix of shape (n_clusters, n_dims)
+
+    Returns:
+        Tuple of (cluster per row, Euclidean distance to that centroid)
+    """
+    labels = np.empty(len(points), dtype=np.int64)
+    distances = np.empty(len(points))
+    centroid_norms = np.einsum('ij,ij->i', centroids, centroids)
+
+    for start in range(0, len(points), ASSIGN_BLOCK_ROWS):
+        block = _float_rows(points[start:start + ASSIGN_BLOCK_ROWS])
+        # |x - c|^2 = |x|^2 - 2 x.c + |c|^2, with one matrix product per block
+        squared = centroid_norms - 2.0 * block @ centroids.T
+        nearest = np.argmin(squared, axis=1)
+        labels[start:start + len(block)] = nearest
+        block_norms = np.einsum('ij,ij->i', block, block)
+        distances[start:start + len(block)] = np.sqrt(np.maximum(squared[np.arange(len(block)), nearest] + block_norms, 0.0))
+    return labels, distances
+
+
+def kmeans_plus_plus(points: np.ndarray, n_clusters: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Choose initial centroids with k-means++ seeding.
+
+    Args:
+        points: Matrix of shape (n_samples, n_dims)
+        n_clusters: Number of centroids
+        rng: Random generator
+
+    Returns:
+        Initial centroids, shape (n_clusters, n_dims)
+    """
+    centroids = np.empty((n_clusters, points.shape[1]))
+    centroids[0] = points[rng.integers(len(points))]
+    closest = np.sum((points - centroids[0]) ** 2, axis=1)
+    for c in range(1, n_clusters):
+        total = closest.sum()
+        # Duplicate points only: any row will do
+        idx = rng.choice(len(points), p=closest / total) if total > 0 else rng.integers(len(points))
+        centroids[c] = points[idx]
+        closest = np.minimum(closest, np.sum((points - centroids[c]) ** 2, axis=1))
+    return centroids
+
+
+def minibatch_kmeans(
+    points: np.ndarray,
+    n_clusters: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    n_steps: int = DEFAULT_N_STEPS,
+    seed: int = 42,
+    tol: float = 1e-4,
+    rows: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Fit centroids with mini-batch k-means (Sculley, 2010).
+
+    Each step assigns one random batch of rows to the nearest centroids and
+    moves every centroid towards the mean of its batch rows, with a learning
+    rate of 1 / (rows assigned to it so far). The cost per step depends on
+    the batch size, not on the number of rows.
+
+    Args:
+        points: Matrix of shape (n_samples, n_dims), of any numeric dtype
+            (e.g. a float32 memmap); NaN counts as 0
+        n_clusters: Number of clusters (at most n_samples)
+        batch_size: Rows per step
+        n_steps: Maximum number of steps
+        seed: Random seed
+        tol: Stop when no centroid moves more than this (relative to the data scale)
+        rows: Optional row indices to fit on (batches are drawn from these
+            rows without copying them all)
+
+    Returns:
+        Centroids, shape (n_clusters, n_dims)
+    """
+    rng = np.random.default_rng(seed)
+    rows = np.arange(len(points)) if rows is None else rows
+    n = len(rows)
+    init_rows = _float_rows(points[rows[rng.choice(n, size=min(n, INIT_ROWS_PER_CLUSTER * n_clusters), replace=False)]])
+    centroids = kmeans_plus_plus(init_rows, n_clusters, rng)
+    counts = np.zeros(n_clusters)
+    threshold = tol * max(float(np.mean(np.var(init_rows, axis=0))), 1e-12)
+
+    for _ in range(n_steps):
+        batch = _float_rows(points[rows[rng.integers(0, n, size=min(batch_size, n))]])
+        labels, _ = assign_clusters(batch, centroids)
+        batch_counts = np.bincount(labels, minlength=n_clusters)
+        batch_sums = np.zeros_like(centroids)
+        np.add.at(batch_sums, labels, batch)
+
+        counts += batch_counts
+        hit = batch_counts > 0
+        previous = centroids.copy()
+        centroids[hit] += (batch_sums[hit] - batch_counts[hit, None] * centroids[hit]) / counts[hit, None]
+        if np.max(np.sum((centroids - previous) ** 2, axis=1)) < threshold:
+            break
+    return centroids
+
+
+def cluster_failures(
+    points: np.ndarray,
+    incorrect: np.ndarray,
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    n_clusters: int = DEFAULT_N_CLUSTERS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    n_representatives: int = DEFAULT_N_REPRESENTATIVES,
+    n_steps: int = DEFAULT_N_STEPS,
+    seed: int = 42,
+    dimension_names: Optional[List[str]] = None,
+    center: Optional[np.ndarray] = None,
+    scale: Optional[np.ndarray] = None
+) -> List[Dict[str, Any]]:
+    """
+    Cluster misclassified rows with mini-batch k-means.
+
+    Args:
+        points: Feature or embedding matrix of all rows, shape (n_samples, n_dims);
+            may be a memmap, rows are read in batches
+        incorrect: Boolean mask of misclassified rows
+        y_true: True labels
+        y_pred: Predicted labels
+        n_clusters: Number of clusters (capped at the number of errors)
+        batch_size: Mini-batch size for k-means
+        n_representatives: Errors closest to each centroid to report
+        n_steps: Maximum number of k-means steps
+        seed: Random seed
+        dimension_names: Optional names of the dimensions; centroids are
+            reported as {name: value} when given, as lists otherwise
+        center: Optional column means used to standardize points; centroids
+            are reported in the original units when center and scale are given
+        scale: Optional column scales used to standardize points
+
+    Returns:
+        List of clusters, largest first, each with the number of errors
+        ('size'), the rows assigned to it ('n_samples'), its 'error_rate',
+        'centroid' and 'representatives'
+    """
+    error_rows = np.flatnonzero(incorrect)
+    n_clusters = min(n_clusters, len(error_rows))
+    if n_clusters == 0 or points.shape[1] == 0:
+        return []
+
+    centroids = minibatch_kmeans(points, n_clusters, batch_size, n_steps, seed, rows=error_rows)
+
+    # Every row goes to its nearest centroid: errors for sizes and
+    # representatives, all rows for the error rate of each region
+    labels, distances = assign_clusters(points, centroids)
+    n_samples = np.bincount(labels, minlength=n_clusters)
+    sizes = np.bincount(labels[error_rows], minlength=n_clusters)
+
+    # Errors ordered by cluster, then by distance to the centroid
+    order = error_rows[np.lexsort((distances[error_rows], labels[error_rows]))]
+    bounds = np.concatenate([[0], np.cumsum(sizes)])
+
+    reported = centroids * scale + center if center is not None and scale is not None else centroids
+    clusters = []
+    for c in np.argsort(-sizes, kind='stable'):
+        if sizes[c] == 0:
+            continue
+        centroid = reported[c].tolist()
+        if dimension_names is not None:
+            centroid = dict(zip(dimension_names, centroid))
+        clusters.append({
+            'cluster': int(c),
+            'size': int(sizes[c]),
+            'n_samples': int(n_samples[c]),
+            'error_rate': float(sizes[c] / n_samples[c]),
+            'centroid': centroid,
+            'representatives': [
+                {
+                    'index': int(idx),
+                    'true_label': np.asarray(y_true)[idx].tolist(),
+                    'predicted_label': np.asarray(y_pred)[idx].tolist(),
+                    'distance': float(distances[idx])
+                }
+                for idx in order[bounds[c]:bounds[c] + n_representatives]
+            ]
+        })
+    return clusters
@@ -0,0 +1,142 @@
+"""
+Label error detection with confident learning.
+
+Finds rows whose given label is probably wrong, from the predicted
+probabilities alone (Northcutt et al., "Confident Learning", 2021):
+
+1. The threshold of class j is the mean predicted probability of j over the
+   rows labeled j (one bincount weighted by each row's self-confidence).
+2. A row is confidently counted as class j when p_j reaches j's threshold
+   (the most probable such class if several do). Counting (given label,
+   confident class) pairs with one bincount gives the confident joint.
+3. Rows off the diagonal of the confident joint are likely label errors;
+   they are ranked by normalized margin, p(given label) - max p(other class).
+
+Probabilities are read in row chunks, so inputs with millions of rows and
+thousands of classes (including memory-mapped arrays) are processed without
+materializing more than one chunk.
+"""
+
+import numpy as np
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+# Upper bound on probability elements materialized at once
+CHUNK_ELEMENTS = 2 ** 22
+
+
+def _chunks(proba: np.ndarray, chunk_elements: int) -> Iterator[Tuple[int, np.ndarray]]:
+    """Yield (start row, 2-D float chunk) pairs; 1-D probabilities become two columns."""
+    n_columns = 2 if proba.ndim == 1 else proba.shape[1]
+    step = max(1, chunk_elements // n_columns)
+    for start in range(0, len(proba), step):
+        chunk = np.asarray(proba[start:start + step])
+        if not np.issubdtype(chunk.dtype, np.floating):
+            chunk = chunk.astype(float)
+        # float32 inputs stay float32 (half the memory traffic)
+        if chunk.ndim == 1:
+            chunk = np.column_stack([1.0 - chunk, chunk])
+        yield start, chunk
+
+
+def class_thresholds(
+    labels: np.ndarray,
+    proba: np.ndarray,
+    n_classes: Optional[int] = None,
+    chunk_elements: int = CHUNK_ELEMENTS
+) -> np.ndarray:
+    """
+    Compute the per-class confidence thresholds.
+
+    Args:
+        labels: Given labels as class indices (columns of proba)
+        proba: Predicted probabilities, shape (n_samples, n_classes), or
+            (n_samples,) for binary tasks
+        n_classes: Number of classes (default: from proba)
+        chunk_elements: Probability elements processed per chunk
+
+    Returns:
+        Mean self-confidence per class, shape (n_classes,); infinite for
+        classes with no labeled rows (no row is confidently counted as them)
+    """
+    n_classes = n_classes or (2 if proba.ndim == 1 else proba.shape[1])
+    sums = np.zeros(n_classes)
+    for start, chunk in _chunks(proba, chunk_elements):
+        given = labels[start:start + len(chunk)]
+        sums += np.bincount(given, weights=chunk[np.arange(len(chunk)), given], minlength=n_classes)
+
+    counts = np.bincount(labels, minlength=n_classes)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, sums / np.maximum(counts, 1), np.inf)
+
+
+def find_label_errors(
+    labels: np.ndarray,
+    proba: np.ndarray,
+    n_classes: Optional[int] = None,
+    chunk_elements: int = CHUNK_ELEMENTS
+) -> Dict[str, Any]:
+    """
+    Find likely label errors with confident learning.
+
+    Args:
+        labels: Given labels as class indices (columns of proba)
+        proba: Predicted probabilities, shape (n_samples, n_classes), or
+            (n_samples,) for binary tasks
+        n_classes: Number of classes (default: from proba)
+        chunk_elements: Probability elements processed per chunk
+
+    Returns:
+        Dictionary with 'thresholds' (per class), 'confident_joint'
+        (n_classes x n_classes counts, rows are given labels), 'indices' of
+        the likely label errors ranked most suspicious first, and their
+        'suggested_labels' (confident class) and 'margins'
+    """
+    labels = np.asarray(labels, dtype=np.int64)
+    n_classes = n_classes or (2 if proba.ndim == 1 else proba.shape[1])
+    if len(labels) != len(proba):
+        raise ValueError(f"Length mismatch: labels ({len(labels)}) vs proba ({len(proba)})")
+    if len(labels) and (labels.min() < 0 or labels.max() >= n_classes):
+        raise ValueError(f"Labels must be class indices in [0, {n_classes})")
+
+    thresholds = class_thresholds(labels, proba, n_classes, chunk_elements)
+
+    joint = np.zeros(n_classes * n_classes, dtype=np.int64)
+    issue_rows, suggested, margins = [], [], []
+    for start, chunk in _chunks(proba, chunk_elements):
+        given = labels[start:start + len(chunk)]
+        rows = np.arange(len(chunk))
+
+        # Most probable class among those reaching their threshold (-1 if none)
+        above = chunk >= thresholds.astype(chunk.dtype)
+        confident = np.argmax(np.where(above, chunk, chunk.dtype.type(-1)), axis=1)
+        counted = above[rows, confident]
+        joint += np.bincount(given[counted] * n_classes + confident[counted], minlength=n_classes * n_classes)
+
+        off_diagonal = np.flatnonzero(counted & (confident != given))
+        if len(off_diagonal) == 0:
+            continue
+
+        # Normalized margin of the flagged rows: p(given) - max p(other)
+        flagged = chunk[off_diagonal]
+        flagged_given = given[off_diagonal]
+        self_confidence = flagged[np.arange(len(off_diagonal)), flagged_given].astype(float)
+        flagged[np.arange(len(off_diagonal)), flagged_given] = -np.inf
+        issue_rows.append(start + off_diagonal)
+        suggested.append(confident[off_diagonal])
+        margins.append(self_confidence - flagged.max(axis=1))
+
+    if issue_rows:
+        issue_rows, suggested, margins = (np.concatenate(parts) for parts in (issue_rows, suggested, margins))
+    else:
+        issue_rows, suggested, margins = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+
+    # Most suspicious (most negative margin) first; ties by row
+    order = np.lexsort((issue_rows, margins))
+    return {
+        'thresholds': thresholds,
+        'confident_joint': joint.reshape(n_classes, n_classes),
+        'indices': issue_rows[order],
+        'suggested_labels': suggested[order],
+        'margins': margins[order]
+    }
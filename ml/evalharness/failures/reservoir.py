@@ -0,0 +1,146 @@
+"""
+Bounded-memory failure example trackers for chunked evaluation.
+
+Both trackers keep at most k rows (per group) plus their payload columns,
+so failure examples can be selected from evaluation sets that never fit
+in memory at once.
+"""
+
+import numpy as np
+from typing import Dict, Optional
+
+
+def _concat_payload(kept: Dict[str, np.ndarray], new: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Append new payload columns to the kept ones."""
+    if not kept:
+        return {name: np.asarray(values) for name, values in new.items()}
+    return {name: np.concatenate([kept[name], np.asarray(new[name])]) for name in kept}
+
+
+def _take_payload(payload: Dict[str, np.ndarray], positions: np.ndarray) -> Dict[str, np.ndarray]:
+    """Select rows from every payload column."""
+    return {name: values[positions] for name, values in payload.items()}
+
+
+class TopK:
+    """
+    Track the k rows with the largest (or smallest) score across batches.
+    """
+
+    def __init__(self, k: int, largest: bool = True):
+        """
+        Initialize tracker.
+
+        Args:
+            k: Number of rows to keep
+            largest: Keep the highest scores (True) or the lowest (False)
+        """
+        self.k = k
+        self.largest = largest
+        self.scores = np.empty(0)
+        self.payload: Dict[str, np.ndarray] = {}
+
+    def update(self, scores: np.ndarray, **payload: np.ndarray):
+        """
+        Offer a batch of candidate rows.
+
+        Args:
+            scores: Score per candidate row
+            **payload: Per-row columns to keep alongside the score (e.g. index, true_label)
+        """
+        if len(scores) == 0 or self.k <= 0:
+            return
+
+        scores = np.concatenate([self.scores, np.asarray(scores, dtype=float)])
+        payload = _concat_payload(self.payload, payload)
+
+        if len(scores) > self.k:
+            keys = -scores if self.largest else scores
+            keep = np.argpartition(keys, self.k - 1)[:self.k]
+            scores = scores[keep]
+            payload = _take_payload(payload, keep)
+
+        self.scores = scores
+        self.payload = payload
+
+    def result(self) -> Dict[str, np.ndarray]:
+        """
+        Get kept rows ordered by score.
+
+        Returns:
+            Dictionary with 'score' and all payload columns
+        """
+        order = np.argsort(-self.scores if self.largest else self.scores, kind='stable')
+        result = _take_payload(self.payload, order)
+        result['score'] = self.scores[order]
+        return result
+
+
+class GroupedReservoir:
+    """
+    Uniform sample of up to k rows per group, across batches.
+
+    Each row gets a random key and every group keeps its k smallest keys
+    (bottom-k sampling). Taking the k smallest keys over the union of several
+    groups therefore gives a uniform sample of the union, so fine-grained
+    groups can be merged into coarser slices after the pass.
+    """
+
+    def __init__(self, k: int, seed: int = 42):
+        """
+        Initialize reservoir.
+
+        Args:
+            k: Number of rows to keep per group
+            seed: Random seed for the sampling keys
+        """
+        self.k = k
+        self.rng = np.random.default_rng(seed)
+        self.groups = np.empty(0, dtype=np.int64)
+        self.keys = np.empty(0)
+        self.payload: Dict[str, np.ndarray] = {}
+
+    def update(self, groups: np.ndarray, **payload: np.ndarray):
+        """
+        Offer a batch of rows.
+
+        Args:
+            groups: Group id per row (negative ids are ignored)
+            **payload: Per-row columns to keep (e.g. index, true_label)
+        """
+        groups = np.asarray(groups, dtype=np.int64)
+        valid = groups >= 0
+        if not np.any(valid) or self.k <= 0:
+            return
+
+        groups = np.concatenate([self.groups, groups[valid]])
+        keys = np.concatenate([self.keys, self.rng.random(int(valid.sum()))])
+        payload = _concat_payload(self.payload, {name: np.asarray(values)[valid] for name, values in payload.items()})
+
+        # Sort by (group, key) and keep the first k rows of each group
+        order = np.lexsort((keys, groups))
+        sorted_groups = groups[order]
+        group_start = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+        run_lengths = np.diff(np.r_[group_start, len(sorted_groups)])
+        rank = np.arange(len(sorted_groups)) - np.repeat(group_start, run_lengths)
+        keep = order[rank < self.k]
+
+        self.groups = groups[keep]
+        self.keys = keys[keep]
+        self.payload = _take_payload(payload, keep)
+
+    def sample(self, group_ids: np.ndarray, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Get a uniform sample from the union of some groups.
+
+        Args:
+            group_ids: Groups to sample from
+            n: Sample size (defaults to k)
+
+        Returns:
+            Dictionary of payload columns for the sampled rows
+        """
+        n = self.k if n is None else n
+        candidates = np.flatnonzero(np.isin(self.groups, group_ids))
+        chosen = candidates[np.argsort(self.keys[candidates], kind='stable')[:n]]
+        return _take_payload(self.payload, chosen)
@@ -5,7 +5,120 @@ Identifies interesting failure cases for investigation.
 """
 
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from .store import FailureStore
+from ..core.rng import make_rng
+
+if TYPE_CHECKING:
+    from ..core.context import EvalContext
+
+
+def top_k_indices(
+    values: np.ndarray,
+    k: int,
+    largest: bool = True,
+    mask: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Select the rows with the k largest (or smallest) values in O(n).
+
+    Uses np.argpartition instead of a full sort; only the k selected rows are
+    sorted. Ties are broken by row index, so the result is deterministic.
+
+    Args:
+        values: Value per row (e.g. confidences)
+        k: Number of rows to select
+        largest: Select the largest values (otherwise the smallest)
+        mask: Optional boolean mask of candidate rows
+
+    Returns:
+        Row indices ordered from the most to the least extreme value
+    """
+    rows = np.flatnonzero(mask) if mask is not None else None
+    candidates = values[rows] if rows is not None else values
+    k = min(k, len(candidates))
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+
+    keys = -candidates if largest else candidates
+    if k < len(keys):
+        kth = keys[np.argpartition(keys, k - 1)[k - 1]]
+        # Everything strictly better than the k-th value, then ties by position
+        chosen = np.flatnonzero(keys < kth)
+        tied = np.flatnonzero(keys == kth)[:k - len(chosen)]
+        chosen = np.concatenate([chosen, tied])
+    else:
+        chosen = np.arange(len(keys))
+
+    chosen = chosen[np.lexsort((chosen, keys[chosen]))]
+    return rows[chosen] if rows is not None else chosen
+
+
+def _context(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    y_proba: Optional[np.ndarray],
+    ctx: Optional['EvalContext']
+) -> 'EvalContext':
+    """Get the shared context, or one over these arrays (computes each per-row vector once)."""
+    if ctx is not None:
+        return ctx
+    from ..core.context import EvalContext
+    return EvalContext(y_true, y_pred, y_proba)
+
+
+def _confidence_store(
+    failure_type: str,
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    y_proba: Optional[np.ndarray],
+    n: int,
+    data: Optional[np.ndarray],
+    ctx: 'EvalContext'
+) -> FailureStore:
+    """Select the most confident errors or least confident correct predictions."""
+    if y_proba is None:
+        # Can't select by confidence without probabilities
+        return FailureStore.from_examples([])
+
+    if failure_type == 'high_confidence_wrong':
+        selected = top_k_indices(ctx.confidences, n, largest=True, mask=~ctx.correct)
+    else:
+        selected = top_k_indices(ctx.confidences, n, largest=False, mask=ctx.correct)
+    return FailureStore.from_selection(failure_type, selected, y_true, y_pred, ctx.confidences, data)
+
+
+def _worst_slice_store(
+    slices: List[Dict[str, Any]],
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    y_proba: Optional[np.ndarray],
+    n: int,
+    data: Optional[np.ndarray],
+    ctx: 'EvalContext',
+    rng: np.random.Generator
+) -> FailureStore:
+    """Sample errors from the worst slice, if it is significantly worse than the rest."""
+    from ..slicing.significance import worst_slice as get_worst_slice
+    worst_slice = get_worst_slice(slices or [])
+    if worst_slice is None:
+        return FailureStore.from_examples([])
+
+    slice_indices = np.asarray(worst_slice['indices'])
+
+    # Find incorrect predictions in this slice
+    incorrect_slice_indices = slice_indices[~ctx.correct[slice_indices]]
+
+    # Get a sample of errors from this slice
+    sample_size = min(n, len(incorrect_slice_indices))
+    sampled_indices = rng.choice(incorrect_slice_indices, size=sample_size, replace=False)
+
+    return FailureStore.from_selection(
+        'worst_slice_error', sampled_indices, y_true, y_pred,
+        confidences=ctx.confidences if y_proba is not None else None,
+        data=data,
+        slice_name=worst_slice['slice_name']
+    )
 
 
 def select_top_confident_wrong(
@@ -13,7 +126,8 @@ def select_top_confident_wrong(
     y_pred: np.ndarray,
     y_proba: Optional[np.ndarray] = None,
     n: int = 10,
-    data: Optional[np.ndarray] = None
+    data: Optional[np.ndarray] = None,
+    ctx: Optional['EvalContext'] = None
 ) -> List[Dict[str, Any]]:
     """
     Select top N examples where model was confident but wrong.
@@ -26,49 +140,13 @@ def select_top_confident_wrong(
         y_proba: Predicted probabilities
         n: Number of examples to return
         data: Optional input features
+        ctx: Shared evaluation context (optional, reuses confidences and correctness)
 
     Returns:
         List of failure examples with metadata
     """
-    if y_proba is None:
-        # Can't select by confidence without probabilities
-        return []
-
-    # Find incorrect predictions
-    incorrect_mask = y_pred != y_true
-
-    if not np.any(incorrect_mask):
-        return []  # No errors!
-
-    # Get confidences for incorrect predictions
-    if y_proba.ndim == 1:
-        confidences = y_proba[incorrect_mask]
-    else:
-        confidences = np.max(y_proba[incorrect_mask], axis=1)
-
-    # Get indices of incorrect predictions
-    incorrect_indices = np.where(incorrect_mask)[0]
-
-    # Sort by confidence (descending)
-    sorted_indices = np.argsort(confidences)[::-1][:n]
-
-    failures = []
-    for i in sorted_indices:
-        idx = incorrect_indices[i]
-        failure = {
-            'index': int(idx),
-            'true_label': int(y_true[idx]) if np.isscalar(y_true[idx]) else y_true[idx].tolist(),
-            'predicted_label': int(y_pred[idx]) if np.isscalar(y_pred[idx]) else y_pred[idx].tolist(),
-            'confidence': float(confidences[i]),
-            'failure_type': 'high_confidence_wrong'
-        }
-
-        if data is not None:
-            failure['features'] = data[idx].tolist() if data.ndim > 1 else float(data[idx])
-
-        failures.append(failure)
-
-    return failures
+    ctx = _context(y_true, y_pred, y_proba, ctx)
+    return _confidence_store('high_confidence_wrong', y_true, y_pred, y_proba, n, data, ctx).to_examples()
 
 
 def select_low_confidence_correct(
@@ -76,7 +154,8 @@ def select_low_confidence_correct(
     y_pred: np.ndarray,
     y_proba: Optional[np.ndarray] = None,
     n: int = 10,
-    data: Optional[np.ndarray] = None
+    data: Optional[np.ndarray] = None,
+    ctx: Optional['EvalContext'] = None
 ) -> List[Dict[str, Any]]:
     """
     Select top N examples where model was correct but uncertain.
@@ -89,48 +168,13 @@ def select_low_confidence_correct(
         y_proba: Predicted probabilities
         n: Number of examples to return
         data: Optional input features
+        ctx: Shared evaluation context (optional, reuses confidences and correctness)
 
     Returns:
         List of examples with metadata
     """
-    if y_proba is None:
-        return []
-
-    # Find correct predictions
-    correct_mask = y_pred == y_true
-
-    if not np.any(correct_mask):
-        return []
-
-    # Get confidences for correct predictions
-    if y_proba.ndim == 1:
-        confidences = y_proba[correct_mask]
-    else:
-        confidences = np.max(y_proba[correct_mask], axis=1)
-
-    # Get indices of correct predictions
-    correct_indices = np.where(correct_mask)[0]
-
-    # Sort by confidence (ascending)
-    sorted_indices = np.argsort(confidences)[:n]
-
-    examples = []
-    for i in sorted_indices:
-        idx = correct_indices[i]
-        example = {
-            'index': int(idx),
-            'true_label': int(y_true[idx]) if np.isscalar(y_true[idx]) else y_true[idx].tolist(),
-            'predicted_label': int(y_pred[idx]) if np.isscalar(y_pred[idx]) else y_pred[idx].tolist(),
-            'confidence': float(confidences[i]),
-            'failure_type': 'low_confidence_correct'
-        }
-
-        if data is not None:
-            example['features'] = data[idx].tolist() if data.ndim > 1 else float(data[idx])
-
-        examples.append(example)
-
-    return examples
+    ctx = _context(y_true, y_pred, y_proba, ctx)
+    return _confidence_store('low_confidence_correct', y_true, y_pred, y_proba, n, data, ctx).to_examples()
 
 
 def select_worst_slice_errors(
@@ -139,11 +183,18 @@ def select_worst_slice_errors(
     y_pred: np.ndarray,
     y_proba: Optional[np.ndarray] = None,
     n: int = 5,
-    data: Optional[np.ndarray] = None
+    data: Optional[np.ndarray] = None,
+    ctx: Optional['EvalContext'] = None,
+    seed: int = 42,
+    rng: Optional[np.random.Generator] = None
 ) -> List[Dict[str, Any]]:
     """
     Select errors from the worst-performing slice.
 
+    When the slices were tested (see slicing.significance.rank_slices), errors
+    are only sampled from a slice that is significantly worse than the rest
+    of the data.
+
     Args:
         slices: List of slice results (sorted by performance)
         y_true: True labels
@@ -151,52 +202,56 @@ def select_worst_slice_errors(
         y_proba: Predicted probabilities
         n: Number of examples to return per slice
         data: Optional input features
+        ctx: Shared evaluation context (optional, reuses correctness and confidences)
+        seed: Random seed for sampling the slice errors
+        rng: Optional random generator (overrides seed)
 
     Returns:
         List of failure examples from worst slices
     """
-    if not slices:
-        return []
-
-    # Get worst slice (last in sorted list)
-    worst_slice = slices[-1]
-    slice_indices = np.array(worst_slice['indices'])
-
-    # Find incorrect predictions in this slice
-    y_true_slice = y_true[slice_indices]
-    y_pred_slice = y_pred[slice_indices]
-    incorrect_mask = y_pred_slice != y_true_slice
-
-    if not np.any(incorrect_mask):
-        return []
-
-    # Get a sample of errors from this slice
-    incorrect_slice_indices = slice_indices[incorrect_mask]
-    sample_size = min(n, len(incorrect_slice_indices))
-    sampled_indices = np.random.choice(incorrect_slice_indices, size=sample_size, replace=False)
+    ctx = _context(y_true, y_pred, y_proba, ctx)
+    return _worst_slice_store(slices, y_true, y_pred, y_proba, n, data, ctx, make_rng(seed, rng)).to_examples()
 
-    failures = []
-    for idx in sampled_indices:
-        failure = {
-            'index': int(idx),
-            'true_label': int(y_true[idx]) if np.isscalar(y_true[idx]) else y_true[idx].tolist(),
-            'predicted_label': int(y_pred[idx]) if np.isscalar(y_pred[idx]) else y_pred[idx].tolist(),
-            'failure_type': 'worst_slice_error',
-            'slice_name': worst_slice['slice_name']
-        }
 
-        if y_proba is not None:
-            if y_proba.ndim == 1:
-                failure['confidence'] = float(y_proba[idx])
-            else:
-                failure['confidence'] = float(np.max(y_proba[idx]))
+def select_failure_store(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    y_proba: Optional[np.ndarray] = None,
+    slices: Optional[List[Dict[str, Any]]] = None,
+    data: Optional[np.ndarray] = None,
+    n_per_type: int = 10,
+    ctx: Optional['EvalContext'] = None,
+    seed: int = 42,
+    rng: Optional[np.random.Generator] = None
+) -> FailureStore:
+    """
+    Select all types of failure examples into a columnar store.
 
-        if data is not None:
-            failure['features'] = data[idx].tolist() if data.ndim > 1 else float(data[idx])
+    Feature rows are gathered once per failure type into one block; no
+    per-example dictionaries are built.
 
-        failures.append(failure)
+    Args:
+        y_true: True labels
+        y_pred: Predicted labels
+        y_proba: Predicted probabilities
+        slices: Slice results
+        data: Optional input features
+        n_per_type: Number of examples per failure type
+        ctx: Shared evaluation context (optional)
+        seed: Random seed for sampling the worst-slice errors
+        rng: Optional random generator (overrides seed)
 
-    return failures
+    Returns:
+        FailureStore with the high-confidence errors, low-confidence correct
+        predictions and worst-slice errors, in that order
+    """
+    # Confidences and correctness are computed once for all failure types
+    ctx = _context(y_true, y_pred, y_proba, ctx)
+    return FailureStore.concat([
+        _confidence_store('high_confidence_wrong', y_true, y_pred, y_proba, n_per_type, data, ctx),
+        _confidence_store('low_confidence_correct', y_true, y_pred, y_proba, n_per_type, data, ctx),
+        _worst_slice_store(slices, y_true, y_pred, y_proba, n_per_type, data, ctx, make_rng(seed, rng))
+    ])
 
 
 def select_all_failure_examples(
@@ -205,7 +260,10 @@ def select_all_failure_examples(
     y_proba: Optional[np.ndarray] = None,
     slices: Optional[List[Dict[str, Any]]] = None,
     data: Optional[np.ndarray] = None,
-    n_per_type: int = 10
+    n_per_type: int = 10,
+    ctx: Optional['EvalContext'] = None,
+    seed: int = 42,
+    rng: Optional[np.random.Generator] = None
 ) -> List[Dict[str, Any]]:
     """
     Select all types of failure examples.
@@ -217,26 +275,11 @@ def select_all_failure_examples(
         slices: Slice results
         data: Optional input features
         n_per_type: Number of examples per failure type
+        ctx: Shared evaluation context (optional)
+        seed: Random seed for sampling the worst-slice errors
+        rng: Optional random generator (overrides seed)
 
     Returns:
         Combined list of all failure examples
     """
-    all_failures = []
-
-    # High confidence wrong
-    all_failures.extend(
-        select_top_confident_wrong(y_true, y_pred, y_proba, n_per_type, data)
-    )
-
-    # Low confidence correct
-    all_failures.extend(
-        select_low_confidence_correct(y_true, y_pred, y_proba, n_per_type, data)
-    )
-
-    # Worst slice errors
-    if slices:
-        all_failures.extend(
-            select_worst_slice_errors(slices, y_true, y_pred, y_proba, n_per_type, data)
-        )
-
-    return all_failures
+    return select_failure_store(y_true, y_pred, y_proba, slices, data, n_per_type, ctx, seed, rng).to_examples()
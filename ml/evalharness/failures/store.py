@@ -0,0 +1,303 @@
+"""
+Columnar failure example store.
+
+Failure examples are held as columns (index, labels, confidence, failure
+type, ...) plus one (k, d) block of feature rows gathered once from the
+input data, instead of one dictionary with a feature list per example. The
+store is written as one `.npy` file per column (features as `.npy`, or
+`.parquet` for mixed-type DataFrame rows), and the JSON report only keeps
+references to those files.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+import numpy as np
+import pandas as pd
+
+
+# Column order; 'confidence' is NaN and string columns are '' where absent
+COLUMNS = ('index', 'true_label', 'predicted_label', 'confidence', 'failure_type', 'slice_name', 'taxonomy_category')
+
+MANIFEST_FILE = 'store.json'
+
+Features = Union[np.ndarray, pd.DataFrame]
+
+
+def _gather(data: Features, indices: np.ndarray) -> Features:
+    """Gather the feature rows of the selected indices in one block."""
+    if isinstance(data, pd.DataFrame):
+        return data.iloc[indices].reset_index(drop=True)
+    return np.asarray(data)[indices]
+
+
+def _concat_features(blocks: List[Features]) -> Optional[Features]:
+    """Concatenate feature blocks (None if any store has no features)."""
+    if not blocks or any(block is None for block in blocks):
+        return None
+    if isinstance(blocks[0], pd.DataFrame):
+        return pd.concat(blocks, ignore_index=True)
+    return np.concatenate(blocks)
+
+
+def _as_column(values: Any) -> np.ndarray:
+    """Convert a column to an array that can be saved without pickling."""
+    values = np.asarray(values)
+    if values.dtype.hasobject:
+        values = values.astype(str)
+    return values
+
+
+class FailureStore:
+    """
+    Failure examples as columns plus a block of feature rows.
+
+    Row i of every column and of the features belongs to the same example.
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, np.ndarray],
+        features: Optional[Features] = None
+    ):
+        """
+        Initialize failure store.
+
+        Args:
+            columns: Per-example columns (see COLUMNS); 'index', 'true_label',
+                'predicted_label' and 'failure_type' are required
+            features: Optional feature rows, shape (n_examples, n_features)
+        """
+        missing = [name for name in ('index', 'true_label', 'predicted_label', 'failure_type') if name not in columns]
+        if missing:
+            raise ValueError(f"Failure store is missing columns: {missing}")
+
+        n = len(columns['index'])
+        self.columns = {name: _as_column(values) for name, values in columns.items()}
+        self.columns['index'] = self.columns['index'].astype(np.int64)
+        self.columns.setdefault('confidence', np.full(n, np.nan))
+
+        for name, values in self.columns.items():
+            if len(values) != n:
+                raise ValueError(f"Column '{name}' has {len(values)} rows, expected {n}")
+        if features is not None and len(features) != n:
+            raise ValueError(f"Features have {len(features)} rows, expected {n}")
+        self.features = features
+
+    @classmethod
+    def from_selection(
+        cls,
+        failure_type: str,
+        indices: np.ndarray,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        confidences: Optional[np.ndarray] = None,
+        data: Optional[Features] = None,
+        slice_name: Optional[str] = None
+    ) -> 'FailureStore':
+        """
+        Build a store from selected row indices of the evaluation arrays.
+
+        Args:
+            failure_type: Failure type of every selected row
+            indices: Selected row indices
+            y_true: True labels (all rows)
+            y_pred: Predicted labels (all rows)
+            confidences: Confidence per row (all rows, optional)
+            data: Input features (all rows, optional)
+            slice_name: Slice the rows were selected from (optional)
+
+        Returns:
+            FailureStore with one example per index
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        n = len(indices)
+        columns = {
+            'index': indices,
+            'true_label': np.asarray(y_true)[indices],
+            'predicted_label': np.asarray(y_pred)[indices],
+            'failure_type': np.full(n, failure_type)
+        }
+        if confidences is not None:
+            columns['confidence'] = np.asarray(confidences, dtype=float)[indices]
+        if slice_name is not None:
+            columns['slice_name'] = np.full(n, slice_name)
+
+        features = _gather(data, indices) if data is not None else None
+        return cls(columns, features)
+
+    @classmethod
+    def from_examples(cls, examples: Sequence[Dict[str, Any]]) -> 'FailureStore':
+        """
+        Build a store from failure example dictionaries.
+
+        Args:
+            examples: Failure examples (as returned by the selectors)
+
+        Returns:
+            FailureStore
+        """
+        columns: Dict[str, Any] = {}
+        for name in COLUMNS:
+            if not any(name in example for example in examples):
+                continue
+            if name == 'confidence':
+                columns[name] = [example.get(name, np.nan) for example in examples]
+            elif name in ('slice_name', 'taxonomy_category'):
+                columns[name] = [example.get(name, '') for example in examples]
+            else:
+                columns[name] = [example[name] for example in examples]
+
+        if not examples:
+            columns = {name: np.zeros(0, dtype=np.int64) for name in ('index', 'true_label', 'predicted_label')}
+            columns['failure_type'] = np.zeros(0, dtype=str)
+
+        features = None
+        if examples and all('features' in example for example in examples):
+            rows = [example['features'] for example in examples]
+            features = np.asarray(rows)
+            if features.dtype.kind in 'USO':
+                # Mixed-type rows stay objects (written as Parquet)
+                features = np.asarray(rows, dtype=object)
+        return cls(columns, features)
+
+    @classmethod
+    def concat(cls, stores: Sequence['FailureStore']) -> 'FailureStore':
+        """
+        Concatenate stores.
+
+        Columns missing from some stores are filled with NaN/''; features are
+        kept only if every store has them.
+
+        Args:
+            stores: Stores to concatenate, in order
+
+        Returns:
+            Combined FailureStore
+        """
+        # Empty stores add no rows (and do not drop the features of the others)
+        stores = [store for store in stores if len(store)] or list(stores[:1])
+        if not stores:
+            return cls.from_examples([])
+
+        names = [name for name in COLUMNS if any(name in store.columns for store in stores)]
+        columns = {}
+        for name in names:
+            parts = []
+            for store in stores:
+                if name in store.columns:
+                    parts.append(store.columns[name])
+                else:
+                    parts.append(np.full(len(store), np.nan if name == 'confidence' else ''))
+            columns[name] = np.concatenate(parts)
+
+        return cls(columns, _concat_features([store.features for store in stores]))
+
+    def __len__(self) -> int:
+        return len(self.columns['index'])
+
+    def to_examples(self, include_features: bool = True) -> List[Dict[str, Any]]:
+        """
+        Convert to failure example dictionaries.
+
+        Args:
+            include_features: Add each example's feature row under 'features'
+
+        Returns:
+            List of failure examples (absent confidences and names are omitted)
+        """
+        columns = {name: self.columns[name].tolist() for name in COLUMNS if name in self.columns}
+        features = None
+        if include_features and self.features is not None:
+            if isinstance(self.features, pd.DataFrame):
+                features = self.features.to_numpy(dtype=object).tolist()
+            else:
+                features = self.features.tolist()
+
+        examples = []
+        for i in range(len(self)):
+            example = {'index': columns['index'][i], 'true_label': columns['true_label'][i],
+                       'predicted_label': columns['predicted_label'][i]}
+            confidence = columns['confidence'][i]
+            if not np.isnan(confidence):
+                example['confidence'] = confidence
+            example['failure_type'] = columns['failure_type'][i]
+            for name in ('slice_name', 'taxonomy_category'):
+                if name in columns and columns[name][i] != '':
+                    example[name] = columns[name][i]
+            if features is not None:
+                example['features'] = features[i]
+            examples.append(example)
+        return examples
+
+    def save(self, directory: Union[str, Path], base_dir: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+        """
+        Write the store as one file per column.
+
+        Columns are written as `.npy` files. Numeric features are written as
+        one `.npy` block; DataFrame or object features as `.parquet`
+        (requires pyarrow). A small manifest (store.json) lists the files.
+
+        Args:
+            directory: Directory to write to (created if needed)
+            base_dir: Directory the returned paths are relative to (default: directory)
+
+        Returns:
+            References to the written files: {'n_examples', 'columns': {name: path},
+            'features': path or None, 'feature_names': list or None}
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        files: Dict[str, Any] = {'n_examples': len(self), 'columns': {}, 'features': None, 'feature_names': None}
+        for name, values in self.columns.items():
+            np.save(directory / f'{name}.npy', values, allow_pickle=False)
+            files['columns'][name] = f'{name}.npy'
+
+        if self.features is not None:
+            features = self.features
+            if not isinstance(features, pd.DataFrame) and features.dtype.hasobject:
+                features = pd.DataFrame(features)
+            if isinstance(features, pd.DataFrame):
+                files['feature_names'] = [str(column) for column in features.columns]
+                frame = features.set_axis(files['feature_names'], axis=1)
+                try:
+                    frame.to_parquet(directory / 'features.parquet', index=False)
+                    files['features'] = 'features.parquet'
+                except ImportError:
+                    print("Warning: Writing failure example features requires pyarrow. Install with: pip install pyarrow")
+            else:
+                np.save(directory / 'features.npy', features, allow_pickle=False)
+                files['features'] = 'features.npy'
+
+        with open(directory / MANIFEST_FILE, 'w') as f:
+            json.dump(files, f, indent=2)
+
+        # References relative to base_dir (e.g. the eval directory of a report)
+        prefix = directory.relative_to(base_dir) if base_dir is not None else Path('.')
+        references = dict(files, columns={name: str(prefix / path) for name, path in files['columns'].items()})
+        if files['features']:
+            references['features'] = str(prefix / files['features'])
+        return references
+
+    @classmethod
+    def load(cls, directory: Union[str, Path]) -> 'FailureStore':
+        """
+        Read a store written by save().
+
+        Args:
+            directory: Directory passed to save()
+
+        Returns:
+            FailureStore
+        """
+        directory = Path(directory)
+        with open(directory / MANIFEST_FILE) as f:
+            files = json.load(f)
+
+        columns = {name: np.load(directory / path, allow_pickle=False) for name, path in files['columns'].items()}
+        features = None
+        if files['features']:
+            path = directory / files['features']
+            features = pd.read_parquet(path) if path.suffix == '.parquet' else np.load(path, allow_pickle=False)
+        return cls(columns, features)
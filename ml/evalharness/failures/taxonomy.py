@@ -11,7 +11,11 @@ Six-category taxonomy for ML failures:
 """
 
 from enum import Enum
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from ..core.context import EvalContext
 
 
 class FailureCategory(Enum):
@@ -24,6 +28,15 @@ class FailureCategory(Enum):
     HUMAN = "human"
 
 
+# int8 code per category (enum order); rows that are not failures get NO_FAILURE
+CATEGORY_CODES = {category: code for code, category in enumerate(FailureCategory)}
+NO_FAILURE = -1
+
+# Rows with a smaller top-2 margin, or a larger normalized entropy, are uncertain
+DEFAULT_MARGIN_THRESHOLD = 0.1
+DEFAULT_ENTROPY_THRESHOLD = 0.8
+
+
 TAXONOMY_DESCRIPTIONS = {
     FailureCategory.DATA: {
         "name": "Data Failures",
@@ -118,10 +131,84 @@ def categorize_failure(failure: Dict[str, Any]) -> FailureCategory:
     elif failure_type == 'worst_slice_error':
         return FailureCategory.DATA
 
+    # Likely mislabeled rows (confident learning) are label noise
+    elif failure_type == 'label_error':
+        return FailureCategory.DATA
+
     # Default
     return FailureCategory.MODEL
 
 
+def categorize_failures(
+    ctx: 'EvalContext',
+    slice_rows: Optional[np.ndarray] = None,
+    label_error_rows: Optional[np.ndarray] = None,
+    margin_threshold: float = DEFAULT_MARGIN_THRESHOLD,
+    entropy_threshold: float = DEFAULT_ENTROPY_THRESHOLD
+) -> Tuple[np.ndarray, Dict[str, int]]:
+    """
+    Categorize every prediction at once.
+
+    Applies the same heuristics as categorize_failure to per-row signals
+    computed in bulk, in this order:
+
+    - Errors on likely mislabeled rows, rows with missing features, or rows
+      in the given (under-performing) slices are DATA failures
+    - Other uncertain errors (small margin or high entropy) are OPTIMIZATION
+      failures; confident errors are MODEL failures
+    - Uncertain correct predictions are OPTIMIZATION failures; confident
+      correct predictions are not failures
+
+    Args:
+        ctx: Evaluation context (margins and entropies come from its
+            probabilities, missingness from its label context's data)
+        slice_rows: Row indices of under-performing slices (optional)
+        label_error_rows: Row indices of likely label errors (optional,
+            see failures.label_errors)
+        margin_threshold: Rows with a top-2 probability margin below this are uncertain
+        entropy_threshold: Rows with a normalized entropy at or above this are uncertain
+
+    Returns:
+        Tuple of (int8 category code per row, see CATEGORY_CODES and
+        NO_FAILURE; number of rows per category value)
+    """
+    n = ctx.n_samples
+    incorrect = ~ctx.correct
+
+    data_signal = np.zeros(n, dtype=bool)
+    if ctx.label_context.rows_with_missing is not None:
+        data_signal |= ctx.label_context.rows_with_missing
+    for rows in (slice_rows, label_error_rows):
+        if rows is not None:
+            data_signal[np.asarray(rows, dtype=np.int64)] = True
+
+    if ctx.margins is not None:
+        uncertain = (ctx.margins < margin_threshold) | (ctx.entropies >= entropy_threshold)
+    else:
+        uncertain = np.zeros(n, dtype=bool)
+
+    codes = np.full(n, NO_FAILURE, dtype=np.int8)
+    codes[uncertain] = CATEGORY_CODES[FailureCategory.OPTIMIZATION]
+    codes[incorrect & ~uncertain] = CATEGORY_CODES[FailureCategory.MODEL]
+    codes[incorrect & data_signal] = CATEGORY_CODES[FailureCategory.DATA]
+
+    counts = np.bincount(codes[codes != NO_FAILURE], minlength=len(CATEGORY_CODES))
+    return codes, {category.value: int(counts[code]) for category, code in CATEGORY_CODES.items()}
+
+
+def category_of(code: int) -> Optional[FailureCategory]:
+    """
+    Get the category of a code from categorize_failures.
+
+    Args:
+        code: Category code
+
+    Returns:
+        FailureCategory, or None for NO_FAILURE
+    """
+    return None if code == NO_FAILURE else list(FailureCategory)[code]
+
+
 def get_category_description(category: FailureCategory) -> Dict[str, Any]:
     """
     Get description and examples for a failure category.
@@ -0,0 +1,44 @@
+"""
+Lazy attribute loading for packages.
+
+Package __init__ modules list their submodules and re-exported names
+instead of importing them. Each is imported on first attribute access
+(PEP 562 module __getattr__), so `import evalharness` and imports of single
+modules only load the heavy libraries (sklearn, pandas, scipy, matplotlib,
+seaborn) that the modules actually used need.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def attach(package_name: str, attributes: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Create the module __getattr__ and __dir__ of a lazily loaded package.
+
+    Args:
+        package_name: The package's __name__
+        attributes: Attribute names mapped to 'module' (a module relative to
+            the package, e.g. 'slicer' or 'metrics.classification') or
+            'module:name' (a name defined in that module)
+
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign in the package namespace
+    """
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+        module_name, _, attr = attributes[name].partition(':')
+        value = importlib.import_module(f'{package_name}.{module_name}')
+        if attr:
+            value = getattr(value, attr)
+        # Cache it in the package, so later accesses skip __getattr__
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(attributes))
+
+    return __getattr__, __dir__
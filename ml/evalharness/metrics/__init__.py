@@ -1,6 +1,11 @@
 """Metric computation modules for different task types."""
 
-from . import classification
-from . import regression
+from ..lazy import attach
 
-__all__ = ['classification', 'regression']
+__all__ = ['classification', 'regression', 'streaming']
+
+__getattr__, __dir__ = attach(__name__, {
+    'classification': 'classification',
+    'regression': 'regression',
+    'streaming': 'streaming'
+})
@@ -9,7 +9,7 @@ Provides comprehensive classification metrics including:
 """
 
 import numpy as np
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
 from sklearn.metrics import (
     accuracy_score,
     precision_score,
@@ -23,12 +23,17 @@ from sklearn.metrics import (
     cohen_kappa_score
 )
 
+if TYPE_CHECKING:
+    from ..core.context import EvalContext
+
 
 def compute_all_metrics(
     y_true: np.ndarray,
     y_pred: np.ndarray,
     y_proba: Optional[np.ndarray] = None,
-    average: str = 'weighted'
+    average: str = 'weighted',
+    classes: Optional[np.ndarray] = None,
+    ctx: Optional['EvalContext'] = None
 ) -> Dict[str, float]:
     """
     Compute all classification metrics.
@@ -38,6 +43,8 @@ def compute_all_metrics(
         y_pred: Predicted labels
         y_proba: Predicted probabilities (optional, for probabilistic metrics)
         average: Averaging strategy for multiclass ('micro', 'macro', 'weighted')
+        classes: Unique true labels, if already known (optional)
+        ctx: Shared evaluation context (optional)
 
     Returns:
         Dictionary of all computed metrics
@@ -45,7 +52,7 @@ def compute_all_metrics(
     metrics = {}
 
     # Basic metrics
-    metrics['accuracy'] = accuracy_score(y_true, y_pred)
+    metrics['accuracy'] = float(np.mean(ctx.correct)) if ctx is not None else accuracy_score(y_true, y_pred)
     metrics['precision'] = precision_score(y_true, y_pred, average=average, zero_division=0)
     metrics['recall'] = recall_score(y_true, y_pred, average=average, zero_division=0)
     metrics['f1_score'] = f1_score(y_true, y_pred, average=average, zero_division=0)
@@ -58,7 +65,7 @@ def compute_all_metrics(
     if y_proba is not None:
         try:
             # Check if binary or multiclass
-            n_classes = len(np.unique(y_true))
+            n_classes = len(classes) if classes is not None else len(np.unique(y_true))
 
             if n_classes == 2:
                 # Binary classification
@@ -73,7 +80,7 @@ def compute_all_metrics(
             metrics['log_loss'] = log_loss(y_true, y_proba)
 
             # Calibration error
-            metrics['expected_calibration_error'] = compute_expected_calibration_error(y_true, y_proba)
+            metrics['expected_calibration_error'] = compute_expected_calibration_error(y_true, y_proba, ctx=ctx)
 
         except Exception as e:
             # Skip probabilistic metrics if computation fails
@@ -99,7 +106,8 @@ def compute_confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarr
 def compute_expected_calibration_error(
     y_true: np.ndarray,
     y_proba: np.ndarray,
-    n_bins: int = 10
+    n_bins: int = 10,
+    ctx: Optional['EvalContext'] = None
 ) -> float:
     """
     Compute Expected Calibration Error (ECE).
@@ -110,21 +118,12 @@ def compute_expected_calibration_error(
         y_true: True labels
         y_proba: Predicted probabilities
         n_bins: Number of bins for calibration
+        ctx: Shared evaluation context (optional, reuses calibration confidences)
 
     Returns:
         Expected calibration error (0 = perfectly calibrated, 1 = worst)
     """
-    # For binary classification, extract positive class probabilities
-    if y_proba.ndim > 1 and y_proba.shape[1] == 2:
-        y_proba = y_proba[:, 1]
-
-    # Get predicted class probabilities
-    if y_proba.ndim == 1:
-        confidences = y_proba
-        predictions = (y_proba > 0.5).astype(int)
-    else:
-        confidences = np.max(y_proba, axis=1)
-        predictions = np.argmax(y_proba, axis=1)
+    confidences, predictions = ctx.calibration if ctx is not None else calibration_confidences(y_proba)
 
     # Create bins
     bins = np.linspace(0, 1, n_bins + 1)
@@ -144,6 +143,104 @@ def compute_expected_calibration_error(
     return ece
 
 
+def calibration_confidences(y_proba: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the confidences and implied predictions used for calibration.
+
+    Binary probabilities are reduced to the positive-class column; multiclass
+    probabilities use the max class probability and its argmax.
+
+    Args:
+        y_proba: Predicted probabilities
+
+    Returns:
+        Tuple of (confidences, predictions)
+    """
+    # For binary classification, extract positive class probabilities
+    if y_proba.ndim > 1 and y_proba.shape[1] == 2:
+        y_proba = y_proba[:, 1]
+
+    # Get predicted class probabilities
+    if y_proba.ndim == 1:
+        return y_proba, (y_proba > 0.5).astype(int)
+
+    return np.max(y_proba, axis=1), np.argmax(y_proba, axis=1)
+
+
+def compute_metrics_from_counts(
+    tp: np.ndarray,
+    pred_count: np.ndarray,
+    true_count: np.ndarray,
+    average: str = 'weighted'
+) -> Dict[str, np.ndarray]:
+    """
+    Compute label-based metrics from per-class counts.
+
+    All inputs have shape (..., n_classes); leading axes are treated as
+    independent groups (slices, bootstrap iterations, ...), so many groups are
+    evaluated in one vectorized call. Results match the sklearn metrics used
+    by compute_all_metrics (zero_division=0).
+
+    Args:
+        tp: True positives per class
+        pred_count: Number of predictions per class
+        true_count: Number of true labels per class
+        average: Averaging strategy for multiclass ('micro', 'macro', 'weighted')
+
+    Returns:
+        Dictionary of metric arrays with the leading shape of the inputs
+    """
+    tp = np.asarray(tp, dtype=float)
+    pred_count = np.asarray(pred_count, dtype=float)
+    true_count = np.asarray(true_count, dtype=float)
+
+    n = true_count.sum(axis=-1)
+    correct = tp.sum(axis=-1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        accuracy = np.where(n > 0, correct / n, 0.0)
+        precision_k = np.where(pred_count > 0, tp / pred_count, 0.0)
+        recall_k = np.where(true_count > 0, tp / true_count, 0.0)
+        denom = pred_count + true_count
+        f1_k = np.where(denom > 0, 2 * tp / denom, 0.0)
+
+        if average == 'micro':
+            precision = recall = f1 = accuracy
+        elif average == 'macro':
+            present = (pred_count > 0) | (true_count > 0)
+            n_present = present.sum(axis=-1)
+
+            def _macro(values):
+                return np.where(n_present > 0, (values * present).sum(axis=-1) / n_present, 0.0)
+
+            precision, recall, f1 = _macro(precision_k), _macro(recall_k), _macro(f1_k)
+        else:
+            def _weighted(values):
+                return np.where(n > 0, (values * true_count).sum(axis=-1) / n, 0.0)
+
+            precision, recall, f1 = _weighted(precision_k), _weighted(recall_k), _weighted(f1_k)
+
+        # MCC and kappa only need the confusion matrix marginals
+        pt = (pred_count * true_count).sum(axis=-1)
+        cov_tp = correct * n - pt
+        cov_pp = n ** 2 - (pred_count ** 2).sum(axis=-1)
+        cov_tt = n ** 2 - (true_count ** 2).sum(axis=-1)
+        mcc_denom = np.sqrt(cov_pp * cov_tt)
+        mcc = np.where(mcc_denom > 0, cov_tp / mcc_denom, 0.0)
+
+        expected = np.where(n > 0, pt / n ** 2, 0.0)
+        kappa = np.where(expected < 1, (accuracy - expected) / (1 - expected), np.nan)
+
+    return {
+        'accuracy': accuracy,
+        'precision': precision,
+        'recall': recall,
+        'f1_score': f1,
+        'matthews_corr_coef': mcc,
+        'cohen_kappa': kappa
+    }
+
+
 def compute_calibration_curve(
     y_true: np.ndarray,
     y_proba: np.ndarray,
@@ -188,7 +285,8 @@ def compute_calibration_curve(
 def compute_per_class_metrics(
     y_true: np.ndarray,
     y_pred: np.ndarray,
-    class_names: Optional[list] = None
+    class_names: Optional[list] = None,
+    classes: Optional[np.ndarray] = None
 ) -> Dict[str, Dict[str, float]]:
     """
     Compute metrics for each class individually.
@@ -197,11 +295,13 @@ def compute_per_class_metrics(
         y_true: True labels
         y_pred: Predicted labels
         class_names: Optional list of class names
+        classes: Unique true labels, if already known (optional)
 
     Returns:
         Dictionary mapping class names to their metrics
     """
-    classes = np.unique(y_true)
+    if classes is None:
+        classes = np.unique(y_true)
     if class_names is None:
         class_names = [f"class_{i}" for i in classes]
 
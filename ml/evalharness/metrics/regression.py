@@ -9,14 +9,6 @@ Provides comprehensive regression metrics including:
 
 import numpy as np
 from typing import Dict
-from sklearn.metrics import (
-    mean_absolute_error,
-    mean_squared_error,
-    r2_score,
-    median_absolute_error,
-    mean_absolute_percentage_error,
-    explained_variance_score
-)
 
 
 def compute_all_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
@@ -30,6 +22,15 @@ def compute_all_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, flo
     Returns:
         Dictionary of all computed metrics
     """
+    from sklearn.metrics import (
+        mean_absolute_error,
+        mean_squared_error,
+        r2_score,
+        median_absolute_error,
+        mean_absolute_percentage_error,
+        explained_variance_score
+    )
+
     metrics = {}
 
     # Basic metrics
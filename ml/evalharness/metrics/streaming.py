@@ -0,0 +1,308 @@
+"""
+Streaming classification metrics.
+
+Accumulates sufficient statistics batch by batch so metrics can be computed
+over evaluation sets that do not fit in memory:
+- Per-class counts for accuracy, precision, recall, F1, MCC, kappa
+- Score histograms for ROC-AUC and PR-AUC
+- Log-loss sums and calibration bins
+- Poisson bootstrap counts for confidence intervals
+"""
+
+import numpy as np
+from typing import Dict, List, Optional
+from .classification import calibration_confidences, compute_metrics_from_counts
+
+
+def _grow(array: np.ndarray, n_classes: int) -> np.ndarray:
+    """Zero-pad the last axis of a count array to n_classes."""
+    if array.shape[-1] >= n_classes:
+        return array
+    pad = [(0, 0)] * (array.ndim - 1) + [(0, n_classes - array.shape[-1])]
+    return np.pad(array, pad)
+
+
+class StreamingClassificationMetrics:
+    """
+    Single-pass accumulator for classification metrics.
+
+    Labels and predictions must be non-negative integer class indices.
+    Score-based metrics (ROC-AUC, PR-AUC) are approximated from fixed-width
+    score histograms and are exact up to the histogram resolution.
+    """
+
+    def __init__(
+        self,
+        n_classes: int = 0,
+        average: str = 'weighted',
+        n_score_bins: int = 2048,
+        n_calibration_bins: int = 10,
+        n_bootstrap: int = 0,
+        seed: int = 42
+    ):
+        """
+        Initialize accumulator.
+
+        Args:
+            n_classes: Number of classes, if known (grows as new classes appear)
+            average: Averaging strategy for multiclass ('micro', 'macro', 'weighted')
+            n_score_bins: Histogram resolution for ROC/PR curves
+            n_calibration_bins: Number of bins for expected calibration error
+            n_bootstrap: Number of Poisson bootstrap replicates (0 disables CIs)
+            seed: Random seed for the bootstrap weights
+        """
+        self.average = average
+        self.n_score_bins = n_score_bins
+        self.n_calibration_bins = n_calibration_bins
+        self.n_bootstrap = n_bootstrap
+        self.rng = np.random.default_rng(seed)
+
+        self.n_samples = 0
+        self.confusion = np.zeros((n_classes, n_classes))
+
+        # Probability statistics (allocated on first batch with probabilities)
+        self.has_proba = False
+        self.pos_hist = None
+        self.neg_hist = None
+        self.log_loss_sum = 0.0
+        self.calib_count = np.zeros(n_calibration_bins)
+        self.calib_conf_sum = np.zeros(n_calibration_bins)
+        self.calib_correct_sum = np.zeros(n_calibration_bins)
+        self.calib_true_sum = np.zeros(n_calibration_bins)
+
+        # Poisson bootstrap counts, shape (n_bootstrap, n_classes)
+        self.boot_tp = np.zeros((n_bootstrap, n_classes))
+        self.boot_pred = np.zeros((n_bootstrap, n_classes))
+        self.boot_true = np.zeros((n_bootstrap, n_classes))
+
+    @property
+    def n_classes(self) -> int:
+        return len(self.confusion)
+
+    @property
+    def tp(self) -> np.ndarray:
+        return np.diag(self.confusion)
+
+    @property
+    def pred_count(self) -> np.ndarray:
+        return self.confusion.sum(axis=0)
+
+    @property
+    def true_count(self) -> np.ndarray:
+        return self.confusion.sum(axis=1)
+
+    def _ensure_classes(self, n_classes: int):
+        """Grow count arrays when a batch contains a new class."""
+        if n_classes <= self.n_classes:
+            return
+        self.confusion = _grow(_grow(self.confusion, n_classes).T, n_classes).T
+        self.boot_tp = _grow(self.boot_tp, n_classes)
+        self.boot_pred = _grow(self.boot_pred, n_classes)
+        self.boot_true = _grow(self.boot_true, n_classes)
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray, y_proba: Optional[np.ndarray] = None):
+        """
+        Add a batch of predictions.
+
+        Args:
+            y_true: True labels
+            y_pred: Predicted labels
+            y_proba: Predicted probabilities (optional)
+        """
+        y_true = np.asarray(y_true).astype(np.int64, copy=False)
+        y_pred = np.asarray(y_pred).astype(np.int64, copy=False)
+        if len(y_true) == 0:
+            return
+        if y_true.min() < 0 or y_pred.min() < 0:
+            raise ValueError("Streaming evaluation requires non-negative integer class labels")
+
+        n_classes = int(max(y_true.max(), y_pred.max())) + 1
+        if y_proba is not None and np.ndim(y_proba) > 1:
+            n_classes = max(n_classes, y_proba.shape[1])
+        self._ensure_classes(n_classes)
+        k = self.n_classes
+
+        self.n_samples += len(y_true)
+        self.confusion += np.bincount(y_true * k + y_pred, minlength=k * k).reshape(k, k)
+
+        if y_proba is not None:
+            self._update_proba(y_true, np.asarray(y_proba, dtype=float))
+
+        if self.n_bootstrap:
+            self._update_bootstrap(y_true, y_pred, y_true == y_pred)
+
+    def _update_proba(self, y_true: np.ndarray, y_proba: np.ndarray):
+        """Accumulate histogram, log-loss and calibration statistics."""
+        self.has_proba = True
+        n_bins = self.n_score_bins
+
+        # One-vs-rest score histograms (a single positive-class curve for binary)
+        if y_proba.ndim == 1:
+            scores, positives = y_proba[:, None], (y_true == 1)[:, None]
+        elif y_proba.shape[1] == 2:
+            scores, positives = y_proba[:, 1:], (y_true == 1)[:, None]
+        else:
+            scores = y_proba
+            positives = y_true[:, None] == np.arange(y_proba.shape[1])[None, :]
+
+        n_curves = scores.shape[1]
+        if self.pos_hist is None:
+            self.pos_hist = np.zeros((n_curves, n_bins))
+            self.neg_hist = np.zeros((n_curves, n_bins))
+        elif self.pos_hist.shape[0] != n_curves:
+            raise ValueError("Probability batches must all have the same number of columns")
+
+        bins = np.clip((scores * n_bins).astype(np.int64), 0, n_bins - 1)
+        flat = bins + (np.arange(n_curves) * n_bins)[None, :]
+        self.pos_hist += np.bincount(flat[positives], minlength=n_curves * n_bins).reshape(n_curves, n_bins)
+        self.neg_hist += np.bincount(flat[~positives], minlength=n_curves * n_bins).reshape(n_curves, n_bins)
+
+        # Log loss (rows renormalized and clipped as in sklearn)
+        eps = np.finfo(y_proba.dtype).eps
+        if y_proba.ndim == 1:
+            p_true = np.where(y_true == 1, y_proba, 1 - y_proba)
+        else:
+            row_sums = y_proba.sum(axis=1)
+            p_true = y_proba[np.arange(len(y_true)), np.minimum(y_true, y_proba.shape[1] - 1)] / row_sums
+        self.log_loss_sum += float(-np.log(np.clip(p_true, eps, 1 - eps)).sum())
+
+        # Calibration bins (same binning as compute_expected_calibration_error)
+        confidences, predictions = calibration_confidences(y_proba)
+        edges = np.linspace(0, 1, self.n_calibration_bins + 1)
+        bin_idx = np.clip(np.digitize(confidences, edges) - 1, 0, self.n_calibration_bins - 1)
+        m = self.n_calibration_bins
+        self.calib_count += np.bincount(bin_idx, minlength=m)
+        self.calib_conf_sum += np.bincount(bin_idx, weights=confidences, minlength=m)
+        self.calib_correct_sum += np.bincount(bin_idx, weights=(predictions == y_true), minlength=m)
+        self.calib_true_sum += np.bincount(bin_idx, weights=y_true, minlength=m)
+
+    def _update_bootstrap(self, y_true: np.ndarray, y_pred: np.ndarray, correct: np.ndarray, block: int = 32):
+        """Accumulate Poisson(1) bootstrap replicate counts."""
+        k = self.n_classes
+        n = len(y_true)
+        for start in range(0, self.n_bootstrap, block):
+            b = min(block, self.n_bootstrap - start)
+            weights = self.rng.poisson(1.0, size=(b, n)).astype(float)
+            offsets = (np.arange(b) * k)[:, None]
+            size = b * k
+            self.boot_true[start:start + b] += np.bincount(
+                (offsets + y_true).ravel(), weights=weights.ravel(), minlength=size
+            ).reshape(b, k)
+            self.boot_pred[start:start + b] += np.bincount(
+                (offsets + y_pred).ravel(), weights=weights.ravel(), minlength=size
+            ).reshape(b, k)
+            self.boot_tp[start:start + b] += np.bincount(
+                (offsets + y_true)[:, correct].ravel(), weights=weights[:, correct].ravel(), minlength=size
+            ).reshape(b, k)
+
+    def compute(self) -> Dict[str, float]:
+        """
+        Compute metrics over all batches seen so far.
+
+        Returns:
+            Dictionary of metrics with the same keys as compute_all_metrics
+        """
+        if self.n_samples == 0:
+            return {}
+
+        metrics = {
+            name: float(value)
+            for name, value in compute_metrics_from_counts(
+                self.tp, self.pred_count, self.true_count, average=self.average
+            ).items()
+        }
+
+        if self.has_proba:
+            roc, pr, weights = [], [], []
+            for pos, neg in zip(self.pos_hist, self.neg_hist):
+                if pos.sum() == 0 or neg.sum() == 0:
+                    continue
+                roc.append(_auc_from_histograms(pos, neg))
+                pr.append(_average_precision_from_histograms(pos, neg))
+                weights.append(pos.sum())
+
+            if roc:
+                if len(roc) == 1:
+                    metrics['roc_auc'], metrics['pr_auc'] = roc[0], pr[0]
+                elif self.average == 'macro':
+                    metrics['roc_auc'], metrics['pr_auc'] = float(np.mean(roc)), float(np.mean(pr))
+                else:
+                    metrics['roc_auc'] = float(np.average(roc, weights=weights))
+                    metrics['pr_auc'] = float(np.average(pr, weights=weights))
+
+            metrics['log_loss'] = self.log_loss_sum / self.n_samples
+
+            nonempty = self.calib_count > 0
+            bin_accuracy = self.calib_correct_sum[nonempty] / self.calib_count[nonempty]
+            bin_confidence = self.calib_conf_sum[nonempty] / self.calib_count[nonempty]
+            bin_weight = self.calib_count[nonempty] / self.n_samples
+            metrics['expected_calibration_error'] = float(np.sum(bin_weight * np.abs(bin_accuracy - bin_confidence)))
+
+        return metrics
+
+    def compute_calibration_curve(self):
+        """
+        Get calibration curve data (binary problems).
+
+        Returns:
+            Tuple of (mean_predicted_probabilities, fraction_of_positives)
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_probs = np.where(self.calib_count > 0, self.calib_conf_sum / self.calib_count, np.nan)
+            frac_pos = np.where(self.calib_count > 0, self.calib_true_sum / self.calib_count, np.nan)
+        return mean_probs, frac_pos
+
+    def compute_confidence_intervals(
+        self,
+        metric_names: List[str],
+        confidence: float = 0.95,
+        seed: int = 42
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Compute Poisson bootstrap confidence intervals.
+
+        Args:
+            metric_names: Label-based metrics to report (e.g. 'accuracy', 'f1_score')
+            confidence: Confidence level
+            seed: Random seed recorded in the result
+
+        Returns:
+            Dictionary mapping metric names to CI results
+        """
+        if not self.n_bootstrap or self.n_samples == 0:
+            return {}
+
+        replicates = compute_metrics_from_counts(self.boot_tp, self.boot_pred, self.boot_true, average=self.average)
+        alpha = 1 - confidence
+
+        cis = {}
+        for name in metric_names:
+            if name not in replicates:
+                continue
+            values = replicates[name]
+            cis[name] = {
+                'mean': float(np.mean(values)),
+                'std': float(np.std(values)),
+                'lower': float(np.percentile(values, (alpha / 2) * 100)),
+                'upper': float(np.percentile(values, (1 - alpha / 2) * 100)),
+                'confidence': confidence,
+                'n_bootstraps': self.n_bootstrap,
+                'seed': seed
+            }
+        return cis
+
+
+def _auc_from_histograms(pos: np.ndarray, neg: np.ndarray) -> float:
+    """ROC-AUC from positive/negative score histograms (ties count one half)."""
+    pos_below = np.cumsum(pos) - pos
+    return float(np.sum(neg * (pos.sum() - pos_below - pos) + 0.5 * neg * pos) / (pos.sum() * neg.sum()))
+
+
+def _average_precision_from_histograms(pos: np.ndarray, neg: np.ndarray) -> float:
+    """Average precision from score histograms, thresholding from the top bin down."""
+    tp = np.cumsum(pos[::-1])
+    fp = np.cumsum(neg[::-1])
+    nonempty = (pos[::-1] + neg[::-1]) > 0
+    precision = tp[nonempty] / (tp[nonempty] + fp[nonempty])
+    recall = tp[nonempty] / pos.sum()
+    return float(np.sum(np.diff(np.concatenate([[0.0], recall])) * precision))
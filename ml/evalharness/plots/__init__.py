@@ -1,6 +1,12 @@
 """Visualization modules for evaluation outputs."""
 
-from . import classification
-from . import regression
+from ..lazy import attach
 
-__all__ = ['classification', 'regression']
+__all__ = ['figures', 'data', 'classification', 'regression']
+
+__getattr__, __dir__ = attach(__name__, {
+    'figures': 'figures',
+    'data': 'data',
+    'classification': 'classification',
+    'regression': 'regression'
+})
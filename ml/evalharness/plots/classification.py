@@ -1,49 +1,50 @@
 """
 Classification visualization functions.
 
-All plots are deterministic (same seed → same plot).
+Plots draw no random numbers, so their seed arguments are unused. Figures
+are rendered without pyplot (see figures), so concurrent evaluations can
+generate plots in parallel threads.
+
+Each plot is split in two steps: a *_data function (see data) reduces the
+raw arrays to the small data the plot shows (curve points thinned to the
+render resolution, bin counts), and a render_* function draws that data.
+Rendering is the slow part and needs only that data, so it can run in
+worker processes (see figures.render_plots). The plot_* functions run both
+steps.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
-from typing import Optional, List
-from sklearn.metrics import roc_curve, precision_recall_curve, auc
+from typing import Any, Dict, Optional, List, TYPE_CHECKING
+from . import figures
+from .data import (
+    roc_curve_data,
+    pr_curve_data,
+    calibration_curve_data,
+    confusion_matrix_data,
+    confidence_histogram_data
+)
 
+if TYPE_CHECKING:
+    from ..core.context import EvalContext
 
-# Set style for consistent, professional plots
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (10, 8)
-plt.rcParams['font.size'] = 11
-plt.rcParams['axes.labelsize'] = 12
-plt.rcParams['axes.titlesize'] = 14
-plt.rcParams['xtick.labelsize'] = 10
-plt.rcParams['ytick.labelsize'] = 10
-plt.rcParams['legend.fontsize'] = 10
 
-
-def plot_confusion_matrix(
-    confusion_matrix: np.ndarray,
-    class_names: Optional[List[str]] = None,
-    output_path: Optional[str] = None,
-    seed: int = 42
-) -> str:
+def render_confusion_matrix(data: Dict[str, Any], output_path: Optional[str] = None) -> str:
     """
-    Plot confusion matrix heatmap.
+    Render a confusion matrix heatmap.
 
     Args:
-        confusion_matrix: Confusion matrix array
-        class_names: Optional list of class names
+        data: Dictionary with 'confusion_matrix' and optional 'class_names'
         output_path: Path to save plot (if None, shows plot)
-        seed: Random seed for reproducibility
 
     Returns:
         Path to saved plot
     """
-    np.random.seed(seed)
+    confusion_matrix = data['confusion_matrix']
+    class_names = data.get('class_names')
 
-    fig, ax = plt.subplots(figsize=(10, 8))
+    fig, ax = figures.new_figure(interactive=not output_path)
 
     # Normalize confusion matrix for percentages
     cm_normalized = confusion_matrix.astype('float') / confusion_matrix.sum(axis=1)[:, np.newaxis]
@@ -56,173 +57,148 @@ def plot_confusion_matrix(
         cmap='Blues',
         xticklabels=class_names if class_names else range(len(confusion_matrix)),
         yticklabels=class_names if class_names else range(len(confusion_matrix)),
+        annot_kws={'size': figures.FONT_SIZE},
         cbar_kws={'label': 'Proportion'},
         ax=ax
     )
 
-    ax.set_xlabel('Predicted Label')
-    ax.set_ylabel('True Label')
-    ax.set_title('Confusion Matrix')
+    figures.label_axes(ax, 'Predicted Label', 'True Label', 'Confusion Matrix')
 
-    plt.tight_layout()
+    return figures.finish(fig, output_path)
 
-    if output_path:
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        return output_path
-    else:
-        plt.show()
-        return ""
 
-
-def plot_roc_curve(
-    y_true: np.ndarray,
-    y_proba: np.ndarray,
+def plot_confusion_matrix(
+    confusion_matrix: np.ndarray,
+    class_names: Optional[List[str]] = None,
     output_path: Optional[str] = None,
     seed: int = 42
 ) -> str:
     """
-    Plot ROC curve.
+    Plot confusion matrix heatmap.
 
     Args:
-        y_true: True labels
-        y_proba: Predicted probabilities
-        output_path: Path to save plot
-        seed: Random seed for reproducibility
+        confusion_matrix: Confusion matrix array
+        class_names: Optional list of class names
+        output_path: Path to save plot (if None, shows plot)
+        seed: Unused; kept for compatibility
 
     Returns:
         Path to saved plot
     """
-    np.random.seed(seed)
-
-    fig, ax = plt.subplots(figsize=(10, 8))
+    return render_confusion_matrix(confusion_matrix_data(confusion_matrix, class_names), output_path)
 
-    # For binary classification
-    if y_proba.ndim == 1 or (y_proba.ndim == 2 and y_proba.shape[1] == 2):
-        if y_proba.ndim == 2:
-            y_proba = y_proba[:, 1]
 
-        fpr, tpr, _ = roc_curve(y_true, y_proba)
-        roc_auc = auc(fpr, tpr)
+def render_roc_curve(data: Dict[str, Any], output_path: Optional[str] = None) -> str:
+    """
+    Render ROC curves.
 
-        ax.plot(fpr, tpr, label=f'ROC curve (AUC = {roc_auc:.3f})', linewidth=2)
+    Args:
+        data: Output of roc_curve_data
+        output_path: Path to save plot
 
-    else:
-        # Multiclass - plot ROC curve for each class
-        from sklearn.preprocessing import label_binarize
-        classes = np.unique(y_true)
-        y_true_bin = label_binarize(y_true, classes=classes)
+    Returns:
+        Path to saved plot
+    """
+    fig, ax = figures.new_figure(interactive=not output_path)
 
-        for i in range(len(classes)):
-            fpr, tpr, _ = roc_curve(y_true_bin[:, i], y_proba[:, i])
-            roc_auc = auc(fpr, tpr)
-            ax.plot(fpr, tpr, label=f'Class {classes[i]} (AUC = {roc_auc:.3f})', linewidth=2)
+    for curve in data['curves']:
+        ax.plot(curve['x'], curve['y'], label=f"{curve['name']} (AUC = {curve['auc']:.3f})", linewidth=2)
 
     # Plot diagonal
     ax.plot([0, 1], [0, 1], 'k--', label='Random (AUC = 0.500)', linewidth=1)
 
-    ax.set_xlabel('False Positive Rate')
-    ax.set_ylabel('True Positive Rate')
-    ax.set_title('ROC Curve')
-    ax.legend(loc='lower right')
+    figures.label_axes(ax, 'False Positive Rate', 'True Positive Rate', 'ROC Curve')
+    figures.legend(ax, loc='lower right')
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-
-    if output_path:
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        return output_path
-    else:
-        plt.show()
-        return ""
+    return figures.finish(fig, output_path)
 
 
-def plot_pr_curve(
+def plot_roc_curve(
     y_true: np.ndarray,
     y_proba: np.ndarray,
     output_path: Optional[str] = None,
     seed: int = 42
 ) -> str:
     """
-    Plot Precision-Recall curve.
+    Plot ROC curve.
 
     Args:
         y_true: True labels
         y_proba: Predicted probabilities
         output_path: Path to save plot
-        seed: Random seed for reproducibility
+        seed: Unused; kept for compatibility
 
     Returns:
         Path to saved plot
     """
-    np.random.seed(seed)
-
-    fig, ax = plt.subplots(figsize=(10, 8))
+    return render_roc_curve(roc_curve_data(y_true, y_proba), output_path)
 
-    # For binary classification
-    if y_proba.ndim == 1 or (y_proba.ndim == 2 and y_proba.shape[1] == 2):
-        if y_proba.ndim == 2:
-            y_proba = y_proba[:, 1]
 
-        precision, recall, _ = precision_recall_curve(y_true, y_proba)
-        pr_auc = auc(recall, precision)
+def render_pr_curve(data: Dict[str, Any], output_path: Optional[str] = None) -> str:
+    """
+    Render Precision-Recall curves.
 
-        ax.plot(recall, precision, label=f'PR curve (AUC = {pr_auc:.3f})', linewidth=2)
+    Args:
+        data: Output of pr_curve_data
+        output_path: Path to save plot
 
-    else:
-        # Multiclass - plot PR curve for each class
-        from sklearn.preprocessing import label_binarize
-        classes = np.unique(y_true)
-        y_true_bin = label_binarize(y_true, classes=classes)
+    Returns:
+        Path to saved plot
+    """
+    fig, ax = figures.new_figure(interactive=not output_path)
 
-        for i in range(len(classes)):
-            precision, recall, _ = precision_recall_curve(y_true_bin[:, i], y_proba[:, i])
-            pr_auc = auc(recall, precision)
-            ax.plot(recall, precision, label=f'Class {classes[i]} (AUC = {pr_auc:.3f})', linewidth=2)
+    for curve in data['curves']:
+        ax.plot(curve['x'], curve['y'], label=f"{curve['name']} (AUC = {curve['auc']:.3f})", linewidth=2)
 
     # Plot baseline
-    baseline = np.sum(y_true) / len(y_true) if y_proba.ndim == 1 else 1 / len(np.unique(y_true))
+    baseline = data['baseline']
     ax.axhline(y=baseline, color='k', linestyle='--', label=f'Baseline (y={baseline:.3f})', linewidth=1)
 
-    ax.set_xlabel('Recall')
-    ax.set_ylabel('Precision')
-    ax.set_title('Precision-Recall Curve')
-    ax.legend(loc='best')
+    figures.label_axes(ax, 'Recall', 'Precision', 'Precision-Recall Curve')
+    figures.legend(ax, loc='best')
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-
-    if output_path:
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        return output_path
-    else:
-        plt.show()
-        return ""
+    return figures.finish(fig, output_path)
 
 
-def plot_calibration_curve(
-    mean_predicted_probs: np.ndarray,
-    fraction_of_positives: np.ndarray,
+def plot_pr_curve(
+    y_true: np.ndarray,
+    y_proba: np.ndarray,
     output_path: Optional[str] = None,
     seed: int = 42
 ) -> str:
     """
-    Plot calibration curve.
+    Plot Precision-Recall curve.
 
     Args:
-        mean_predicted_probs: Mean predicted probabilities per bin
-        fraction_of_positives: Fraction of positives per bin
+        y_true: True labels
+        y_proba: Predicted probabilities
+        output_path: Path to save plot
+        seed: Unused; kept for compatibility
+
+    Returns:
+        Path to saved plot
+    """
+    return render_pr_curve(pr_curve_data(y_true, y_proba), output_path)
+
+
+def render_calibration_curve(data: Dict[str, Any], output_path: Optional[str] = None) -> str:
+    """
+    Render a calibration curve.
+
+    Args:
+        data: Dictionary with 'mean_predicted_probs' and
+            'fraction_of_positives' per bin (NaN for empty bins)
         output_path: Path to save plot
-        seed: Random seed for reproducibility
 
     Returns:
         Path to saved plot
     """
-    np.random.seed(seed)
+    mean_predicted_probs = data['mean_predicted_probs']
+    fraction_of_positives = data['fraction_of_positives']
 
-    fig, ax = plt.subplots(figsize=(10, 8))
+    fig, ax = figures.new_figure(interactive=not output_path)
 
     # Plot calibration curve
     mask = ~np.isnan(mean_predicted_probs)
@@ -238,30 +214,67 @@ def plot_calibration_curve(
     # Plot perfect calibration
     ax.plot([0, 1], [0, 1], 'k--', label='Perfect calibration', linewidth=1)
 
-    ax.set_xlabel('Mean Predicted Probability')
-    ax.set_ylabel('Fraction of Positives')
-    ax.set_title('Calibration Curve')
-    ax.legend(loc='best')
+    figures.label_axes(ax, 'Mean Predicted Probability', 'Fraction of Positives', 'Calibration Curve')
+    figures.legend(ax, loc='best')
     ax.grid(True, alpha=0.3)
     ax.set_xlim([-0.05, 1.05])
     ax.set_ylim([-0.05, 1.05])
 
-    plt.tight_layout()
+    return figures.finish(fig, output_path)
 
-    if output_path:
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        return output_path
-    else:
-        plt.show()
-        return ""
+
+def plot_calibration_curve(
+    mean_predicted_probs: np.ndarray,
+    fraction_of_positives: np.ndarray,
+    output_path: Optional[str] = None,
+    seed: int = 42
+) -> str:
+    """
+    Plot calibration curve.
+
+    Args:
+        mean_predicted_probs: Mean predicted probabilities per bin
+        fraction_of_positives: Fraction of positives per bin
+        output_path: Path to save plot
+        seed: Unused; kept for compatibility
+
+    Returns:
+        Path to saved plot
+    """
+    return render_calibration_curve(calibration_curve_data(mean_predicted_probs, fraction_of_positives), output_path)
+
+
+def render_confidence_histogram(data: Dict[str, Any], output_path: Optional[str] = None) -> str:
+    """
+    Render the histogram of prediction confidences.
+
+    Args:
+        data: Output of confidence_histogram_data
+        output_path: Path to save plot
+
+    Returns:
+        Path to saved plot
+    """
+    fig, ax = figures.new_figure(interactive=not output_path)
+
+    # Plot histograms from the bin counts (one weighted point per bin)
+    bins = data['bins']
+    ax.hist(bins[:-1], bins=bins, weights=data['correct'], alpha=0.6, label='Correct', color='green')
+    ax.hist(bins[:-1], bins=bins, weights=data['incorrect'], alpha=0.6, label='Incorrect', color='red')
+
+    figures.label_axes(ax, 'Prediction Confidence', 'Count', 'Confidence Distribution')
+    figures.legend(ax, loc='best')
+    ax.grid(True, alpha=0.3)
+
+    return figures.finish(fig, output_path)
 
 
 def plot_confidence_histogram(
     y_true: np.ndarray,
     y_proba: np.ndarray,
     output_path: Optional[str] = None,
-    seed: int = 42
+    seed: int = 42,
+    ctx: Optional['EvalContext'] = None
 ) -> str:
     """
     Plot histogram of prediction confidences, separated by correct/incorrect.
@@ -270,45 +283,10 @@ def plot_confidence_histogram(
         y_true: True labels
         y_proba: Predicted probabilities
         output_path: Path to save plot
-        seed: Random seed for reproducibility
+        seed: Unused; kept for compatibility
+        ctx: Shared evaluation context (optional, reuses confidences)
 
     Returns:
         Path to saved plot
     """
-    np.random.seed(seed)
-
-    fig, ax = plt.subplots(figsize=(10, 8))
-
-    # Get confidences and predictions
-    if y_proba.ndim == 1:
-        confidences = y_proba
-        y_pred = (y_proba > 0.5).astype(int)
-    else:
-        confidences = np.max(y_proba, axis=1)
-        y_pred = np.argmax(y_proba, axis=1)
-
-    # Separate correct and incorrect
-    correct_mask = y_pred == y_true
-    correct_confidences = confidences[correct_mask]
-    incorrect_confidences = confidences[~correct_mask]
-
-    # Plot histograms
-    bins = np.linspace(0, 1, 20)
-    ax.hist(correct_confidences, bins=bins, alpha=0.6, label='Correct', color='green')
-    ax.hist(incorrect_confidences, bins=bins, alpha=0.6, label='Incorrect', color='red')
-
-    ax.set_xlabel('Prediction Confidence')
-    ax.set_ylabel('Count')
-    ax.set_title('Confidence Distribution')
-    ax.legend(loc='best')
-    ax.grid(True, alpha=0.3)
-
-    plt.tight_layout()
-
-    if output_path:
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        return output_path
-    else:
-        plt.show()
-        return ""
+    return render_confidence_histogram(confidence_histogram_data(y_true, y_proba, ctx), output_path)
@@ -0,0 +1,286 @@
+"""
+Plot data: the small arrays each plot shows, without drawing anything.
+
+The *_data functions reduce the raw evaluation arrays to curve points
+(thinned to a grid, see thin_curve), bin counts and confusion counts. The
+render_* functions in plots.classification draw them as PNGs; with
+config['plot_format'] = 'data' they are written as compact JSON instead
+(write_plot_data), for clients that draw the charts themselves. This module
+does not import matplotlib.
+"""
+
+import json
+import numpy as np
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+from sklearn.metrics import roc_curve, precision_recall_curve, auc
+
+if TYPE_CHECKING:
+    from ..core.context import EvalContext
+
+
+PLOT_FORMATS = ('png', 'data')
+
+# Curve points are kept on a grid this fine; rendered PNGs are 3000 pixels
+# wide, while charts drawn from JSON need far fewer points
+CURVE_RESOLUTION = 4096
+DATA_CURVE_RESOLUTION = 500
+
+# Decimal places of curve coordinates in JSON (finer than the data grid)
+JSON_DECIMALS = 4
+
+
+def thin_curve(x: np.ndarray, y: np.ndarray, resolution: int = CURVE_RESOLUTION) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Drop curve points that fall in the same grid cell as the previous point.
+
+    ROC and PR curves have up to one point per distinct score; on a
+    rendered plot, consecutive points closer than a pixel are
+    indistinguishable. Thinning keeps the plot data small however many
+    rows were evaluated, while the curve moves less than one grid cell.
+
+    Args:
+        x: Curve x coordinates in [0, 1]
+        y: Curve y coordinates in [0, 1]
+        resolution: Grid cells per unit
+
+    Returns:
+        Tuple of (x, y) of the kept points; the first and last points are always kept
+    """
+    cells = np.round(x * resolution).astype(np.int64) * (resolution + 1) + np.round(y * resolution).astype(np.int64)
+    keep = np.ones(len(x), dtype=bool)
+    keep[1:] = cells[1:] != cells[:-1]
+    keep[-1] = True
+    return x[keep], y[keep]
+
+
+def _binary_scores(y_proba: np.ndarray) -> Optional[np.ndarray]:
+    """Get the positive-class scores of binary probabilities (None for multiclass)."""
+    if y_proba.ndim == 1:
+        return y_proba
+    if y_proba.ndim == 2 and y_proba.shape[1] == 2:
+        return y_proba[:, 1]
+    return None
+
+
+def _one_vs_rest(y_true: np.ndarray, y_proba: np.ndarray, curve_fn) -> List[Tuple[str, np.ndarray, np.ndarray]]:
+    """Compute one curve per class, as (class name, first output, second output) of curve_fn."""
+    from sklearn.preprocessing import label_binarize
+    classes = np.unique(y_true)
+    y_true_bin = label_binarize(y_true, classes=classes)
+    return [(f'Class {classes[i]}', *curve_fn(y_true_bin[:, i], y_proba[:, i])[:2]) for i in range(len(classes))]
+
+
+def roc_curve_data(
+    y_true: np.ndarray,
+    y_proba: np.ndarray,
+    resolution: int = CURVE_RESOLUTION
+) -> Dict[str, Any]:
+    """
+    Compute the ROC curve points.
+
+    Args:
+        y_true: True labels
+        y_proba: Predicted probabilities
+        resolution: Grid cells per unit for thinning the curves
+
+    Returns:
+        Dictionary with 'curves': list of {'name', 'auc', 'x' (false
+        positive rates), 'y' (true positive rates)}, one curve per class for
+        multiclass; AUCs are computed before the curves are thinned
+    """
+    scores = _binary_scores(y_proba)
+    if scores is not None:
+        fpr, tpr, _ = roc_curve(y_true, scores)
+        raw = [('ROC curve', fpr, tpr)]
+    else:
+        raw = _one_vs_rest(y_true, y_proba, roc_curve)
+
+    curves = []
+    for name, fpr, tpr in raw:
+        x, y = thin_curve(fpr, tpr, resolution)
+        curves.append({'name': name, 'auc': float(auc(fpr, tpr)), 'x': x, 'y': y})
+    return {'curves': curves}
+
+
+def pr_curve_data(
+    y_true: np.ndarray,
+    y_proba: np.ndarray,
+    resolution: int = CURVE_RESOLUTION
+) -> Dict[str, Any]:
+    """
+    Compute the Precision-Recall curve points.
+
+    Args:
+        y_true: True labels
+        y_proba: Predicted probabilities
+        resolution: Grid cells per unit for thinning the curves
+
+    Returns:
+        Dictionary with 'curves': list of {'name', 'auc', 'x' (recalls),
+        'y' (precisions)}, one curve per class for multiclass (AUCs are
+        computed before the curves are thinned), and the 'baseline' precision
+    """
+    scores = _binary_scores(y_proba)
+    if scores is not None:
+        precision, recall, _ = precision_recall_curve(y_true, scores)
+        raw = [('PR curve', precision, recall)]
+        baseline = float(np.sum(y_true) / len(y_true))
+    else:
+        raw = _one_vs_rest(y_true, y_proba, precision_recall_curve)
+        baseline = 1 / len(raw)
+
+    curves = []
+    for name, precision, recall in raw:
+        x, y = thin_curve(recall, precision, resolution)
+        curves.append({'name': name, 'auc': float(auc(recall, precision)), 'x': x, 'y': y})
+    return {'curves': curves, 'baseline': baseline}
+
+
+def calibration_curve_data(mean_predicted_probs: np.ndarray, fraction_of_positives: np.ndarray) -> Dict[str, Any]:
+    """
+    Package a calibration curve as plot data.
+
+    Args:
+        mean_predicted_probs: Mean predicted probabilities per bin (NaN for empty bins)
+        fraction_of_positives: Fraction of positives per bin
+
+    Returns:
+        Dictionary with 'mean_predicted_probs' and 'fraction_of_positives'
+    """
+    return {'mean_predicted_probs': mean_predicted_probs, 'fraction_of_positives': fraction_of_positives}
+
+
+def confusion_matrix_data(confusion_matrix: np.ndarray, class_names: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Package a confusion matrix as plot data.
+
+    Args:
+        confusion_matrix: Confusion matrix counts (rows are true labels)
+        class_names: Optional list of class names
+
+    Returns:
+        Dictionary with 'confusion_matrix' and 'class_names'
+    """
+    return {'confusion_matrix': confusion_matrix, 'class_names': class_names}
+
+
+def confidence_histogram_data(
+    y_true: np.ndarray,
+    y_proba: np.ndarray,
+    ctx: Optional['EvalContext'] = None
+) -> Dict[str, Any]:
+    """
+    Count prediction confidences per bin, separately for correct and incorrect predictions.
+
+    Args:
+        y_true: True labels
+        y_proba: Predicted probabilities
+        ctx: Shared evaluation context (optional, reuses confidences)
+
+    Returns:
+        Dictionary with the 'bins' edges and the 'correct' and 'incorrect' counts per bin
+    """
+    # Get confidences and predictions
+    if ctx is not None:
+        confidences = ctx.confidences
+        y_pred = ctx.proba_predictions
+    elif y_proba.ndim == 1:
+        confidences = y_proba
+        y_pred = (y_proba > 0.5).astype(int)
+    else:
+        confidences = np.max(y_proba, axis=1)
+        y_pred = np.argmax(y_proba, axis=1)
+
+    # Separate correct and incorrect
+    correct_mask = y_pred == y_true
+    bins = np.linspace(0, 1, 20)
+    return {
+        'bins': bins,
+        'correct': np.histogram(confidences[correct_mask], bins=bins)[0],
+        'incorrect': np.histogram(confidences[~correct_mask], bins=bins)[0]
+    }
+
+
+def to_json_ready(value: Any) -> Any:
+    """
+    Convert plot data to JSON-serializable values.
+
+    Float arrays are rounded to JSON_DECIMALS places; NaN becomes null.
+
+    Args:
+        value: Plot data (dicts, lists, tuples, arrays, scalars)
+
+    Returns:
+        Nested dicts and lists of JSON-serializable values
+    """
+    if isinstance(value, dict):
+        return {key: to_json_ready(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json_ready(item) for item in value]
+    if isinstance(value, np.ndarray):
+        if np.issubdtype(value.dtype, np.floating):
+            rounded = np.round(value.astype(float), JSON_DECIMALS)
+            return np.where(np.isnan(rounded), None, rounded).tolist()
+        return value.tolist()
+    if isinstance(value, (float, np.floating)):
+        return None if np.isnan(value) else float(value)
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+def write_plot_data(name: str, data: Dict[str, Any], plots_dir: Union[str, Path]) -> str:
+    """
+    Write one plot's data as compact JSON.
+
+    Args:
+        name: Plot name (e.g. 'roc_curve'); the file is <name>.json
+        data: Output of the plot's *_data function
+        plots_dir: Directory to write to
+
+    Returns:
+        Path to the written file
+    """
+    path = Path(plots_dir) / f'{name}.json'
+    with open(path, 'w') as f:
+        json.dump({'plot': name, **to_json_ready(data)}, f, separators=(',', ':'))
+    return str(path)
+
+
+def save_plots(
+    plot_data: List[Tuple[str, Dict[str, Any]]],
+    plots_dir: Union[str, Path],
+    plot_format: str = 'png',
+    n_workers: Optional[int] = None
+) -> List[str]:
+    """
+    Save plots as PNG images or as JSON plot data.
+
+    In 'png' format each plot is drawn by render_<name> in
+    plots.classification (in n_workers processes, see
+    figures.render_plots); in 'data' format the data is written as JSON
+    and matplotlib is never imported.
+
+    Args:
+        plot_data: Plots to save as (name, output of the plot's *_data function)
+        plots_dir: Directory to write to
+        plot_format: 'png' or 'data'
+        n_workers: Number of render processes (png format only)
+
+    Returns:
+        Paths of the saved files, in plot order
+    """
+    if plot_format not in PLOT_FORMATS:
+        raise ValueError(f"Unknown plot_format: {plot_format!r}. Must be one of {PLOT_FORMATS}.")
+
+    if plot_format == 'data':
+        return [write_plot_data(name, data, plots_dir) for name, data in plot_data]
+
+    from . import classification
+    from .figures import render_plots
+    jobs = [
+        (getattr(classification, f'render_{name}'), data, str(Path(plots_dir) / f'{name}.png'))
+        for name, data in plot_data
+    ]
+    return render_plots(jobs, n_workers)
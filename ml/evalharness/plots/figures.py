@@ -0,0 +1,141 @@
+"""
+Figure creation and rendering without pyplot state.
+
+Plots are drawn on a matplotlib.figure.Figure with its own Agg canvas, so
+nothing is registered with pyplot and no global state is shared between
+plots: evaluations can render plots in parallel threads.
+
+The house style (seaborn's whitegrid look and our font sizes) is applied to
+each figure and its axes when they are created. Neither plt.rcParams nor
+seaborn's global style is modified; a style context (plt.rc_context) would
+temporarily change the process-wide rcParams and so race with other
+threads.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+FIGSIZE = (10, 8)
+DPI = 300
+
+# Font sizes (points)
+FONT_SIZE = 11
+LABEL_SIZE = 12
+TITLE_SIZE = 14
+TICK_SIZE = 10
+LEGEND_SIZE = 10
+
+# Whitegrid colors (gray levels)
+GRID_COLOR = '.8'
+TEXT_COLOR = '.15'
+
+# A plot to render: (render function, its data, output path)
+PlotJob = Tuple[Callable[[Dict[str, Any], Optional[str]], str], Dict[str, Any], str]
+
+
+def new_figure(interactive: bool = False, figsize: Tuple[float, float] = FIGSIZE) -> Tuple[Figure, Axes]:
+    """
+    Create a styled figure with one axes.
+
+    Args:
+        interactive: Create the figure through pyplot so it can be shown
+            (only for interactive use without an output path; not thread-safe)
+        figsize: Figure size in inches
+
+    Returns:
+        Tuple of (figure, axes)
+    """
+    if interactive:
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=figsize)
+    else:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+
+    ax = fig.add_subplot()
+    ax.set_facecolor('white')
+    ax.set_axisbelow(True)
+    ax.grid(True, color=GRID_COLOR, linestyle='-', linewidth=1)
+    for spine in ax.spines.values():
+        spine.set_color(GRID_COLOR)
+    ax.tick_params(length=0, labelsize=TICK_SIZE, colors=TEXT_COLOR)
+    return fig, ax
+
+
+def label_axes(ax: Axes, xlabel: str, ylabel: str, title: str) -> None:
+    """
+    Set axis labels and title in the house font sizes.
+
+    Args:
+        ax: Axes to label
+        xlabel: X axis label
+        ylabel: Y axis label
+        title: Axes title
+    """
+    ax.set_xlabel(xlabel, fontsize=LABEL_SIZE, color=TEXT_COLOR)
+    ax.set_ylabel(ylabel, fontsize=LABEL_SIZE, color=TEXT_COLOR)
+    ax.set_title(title, fontsize=TITLE_SIZE, color=TEXT_COLOR)
+
+
+def legend(ax: Axes, loc: str = 'best') -> None:
+    """
+    Add a legend in the house font size.
+
+    Args:
+        ax: Axes with labeled artists
+        loc: Legend location
+    """
+    ax.legend(loc=loc, fontsize=LEGEND_SIZE)
+
+
+def finish(fig: Figure, output_path: Optional[str] = None) -> str:
+    """
+    Lay out the figure and save it (or show it when no path is given).
+
+    Args:
+        fig: Figure from new_figure
+        output_path: Path to save the figure to
+
+    Returns:
+        output_path, or "" if the figure was shown
+    """
+    fig.tight_layout()
+    if output_path:
+        fig.savefig(output_path, dpi=DPI, bbox_inches='tight')
+        return output_path
+
+    import matplotlib.pyplot as plt
+    plt.show()
+    return ""
+
+
+def _render(job: PlotJob) -> str:
+    """Render one plot job (runs in a worker process)."""
+    render_fn, data, output_path = job
+    return render_fn(data, output_path)
+
+
+def render_plots(jobs: List[PlotJob], n_workers: Optional[int] = None) -> List[str]:
+    """
+    Render independent plots, in a process pool when several workers are requested.
+
+    Each job carries only the precomputed plot data (curve points, bin
+    counts), never the raw evaluation arrays, so sending it to a worker is
+    cheap. Render functions must be module-level functions (picklable).
+
+    Args:
+        jobs: Plots to render as (render function, data, output path)
+        n_workers: Number of worker processes (None or 1 renders in-process)
+
+    Returns:
+        Paths of the saved plots, in job order
+    """
+    if not n_workers or n_workers <= 1 or len(jobs) <= 1:
+        return [_render(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(jobs))) as pool:
+        return list(pool.map(_render, jobs))
@@ -1,17 +1,13 @@
 """
 Regression visualization functions.
 
-All plots are deterministic (same seed → same plot).
+Residual plots are not sampled (the seed arguments are ignored) and are
+drawn on pyplot-free figures from figures.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from typing import Optional
-
-
-# Set style for consistent, professional plots
-sns.set_style("whitegrid")
+from . import figures
 
 
 def plot_residuals(
@@ -27,35 +23,23 @@ def plot_residuals(
         y_true: True values
         y_pred: Predicted values
         output_path: Path to save plot
-        seed: Random seed for reproducibility
+        seed: Unused; kept for compatibility
 
     Returns:
         Path to saved plot
     """
-    np.random.seed(seed)
-
     residuals = y_true - y_pred
 
-    fig, ax = plt.subplots(figsize=(10, 8))
+    fig, ax = figures.new_figure(interactive=not output_path)
 
     ax.scatter(y_pred, residuals, alpha=0.5, s=30)
     ax.axhline(y=0, color='r', linestyle='--', linewidth=2, label='Zero residual')
 
-    ax.set_xlabel('Predicted Values')
-    ax.set_ylabel('Residuals')
-    ax.set_title('Residual Plot')
-    ax.legend()
+    figures.label_axes(ax, 'Predicted Values', 'Residuals', 'Residual Plot')
+    figures.legend(ax)
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-
-    if output_path:
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        return output_path
-    else:
-        plt.show()
-        return ""
+    return figures.finish(fig, output_path)
 
 
 def plot_predicted_vs_actual(
@@ -71,14 +55,12 @@ def plot_predicted_vs_actual(
         y_true: True values
         y_pred: Predicted values
         output_path: Path to save plot
-        seed: Random seed for reproducibility
+        seed: Unused; kept for compatibility
 
     Returns:
         Path to saved plot
     """
-    np.random.seed(seed)
-
-    fig, ax = plt.subplots(figsize=(10, 8))
+    fig, ax = figures.new_figure(interactive=not output_path)
 
     ax.scatter(y_true, y_pred, alpha=0.5, s=30, label='Predictions')
 
@@ -87,21 +69,11 @@ def plot_predicted_vs_actual(
     max_val = max(np.max(y_true), np.max(y_pred))
     ax.plot([min_val, max_val], [min_val, max_val], 'r--', linewidth=2, label='Perfect prediction')
 
-    ax.set_xlabel('True Values')
-    ax.set_ylabel('Predicted Values')
-    ax.set_title('Predicted vs Actual')
-    ax.legend()
+    figures.label_axes(ax, 'True Values', 'Predicted Values', 'Predicted vs Actual')
+    figures.legend(ax)
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-
-    if output_path:
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        return output_path
-    else:
-        plt.show()
-        return ""
+    return figures.finish(fig, output_path)
 
 
 def plot_error_distribution(
@@ -117,32 +89,20 @@ def plot_error_distribution(
         y_true: True values
         y_pred: Predicted values
         output_path: Path to save plot
-        seed: Random seed for reproducibility
+        seed: Unused; kept for compatibility
 
     Returns:
         Path to saved plot
     """
-    np.random.seed(seed)
-
     residuals = y_true - y_pred
 
-    fig, ax = plt.subplots(figsize=(10, 8))
+    fig, ax = figures.new_figure(interactive=not output_path)
 
     ax.hist(residuals, bins=50, edgecolor='black', alpha=0.7)
     ax.axvline(x=0, color='r', linestyle='--', linewidth=2, label='Zero error')
 
-    ax.set_xlabel('Residuals')
-    ax.set_ylabel('Frequency')
-    ax.set_title('Error Distribution')
-    ax.legend()
+    figures.label_axes(ax, 'Residuals', 'Frequency', 'Error Distribution')
+    figures.legend(ax)
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-
-    if output_path:
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        return output_path
-    else:
-        plt.show()
-        return ""
+    return figures.finish(fig, output_path)
@@ -46,13 +46,17 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "numpy>=1.20.0",
-        "pandas>=1.3.0",
+        "pandas>=1.5.0",
         "scikit-learn>=1.0.0",
+        "scipy>=1.5.0",
         "matplotlib>=3.4.0",
         "seaborn>=0.11.0",
         "pydantic>=1.9.0",
     ],
     extras_require={
+        "parquet": [
+            "pyarrow>=8.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
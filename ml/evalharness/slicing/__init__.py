@@ -1,5 +1,22 @@
 """Data slicing for performance analysis across subgroups."""
 
-from . import slicer
+from ..lazy import attach
 
-__all__ = ['slicer']
+__all__ = [
+    'slicer', 'columns', 'engine', 'bucketing', 'missingness', 'significance',
+    'discovery', 'interactions', 'streaming', 'parallel', 'SliceIndex'
+]
+
+__getattr__, __dir__ = attach(__name__, {
+    'slicer': 'slicer',
+    'columns': 'columns',
+    'engine': 'engine',
+    'bucketing': 'bucketing',
+    'missingness': 'missingness',
+    'significance': 'significance',
+    'discovery': 'discovery',
+    'interactions': 'interactions',
+    'streaming': 'streaming',
+    'parallel': 'parallel',
+    'SliceIndex': 'index:SliceIndex'
+})
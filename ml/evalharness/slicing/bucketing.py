@@ -0,0 +1,245 @@
+"""
+Quantile bucketing for numeric features and confidences.
+
+Bucket ids are assigned in one np.searchsorted pass over quantile edges
+instead of one boolean mask per bucket. For data seen in batches,
+QuantileSketch keeps a mergeable summary (logarithmically spaced bins with
+bounded relative error) whose bins can be merged into quantile buckets after
+the pass.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+
+def quantile_edges(values: np.ndarray, n_buckets: int = 10) -> np.ndarray:
+    """
+    Compute quantile bucket edges.
+
+    Args:
+        values: 1-D array of values (NaNs are ignored)
+        n_buckets: Number of buckets
+
+    Returns:
+        Array of n_buckets + 1 edges (may repeat when values are tied)
+    """
+    return np.nanpercentile(values, np.linspace(0, 100, n_buckets + 1))
+
+
+def assign_buckets(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Assign bucket ids in one searchsorted pass.
+
+    Bucket i holds values in [edges[i], edges[i + 1]); the last bucket also
+    includes its upper edge, and values outside the edges are clipped into
+    the first or last bucket. When edges repeat, tied values fall in the last
+    bucket starting at that edge.
+
+    Args:
+        values: 1-D array of values
+        edges: Sorted bucket edges, length n_buckets + 1
+
+    Returns:
+        Integer bucket id per value (-1 for NaN)
+    """
+    buckets = np.searchsorted(edges[1:-1], values, side='right')
+    if np.issubdtype(np.asarray(values).dtype, np.floating):
+        buckets[np.isnan(values)] = -1
+    return buckets
+
+
+def bucket_labels(edges: np.ndarray) -> List[str]:
+    """
+    Format bucket ranges as "[lower, upper)" labels ("]" for the last bucket).
+
+    Args:
+        edges: Bucket edges
+
+    Returns:
+        One label per bucket
+    """
+    n_buckets = len(edges) - 1
+    return [
+        f"[{edges[i]:.4g}, {edges[i + 1]:.4g}{']' if i == n_buckets - 1 else ')'}"
+        for i in range(n_buckets)
+    ]
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with bounded relative error.
+
+    Values are counted in logarithmically spaced bins (key k covers
+    (gamma^(k-1), gamma^k] in absolute value, gamma = (1 + a) / (1 - a)), so
+    every quantile estimate is within relative error `a` of a true sample
+    quantile. Sketches of different batches or workers merge by adding bin
+    counts. Keys are ordered like the values they cover.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-9):
+        """
+        Initialize quantile sketch.
+
+        Args:
+            relative_accuracy: Relative error bound of quantile estimates
+            min_value: Absolute values below this are counted as zero
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy must be in (0, 1), got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = np.log(self.gamma)
+        # Shift indices so that every key of a non-zero value is >= 1
+        self._offset = 1 - int(np.ceil(np.log(min_value) / self._log_gamma))
+        self.keys = np.zeros(0, dtype=np.int64)
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    @property
+    def count(self) -> int:
+        """Number of values added."""
+        return int(self.counts.sum())
+
+    def key(self, values: np.ndarray) -> np.ndarray:
+        """
+        Map values to sketch keys (sign * shifted log-gamma index; 0 for ~0).
+
+        Args:
+            values: Array of finite values
+
+        Returns:
+            Integer key per value
+        """
+        values = np.asarray(values, dtype=float)
+        magnitude = np.abs(values)
+        with np.errstate(divide='ignore'):
+            index = np.ceil(np.log(np.maximum(magnitude, self.min_value)) / self._log_gamma).astype(np.int64)
+        keys = np.sign(values).astype(np.int64) * (index + self._offset)
+        keys[magnitude < self.min_value] = 0
+        return keys
+
+    def value(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Get the representative value of each key (relative error <= relative_accuracy).
+
+        Args:
+            keys: Sketch keys
+
+        Returns:
+            Representative values
+        """
+        keys = np.asarray(keys)
+        index = np.abs(keys) - self._offset
+        values = np.sign(keys) * 2 * self.gamma ** index / (self.gamma + 1)
+        return np.where(keys == 0, 0.0, values)
+
+    def update(self, values: np.ndarray):
+        """
+        Add a batch of values (NaNs are ignored).
+
+        Args:
+            values: Array of values
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        keys, counts = np.unique(self.key(values), return_counts=True)
+        self._add_counts(keys, counts)
+
+    def merge(self, other: 'QuantileSketch'):
+        """
+        Merge another sketch with the same accuracy into this one.
+
+        Args:
+            other: Sketch to merge
+        """
+        if other.gamma != self.gamma or other._offset != self._offset:
+            raise ValueError("Only sketches with the same relative_accuracy and min_value can be merged")
+        self._add_counts(other.keys, other.counts)
+
+    def _add_counts(self, keys: np.ndarray, counts: np.ndarray):
+        all_keys, inverse = np.unique(np.concatenate([self.keys, keys]), return_inverse=True)
+        merged = np.bincount(inverse.ravel(), weights=np.concatenate([self.counts, counts]), minlength=len(all_keys))
+        self.keys, self.counts = all_keys, merged.astype(np.int64)
+
+    def quantiles(self, qs: np.ndarray) -> np.ndarray:
+        """
+        Estimate quantiles.
+
+        Args:
+            qs: Quantiles in [0, 1]
+
+        Returns:
+            Estimated values
+        """
+        if self.count == 0:
+            return np.full(len(np.atleast_1d(qs)), np.nan)
+        ranks = np.asarray(qs, dtype=float) * (self.count - 1)
+        positions = np.searchsorted(np.cumsum(self.counts), ranks, side='right')
+        return self.value(self.keys[np.minimum(positions, len(self.keys) - 1)])
+
+    def edges(self, n_buckets: int = 10) -> np.ndarray:
+        """
+        Estimate quantile bucket edges (see quantile_edges).
+
+        Args:
+            n_buckets: Number of buckets
+
+        Returns:
+            Array of n_buckets + 1 edges
+        """
+        return self.quantiles(np.linspace(0, 1, n_buckets + 1))
+
+
+def merge_bins_to_buckets(
+    bin_keys: np.ndarray,
+    bin_counts: np.ndarray,
+    n_buckets: int = 10
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Group ordered fine bins into quantile buckets by cumulative count.
+
+    Used after a streaming pass: rows were counted per fine bin, and fine
+    bins are merged into buckets holding about equal numbers of rows.
+
+    Args:
+        bin_keys: Sort key of each fine bin (bins are ordered by key)
+        bin_counts: Number of rows in each fine bin
+        n_buckets: Number of buckets
+
+    Returns:
+        Tuple of (bucket id per fine bin, sort order of the fine bins)
+    """
+    order = np.argsort(bin_keys, kind='stable')
+    sorted_counts = bin_counts[order]
+    cumulative = np.cumsum(sorted_counts) - sorted_counts / 2
+    boundaries = np.linspace(0, 1, n_buckets + 1)[1:-1] * sorted_counts.sum()
+    buckets = np.empty(len(order), dtype=np.int64)
+    buckets[order] = np.searchsorted(boundaries, cumulative, side='right')
+    return buckets, order
+
+
+def bucket_slices(
+    values: np.ndarray,
+    n_buckets: int = 10,
+    edges: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, Dict[int, np.ndarray]]:
+    """
+    Bucket values by quantile and return the row indices of every bucket.
+
+    Args:
+        values: 1-D array of values
+        n_buckets: Number of buckets (ignored if edges are given)
+        edges: Precomputed edges (optional, e.g. from a QuantileSketch)
+
+    Returns:
+        Tuple of (edges, dictionary of bucket id to sorted row indices)
+    """
+    from .engine import group_indices
+
+    if edges is None:
+        edges = quantile_edges(values, n_buckets)
+    buckets = assign_buckets(values, edges)
+    valid = buckets >= 0
+    rows = np.flatnonzero(valid)
+    groups = group_indices(buckets[valid], len(edges) - 1)
+    return edges, {i: rows[group] for i, group in enumerate(groups)}
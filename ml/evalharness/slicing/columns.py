@@ -0,0 +1,99 @@
+"""
+Column access for arrays and DataFrames.
+
+Slicing functions accept either a 2-D numpy array, addressed by feature
+position, or a pandas DataFrame, addressed by column name (or position).
+DataFrame columns are read one at a time as Series, so a mixed-type frame
+is never converted to an object array, and categorical columns keep their
+integer codes.
+"""
+
+from typing import Any, Hashable, List, Optional, Union
+import numpy as np
+import pandas as pd
+
+
+Data = Union[np.ndarray, pd.DataFrame]
+
+
+def is_frame(data: Any) -> bool:
+    """Whether data is a pandas DataFrame."""
+    return isinstance(data, pd.DataFrame)
+
+
+def feature_keys(data: Data) -> List[Hashable]:
+    """
+    List the features of the data.
+
+    Args:
+        data: Input array or DataFrame
+
+    Returns:
+        Column names for a DataFrame, feature positions for an array
+    """
+    if is_frame(data):
+        return list(data.columns)
+    return list(range(data.shape[1] if data.ndim > 1 else 1))
+
+
+def get_column(data: Data, feature: Hashable) -> Union[np.ndarray, pd.Series]:
+    """
+    Get one feature column.
+
+    Args:
+        data: Input array or DataFrame
+        feature: Column name, or position (for arrays, or DataFrame columns
+            that are not themselves named by integers)
+
+    Returns:
+        The column as a Series (DataFrame) or 1-D array
+    """
+    if is_frame(data):
+        if feature in data.columns:
+            return data[feature]
+        return data.iloc[:, feature]
+    return data[:, feature] if data.ndim > 1 else data
+
+
+def feature_label(data: Data, feature: Hashable, feature_names: Optional[List[str]] = None) -> str:
+    """
+    Get the display name of a feature.
+
+    Args:
+        data: Input array or DataFrame
+        feature: Column name or position
+        feature_names: Optional list of feature names (by position)
+
+    Returns:
+        Feature name used in slice names
+    """
+    if isinstance(feature, (int, np.integer)) and feature_names and feature < len(feature_names):
+        return feature_names[feature]
+    if is_frame(data):
+        return str(feature if feature in data.columns else data.columns[feature])
+    return f'feature_{feature}'
+
+
+def column_values(column: Union[np.ndarray, pd.Series], dtype: Optional[type] = None) -> np.ndarray:
+    """
+    Get the values of a column as a numpy array.
+
+    Args:
+        column: Series or 1-D array
+        dtype: Optional dtype to convert to (e.g. float; missing values become NaN)
+
+    Returns:
+        1-D array
+    """
+    if isinstance(column, pd.Series):
+        if dtype is float:
+            return column.to_numpy(dtype=float, na_value=np.nan)
+        return column.to_numpy(dtype=dtype)
+    return column.astype(dtype) if dtype is not None else column
+
+
+def is_numeric_column(column: Union[np.ndarray, pd.Series]) -> bool:
+    """Whether a column holds numbers (bool and categorical columns do not count)."""
+    if isinstance(column, pd.Series):
+        return pd.api.types.is_numeric_dtype(column.dtype) and not pd.api.types.is_bool_dtype(column.dtype)
+    return np.issubdtype(column.dtype, np.number)
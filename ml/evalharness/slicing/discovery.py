@@ -0,0 +1,218 @@
+"""
+Automatic problematic-slice discovery.
+
+Searches the lattice of feature crosses (feature_a=x AND feature_b=y ...)
+level by level for large slices whose error rate is significantly higher
+than on the rest of the data.
+
+Each level is counted with one np.bincount per extension feature over the
+(parent slice, row) membership pairs of all parents at once. Parents are
+ordered by their last feature, so the parents a feature can extend (in
+canonical feature order) are always a prefix of the pairs. Candidates are
+pruned with bounds that hold for every descendant:
+
+- Support: a cross never has more rows than its parent, so parents below
+  the minimum support are not expanded.
+- Effect size: a descendant with at least `min_count` rows has at most
+  min(errors, min_count) / min_count error rate, so parents whose optimistic
+  error rate cannot beat the overall rate by `min_effect` are not expanded.
+
+Of the parents that survive both bounds, only the `beam_width` with the most
+excess errors are expanded, which bounds the work per level.
+
+Numeric features with more than `max_cardinality` distinct values are
+crossed by quantile bucket; other high-cardinality features are skipped.
+"""
+
+import numpy as np
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+from . import bucketing, columns
+from .engine import encode_groups
+from .significance import two_proportion_z
+
+
+# Features with more distinct values than this are bucketed (numeric) or skipped
+DEFAULT_MAX_CARDINALITY = 50
+
+
+def _encode_column(
+    values: np.ndarray,
+    max_cardinality: int,
+    n_buckets: int
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Encode a column as (value labels, compact codes), or None if it cannot be crossed."""
+    unique_values, codes = encode_groups(values)
+
+    if len(unique_values) > max_cardinality:
+        if not columns.is_numeric_column(values):
+            return None
+        values = columns.column_values(values, float)
+        edges = bucketing.quantile_edges(values, n_buckets)
+        buckets = bucketing.assign_buckets(values, edges)
+        unique_values = np.array(bucketing.bucket_labels(edges) + ['nan'], dtype=object)
+        codes = np.where(buckets < 0, n_buckets, buckets)
+
+    return unique_values, codes.astype(np.min_scalar_type(max(len(unique_values) - 1, 0)))
+
+
+def find_problematic_slices(
+    data: np.ndarray,
+    correct: np.ndarray,
+    features: Optional[Sequence[Hashable]] = None,
+    feature_names: Optional[List[str]] = None,
+    max_depth: int = 2,
+    min_support: float = 0.01,
+    min_effect: float = 0.05,
+    z_threshold: float = 1.96,
+    max_cardinality: int = DEFAULT_MAX_CARDINALITY,
+    n_numeric_buckets: int = 10,
+    beam_width: int = 50,
+    max_slices: int = 20,
+    return_indices: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Find large slices with a significantly higher error rate, over feature crosses.
+
+    Args:
+        data: Input features, shape (n_samples, n_features), array or DataFrame
+        correct: Boolean mask of correct predictions
+        features: Feature indices or DataFrame column names to search (default: all)
+        feature_names: Optional list of feature names
+        max_depth: Maximum number of features in a cross
+        min_support: Minimum slice size, as a fraction of rows (< 1) or a row count
+        min_effect: Minimum error rate increase over the whole dataset
+        z_threshold: Minimum z statistic against the slice complement
+        max_cardinality: Bucket numeric (skip other) features with more distinct values than this
+        n_numeric_buckets: Number of quantile buckets for high-cardinality numeric features
+        beam_width: Maximum number of slices expanded per level
+        max_slices: Maximum number of slices to return
+        return_indices: Also return the row indices of each slice
+
+    Returns:
+        List of slices (slice_name, conditions, sample_count, error_rate,
+        effect_size, z_score, and indices if requested), most significant first
+    """
+    if not columns.is_frame(data):
+        data = np.asarray(data)
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
+    n = len(data)
+    if n == 0:
+        return []
+
+    errors = (~np.asarray(correct, dtype=bool)).astype(np.float64)
+    total_errors = errors.sum()
+    overall_error = total_errors / n
+    min_count = max(int(np.ceil(min_support * n)) if min_support < 1 else int(min_support), 1)
+
+    # Encode candidate features, addressed by position in the search
+    all_features = columns.feature_keys(data)
+    positions = range(len(all_features)) if features is None else [
+        all_features.index(f) if columns.is_frame(data) and f in all_features else f for f in features
+    ]
+    encoded_columns = {}
+    for j in positions:
+        encoded = _encode_column(columns.get_column(data, all_features[j]), max_cardinality, n_numeric_buckets)
+        if encoded is not None:
+            encoded_columns[j] = encoded
+    feature_order = sorted(encoded_columns)
+
+    found = []
+
+    # Parents of the current level: conditions ((feature, code), ...) and rows,
+    # sorted by last feature. The root (no conditions) covers every row.
+    parents = [((), np.arange(n, dtype=np.int64))]
+
+    for depth in range(1, max_depth + 1):
+        sizes = [len(rows) for _, rows in parents]
+        pair_parent = np.repeat(np.arange(len(parents)), sizes)
+        pair_rows = np.concatenate([rows for _, rows in parents])
+        pair_errors = errors[pair_rows]
+        last_feature = np.array([conds[-1][0] if conds else -1 for conds, _ in parents])
+        pair_ends = np.cumsum(sizes)
+
+        # Expandable children of this level: (excess errors, parent, feature, code)
+        expandable = []
+
+        for j in feature_order:
+            n_parents = int(np.searchsorted(last_feature, j))  # parents whose last feature < j
+            if n_parents == 0:
+                continue
+            end = pair_ends[n_parents - 1]
+            unique_values, codes = encoded_columns[j]
+            n_values = len(unique_values)
+
+            keys = pair_parent[:end] * n_values + codes[pair_rows[:end]]
+            counts = np.bincount(keys, minlength=n_parents * n_values)
+            slice_errors = np.bincount(keys, weights=pair_errors[:end], minlength=n_parents * n_values)
+
+            supported = counts >= min_count
+            with np.errstate(divide='ignore', invalid='ignore'):
+                error_rate = np.where(counts > 0, slice_errors / counts, 0.0)
+            effect = error_rate - overall_error
+            z = two_proportion_z(slice_errors, counts, total_errors, n)
+
+            for i in np.flatnonzero(supported & (effect >= min_effect) & (z >= z_threshold)):
+                found.append({
+                    'conditions': parents[i // n_values][0] + ((j, int(i % n_values)),),
+                    'sample_count': int(counts[i]),
+                    'error_rate': float(error_rate[i]),
+                    'effect_size': float(effect[i]),
+                    'z_score': float(z[i])
+                })
+
+            if depth < max_depth:
+                optimistic_error = np.minimum(slice_errors, min_count) / min_count
+                excess = slice_errors - counts * overall_error
+                for i in np.flatnonzero(supported & (optimistic_error - overall_error >= min_effect)):
+                    expandable.append((excess[i], i // n_values, j, i % n_values))
+
+        if not expandable:
+            break
+
+        # Keep the children with the most excess errors; order them by last feature
+        expandable.sort(key=lambda child: child[0], reverse=True)
+        children = sorted(expandable[:beam_width], key=lambda child: child[2])
+        parents = [
+            (parents[p][0] + ((j, int(code)),), parents[p][1][encoded_columns[j][1][parents[p][1]] == code])
+            for _, p, j, code in children
+        ]
+
+    found.sort(key=lambda s: s['z_score'], reverse=True)
+    found = found[:max_slices]
+
+    for s in found:
+        s['slice_name'] = ' AND '.join(
+            f"{columns.feature_label(data, all_features[j], feature_names)}={encoded_columns[j][0][code]}"
+            for j, code in s['conditions']
+        )
+        if return_indices:
+            mask = np.ones(n, dtype=bool)
+            for j, code in s['conditions']:
+                mask &= encoded_columns[j][1] == code
+            s['indices'] = np.flatnonzero(mask)
+        s['conditions'] = [(all_features[j], np.asarray(encoded_columns[j][0][code]).item()) for j, code in s['conditions']]
+
+    return found
+
+
+def discover_slices(
+    data: np.ndarray,
+    correct: np.ndarray,
+    feature_names: Optional[List[str]] = None,
+    **kwargs
+) -> Dict[str, np.ndarray]:
+    """
+    Discover problematic feature-cross slices.
+
+    Args:
+        data: Input features, shape (n_samples, n_features)
+        correct: Boolean mask of correct predictions
+        feature_names: Optional list of feature names
+        **kwargs: Search options passed to find_problematic_slices
+
+    Returns:
+        Dictionary mapping slice names to indices, most significant first
+    """
+    found = find_problematic_slices(data, correct, feature_names=feature_names, return_indices=True, **kwargs)
+    return {s['slice_name']: s['indices'] for s in found}
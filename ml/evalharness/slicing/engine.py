@@ -0,0 +1,272 @@
+"""
+Group-by slice evaluation engine.
+
+Slice membership is encoded as integer ids and per-slice confusion counts
+for all slices are computed at once with a single 2-D np.bincount over
+(slice id, class) pairs. Every per-slice metric is then derived from the
+counts, so evaluating thousands of slices costs one pass over the rows
+instead of one full metric computation per slice.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Tuple, Union
+from ..metrics.classification import compute_metrics_from_counts
+from .significance import rank_slices
+
+
+def encode_groups(values: Union[np.ndarray, pd.Series]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode values as integer group ids.
+
+    Categorical Series reuse their codes, and other non-numeric Series are
+    hashed with pd.factorize, so string columns are never sorted row by row
+    or converted to object arrays. Missing values form their own group (last).
+
+    Args:
+        values: 1-D array or Series of values (e.g. one feature column)
+
+    Returns:
+        Tuple of (unique values, sorted or in category order, and group id per row)
+    """
+    if isinstance(values, pd.Series):
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            return _encode_categorical(values)
+        if not pd.api.types.is_numeric_dtype(values.dtype):
+            group_ids, unique_values = pd.factorize(values, sort=True, use_na_sentinel=False)
+            return np.asarray(unique_values, dtype=object), group_ids.astype(np.int64)
+        values = values.to_numpy()
+
+    unique_values, group_ids = np.unique(values, return_inverse=True)
+    return unique_values, group_ids.reshape(-1)
+
+
+def _encode_categorical(values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode a categorical Series from its codes, dropping unused categories."""
+    codes = values.cat.codes.to_numpy().astype(np.int64)
+    categories = np.asarray(values.cat.categories, dtype=object)
+    missing = codes < 0
+    if missing.any():
+        categories = np.append(categories, np.nan)
+        codes[missing] = len(categories) - 1
+
+    used = np.flatnonzero(np.bincount(codes, minlength=len(categories)))
+    if len(used) < len(categories):
+        remap = np.full(len(categories), -1, dtype=np.int64)
+        remap[used] = np.arange(len(used))
+        categories, codes = categories[used], remap[codes]
+    return categories, codes
+
+
+def group_indices(group_ids: np.ndarray, n_groups: int) -> List[np.ndarray]:
+    """
+    Split row indices by group id with one stable sort.
+
+    Args:
+        group_ids: Group id per row
+        n_groups: Number of groups
+
+    Returns:
+        List of sorted row index arrays, one per group
+    """
+    if 0 < n_groups <= 2 ** 16:
+        # Stable argsort of 8/16-bit keys is a radix sort
+        group_ids = group_ids.astype(np.min_scalar_type(n_groups - 1), copy=False)
+    order = np.argsort(group_ids, kind='stable')
+    bounds = np.cumsum(np.bincount(group_ids, minlength=n_groups))[:-1]
+    return np.split(order, bounds)
+
+
+def encode_labels(y_true: np.ndarray, y_pred: np.ndarray) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Encode true and predicted labels into one shared class index space.
+
+    Args:
+        y_true: True labels
+        y_pred: Predicted labels
+
+    Returns:
+        Tuple of (encoded true labels, encoded predictions, number of classes)
+    """
+    classes, codes = np.unique(np.concatenate([y_true, y_pred]), return_inverse=True)
+    codes = codes.reshape(-1)
+    return codes[:len(y_true)], codes[len(y_true):], len(classes)
+
+
+def membership_from_slices(slices: Dict[str, np.ndarray]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Flatten a dict of (possibly overlapping) slices into (slice id, row) pairs.
+
+    Args:
+        slices: Dictionary (or SliceIndex) of slice names to row indices
+
+    Returns:
+        Tuple of (slice names, slice id per pair, row index per pair)
+    """
+    names = list(slices)
+    if not names:
+        return names, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    members = [np.asarray(slices[name], dtype=np.int64) for name in names]
+    slice_ids = np.repeat(np.arange(len(names)), [len(rows) for rows in members])
+    return names, slice_ids, np.concatenate(members)
+
+
+def slice_confusion_counts(
+    slice_ids: np.ndarray,
+    rows: np.ndarray,
+    n_slices: int,
+    y_true_codes: np.ndarray,
+    y_pred_codes: np.ndarray,
+    n_classes: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Count true positives, predictions and true labels per slice and class.
+
+    Args:
+        slice_ids: Slice id per (slice, row) pair
+        rows: Row index per pair
+        n_slices: Number of slices
+        y_true_codes: Encoded true labels per row
+        y_pred_codes: Encoded predictions per row
+        n_classes: Number of classes
+
+    Returns:
+        Tuple of (tp, pred_count, true_count), each of shape (n_slices, n_classes)
+    """
+    size = n_slices * n_classes
+    y_true_rows = y_true_codes[rows]
+    y_pred_rows = y_pred_codes[rows]
+    base = slice_ids * n_classes
+    correct = y_true_rows == y_pred_rows
+
+    true_count = np.bincount(base + y_true_rows, minlength=size).reshape(n_slices, n_classes)
+    pred_count = np.bincount(base + y_pred_rows, minlength=size).reshape(n_slices, n_classes)
+    tp = np.bincount(base[correct] + y_true_rows[correct], minlength=size).reshape(n_slices, n_classes)
+    return tp, pred_count, true_count
+
+
+def merge_counts(
+    counts: Tuple[List[str], np.ndarray, np.ndarray, np.ndarray],
+    extra: Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]
+) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Append precounted slices to per-slice counts.
+
+    Args:
+        counts: (names, tp, pred_count, true_count)
+        extra: Further (names, tp, pred_count, true_count); names already in
+            `counts` are skipped
+
+    Returns:
+        Combined (names, tp, pred_count, true_count)
+    """
+    names, *arrays = counts
+    extra_names, *extra_arrays = extra
+    seen = set(names)
+    keep = np.array([name not in seen for name in extra_names], dtype=bool)
+    merged = [np.concatenate([array, extra_array[keep]]) for array, extra_array in zip(arrays, extra_arrays)]
+    return (names + [name for name, kept in zip(extra_names, keep) if kept], *merged)
+
+
+def build_slice_results(
+    names: List[str],
+    tp: np.ndarray,
+    pred_count: np.ndarray,
+    true_count: np.ndarray,
+    min_samples: int = 10,
+    average: str = 'weighted',
+    totals: Optional[Tuple[int, float]] = None,
+    alpha: Optional[float] = 0.05,
+    test: str = 'binomial'
+) -> List[Dict[str, Any]]:
+    """
+    Build slice results from per-slice counts.
+
+    Args:
+        names: Slice names, aligned with the first axis of the counts
+        tp: True positives, shape (n_slices, n_classes)
+        pred_count: Predictions per class, shape (n_slices, n_classes)
+        true_count: True labels per class, shape (n_slices, n_classes)
+        min_samples: Minimum samples required to report a slice
+        average: Averaging strategy for precision, recall and F1
+        totals: (number of rows, number of errors) over the whole dataset;
+            when given, slices are tested against their complement
+        alpha: False discovery rate for the slice tests (None disables them)
+        test: Slice test method ('binomial' or 'z', see slicing.significance)
+
+    Returns:
+        List of slice results sorted by accuracy (descending), or ranked by
+        significance (see significance.rank_slices) when totals are given
+    """
+    sample_counts = true_count.sum(axis=1)
+    keep = np.flatnonzero(sample_counts >= min_samples)
+    slice_metrics = compute_metrics_from_counts(tp[keep], pred_count[keep], true_count[keep], average=average)
+
+    # Stable sort keeps the input order among equal accuracies
+    order = np.argsort(-slice_metrics['accuracy'], kind='stable')
+
+    results = []
+    for i in order:
+        accuracy = float(slice_metrics['accuracy'][i])
+        results.append({
+            'slice_name': names[keep[i]],
+            'sample_count': int(sample_counts[keep[i]]),
+            'metric_value': accuracy,
+            'accuracy': accuracy,
+            'precision': float(slice_metrics['precision'][i]),
+            'recall': float(slice_metrics['recall'][i]),
+            'f1_score': float(slice_metrics['f1_score'][i])
+        })
+
+    if totals is not None and alpha is not None:
+        n, total_errors = totals
+        slice_errors = (true_count.sum(axis=1) - tp.sum(axis=1))[keep[order]]
+        results = rank_slices(results, slice_errors, total_errors, n, alpha=alpha, method=test)
+
+    return results
+
+
+def evaluate_slices_by_counts(
+    slices: Dict[str, np.ndarray],
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    min_samples: int = 10,
+    average: str = 'weighted',
+    label_codes: Optional[Tuple[np.ndarray, np.ndarray, int]] = None,
+    alpha: Optional[float] = 0.05,
+    test: str = 'binomial',
+    extra_counts: Optional[Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate classification metrics on every slice in one vectorized pass.
+
+    Gives the same accuracy, precision, recall and F1 per slice as running
+    compute_all_metrics on each slice separately.
+
+    Args:
+        slices: Dictionary of slice names to row indices
+        y_true: True labels
+        y_pred: Predicted labels
+        min_samples: Minimum samples required to report a slice
+        average: Averaging strategy for precision, recall and F1
+        label_codes: Precomputed output of encode_labels (optional)
+        alpha: False discovery rate for testing slices against their complement
+            (None keeps plain accuracy order)
+        test: Slice test method ('binomial' or 'z')
+        extra_counts: Precounted slices as (names, tp, pred_count, true_count),
+            e.g. from interactions.evaluate_feature_pairs; names already in
+            `slices` are ignored
+
+    Returns:
+        List of slice results, worst significant slice last (see build_slice_results)
+    """
+    y_true_codes, y_pred_codes, n_classes = label_codes or encode_labels(y_true, y_pred)
+    names, slice_ids, rows = membership_from_slices(slices)
+    tp, pred_count, true_count = slice_confusion_counts(
+        slice_ids, rows, len(names), y_true_codes, y_pred_codes, n_classes
+    )
+    if extra_counts is not None:
+        names, tp, pred_count, true_count = merge_counts((names, tp, pred_count, true_count), extra_counts)
+    totals = (len(y_true_codes), float(np.count_nonzero(y_true_codes != y_pred_codes)))
+    return build_slice_results(names, tp, pred_count, true_count, min_samples, average, totals, alpha, test)
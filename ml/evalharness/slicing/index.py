@@ -0,0 +1,259 @@
+"""
+Compact slice index.
+
+Stores named slices over a fixed set of rows. Each slice is kept as a packed
+bitmap (np.packbits, n_rows / 8 bytes) when it is dense, or as a sorted row
+array (int32, or int64 above 2^31 rows) when it is sparse, whichever is
+smaller.
+Intersections, unions and counts work directly on these representations, so
+slice crosses such as "country=BR AND missingness_high" can be queried
+without rescanning the data.
+"""
+
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+import numpy as np
+
+
+# Number of set bits in every byte value
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+_Entry = Tuple[str, np.ndarray]  # ('bits', packed uint8) or ('rows', sorted row ids)
+
+
+class SliceIndex(Mapping):
+    """
+    Named slices stored as packed bitmaps or sorted row arrays.
+
+    Behaves as a read-only mapping of slice names to sorted row indices, so it
+    can be passed wherever a dict of slice indices is expected.
+    """
+
+    def __init__(self, n_rows: int):
+        """
+        Initialize an empty slice index.
+
+        Args:
+            n_rows: Number of rows the slices refer to
+        """
+        self.n_rows = n_rows
+        # Row ids must hold n_rows - 1 without overflowing
+        self.row_dtype = np.dtype(np.int32 if n_rows <= 2 ** 31 else np.int64)
+        self._entries: Dict[str, _Entry] = {}
+        self._counts: Dict[str, int] = {}
+
+    @classmethod
+    def from_slices(cls, slices: Dict[str, np.ndarray], n_rows: int) -> 'SliceIndex':
+        """
+        Build an index from a dictionary of slice names to row indices.
+
+        Args:
+            slices: Dictionary of slice names to row indices
+            n_rows: Number of rows the slices refer to
+
+        Returns:
+            SliceIndex holding the slices
+        """
+        index = cls(n_rows)
+        index.update(slices)
+        return index
+
+    def add(self, name: str, rows: Union[np.ndarray, List[int]]):
+        """
+        Add a slice from row indices or a boolean mask.
+
+        Args:
+            name: Slice name
+            rows: Row indices, or a boolean mask of length n_rows
+        """
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            if len(rows) != self.n_rows:
+                raise ValueError(f"Slice mask length ({len(rows)}) must equal n_rows ({self.n_rows})")
+            mask, rows = rows, np.flatnonzero(rows)
+        else:
+            # Slicers produce sorted, unique rows; only sort when they are not
+            if len(rows) > 1 and not np.all(rows[1:] > rows[:-1]):
+                rows = np.unique(rows)
+            mask = None
+
+        if len(rows) and (rows[0] < 0 or rows[-1] >= self.n_rows):
+            raise ValueError(f"Slice '{name}' has row indices outside [0, {self.n_rows})")
+
+        self._entries[name] = self._encode(rows, mask)
+        self._counts[name] = len(rows)
+
+    def update(self, slices: Union['SliceIndex', Dict[str, np.ndarray]]):
+        """
+        Add several slices.
+
+        Args:
+            slices: Dictionary of slice names to row indices, or another SliceIndex
+                over the same rows (its entries are copied without re-encoding)
+        """
+        if isinstance(slices, SliceIndex):
+            if slices.n_rows != self.n_rows:
+                raise ValueError(f"Slice indices must cover the same rows ({slices.n_rows} != {self.n_rows})")
+            self._entries.update(slices._entries)
+            self._counts.update(slices._counts)
+            return
+
+        for name, rows in slices.items():
+            self.add(name, rows)
+
+    def _encode(self, rows: np.ndarray, mask: Optional[np.ndarray] = None) -> _Entry:
+        # A bitmap costs n_rows / 8 bytes, a row array itemsize bytes per member
+        if 8 * self.row_dtype.itemsize * len(rows) < self.n_rows:
+            return 'rows', rows.astype(self.row_dtype)
+        if mask is None:
+            mask = self._sparse_mask(rows)
+        return 'bits', np.packbits(mask)
+
+    def _decode(self, entry: _Entry) -> np.ndarray:
+        kind, values = entry
+        if kind == 'rows':
+            return values
+        return np.flatnonzero(np.unpackbits(values, count=self.n_rows)).astype(self.row_dtype)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._decode(self._entries[name])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def count(self, name: str) -> int:
+        """
+        Get the number of rows in a slice.
+
+        Args:
+            name: Slice name
+
+        Returns:
+            Row count
+        """
+        return self._counts[name]
+
+    def mask(self, name: str) -> np.ndarray:
+        """
+        Get a slice as a boolean mask over all rows.
+
+        Args:
+            name: Slice name
+
+        Returns:
+            Boolean mask of length n_rows
+        """
+        kind, values = self._entries[name]
+        if kind == 'bits':
+            return np.unpackbits(values, count=self.n_rows).astype(bool)
+        return self._sparse_mask(values)
+
+    @staticmethod
+    def _test_bits(bits: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        # packbits is big-endian within each byte
+        return ((bits[rows >> 3] >> (7 - (rows & 7))) & 1).astype(bool)
+
+    def _combine(self, names: Tuple[str, ...], op: str) -> _Entry:
+        if not names:
+            raise ValueError("At least one slice name is required")
+
+        if op == 'and':
+            # Start from the smallest slice; sparse rows are filtered by the rest
+            entries = [self._entries[name] for name in sorted(names, key=self._counts.__getitem__)]
+            kind, values = entries[0]
+            for other_kind, other in entries[1:]:
+                if kind == 'bits' and other_kind == 'bits':
+                    values = values & other
+                elif kind == 'bits':
+                    kind, values = 'rows', other[self._test_bits(values, other)]
+                elif other_kind == 'bits':
+                    values = values[self._test_bits(other, values)]
+                else:
+                    values = np.intersect1d(values, other, assume_unique=True)
+            return kind, values
+
+        entries = [self._entries[name] for name in names]
+        if any(kind == 'bits' for kind, _ in entries):
+            bits = np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+            for kind, values in entries:
+                bits |= values if kind == 'bits' else np.packbits(self._sparse_mask(values))
+            return 'bits', bits
+        return 'rows', np.unique(np.concatenate([values for _, values in entries]))
+
+    def _sparse_mask(self, rows: np.ndarray) -> np.ndarray:
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[rows] = True
+        return mask
+
+    @staticmethod
+    def _entry_count(entry: _Entry) -> int:
+        kind, values = entry
+        return int(_POPCOUNT[values].sum()) if kind == 'bits' else len(values)
+
+    def intersect(self, *names: str) -> np.ndarray:
+        """
+        Get the rows in every given slice (AND).
+
+        Args:
+            *names: Slice names
+
+        Returns:
+            Sorted row indices
+        """
+        return self._decode(self._combine(names, 'and'))
+
+    def union(self, *names: str) -> np.ndarray:
+        """
+        Get the rows in any given slice (OR).
+
+        Args:
+            *names: Slice names
+
+        Returns:
+            Sorted row indices
+        """
+        return self._decode(self._combine(names, 'or'))
+
+    def intersection_count(self, *names: str) -> int:
+        """
+        Count the rows in every given slice without materializing them.
+
+        Args:
+            *names: Slice names
+
+        Returns:
+            Row count
+        """
+        return self._entry_count(self._combine(names, 'and'))
+
+    def union_count(self, *names: str) -> int:
+        """
+        Count the rows in any given slice without materializing them.
+
+        Args:
+            *names: Slice names
+
+        Returns:
+            Row count
+        """
+        return self._entry_count(self._combine(names, 'or'))
+
+    def add_intersection(self, name: str, *names: str):
+        """
+        Store the intersection of existing slices as a new slice.
+
+        Args:
+            name: Name of the new slice
+            *names: Slice names to intersect
+        """
+        rows = self.intersect(*names)
+        self._entries[name] = self._encode(rows)
+        self._counts[name] = len(rows)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the stored slices."""
+        return sum(values.nbytes for _, values in self._entries.values())
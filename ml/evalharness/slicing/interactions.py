@@ -0,0 +1,138 @@
+"""
+Two-way interaction slices.
+
+Evaluates every pair of selected categorical features (e.g. region x
+device). Each column is integer-encoded once; a pair's joint code is
+computed arithmetically as code_a * cardinality_b + code_b, and the
+confusion counts of all its cells come from a single np.bincount over
+(joint code, true class, predicted class). Pairs whose number of cells
+exceeds a cardinality limit are skipped, which bounds the memory of the
+counts.
+"""
+
+import itertools
+import numpy as np
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+from . import columns
+from .engine import encode_groups, group_indices
+
+
+# Maximum number of cells (card_a * card_b) of an evaluated pair
+DEFAULT_MAX_PAIR_CELLS = 10_000
+
+# Above this many (cell, true, predicted) counters, counts use three bincounts
+# of (cell, class) instead of one full confusion bincount
+MAX_CONFUSION_COUNTERS = 2 ** 22
+
+
+def pair_confusion_counts(
+    joint_codes: np.ndarray,
+    n_cells: int,
+    y_true_codes: np.ndarray,
+    y_pred_codes: np.ndarray,
+    n_classes: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Count true positives, predictions and true labels per cell of a pair.
+
+    Args:
+        joint_codes: Joint cell code per row
+        n_cells: Number of cells
+        y_true_codes: Encoded true labels per row
+        y_pred_codes: Encoded predictions per row
+        n_classes: Number of classes
+
+    Returns:
+        Tuple of (tp, pred_count, true_count), each of shape (n_cells, n_classes)
+    """
+    if n_cells * n_classes * n_classes <= MAX_CONFUSION_COUNTERS:
+        keys = (joint_codes * n_classes + y_true_codes) * n_classes + y_pred_codes
+        confusion = np.bincount(keys, minlength=n_cells * n_classes * n_classes)
+        confusion = confusion.reshape(n_cells, n_classes, n_classes)
+        tp = np.diagonal(confusion, axis1=1, axis2=2).copy()
+        return tp, confusion.sum(axis=1), confusion.sum(axis=2)
+
+    size = n_cells * n_classes
+    base = joint_codes * n_classes
+    correct = y_true_codes == y_pred_codes
+    true_count = np.bincount(base + y_true_codes, minlength=size).reshape(n_cells, n_classes)
+    pred_count = np.bincount(base + y_pred_codes, minlength=size).reshape(n_cells, n_classes)
+    tp = np.bincount(base[correct] + y_true_codes[correct], minlength=size).reshape(n_cells, n_classes)
+    return tp, pred_count, true_count
+
+
+def evaluate_feature_pairs(
+    data: np.ndarray,
+    features: Sequence[Hashable],
+    y_true_codes: np.ndarray,
+    y_pred_codes: np.ndarray,
+    n_classes: int,
+    feature_names: Optional[List[str]] = None,
+    max_cells: int = DEFAULT_MAX_PAIR_CELLS,
+    min_samples: int = 10
+) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Count every cell of every pair of features.
+
+    Args:
+        data: Input data array or DataFrame, shape (n_samples, n_features)
+        features: Indices (or DataFrame column names) of the categorical features to cross
+        y_true_codes: Encoded true labels per row (see engine.encode_labels)
+        y_pred_codes: Encoded predictions per row
+        n_classes: Number of classes
+        feature_names: Optional list of feature names
+        max_cells: Skip pairs with more cells than this
+        min_samples: Row indices are returned for cells with at least this many rows
+
+    Returns:
+        Tuple of (slice names, tp, pred_count, true_count, slices) where the
+        counts have shape (n_pair_slices, n_classes) over all non-empty cells
+        and slices maps the names of cells with at least min_samples rows to
+        their row indices
+    """
+    def name_of(j):
+        return columns.feature_label(data, j, feature_names)
+
+    # Encode each column once (categorical DataFrame columns reuse their codes)
+    encoded = {}
+    for j in features:
+        unique_values, codes = encode_groups(columns.get_column(data, j))
+        encoded[j] = (unique_values, codes.astype(np.int64))
+
+    names: List[str] = []
+    counts: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+    slices: Dict[str, np.ndarray] = {}
+
+    for a, b in itertools.combinations(features, 2):
+        values_a, codes_a = encoded[a]
+        values_b, codes_b = encoded[b]
+        n_cells = len(values_a) * len(values_b)
+        if n_cells > max_cells:
+            print(f"Warning: Skipping pair ({name_of(a)}, {name_of(b)}) with {n_cells} cells (max_cells={max_cells})")
+            continue
+
+        joint = codes_a * len(values_b) + codes_b
+        tp, pred_count, true_count = pair_confusion_counts(joint, n_cells, y_true_codes, y_pred_codes, n_classes)
+
+        cell_counts = true_count.sum(axis=1)
+        present = np.flatnonzero(cell_counts)
+        cell_names = [
+            f"{name_of(a)}={values_a[cell // len(values_b)]} AND {name_of(b)}={values_b[cell % len(values_b)]}"
+            for cell in present
+        ]
+        names.extend(cell_names)
+        counts.append((tp[present], pred_count[present], true_count[present]))
+
+        # Row indices only for cells large enough to be reported
+        if np.any(cell_counts[present] >= min_samples):
+            rows = group_indices(joint, n_cells)
+            for cell, name in zip(present, cell_names):
+                if cell_counts[cell] >= min_samples:
+                    slices[name] = rows[cell]
+
+    if not counts:
+        empty = np.zeros((0, n_classes), dtype=np.int64)
+        return names, empty, empty, empty, slices
+
+    tp, pred_count, true_count = (np.concatenate(parts) for parts in zip(*counts))
+    return names, tp, pred_count, true_count, slices
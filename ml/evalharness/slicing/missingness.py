@@ -0,0 +1,208 @@
+"""
+Missingness-pattern slicing.
+
+Groups rows by which columns are missing. Each row's NaN mask is packed
+into bytes (np.packbits, one bit per column), the packed rows are hashed to
+one 64-bit value per row, and rows are grouped by hash with a single
+np.unique. On a 500-column frame this compares one integer per row instead
+of 500 booleans; hash collisions are detected and resolved by grouping the
+packed bytes exactly.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Upper bound on mask elements materialized at once
+CHUNK_ELEMENTS = 2 ** 26
+
+# Maximum number of column names spelled out in a pattern slice name
+MAX_NAMED_COLUMNS = 5
+
+_FNV_PRIME = np.uint64(0x100000001b3)
+_FNV_OFFSET = np.uint64(0xcbf29ce484222325)
+
+
+def missing_mask(data: np.ndarray) -> np.ndarray:
+    """
+    Get the missing-value mask of an array.
+
+    Args:
+        data: Input data array (numeric or object) or DataFrame
+
+    Returns:
+        Boolean array of the same shape, True where a value is missing
+    """
+    if isinstance(data, pd.DataFrame):
+        # Column blocks are checked by dtype; no object-array conversion
+        return data.isna().to_numpy()
+    data = np.asarray(data)
+    if np.issubdtype(data.dtype, np.floating):
+        return np.isnan(data)
+    if np.issubdtype(data.dtype, np.number) or data.dtype == bool:
+        return np.zeros(data.shape, dtype=bool)
+    return pd.isna(data)
+
+
+def pack_missing(data: np.ndarray) -> np.ndarray:
+    """
+    Pack each row's missing-value mask into bytes.
+
+    Rows are processed in chunks, so the full boolean mask of a wide frame is
+    never materialized.
+
+    Args:
+        data: Input data array or DataFrame, shape (n_samples, n_features)
+
+    Returns:
+        Packed masks, shape (n_samples, ceil(n_features / 8)), dtype uint8
+    """
+    if not isinstance(data, pd.DataFrame):
+        data = np.asarray(data)
+    if data.ndim == 1:
+        data = data.reshape(-1, 1)
+    n, d = data.shape
+    packed = np.empty((n, (d + 7) // 8), dtype=np.uint8)
+    step = max(1, CHUNK_ELEMENTS // max(d, 1))
+    for start in range(0, n, step):
+        chunk = data.iloc[start:start + step] if isinstance(data, pd.DataFrame) else data[start:start + step]
+        packed[start:start + step] = np.packbits(missing_mask(chunk), axis=1)
+    return packed
+
+
+def hash_rows(packed: np.ndarray) -> np.ndarray:
+    """
+    Hash packed rows to 64-bit values (FNV-1a over 8-byte words).
+
+    Args:
+        packed: Packed masks, shape (n_samples, n_bytes)
+
+    Returns:
+        uint64 hash per row
+    """
+    n, n_bytes = packed.shape
+    n_words = (n_bytes + 7) // 8
+    if n_words * 8 != n_bytes:
+        padded = np.zeros((n, n_words * 8), dtype=np.uint8)
+        padded[:, :n_bytes] = packed
+        packed = padded
+    words = np.ascontiguousarray(packed).view(np.uint64)
+
+    hashes = np.full(n, _FNV_OFFSET, dtype=np.uint64)
+    for j in range(n_words):
+        hashes ^= words[:, j]
+        hashes *= _FNV_PRIME
+    return hashes
+
+
+def group_patterns(packed: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Group rows with identical packed masks.
+
+    Args:
+        packed: Packed masks, shape (n_samples, n_bytes)
+
+    Returns:
+        Tuple of (first row of each pattern, pattern id per row, rows per pattern)
+    """
+    _, first_rows, pattern_ids, counts = np.unique(
+        hash_rows(packed), return_index=True, return_inverse=True, return_counts=True
+    )
+    pattern_ids = pattern_ids.reshape(-1)
+
+    # Every row must equal its pattern's representative; otherwise two
+    # patterns share a hash and the bytes are grouped exactly instead
+    if not np.array_equal(packed, packed[first_rows[pattern_ids]]):
+        keys = np.ascontiguousarray(packed).view(np.dtype((np.void, packed.shape[1]))).ravel()
+        _, first_rows, pattern_ids, counts = np.unique(
+            keys, return_index=True, return_inverse=True, return_counts=True
+        )
+        pattern_ids = pattern_ids.reshape(-1)
+
+    return first_rows, pattern_ids, counts
+
+
+def pattern_name(
+    missing_columns: np.ndarray,
+    feature_names: Optional[List[str]] = None,
+    pattern_hash: Optional[int] = None
+) -> str:
+    """
+    Format a missingness pattern as a slice name.
+
+    Args:
+        missing_columns: Indices of the missing columns
+        feature_names: Optional list of feature names
+        pattern_hash: Hash of the pattern, appended when columns are elided
+            so that names stay unique
+
+    Returns:
+        Slice name such as "missing_pattern=[age,income]"
+    """
+    if len(missing_columns) == 0:
+        return 'missing_pattern=[]'
+    names = [
+        feature_names[j] if feature_names and j < len(feature_names) else f'feature_{j}'
+        for j in missing_columns[:MAX_NAMED_COLUMNS]
+    ]
+    if len(missing_columns) > MAX_NAMED_COLUMNS:
+        names.append(f'+{len(missing_columns) - MAX_NAMED_COLUMNS} more')
+        if pattern_hash is not None:
+            names.append(f'#{int(pattern_hash) & 0xffffffff:08x}')
+    return f"missing_pattern=[{','.join(names)}]"
+
+
+def missing_patterns(
+    data: np.ndarray,
+    top_n: int = 10,
+    min_count: int = 1,
+    include_complete: bool = False,
+    feature_names: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Find the most frequent missingness patterns.
+
+    Args:
+        data: Input data array or DataFrame, shape (n_samples, n_features)
+        top_n: Maximum number of patterns to return
+        min_count: Minimum number of rows per pattern
+        include_complete: Also report the pattern with no missing values
+        feature_names: Optional list of feature names (DataFrames use their column names)
+
+    Returns:
+        List of patterns (slice_name, missing_columns, sample_count, indices),
+        most frequent first
+    """
+    if isinstance(data, pd.DataFrame):
+        feature_names = feature_names or [str(column) for column in data.columns]
+    else:
+        data = np.asarray(data)
+    if data.ndim == 1:
+        data = data.reshape(-1, 1)
+    if len(data) == 0:
+        return []
+
+    packed = pack_missing(data)
+    first_rows, pattern_ids, counts = group_patterns(packed)
+    hashes = hash_rows(packed[first_rows])
+
+    complete = ~packed[first_rows].any(axis=1)
+    eligible = (counts >= min_count) & (include_complete | ~complete)
+    # Most frequent first; ties keep first-occurrence order
+    candidates = np.flatnonzero(eligible)
+    candidates = candidates[np.lexsort((first_rows[candidates], -counts[candidates]))][:top_n]
+
+    order = np.argsort(pattern_ids, kind='stable')
+    bounds = np.concatenate([[0], np.cumsum(counts)])
+
+    patterns = []
+    for p in candidates:
+        missing_columns = np.flatnonzero(np.unpackbits(packed[first_rows[p]], count=data.shape[1]))
+        patterns.append({
+            'slice_name': pattern_name(missing_columns, feature_names, hashes[p]),
+            'missing_columns': missing_columns.tolist(),
+            'sample_count': int(counts[p]),
+            'indices': order[bounds[p]:bounds[p + 1]]
+        })
+    return patterns
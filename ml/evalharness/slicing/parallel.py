@@ -0,0 +1,290 @@
+"""
+Process-parallel slice evaluation.
+
+The evaluation inputs (encoded labels and predictions, predicted
+probabilities and input features) are copied once into
+multiprocessing.shared_memory blocks. Worker processes attach to the blocks
+by name when they start, so tasks only carry a slice family (confidence,
+missingness, or one feature) and the big arrays are never pickled. Each task
+builds its slices and per-slice confusion counts; the parent concatenates
+the counts and builds the slice results exactly as the serial engine does.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from . import slicer
+from .engine import build_slice_results, membership_from_slices, merge_counts, slice_confusion_counts
+from .index import SliceIndex
+
+
+# Task chunks per worker (more chunks balance uneven features better)
+CHUNKS_PER_WORKER = 4
+
+_Spec = Dict[str, Tuple[str, Tuple[int, ...], str]]
+_Task = Tuple[str, Optional[int]]
+
+# Arrays attached by a worker process (kept alive for the worker's lifetime)
+_worker_arrays: Dict[str, np.ndarray] = {}
+_worker_blocks: List[shared_memory.SharedMemory] = []
+
+
+class SharedArrays:
+    """
+    Numpy arrays copied into named shared memory blocks.
+
+    Use as a context manager; the blocks are released on exit.
+    """
+
+    def __init__(self, arrays: Dict[str, Optional[np.ndarray]]):
+        """
+        Copy arrays into shared memory.
+
+        Args:
+            arrays: Dictionary of names to arrays (None values are skipped);
+                object arrays cannot be shared
+        """
+        self.blocks: Dict[str, shared_memory.SharedMemory] = {}
+        self.spec: _Spec = {}
+        try:
+            for name, array in arrays.items():
+                if array is None:
+                    continue
+                array = np.ascontiguousarray(array)
+                if array.dtype.hasobject:
+                    raise ValueError(f"Array '{name}' has dtype object and cannot be placed in shared memory")
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self.blocks[name] = block
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+                self.spec[name] = (block.name, array.shape, array.dtype.str)
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        """Release the shared memory blocks."""
+        for block in self.blocks.values():
+            block.close()
+            block.unlink()
+        self.blocks = {}
+
+    def __enter__(self) -> 'SharedArrays':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def attach(spec: _Spec) -> Tuple[Dict[str, np.ndarray], List[shared_memory.SharedMemory]]:
+    """
+    Attach to arrays shared by SharedArrays.
+
+    Args:
+        spec: SharedArrays.spec (block name, shape and dtype per array)
+
+    Returns:
+        Tuple of (array views, shared memory handles that must outlive the views)
+    """
+    arrays, blocks = {}, []
+    for name, (block_name, shape, dtype) in spec.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        blocks.append(block)
+        arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    return arrays, blocks
+
+
+def _init_worker(spec: _Spec):
+    """Process pool initializer: attach the shared arrays once per worker."""
+    arrays, blocks = attach(spec)
+    _worker_arrays.update(arrays)
+    _worker_blocks.extend(blocks)
+
+
+def task_slices(
+    arrays: Dict[str, np.ndarray],
+    task: _Task,
+    feature_names: Optional[List[str]] = None,
+    missing_patterns: int = 0
+) -> Dict[str, np.ndarray]:
+    """
+    Build the slices of one slice family.
+
+    Args:
+        arrays: Evaluation arrays ('data' and/or 'predictions_proba')
+        task: (family, feature index), family one of 'confidence',
+            'missingness', 'categorical' or 'numeric'
+        feature_names: Optional list of feature names
+        missing_patterns: Number of most frequent missingness patterns to slice by
+
+    Returns:
+        Dictionary of slice names to indices
+    """
+    family, feat_idx = task
+    data = arrays.get('data')
+
+    if family == 'confidence':
+        return slicer.slice_by_confidence(arrays['predictions_proba'])
+    if family == 'missingness':
+        slices = slicer.slice_by_missingness(data)
+        if missing_patterns:
+            slices.update(slicer.slice_by_missing_pattern(data, top_n=missing_patterns, feature_names=feature_names))
+        return slices
+
+    feat_name = feature_names[feat_idx] if feature_names and feat_idx < len(feature_names) else None
+    if family == 'categorical':
+        return slicer.slice_by_feature(data, feat_idx, feat_name)
+    if family == 'numeric':
+        return slicer.slice_by_numeric_feature(data, feat_idx, feat_name)
+    raise ValueError(f"Unknown slice family: {family}")
+
+
+def _count_slices(
+    arrays: Dict[str, np.ndarray],
+    slices: Dict[str, np.ndarray],
+    n_classes: int
+) -> Tuple[SliceIndex, np.ndarray, np.ndarray, np.ndarray]:
+    """Build a SliceIndex and per-slice confusion counts for a dict of slices."""
+    n_rows = len(arrays['true_codes'])
+    names, slice_ids, rows = membership_from_slices(slices)
+    counts = slice_confusion_counts(
+        slice_ids, rows, len(names), arrays['true_codes'], arrays['pred_codes'], n_classes
+    )
+    return (SliceIndex.from_slices(slices, n_rows),) + counts
+
+
+def _run_tasks(
+    tasks: List[_Task],
+    n_classes: int,
+    feature_names: Optional[List[str]],
+    missing_patterns: int
+) -> Tuple[SliceIndex, np.ndarray, np.ndarray, np.ndarray]:
+    """Worker entry point: slices and confusion counts for a chunk of tasks."""
+    slices = {}
+    for task in tasks:
+        slices.update(task_slices(_worker_arrays, task, feature_names, missing_patterns))
+    return _count_slices(_worker_arrays, slices, n_classes)
+
+
+def slice_tasks(
+    has_proba: bool,
+    has_data: bool,
+    categorical_features: Optional[List[int]] = None,
+    numeric_features: Optional[List[int]] = None
+) -> List[_Task]:
+    """
+    List the slice families to evaluate, in the order of slicer.create_all_slices.
+
+    Args:
+        has_proba: Whether predicted probabilities are available
+        has_data: Whether input features are available
+        categorical_features: List of indices of categorical features
+        numeric_features: List of indices of numeric features
+
+    Returns:
+        List of (family, feature index) tasks
+    """
+    tasks: List[_Task] = []
+    if has_proba:
+        tasks.append(('confidence', None))
+    if has_data:
+        tasks.append(('missingness', None))
+        tasks.extend(('categorical', j) for j in categorical_features or [])
+        tasks.extend(('numeric', j) for j in numeric_features or [])
+    return tasks
+
+
+def evaluate_slices_parallel(
+    label_codes: Tuple[np.ndarray, np.ndarray, int],
+    data: Optional[np.ndarray] = None,
+    predictions_proba: Optional[np.ndarray] = None,
+    categorical_features: Optional[List[int]] = None,
+    numeric_features: Optional[List[int]] = None,
+    feature_names: Optional[List[str]] = None,
+    missing_patterns: int = 0,
+    extra_slices: Optional[Dict[str, np.ndarray]] = None,
+    extra_counts: Optional[Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]] = None,
+    n_workers: Optional[int] = None,
+    min_samples: int = 10,
+    average: str = 'weighted',
+    alpha: Optional[float] = 0.05,
+    test: str = 'binomial'
+) -> Tuple[List[Dict[str, Any]], SliceIndex]:
+    """
+    Build and evaluate all standard slices in a process pool over shared memory.
+
+    Gives the same slices and results as building them with
+    slicer.create_all_slices and evaluating with engine.evaluate_slices_by_counts.
+
+    Args:
+        label_codes: Output of engine.encode_labels for the labels and predictions
+        data: Input features (optional, numeric dtype)
+        predictions_proba: Predicted probabilities (optional, for confidence slices)
+        categorical_features: List of indices of categorical features
+        numeric_features: List of indices of numeric features (quantile buckets)
+        feature_names: Optional list of feature names
+        missing_patterns: Number of most frequent missingness patterns to slice by
+        extra_slices: Additional slices evaluated in the parent (e.g. discovered slices)
+        extra_counts: Precounted slices as (names, tp, pred_count, true_count)
+            (see engine.evaluate_slices_by_counts)
+        n_workers: Number of worker processes (default: CPU count)
+        min_samples: Minimum samples required to report a slice
+        average: Averaging strategy for precision, recall and F1
+        alpha: False discovery rate for testing slices against their complement
+        test: Slice test method ('binomial' or 'z')
+
+    Returns:
+        Tuple of (slice results, SliceIndex of all slices)
+    """
+    true_codes, pred_codes, n_classes = label_codes
+    n_workers = n_workers or os.cpu_count() or 1
+    tasks = slice_tasks(predictions_proba is not None, data is not None, categorical_features, numeric_features)
+
+    # Contiguous chunks keep the task order when results are merged
+    bounds = np.linspace(0, len(tasks), min(len(tasks), n_workers * CHUNKS_PER_WORKER) + 1).astype(int)
+    chunks = [tasks[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    arrays = {
+        'true_codes': true_codes,
+        'pred_codes': pred_codes,
+        'predictions_proba': predictions_proba,
+        'data': data
+    }
+    with SharedArrays(arrays) as shared:
+        with ProcessPoolExecutor(
+            max_workers=min(n_workers, max(len(chunks), 1)),
+            initializer=_init_worker,
+            initargs=(shared.spec,)
+        ) as pool:
+            parts = list(pool.map(
+                _run_tasks,
+                chunks,
+                [n_classes] * len(chunks),
+                [feature_names] * len(chunks),
+                [missing_patterns] * len(chunks)
+            ))
+
+    if extra_slices:
+        parts.append(_count_slices({'true_codes': true_codes, 'pred_codes': pred_codes}, extra_slices, n_classes))
+
+    # Merge in task order; like dict.update, a repeated name keeps its first
+    # position and takes the latest slice
+    all_slices = SliceIndex(len(true_codes))
+    positions: Dict[str, Tuple[int, int]] = {}
+    for part_idx, (index, _, _, _) in enumerate(parts):
+        all_slices.update(index)
+        for slice_idx, name in enumerate(index):
+            positions[name] = (part_idx, slice_idx)
+
+    names = list(positions)
+    tp, pred_count, true_count = (
+        np.stack([parts[p][k][i] for p, i in positions.values()]) if names else np.zeros((0, n_classes))
+        for k in (1, 2, 3)
+    )
+    if extra_counts is not None:
+        names, tp, pred_count, true_count = merge_counts((names, tp, pred_count, true_count), extra_counts)
+
+    totals = (len(true_codes), float(np.count_nonzero(true_codes != pred_codes)))
+    results = build_slice_results(names, tp, pred_count, true_count, min_samples, average, totals, alpha, test)
+    return results, all_slices
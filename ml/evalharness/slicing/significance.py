@@ -0,0 +1,169 @@
+"""
+Statistical testing of slice performance.
+
+Tests, for every slice at once, whether its error rate is higher than on
+the rows outside it (two-proportion z test or exact binomial test), and
+controls the false discovery rate across slices with Benjamini-Hochberg.
+Everything is computed from per-slice counts, so tens of thousands of
+slices cost a few vectorized array operations.
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional
+from scipy import special, stats
+
+
+def two_proportion_z(
+    slice_errors: np.ndarray,
+    slice_counts: np.ndarray,
+    total_errors: float,
+    n: int
+) -> np.ndarray:
+    """
+    Two-proportion z statistic of slice error rates against their complements.
+
+    Args:
+        slice_errors: Number of errors per slice
+        slice_counts: Number of rows per slice
+        total_errors: Number of errors over all rows
+        n: Number of rows
+
+    Returns:
+        z statistic per slice (0 where undefined)
+    """
+    rest_counts = n - slice_counts
+    p_pooled = total_errors / n
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p_slice = slice_errors / slice_counts
+        p_rest = (total_errors - slice_errors) / rest_counts
+        se = np.sqrt(p_pooled * (1 - p_pooled) * (1 / slice_counts + 1 / rest_counts))
+        z = (p_slice - p_rest) / se
+    return np.where(np.isfinite(z), z, 0.0)
+
+
+def worse_than_rest_p_values(
+    slice_errors: np.ndarray,
+    slice_counts: np.ndarray,
+    total_errors: float,
+    n: int,
+    method: str = 'binomial'
+) -> np.ndarray:
+    """
+    One-sided p-values for "the slice has a higher error rate than the other rows".
+
+    Args:
+        slice_errors: Number of errors per slice
+        slice_counts: Number of rows per slice
+        total_errors: Number of errors over all rows
+        n: Number of rows
+        method: 'binomial' (exact test of the slice errors against the
+            complement error rate) or 'z' (two-proportion z test)
+
+    Returns:
+        p-value per slice
+    """
+    slice_errors = np.asarray(slice_errors, dtype=float)
+    slice_counts = np.asarray(slice_counts, dtype=float)
+
+    if method == 'z':
+        return special.ndtr(-two_proportion_z(slice_errors, slice_counts, total_errors, n))
+    if method != 'binomial':
+        raise ValueError(f"Unknown method: {method}. Must be 'binomial' or 'z'.")
+
+    rest_counts = n - slice_counts
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p_rest = np.where(rest_counts > 0, (total_errors - slice_errors) / rest_counts, total_errors / n)
+    # P(X >= slice_errors) for X ~ Binomial(slice_count, p_rest)
+    p_values = stats.binom.sf(np.round(slice_errors) - 1, np.round(slice_counts), p_rest)
+    return np.where(slice_counts > 0, p_values, 1.0)
+
+
+def benjamini_hochberg(p_values: np.ndarray) -> np.ndarray:
+    """
+    Benjamini-Hochberg adjusted p-values (q-values).
+
+    A slice is a discovery at false discovery rate alpha when its q-value is
+    at most alpha.
+
+    Args:
+        p_values: p-value per test
+
+    Returns:
+        Adjusted p-value per test
+    """
+    p_values = np.asarray(p_values, dtype=float)
+    m = len(p_values)
+    if m == 0:
+        return p_values
+
+    order = np.argsort(p_values)
+    scaled = p_values[order] * m / np.arange(1, m + 1)
+    # Enforce monotonicity from the largest p-value down
+    adjusted = np.minimum.accumulate(scaled[::-1])[::-1]
+    q_values = np.empty(m)
+    q_values[order] = np.minimum(adjusted, 1.0)
+    return q_values
+
+
+def rank_slices(
+    results: List[Dict[str, Any]],
+    slice_errors: np.ndarray,
+    total_errors: float,
+    n: int,
+    alpha: float = 0.05,
+    method: str = 'binomial'
+) -> List[Dict[str, Any]]:
+    """
+    Test every slice against its complement and rank slices by the result.
+
+    Each result gets p_value, q_value and significantly_worse. Slices that
+    are not significantly worse come first (by accuracy, descending),
+    followed by significantly worse slices (by accuracy, descending), so the
+    last slice is the worst slice that is significantly worse than the rest
+    of the data whenever such a slice exists.
+
+    Args:
+        results: Slice results sorted by accuracy (descending)
+        slice_errors: Number of errors per slice, aligned with results
+        total_errors: Number of errors over all rows
+        n: Number of rows
+        alpha: False discovery rate
+        method: Test method (see worse_than_rest_p_values)
+
+    Returns:
+        Ranked slice results
+    """
+    if not results:
+        return results
+
+    slice_counts = np.array([r['sample_count'] for r in results], dtype=float)
+    p_values = worse_than_rest_p_values(slice_errors, slice_counts, total_errors, n, method)
+    q_values = benjamini_hochberg(p_values)
+
+    for result, p_value, q_value in zip(results, p_values, q_values):
+        result['p_value'] = float(p_value)
+        result['q_value'] = float(q_value)
+        result['significantly_worse'] = bool(q_value <= alpha)
+
+    # Stable sort keeps accuracy order within each group
+    return sorted(results, key=lambda r: r['significantly_worse'])
+
+
+def worst_slice(slices: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Get the worst slice worth reporting from ranked slice results.
+
+    Args:
+        slices: Slice results ranked by rank_slices (or sorted by accuracy
+            when the slices were not tested)
+
+    Returns:
+        The last slice if it is significantly worse than the rest of the
+        data (or if the slices were not tested), else None
+    """
+    if not slices:
+        return None
+    if 'significantly_worse' in slices[-1] and not slices[-1]['significantly_worse']:
+        # Nothing is significant: the lowest accuracy is noise (often a tiny slice)
+        return None
+    return slices[-1]
@@ -4,17 +4,23 @@ Data slicing functions for performance analysis.
 Supports slicing by:
 - Confidence levels (deciles)
 - Feature values (categorical)
+- Numeric feature ranges (quantile buckets)
 - Missingness patterns
 """
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Any, Callable, Optional
+from . import bucketing, columns, missingness
+from typing import Dict, Hashable, List, Any, Callable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..core.context import EvalContext
 
 
 def slice_by_confidence(
     predictions_proba: np.ndarray,
-    n_buckets: int = 10
+    n_buckets: int = 10,
+    ctx: Optional['EvalContext'] = None
 ) -> Dict[str, np.ndarray]:
     """
     Slice data by prediction confidence into deciles.
@@ -22,63 +28,96 @@ def slice_by_confidence(
     Args:
         predictions_proba: Predicted probabilities
         n_buckets: Number of confidence buckets
+        ctx: Shared evaluation context (optional, reuses confidences)
 
     Returns:
         Dictionary mapping bucket names to indices
     """
     # Get max confidence for each prediction
-    if predictions_proba.ndim == 1:
+    if ctx is not None:
+        confidences = ctx.confidences
+    elif predictions_proba.ndim == 1:
         confidences = predictions_proba
     else:
         confidences = np.max(predictions_proba, axis=1)
 
-    # Create buckets
+    # Assign decile buckets in one pass (last bucket includes its upper edge)
     percentiles = np.linspace(0, 100, n_buckets + 1)
-    bucket_edges = np.percentile(confidences, percentiles)
+    _, buckets = bucketing.bucket_slices(confidences, n_buckets)
 
-    slices = {}
-    for i in range(n_buckets):
-        lower = bucket_edges[i]
-        upper = bucket_edges[i + 1]
+    return {
+        f"confidence_p{int(percentiles[i])}-{int(percentiles[i+1])}": buckets[i]
+        for i in range(n_buckets)
+    }
 
-        if i == n_buckets - 1:
-            # Include upper bound in last bucket
-            mask = (confidences >= lower) & (confidences <= upper)
-        else:
-            mask = (confidences >= lower) & (confidences < upper)
 
-        slices[f"confidence_p{int(percentiles[i])}-{int(percentiles[i+1])}"] = np.where(mask)[0]
+def slice_by_feature(
+    data: np.ndarray,
+    feature_index: Hashable,
+    feature_name: Optional[str] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Slice data by a categorical feature, one slice per value.
+
+    Continuous features are sliced with slice_by_numeric_feature instead.
+
+    Args:
+        data: Input data array or DataFrame
+        feature_index: Index of the feature to slice by (or DataFrame column name)
+        feature_name: Optional name of the feature
+
+    Returns:
+        Dictionary mapping feature values to indices
+    """
+    if data is None:
+        return {}
+
+    from .engine import encode_groups, group_indices
+
+    feature_values = columns.get_column(data, feature_index)
+    unique_values, group_ids = encode_groups(feature_values)
+
+    # One sort over the group ids instead of one mask per value
+    name = feature_name or columns.feature_label(data, feature_index)
+    slices = {}
+    for value, indices in zip(unique_values, group_indices(group_ids, len(unique_values))):
+        slices[f"{name}={value}"] = indices
 
     return slices
 
 
-def slice_by_feature(
+def slice_by_numeric_feature(
     data: np.ndarray,
-    feature_index: int,
-    feature_name: Optional[str] = None
+    feature_index: Hashable,
+    feature_name: Optional[str] = None,
+    n_buckets: int = 10,
+    edges: Optional[np.ndarray] = None
 ) -> Dict[str, np.ndarray]:
     """
-    Slice data by a categorical feature.
+    Slice data by quantile buckets of a numeric feature.
 
     Args:
-        data: Input data array
-        feature_index: Index of the feature to slice by
+        data: Input data array or DataFrame
+        feature_index: Index of the feature to slice by (or DataFrame column name)
         feature_name: Optional name of the feature
+        n_buckets: Number of quantile buckets
+        edges: Precomputed bucket edges (optional, e.g. from a QuantileSketch)
 
     Returns:
-        Dictionary mapping feature values to indices
+        Dictionary mapping value ranges to indices (NaN rows are left out)
     """
     if data is None:
         return {}
 
-    feature_values = data[:, feature_index] if data.ndim > 1 else data
-    unique_values = np.unique(feature_values)
+    feature_values = columns.column_values(columns.get_column(data, feature_index), float)
+    edges, buckets = bucketing.bucket_slices(feature_values, n_buckets, edges)
+    name = feature_name or columns.feature_label(data, feature_index)
 
     slices = {}
-    for value in unique_values:
-        mask = feature_values == value
-        name = f"{feature_name or f'feature_{feature_index}'}={value}"
-        slices[name] = np.where(mask)[0]
+    for i, label in enumerate(bucketing.bucket_labels(edges)):
+        # Tied edges give empty or duplicate ranges; keep the non-empty ones
+        if len(buckets[i]):
+            slices[f"{name}={label}"] = buckets[i]
 
     return slices
 
@@ -91,7 +130,7 @@ def slice_by_missingness(
     Slice data by missingness patterns (low/medium/high missing values).
 
     Args:
-        data: Input data array
+        data: Input data array or DataFrame
         thresholds: Thresholds for low/medium/high missingness
 
     Returns:
@@ -100,12 +139,12 @@ def slice_by_missingness(
     if data is None:
         return {}
 
-    # Count missing values per row
+    # Fraction of missing values per row
+    missing = missingness.missing_mask(data)
     if data.ndim == 1:
-        missing_counts = np.isnan(data).astype(int)
+        missing_fractions = missing.astype(float)
     else:
-        missing_counts = np.sum(np.isnan(data), axis=1)
-        missing_fractions = missing_counts / data.shape[1]
+        missing_fractions = np.sum(missing, axis=1) / data.shape[1]
 
     slices = {}
 
@@ -124,6 +163,32 @@ def slice_by_missingness(
     return slices
 
 
+def slice_by_missing_pattern(
+    data: np.ndarray,
+    top_n: int = 10,
+    min_count: int = 1,
+    feature_names: Optional[List[str]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Slice data by exact missingness pattern (which columns are missing).
+
+    Args:
+        data: Input data array or DataFrame
+        top_n: Number of most frequent patterns to keep (rows without missing
+            values are not reported as a pattern)
+        min_count: Minimum number of rows per pattern
+        feature_names: Optional list of feature names
+
+    Returns:
+        Dictionary mapping pattern names to indices, most frequent first
+    """
+    if data is None:
+        return {}
+
+    patterns = missingness.missing_patterns(data, top_n=top_n, min_count=min_count, feature_names=feature_names)
+    return {p['slice_name']: p['indices'] for p in patterns}
+
+
 def evaluate_slices(
     slices: Dict[str, np.ndarray],
     y_true: np.ndarray,
@@ -160,7 +225,7 @@ def evaluate_slices(
                 'slice_name': slice_name,
                 'sample_count': len(indices),
                 'metric_value': float(metric_value),
-                'indices': indices.tolist()
+                'indices': np.asarray(indices)
             })
         except Exception as e:
             # Skip slices where metric computation fails
@@ -176,17 +241,23 @@ def evaluate_slices(
 def create_all_slices(
     data: Optional[np.ndarray],
     predictions_proba: Optional[np.ndarray] = None,
-    categorical_features: Optional[List[int]] = None,
-    feature_names: Optional[List[str]] = None
+    categorical_features: Optional[List[Hashable]] = None,
+    feature_names: Optional[List[str]] = None,
+    ctx: Optional['EvalContext'] = None,
+    numeric_features: Optional[List[Hashable]] = None,
+    missing_patterns: int = 0
 ) -> Dict[str, np.ndarray]:
     """
     Create all standard slices.
 
     Args:
-        data: Input data array
+        data: Input data array or DataFrame
         predictions_proba: Predicted probabilities (for confidence slicing)
-        categorical_features: List of indices of categorical features
-        feature_names: Optional list of feature names
+        categorical_features: List of indices (or DataFrame column names) of categorical features
+        feature_names: Optional list of feature names (DataFrames use their column names)
+        ctx: Shared evaluation context (optional)
+        numeric_features: List of indices (or column names) of numeric features (sliced by quantile buckets)
+        missing_patterns: Number of most frequent missingness patterns to slice by (0 disables)
 
     Returns:
         Dictionary of all slices
@@ -195,16 +266,24 @@ def create_all_slices(
 
     # Confidence slices
     if predictions_proba is not None:
-        all_slices.update(slice_by_confidence(predictions_proba))
+        all_slices.update(slice_by_confidence(predictions_proba, ctx=ctx))
 
     # Missingness slices
     if data is not None:
         all_slices.update(slice_by_missingness(data))
+        if missing_patterns:
+            all_slices.update(slice_by_missing_pattern(data, top_n=missing_patterns, feature_names=feature_names))
 
     # Categorical feature slices
     if data is not None and categorical_features:
         for feat_idx in categorical_features:
-            feat_name = feature_names[feat_idx] if feature_names and feat_idx < len(feature_names) else None
+            feat_name = columns.feature_label(data, feat_idx, feature_names)
             all_slices.update(slice_by_feature(data, feat_idx, feat_name))
 
+    # Numeric feature slices
+    if data is not None and numeric_features:
+        for feat_idx in numeric_features:
+            feat_name = columns.feature_label(data, feat_idx, feature_names)
+            all_slices.update(slice_by_numeric_feature(data, feat_idx, feat_name))
+
     return all_slices
@@ -0,0 +1,331 @@
+"""
+Streaming slice statistics for chunked evaluation.
+
+Maintains per-slice class counts for the standard slice families
+(confidence deciles, missingness levels and patterns, categorical feature
+values, numeric feature quantile buckets) without keeping per-row slice membership
+in memory.
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional
+from .engine import build_slice_results
+from .bucketing import QuantileSketch, bucket_labels, merge_bins_to_buckets
+from .missingness import hash_rows, pack_missing, pattern_name
+from ..failures.reservoir import GroupedReservoir
+
+
+# Group key of NaN categorical values (one object, so dict lookups match it)
+_NAN = float('nan')
+
+
+class _GroupCounts:
+    """Per-group, per-class counts that grow as new groups and classes appear."""
+
+    def __init__(self):
+        self.tp = np.zeros((0, 0))
+        self.pred_count = np.zeros((0, 0))
+        self.true_count = np.zeros((0, 0))
+
+    def add(self, codes: np.ndarray, y_true: np.ndarray, y_pred: np.ndarray, n_groups: int, n_classes: int):
+        """Accumulate counts for rows with group ids `codes` (negative ids are ignored)."""
+        n_groups = max(n_groups, self.tp.shape[0])
+        n_classes = max(n_classes, self.tp.shape[1])
+        for name in ('tp', 'pred_count', 'true_count'):
+            counts = getattr(self, name)
+            if counts.shape != (n_groups, n_classes):
+                grown = np.zeros((n_groups, n_classes))
+                grown[:counts.shape[0], :counts.shape[1]] = counts
+                setattr(self, name, grown)
+
+        valid = codes >= 0
+        codes, y_true, y_pred = codes[valid], y_true[valid], y_pred[valid]
+        size = n_groups * n_classes
+        correct = y_true == y_pred
+        self.true_count += np.bincount(codes * n_classes + y_true, minlength=size).reshape(n_groups, n_classes)
+        self.pred_count += np.bincount(codes * n_classes + y_pred, minlength=size).reshape(n_groups, n_classes)
+        self.tp += np.bincount(codes[correct] * n_classes + y_true[correct], minlength=size).reshape(n_groups, n_classes)
+
+    def merged(self, membership: List[np.ndarray]):
+        """Sum counts of fine groups into coarse groups (one id array per coarse group)."""
+        return tuple(
+            np.stack([counts[ids].sum(axis=0) for ids in membership])
+            for counts in (self.tp, self.pred_count, self.true_count)
+        )
+
+
+class StreamingSliceStats:
+    """
+    Accumulate slice statistics batch by batch.
+
+    Quantile buckets are resolved after the pass: confidences are counted in
+    a fine fixed-width histogram, and numeric features in the bins of a
+    QuantileSketch. Cumulative bin counts give the bucket edges, and fine
+    bins are then merged into bucket slices.
+    """
+
+    def __init__(
+        self,
+        categorical_features: Optional[List[int]] = None,
+        feature_names: Optional[List[str]] = None,
+        numeric_features: Optional[List[int]] = None,
+        n_numeric_buckets: int = 10,
+        n_confidence_buckets: int = 10,
+        n_confidence_bins: int = 1000,
+        missingness_thresholds: List[float] = [0.1, 0.3],
+        missing_patterns: int = 0,
+        max_tracked_patterns: int = 10_000,
+        n_examples: int = 10,
+        seed: int = 42
+    ):
+        """
+        Initialize slice statistics.
+
+        Args:
+            categorical_features: List of indices of categorical features
+            feature_names: Optional list of feature names
+            numeric_features: List of indices of numeric features (quantile buckets)
+            n_numeric_buckets: Number of quantile buckets per numeric feature
+            n_confidence_buckets: Number of confidence quantile buckets
+            n_confidence_bins: Resolution of the confidence histogram
+            missingness_thresholds: Thresholds for low/medium/high missingness
+            missing_patterns: Number of most frequent missingness patterns to report (0 disables)
+            max_tracked_patterns: Maximum number of distinct patterns counted; rows
+                with patterns first seen after the limit are not counted
+            n_examples: Error examples kept per slice (for worst-slice failures)
+            seed: Random seed for example sampling
+        """
+        self.categorical_features = categorical_features or []
+        self.feature_names = feature_names
+        self.numeric_features = numeric_features or []
+        self.n_numeric_buckets = n_numeric_buckets
+        self.n_confidence_buckets = n_confidence_buckets
+        self.n_confidence_bins = n_confidence_bins
+        self.missingness_thresholds = missingness_thresholds
+        self.missing_patterns = missing_patterns
+        self.max_tracked_patterns = max_tracked_patterns
+        self.n_examples = n_examples
+        self.seed = seed
+
+        self.n_classes = 0
+        self.n_rows = 0
+        self.n_errors = 0
+        self.counts: Dict[str, _GroupCounts] = {}
+        self.reservoirs: Dict[str, GroupedReservoir] = {}
+        self.feature_values: Dict[int, Dict[Any, int]] = {i: {} for i in self.categorical_features}
+        # Numeric features: sketch key -> group id
+        self.sketches = {i: QuantileSketch() for i in self.numeric_features}
+        self.sketch_groups: Dict[int, Dict[int, int]] = {i: {} for i in self.numeric_features}
+        # Missingness patterns: row hash -> group id, and missing columns per group id
+        self.pattern_groups: Dict[int, int] = {}
+        self.pattern_columns: List[np.ndarray] = []
+
+    @staticmethod
+    def _group_ids(values: np.ndarray, mapping: Dict[Any, int]) -> np.ndarray:
+        """Map values to stable group ids, adding unseen values to `mapping`."""
+        uniques, inverse = np.unique(values, return_inverse=True)
+        # Every NaN is a new object that equals nothing; key them all by one object
+        keys = [_NAN if value != value else value for value in uniques.tolist()]
+        for key in keys:
+            mapping.setdefault(key, len(mapping))
+        global_ids = np.array([mapping[key] for key in keys], dtype=np.int64)
+        return global_ids[inverse.ravel()]
+
+    def _pattern_ids(self, data: np.ndarray) -> np.ndarray:
+        """Map rows to missingness pattern group ids (-1 past the tracking limit)."""
+        packed = pack_missing(data)
+        hashes, first_rows, inverse = np.unique(hash_rows(packed), return_index=True, return_inverse=True)
+        group_ids = np.full(len(hashes), -1, dtype=np.int64)
+        n_features = 1 if data.ndim == 1 else data.shape[1]
+        for i, (row_hash, row) in enumerate(zip(hashes.tolist(), first_rows)):
+            if row_hash not in self.pattern_groups:
+                if len(self.pattern_groups) >= self.max_tracked_patterns:
+                    continue
+                self.pattern_groups[row_hash] = len(self.pattern_groups)
+                self.pattern_columns.append(np.flatnonzero(np.unpackbits(packed[row], count=n_features)))
+            group_ids[i] = self.pattern_groups[row_hash]
+        return group_ids[inverse.ravel()]
+
+    def _family(self, name: str) -> _GroupCounts:
+        if name not in self.counts:
+            self.counts[name] = _GroupCounts()
+            self.reservoirs[name] = GroupedReservoir(self.n_examples, seed=self.seed + len(self.reservoirs))
+        return self.counts[name]
+
+    def update(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        y_proba: Optional[np.ndarray] = None,
+        data: Optional[np.ndarray] = None,
+        offset: int = 0
+    ):
+        """
+        Add a batch of rows.
+
+        Args:
+            y_true: True labels (non-negative integers)
+            y_pred: Predicted labels (non-negative integers)
+            y_proba: Predicted probabilities (optional)
+            data: Input features (optional)
+            offset: Global row index of the first row in the batch
+        """
+        self.n_classes = max(self.n_classes, int(max(y_true.max(), y_pred.max())) + 1)
+        incorrect = y_true != y_pred
+        self.n_rows += len(y_true)
+        self.n_errors += int(np.count_nonzero(incorrect))
+        payload = {
+            'index': offset + np.flatnonzero(incorrect),
+            'true_label': y_true[incorrect],
+            'predicted_label': y_pred[incorrect]
+        }
+        if y_proba is not None:
+            confidences = y_proba if y_proba.ndim == 1 else np.max(y_proba, axis=1)
+            payload['confidence'] = confidences[incorrect]
+        if data is not None:
+            payload['features'] = data[incorrect]
+
+        families = {}
+
+        if y_proba is not None:
+            families['confidence'] = (
+                np.clip((confidences * self.n_confidence_bins).astype(np.int64), 0, self.n_confidence_bins - 1),
+                self.n_confidence_bins
+            )
+
+        if data is not None:
+            missing = np.isnan(data.astype(float))
+            missing_fractions = missing.astype(float) if data.ndim == 1 else missing.mean(axis=1)
+            low, high = self.missingness_thresholds
+            families['missingness'] = (np.searchsorted([low, high], missing_fractions, side='right'), 3)
+
+            if self.missing_patterns:
+                families['missing_pattern'] = (self._pattern_ids(data), max(len(self.pattern_groups), 1))
+
+            for feat_idx in self.categorical_features:
+                values = data[:, feat_idx] if data.ndim > 1 else data
+                mapping = self.feature_values[feat_idx]
+                families[f'feature_{feat_idx}'] = (self._group_ids(values, mapping), len(mapping))
+
+            for feat_idx in self.numeric_features:
+                values = (data[:, feat_idx] if data.ndim > 1 else data).astype(float)
+                sketch, mapping = self.sketches[feat_idx], self.sketch_groups[feat_idx]
+                sketch.update(values)
+                valid = ~np.isnan(values)
+                codes = np.full(len(values), -1, dtype=np.int64)
+                codes[valid] = self._group_ids(sketch.key(values[valid]), mapping)
+                families[f'numeric_{feat_idx}'] = (codes, max(len(mapping), 1))
+
+        for name, (codes, n_groups) in families.items():
+            self._family(name).add(codes, y_true, y_pred, n_groups, self.n_classes)
+            self.reservoirs[name].update(codes[incorrect], **payload)
+
+    def _slices(self):
+        """Yield (slice_name, family, fine group ids) for every slice."""
+        if 'confidence' in self.counts:
+            bin_counts = self.counts['confidence'].true_count.sum(axis=1)
+            percentiles = np.linspace(0, 100, self.n_confidence_buckets + 1)
+            bucket, _ = merge_bins_to_buckets(np.arange(len(bin_counts)), bin_counts, self.n_confidence_buckets)
+            for i in range(self.n_confidence_buckets):
+                name = f"confidence_p{int(percentiles[i])}-{int(percentiles[i + 1])}"
+                yield name, 'confidence', np.flatnonzero((bucket == i) & (bin_counts > 0))
+
+        if 'missingness' in self.counts:
+            for i, level in enumerate(['low', 'medium', 'high']):
+                yield f'missingness_{level}', 'missingness', np.array([i])
+
+        if 'missing_pattern' in self.counts:
+            pattern_counts = self.counts['missing_pattern'].true_count.sum(axis=1)[:len(self.pattern_columns)]
+            hashes = list(self.pattern_groups)  # indexed by group id
+            top = [
+                group_id for group_id in np.argsort(-pattern_counts, kind='stable')
+                if len(self.pattern_columns[group_id]) and pattern_counts[group_id] > 0
+            ][:self.missing_patterns]
+            for group_id in top:
+                name = pattern_name(self.pattern_columns[group_id], self.feature_names, hashes[group_id])
+                yield name, 'missing_pattern', np.array([group_id])
+
+        for feat_idx in self.categorical_features:
+            family = f'feature_{feat_idx}'
+            if family not in self.counts:
+                continue
+            feat_name = (
+                self.feature_names[feat_idx]
+                if self.feature_names and feat_idx < len(self.feature_names) else None
+            )
+            for value, group_id in self.feature_values[feat_idx].items():
+                yield f"{feat_name or f'feature_{feat_idx}'}={value}", family, np.array([group_id])
+
+        for feat_idx in self.numeric_features:
+            family = f'numeric_{feat_idx}'
+            if family not in self.counts:
+                continue
+            feat_name = (
+                self.feature_names[feat_idx]
+                if self.feature_names and feat_idx < len(self.feature_names) else f'feature_{feat_idx}'
+            )
+            keys = np.array(list(self.sketch_groups[feat_idx]), dtype=np.int64)  # indexed by group id
+            bin_counts = self.counts[family].true_count.sum(axis=1)[:len(keys)]
+            bucket, _ = merge_bins_to_buckets(keys, bin_counts, self.n_numeric_buckets)
+
+            members = [np.flatnonzero((bucket == i) & (bin_counts > 0)) for i in range(self.n_numeric_buckets)]
+            members = [group_ids for group_ids in members if len(group_ids)]
+            sketch = self.sketches[feat_idx]
+            edges = sketch.value([keys[group_ids].min() for group_ids in members] + [keys.max()]) if members else []
+            for group_ids, label in zip(members, bucket_labels(edges)):
+                yield f"{feat_name}={label}", family, group_ids
+
+    def compute(
+        self,
+        min_samples: int = 10,
+        average: str = 'weighted',
+        alpha: Optional[float] = 0.05,
+        test: str = 'binomial'
+    ) -> List[Dict[str, Any]]:
+        """
+        Compute metrics for every slice.
+
+        Args:
+            min_samples: Minimum samples required to report a slice
+            average: Averaging strategy for precision, recall and F1
+            alpha: False discovery rate for testing slices against their complement
+            test: Slice test method ('binomial' or 'z')
+
+        Returns:
+            List of slice results, worst significant slice last
+        """
+        names, counts = [], []
+        n_classes = max((c.tp.shape[1] for c in self.counts.values()), default=0)
+
+        for name, family, group_ids in self._slices():
+            if len(group_ids) == 0:
+                continue
+            slice_counts = np.zeros((3, n_classes))
+            for i, merged in enumerate(self.counts[family].merged([group_ids])):
+                slice_counts[i, :merged.shape[1]] = merged[0]
+            names.append(name)
+            counts.append(slice_counts)
+
+        if not names:
+            return []
+        tp, pred_count, true_count = np.stack(counts, axis=1)
+        return build_slice_results(
+            names, tp, pred_count, true_count, min_samples, average,
+            totals=(self.n_rows, self.n_errors), alpha=alpha, test=test
+        )
+
+    def sample_errors(self, slice_name: str, n: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Get a uniform sample of misclassified rows from a slice.
+
+        Args:
+            slice_name: Name of the slice
+            n: Number of rows (defaults to n_examples)
+
+        Returns:
+            Dictionary of columns (index, true_label, predicted_label, confidence, features)
+        """
+        for name, family, group_ids in self._slices():
+            if name == slice_name:
+                return self.reservoirs[family].sample(group_ids, n)
+        raise KeyError(f"Unknown slice: {slice_name}")
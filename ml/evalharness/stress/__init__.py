@@ -1,5 +1,9 @@
 """Stress tests for model robustness."""
 
-from . import corruption
+from ..lazy import attach
 
 __all__ = ['corruption']
+
+__getattr__, __dir__ = attach(__name__, {
+    'corruption': 'corruption'
+})
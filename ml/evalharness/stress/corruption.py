@@ -6,12 +6,14 @@ Tests how model performance degrades under various data corruptions.
 
 import numpy as np
 from typing import Dict, Any, Callable, Optional
+from ..core.rng import make_rng
 
 
 def corrupt_missing_values(
     data: np.ndarray,
     fraction: float = 0.1,
-    seed: int = 42
+    seed: int = 42,
+    rng: Optional[np.random.Generator] = None
 ) -> np.ndarray:
     """
     Randomly mask values as missing (NaN).
@@ -20,17 +22,18 @@ def corrupt_missing_values(
         data: Input data
         fraction: Fraction of values to corrupt
         seed: Random seed
+        rng: Optional random generator (overrides seed)
 
     Returns:
         Corrupted data with missing values
     """
-    np.random.seed(seed)
+    rng = make_rng(seed, rng)
     corrupted = data.copy()
 
     # Randomly select values to corrupt
     n_values = corrupted.size
     n_corrupt = int(n_values * fraction)
-    corrupt_indices = np.random.choice(n_values, size=n_corrupt, replace=False)
+    corrupt_indices = rng.choice(n_values, size=n_corrupt, replace=False)
 
     # Flatten, corrupt, and reshape
     flat = corrupted.flatten()
@@ -43,7 +46,8 @@ def corrupt_missing_values(
 def inject_label_noise(
     labels: np.ndarray,
     fraction: float = 0.05,
-    seed: int = 42
+    seed: int = 42,
+    rng: Optional[np.random.Generator] = None
 ) -> np.ndarray:
     """
     Randomly flip labels to wrong values.
@@ -52,11 +56,12 @@ def inject_label_noise(
         labels: True labels
         fraction: Fraction of labels to corrupt
         seed: Random seed
+        rng: Optional random generator (overrides seed)
 
     Returns:
         Labels with noise injected
     """
-    np.random.seed(seed)
+    rng = make_rng(seed, rng)
     corrupted = labels.copy()
 
     # Get unique labels
@@ -68,13 +73,13 @@ def inject_label_noise(
 
     # Randomly select labels to corrupt
     n_corrupt = int(len(labels) * fraction)
-    corrupt_indices = np.random.choice(len(labels), size=n_corrupt, replace=False)
+    corrupt_indices = rng.choice(len(labels), size=n_corrupt, replace=False)
 
     # Flip to random other class
     for idx in corrupt_indices:
         current_label = labels[idx]
         other_labels = unique_labels[unique_labels != current_label]
-        corrupted[idx] = np.random.choice(other_labels)
+        corrupted[idx] = rng.choice(other_labels)
 
     return corrupted
 
@@ -84,7 +89,8 @@ def corrupt_feature(
     column: int,
     corruption_type: str = 'shuffle',
     noise_scale: float = 0.1,
-    seed: int = 42
+    seed: int = 42,
+    rng: Optional[np.random.Generator] = None
 ) -> np.ndarray:
     """
     Corrupt a specific feature column.
@@ -95,21 +101,22 @@ def corrupt_feature(
         corruption_type: Type of corruption ('shuffle' or 'noise')
         noise_scale: Scale of noise to add (for 'noise' type)
         seed: Random seed
+        rng: Optional random generator (overrides seed)
 
     Returns:
         Data with corrupted feature
     """
-    np.random.seed(seed)
+    rng = make_rng(seed, rng)
     corrupted = data.copy()
 
     if corruption_type == 'shuffle':
         # Shuffle the column
-        corrupted[:, column] = np.random.permutation(corrupted[:, column])
+        corrupted[:, column] = rng.permutation(corrupted[:, column])
 
     elif corruption_type == 'noise':
         # Add Gaussian noise
         feature_values = corrupted[:, column]
-        noise = np.random.normal(0, noise_scale * np.std(feature_values), size=len(feature_values))
+        noise = rng.normal(0, noise_scale * np.std(feature_values), size=len(feature_values))
         corrupted[:, column] = feature_values + noise
 
     return corrupted
@@ -161,7 +168,8 @@ def run_stress_test_suite(
     predictions: np.ndarray,
     labels: np.ndarray,
     model_fn: Optional[Callable] = None,
-    metric_fn: Optional[Callable] = None
+    metric_fn: Optional[Callable] = None,
+    seed: int = 42
 ) -> Dict[str, Any]:
     """
     Run full suite of stress tests.
@@ -172,6 +180,8 @@ def run_stress_test_suite(
         labels: True labels
         model_fn: Optional function that predicts from data
         metric_fn: Metric function to evaluate
+        seed: Random seed; each corruption draws from its own generator
+            seeded with it, so results don't depend on which tests run
 
     Returns:
         Dictionary of stress test results
@@ -188,7 +198,7 @@ def run_stress_test_suite(
     # Test 1: Missing values corruption
     if model_fn:
         for fraction in [0.1, 0.2, 0.3]:
-            corrupted = corrupt_missing_values(data, fraction=fraction)
+            corrupted = corrupt_missing_values(data, fraction=fraction, seed=seed)
             result = measure_degradation(model_fn, data, labels, corrupted, metric_fn)
             results.append({
                 'test_name': f'missing_values_{int(fraction*100)}pct',
@@ -199,7 +209,7 @@ def run_stress_test_suite(
     # Test 2: Feature shuffling
     if model_fn and data.ndim > 1:
         for col in range(min(3, data.shape[1])):  # Test first 3 features
-            corrupted = corrupt_feature(data, col, corruption_type='shuffle')
+            corrupted = corrupt_feature(data, col, corruption_type='shuffle', seed=seed)
             result = measure_degradation(model_fn, data, labels, corrupted, metric_fn)
             results.append({
                 'test_name': f'feature_{col}_shuffle',
@@ -0,0 +1,85 @@
+"""
+Tests for quantile bucketing
+"""
+
+import pytest
+import numpy as np
+from evalharness.slicing import bucketing, slicer
+from evalharness.slicing.streaming import StreamingSliceStats
+
+
+class TestBucketAssignment:
+
+    def test_matches_mask_per_bucket(self):
+        """Test searchsorted buckets equal the per-bucket range masks"""
+        rng = np.random.default_rng(2)
+        values = np.round(rng.random(5000), 2)  # many ties
+        edges = bucketing.quantile_edges(values, 10)
+        buckets = bucketing.assign_buckets(values, edges)
+
+        for i in range(10):
+            upper_ok = values <= edges[i + 1] if i == 9 else values < edges[i + 1]
+            expected = (values >= edges[i]) & upper_ok
+            np.testing.assert_array_equal(buckets == i, expected)
+
+    def test_numeric_feature_is_binned(self):
+        """Test numeric features give quantile slices instead of one slice per value"""
+        rng = np.random.default_rng(4)
+        X = np.column_stack([rng.normal(size=1000), rng.integers(0, 3, 1000)])
+        X[::50, 0] = np.nan
+
+        slices = slicer.create_all_slices(X, categorical_features=[1], numeric_features=[0], feature_names=['income', 'f'])
+        numeric = {name: rows for name, rows in slices.items() if name.startswith('income')}
+        assert len(numeric) == 10
+        assert sum(len(rows) for rows in numeric.values()) == 980
+        assert all(name.startswith('income=[') for name in numeric)
+        assert sum(name.startswith('f=') for name in slices) == 3
+
+    def test_declared_categorical_not_binned(self):
+        """Test a declared categorical feature with many codes keeps one slice per value"""
+        codes = np.random.default_rng(5).permutation(np.arange(5000) % 5000)
+        X = np.column_stack([codes, np.zeros(5000)])
+
+        slices = slicer.create_all_slices(X, categorical_features=[0])
+        feature_slices = [name for name in slices if name.startswith('feature_0=')]
+        assert len(feature_slices) == 5000
+        assert len(slicer.slice_by_feature(X, 0)) == 5000
+
+
+class TestQuantileSketch:
+
+    def test_relative_error_and_merge(self):
+        """Test merged sketch quantiles are within the relative error bound"""
+        rng = np.random.default_rng(6)
+        values = rng.lognormal(size=20_000) * rng.choice([-1, 1], 20_000)
+
+        sketch = bucketing.QuantileSketch(relative_accuracy=0.01)
+        other = bucketing.QuantileSketch(relative_accuracy=0.01)
+        sketch.update(values[:7000])
+        other.update(values[7000:])
+        sketch.merge(other)
+
+        qs = np.array([0.01, 0.25, 0.5, 0.75, 0.99])
+        expected = np.quantile(values, qs, method='lower')
+        assert sketch.count == len(values)
+        np.testing.assert_allclose(sketch.quantiles(qs), expected, rtol=0.011)
+
+    def test_streaming_numeric_slices(self):
+        """Test streaming numeric buckets hold about a tenth of the rows each"""
+        rng = np.random.default_rng(7)
+        X = rng.exponential(size=(4000, 1))
+        y_true = rng.integers(0, 2, 4000)
+
+        stats = StreamingSliceStats(numeric_features=[0])
+        for start in range(0, 4000, 1000):
+            batch = slice(start, start + 1000)
+            stats.update(y_true[batch], y_true[batch], data=X[batch], offset=start)
+
+        numeric = [s for s in stats.compute(min_samples=1) if s['slice_name'].startswith('feature_0=')]
+        assert len(numeric) == 10
+        assert sum(s['sample_count'] for s in numeric) == 4000
+        assert all(300 <= s['sample_count'] <= 500 for s in numeric)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,98 @@
+"""
+Tests for time-budgeted evaluation
+"""
+
+import tempfile
+
+import pytest
+import numpy as np
+from evalharness import evaluate
+from evalharness.core.budget import plan_evaluation, estimate_stage_costs
+
+
+@pytest.fixture
+def profile():
+    """Profile of a large binary evaluation with feature slices"""
+    return {
+        'n_samples': 2_000_000,
+        'n_classes': 2,
+        'has_proba': True,
+        'n_slices': 13,
+        'n_feature_slices': 20
+    }
+
+
+class TestPlanEvaluation:
+
+    def test_fits_budget_unchanged(self, profile):
+        """Test a generous budget leaves the config untouched"""
+        config = {'n_bootstrap': 1000}
+        planned, degradations = plan_evaluation(profile, config, time_budget_s=1e6)
+
+        assert planned == config
+        assert degradations == []
+
+    def test_degrades_in_order(self, profile):
+        """Test optional work is cut in the documented order and recorded"""
+        config = {
+            'n_bootstrap': 1000,
+            'run_stress_tests': True,
+            'compute_per_class': True,
+            'categorical_features': [0]
+        }
+        planned, degradations = plan_evaluation(profile, config, time_budget_s=30.0)
+
+        actions = [(d['stage'], d['action']) for d in degradations]
+        assert actions[:3] == [
+            ('stress_tests', 'skipped'),
+            ('metrics', 'skipped_per_class_metrics'),
+            ('plots', 'subsampled')
+        ]
+        assert actions[3][0] == 'confidence_intervals'
+        assert sum(estimate_stage_costs(profile, planned).values()) <= 30.0
+        assert config['run_stress_tests'] is True  # caller's config not modified
+
+    def test_unknown_size_not_planned(self, profile):
+        """Test iterator inputs of unknown length fall back to the runtime deadline"""
+        planned, degradations = plan_evaluation({**profile, 'n_samples': None}, {}, time_budget_s=1.0)
+
+        assert planned == {}
+        assert degradations[0]['action'] == 'not_planned'
+
+    def test_streaming_class_count(self):
+        """Test chunked inputs report the class count of their probabilities, or None"""
+        from evalharness.evaluators.streaming import StreamingClassificationEvaluator
+        rng = np.random.default_rng(1)
+        y_true = rng.integers(0, 5, 200)
+        proba = rng.dirichlet(np.ones(5), 200)
+
+        multiclass = StreamingClassificationEvaluator(proba.argmax(axis=1), y_true, predictions_proba=proba)
+        unknown = StreamingClassificationEvaluator(proba.argmax(axis=1), y_true)
+        assert multiclass._budget_profile()['n_classes'] == 5
+        assert unknown._budget_profile()['n_classes'] is None
+
+        costs = estimate_stage_costs(multiclass._budget_profile(), {})
+        assert costs['metrics'] > estimate_stage_costs(unknown._budget_profile(), {})['metrics']
+
+
+class TestBudgetedEvaluate:
+
+    def test_report_records_degradations(self):
+        """Test an evaluation over budget skips work and says so in the report"""
+        rng = np.random.default_rng(0)
+        y_true = rng.integers(0, 2, 300)
+        y_pred = np.where(rng.random(300) < 0.8, y_true, 1 - y_true)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            report = evaluate('classification', y_pred, y_true, output_dir=tmpdir, time_budget_s=1e-9)
+
+        assert report.get_summary_dict()['degraded']
+        assert report.confidence_intervals == {}
+        assert report.plots == []
+        assert 'accuracy' in report.metrics
+        assert 'metrics' in report.stage_timings
+        assert any(d['stage'] == 'confidence_intervals' for d in report.degradations)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,134 @@
+"""
+Tests for the evaluation stage cache
+"""
+
+import os
+import tempfile
+
+import pytest
+import numpy as np
+from evalharness.core.cache import EvalCache, hash_array
+from evalharness.evaluators.classification import ClassificationEvaluator
+from evalharness.evaluators.streaming import StreamingClassificationEvaluator
+
+
+@pytest.fixture
+def classification_inputs():
+    """Binary predictions with probabilities and one categorical feature"""
+    rng = np.random.default_rng(42)
+    n_samples = 500
+
+    y_true = rng.integers(0, 2, n_samples)
+    y_pred = np.where(rng.random(n_samples) < 0.8, y_true, 1 - y_true)
+    p1 = np.clip(0.7 * y_pred + 0.3 * rng.random(n_samples), 0, 1)
+    y_proba = np.column_stack([1 - p1, p1])
+    X = rng.normal(size=(n_samples, 3))
+    X[:, 0] = rng.integers(0, 3, n_samples)
+
+    return X, y_true, y_pred, y_proba
+
+
+class TestEvalCache:
+
+    def test_hash_depends_on_content(self):
+        """Test array hashes change with contents, dtype and shape"""
+        a = np.arange(6)
+        assert hash_array(a) == hash_array(a.copy())
+        assert hash_array(a) != hash_array(a.astype(float))
+        assert hash_array(a) != hash_array(a.reshape(2, 3))
+        assert hash_array(a) != hash_array(a[::-1])
+
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted over the size bound"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = EvalCache(tmpdir, max_bytes=2500)
+            payload = b'x' * 1000
+
+            cache.put('a', payload)
+            cache.put('b', payload)
+            os.utime(os.path.join(tmpdir, 'a.pkl'), (0, 0))
+            os.utime(os.path.join(tmpdir, 'b.pkl'), (1, 1))
+            cache.get('a')  # refresh 'a'
+            cache.put('c', payload)
+
+            assert cache.get('a') == payload
+            assert cache.get('b') is None
+            assert cache.get('c') == payload
+
+
+class TestStageReuse:
+
+    def test_only_changed_stages_recompute(self, classification_inputs):
+        """Test config changes only invalidate the stages that depend on them"""
+        X, y_true, y_pred, y_proba = classification_inputs
+
+        with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as output_dir:
+            base_config = {'cache_dir': cache_dir, 'n_bootstrap': 50}
+
+            first = ClassificationEvaluator(y_pred, y_true, X, output_dir, base_config, predictions_proba=y_proba)
+            first_report = first.evaluate()
+            assert set(first.cache_status.values()) == {'miss'}
+
+            rerun = ClassificationEvaluator(y_pred, y_true, X, output_dir, base_config, predictions_proba=y_proba)
+            rerun_report = rerun.evaluate()
+            assert set(rerun.cache_status.values()) == {'hit'}
+            assert rerun_report.metrics == first_report.metrics
+            assert all(os.path.exists(path) for path in rerun_report.plots)
+
+            changed = ClassificationEvaluator(
+                y_pred, y_true, X, output_dir, {**base_config, 'categorical_features': [0]},
+                predictions_proba=y_proba
+            )
+            changed.evaluate()
+            assert changed.cache_status['metrics'] == 'hit'
+            assert changed.cache_status['slices'] == 'miss'
+            assert changed.cache_status['failures'] == 'miss'
+
+    def test_changed_inputs_recompute(self, classification_inputs):
+        """Test different predictions never reuse cached outputs"""
+        X, y_true, y_pred, y_proba = classification_inputs
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            config = {'cache_dir': cache_dir, 'compute_cis': False}
+            ClassificationEvaluator(y_pred, y_true, X, config=config).evaluate()
+
+            evaluator = ClassificationEvaluator(1 - y_pred, y_true, X, config=config)
+            report = evaluator.evaluate()
+
+            assert evaluator.cache_status['metrics'] == 'miss'
+            assert report.metrics['accuracy'] == pytest.approx(np.mean(y_true != y_pred))
+
+    def test_streaming_round_trip(self, classification_inputs):
+        """Test chunked evaluation of file inputs reuses cached stages"""
+        X, y_true, y_pred, y_proba = classification_inputs
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = {}
+            for name, array in (('X', X), ('y_true', y_true), ('y_pred', y_pred), ('y_proba', y_proba)):
+                paths[name] = os.path.join(tmpdir, f'{name}.npy')
+                np.save(paths[name], array)
+            config = {
+                'cache_dir': os.path.join(tmpdir, 'cache'), 'n_bootstrap': 50,
+                'categorical_features': [0], 'batch_size': 100
+            }
+
+            def evaluate():
+                evaluator = StreamingClassificationEvaluator(
+                    paths['y_pred'], paths['y_true'], paths['X'], os.path.join(tmpdir, 'out'), config,
+                    predictions_proba=paths['y_proba']
+                )
+                return evaluator, evaluator.evaluate()
+
+            first, first_report = evaluate()
+            assert set(first.cache_status.values()) == {'miss'}
+
+            rerun, rerun_report = evaluate()
+            assert set(rerun.cache_status.values()) == {'hit'}
+            assert rerun_report.metrics == first_report.metrics
+            assert rerun_report.slices == first_report.slices
+            assert rerun_report.failure_examples == first_report.failure_examples
+            assert len(rerun.failure_store) == len(first.failure_store)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
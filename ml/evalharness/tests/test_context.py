@@ -0,0 +1,58 @@
+"""
+Tests for shared evaluation context
+"""
+
+import pytest
+import numpy as np
+from evalharness.core.context import EvalContext
+from evalharness.metrics import classification as metrics
+from evalharness.slicing import slicer
+from evalharness.failures import selector
+
+
+@pytest.fixture
+def multiclass_outputs():
+    """Multiclass predictions with probabilities"""
+    rng = np.random.default_rng(3)
+    n_samples = 600
+
+    y_proba = rng.dirichlet(np.ones(4), n_samples)
+    y_pred = np.argmax(y_proba, axis=1)
+    y_true = np.where(rng.random(n_samples) < 0.7, y_pred, rng.integers(0, 4, n_samples))
+
+    return y_true, y_pred, y_proba
+
+
+class TestEvalContext:
+
+    def test_matches_direct_computation(self, multiclass_outputs):
+        """Test functions give the same results with and without a context"""
+        y_true, y_pred, y_proba = multiclass_outputs
+        ctx = EvalContext(y_true, y_pred, y_proba)
+
+        assert metrics.compute_all_metrics(y_true, y_pred, y_proba, ctx=ctx) == \
+            pytest.approx(metrics.compute_all_metrics(y_true, y_pred, y_proba))
+
+        with_ctx = slicer.slice_by_confidence(y_proba, ctx=ctx)
+        without_ctx = slicer.slice_by_confidence(y_proba)
+        assert all(np.array_equal(with_ctx[name], without_ctx[name]) for name in without_ctx)
+
+        for select in (selector.select_top_confident_wrong, selector.select_low_confidence_correct):
+            assert select(y_true, y_pred, y_proba, n=5, ctx=ctx) == select(y_true, y_pred, y_proba, n=5)
+
+    def test_arrays_computed_once(self, multiclass_outputs):
+        """Test derived arrays are cached and subsets reuse them"""
+        y_true, y_pred, y_proba = multiclass_outputs
+        ctx = EvalContext(y_true, y_pred, y_proba)
+
+        assert ctx.confidences is ctx.confidences
+        np.testing.assert_array_equal(ctx.correct, y_true == y_pred)
+
+        rows = np.arange(0, 600, 7)
+        subset = ctx.take(rows)
+        assert 'confidences' in subset._cache
+        np.testing.assert_array_equal(subset.confidences, np.max(y_proba[rows], axis=1))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
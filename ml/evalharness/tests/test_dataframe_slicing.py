@@ -0,0 +1,93 @@
+"""
+Tests for slicing DataFrame inputs by column name
+"""
+
+import tempfile
+
+import pytest
+import numpy as np
+import pandas as pd
+from evalharness.core.cache import hash_array
+from evalharness.slicing import discovery, engine, slicer
+from evalharness.evaluators.classification import ClassificationEvaluator
+
+
+@pytest.fixture
+def frame():
+    """Mixed-type frame: categorical, string (with missing values) and numeric columns"""
+    rng = np.random.default_rng(0)
+    n = 2000
+    df = pd.DataFrame({
+        'country': pd.Categorical(rng.choice(['BR', 'DE', 'US'], n), categories=['BR', 'DE', 'US', 'FR']),
+        'device': rng.choice(np.array(['android', 'ios', 'web'], dtype=object), n),
+        'age': rng.normal(40, 10, n)
+    })
+    df.loc[:99, 'device'] = None
+    df.loc[100:149, 'age'] = np.nan
+    labels = rng.integers(0, 2, n)
+    predictions = np.where(rng.random(n) < np.where(df['country'] == 'BR', 0.6, 0.9), labels, 1 - labels)
+    return df, labels, predictions
+
+
+class TestDataFrameSlicing:
+
+    def test_encode_groups_uses_codes(self, frame):
+        """Test categorical codes and factorized strings give sorted groups with missing values last"""
+        df, _, _ = frame
+
+        categories, codes = engine.encode_groups(df['country'])
+        assert list(categories) == ['BR', 'DE', 'US']  # unused category dropped
+        np.testing.assert_array_equal(categories[codes], df['country'].astype(str).to_numpy())
+
+        values, codes = engine.encode_groups(df['device'])
+        assert list(values[:3]) == ['android', 'ios', 'web'] and pd.isna(values[3])
+        assert np.all(codes[:100] == 3)
+
+    def test_slices_by_column_name(self, frame):
+        """Test feature slices are addressed and named by column"""
+        df, _, _ = frame
+        slices = slicer.create_all_slices(df, categorical_features=['country', 'device'], numeric_features=['age'])
+
+        np.testing.assert_array_equal(slices['country=BR'], np.flatnonzero(df['country'] == 'BR'))
+        assert len(slices['device=nan']) == 100
+        assert len(slices['missingness_low']) == 2000 - 150
+        assert sum(len(v) for k, v in slices.items() if k.startswith('age=')) == 1950
+
+    def test_missing_patterns_name_columns(self, frame):
+        """Test missingness patterns use column names"""
+        df, _, _ = frame
+        slices = slicer.slice_by_missing_pattern(df, top_n=2)
+
+        assert list(slices) == ['missing_pattern=[device]', 'missing_pattern=[age]']
+
+    def test_discovery_by_column(self, frame):
+        """Test discovered slices name DataFrame columns"""
+        df, labels, predictions = frame
+        found = discovery.find_problematic_slices(df, labels == predictions, max_depth=1)
+
+        assert found[0]['slice_name'] == 'country=BR'
+        assert found[0]['conditions'] == [('country', 'BR')]
+
+    def test_evaluator_with_frame(self, frame):
+        """Test a DataFrame is evaluated without conversion and cached by content"""
+        df, labels, predictions = frame
+        config = {'categorical_features': ['country', 'device'], 'numeric_features': ['age']}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            evaluator = ClassificationEvaluator(predictions, labels, df, config={**config, 'cache_dir': tmpdir})
+            report = evaluator.evaluate()
+            assert evaluator.data is df
+            assert report.slices[-1]['slice_name'] == 'country=BR'
+            assert report.failure_examples
+            assert list(report.failure_store.features.columns) == list(df.columns)
+
+            rerun = ClassificationEvaluator(predictions, labels, df.copy(), config={**config, 'cache_dir': tmpdir})
+            rerun.evaluate()
+            assert rerun.cache_status['slices'] == 'hit'
+            assert rerun.failure_store.features.equals(evaluator.failure_store.features)
+
+        assert hash_array(df) != hash_array(df.assign(age=df['age'] + 1))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
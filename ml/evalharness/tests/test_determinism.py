@@ -0,0 +1,156 @@
+"""
+Tests for seeded, generator-based sampling.
+"""
+
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from sklearn.metrics import accuracy_score
+from evalharness import evaluate
+from evalharness.ci import bootstrap
+from evalharness.core.context import LabelContext
+from evalharness.failures import selector
+from evalharness.stress import corruption
+
+
+@pytest.fixture
+def outputs():
+    """Create labels, predictions, probabilities and features"""
+    rng = np.random.default_rng(5)
+    n = 3000
+    y_true = rng.integers(0, 3, n)
+    y_pred = np.where(rng.random(n) < 0.75, y_true, rng.integers(0, 3, n))
+    y_proba = rng.dirichlet(np.ones(3), n)
+    data = rng.normal(size=(n, 4))
+    return y_true, y_pred, y_proba, data
+
+
+@pytest.fixture
+def global_state():
+    """Seed the global random state and return a copy of it"""
+    np.random.seed(1234)
+    return np.random.get_state()
+
+
+def assert_global_state_unchanged(state):
+    """Check that NumPy's global random state was not touched"""
+    current = np.random.get_state()
+    np.testing.assert_array_equal(current[1], state[1])
+    assert current[2] == state[2]
+
+
+class TestSeededFunctions:
+    """Tests for the seed and rng arguments of sampling functions"""
+
+    def test_bootstrap_same_seed(self, outputs, global_state):
+        """Test bootstrap intervals are reproducible and leave global state alone"""
+        y_true, y_pred, _, _ = outputs
+        first = bootstrap.bootstrap_confidence_interval((y_pred, y_true), accuracy_score, n_iterations=50, seed=7)
+        second = bootstrap.bootstrap_confidence_interval((y_pred, y_true), accuracy_score, n_iterations=50, seed=7)
+        assert first == second
+        assert_global_state_unchanged(global_state)
+
+    def test_bootstrap_rng_matches_seed(self, outputs):
+        """Test passing a generator equals passing its seed"""
+        y_true, y_pred, _, _ = outputs
+        seeded = bootstrap.bootstrap_confidence_interval((y_pred, y_true), accuracy_score, n_iterations=50, seed=7)
+        with_rng = bootstrap.bootstrap_confidence_interval(
+            (y_pred, y_true), accuracy_score, n_iterations=50, rng=np.random.default_rng(7)
+        )
+        assert seeded['mean'] == with_rng['mean']
+        assert seeded['lower'] == with_rng['lower']
+
+    def test_bootstrap_cached_indices_match(self, outputs):
+        """Test resamples drawn on the fly equal the cached LabelContext indices"""
+        y_true, y_pred, _, _ = outputs
+        indices = LabelContext(y_true).bootstrap_indices(20, seed=3)
+        cached = bootstrap.bootstrap_confidence_interval(
+            (y_pred, y_true), accuracy_score, n_iterations=20, seed=3, indices=indices
+        )
+        drawn = bootstrap.bootstrap_confidence_interval((y_pred, y_true), accuracy_score, n_iterations=20, seed=3)
+        assert cached == drawn
+
+    def test_multiple_metrics_share_resamples(self, outputs):
+        """Test one generator gives every metric the same resamples"""
+        y_true, y_pred, _, _ = outputs
+        results = bootstrap.bootstrap_multiple_metrics(
+            (y_pred, y_true), {'a': accuracy_score, 'b': accuracy_score},
+            n_iterations=30, rng=np.random.default_rng(0)
+        )
+        assert results['a'] == results['b']
+
+    def test_corruption_reproducible(self, outputs, global_state):
+        """Test corruptions depend only on the seed"""
+        _, y_true, _, data = outputs
+        np.testing.assert_array_equal(
+            corruption.corrupt_missing_values(data, 0.2, seed=1),
+            corruption.corrupt_missing_values(data, 0.2, rng=np.random.default_rng(1))
+        )
+        np.testing.assert_array_equal(
+            corruption.corrupt_feature(data, 0, 'noise', seed=2),
+            corruption.corrupt_feature(data, 0, 'noise', seed=2)
+        )
+        noisy = corruption.inject_label_noise(y_true, 0.1, seed=3)
+        np.testing.assert_array_equal(noisy, corruption.inject_label_noise(y_true, 0.1, seed=3))
+        assert (noisy != y_true).sum() == int(len(y_true) * 0.1)
+        assert_global_state_unchanged(global_state)
+
+    def test_worst_slice_errors_seeded(self, outputs, global_state):
+        """Test worst-slice sampling is reproducible and seed-dependent"""
+        y_true, y_pred, y_proba, data = outputs
+        slices = [{'slice_name': 'all', 'indices': np.arange(len(y_true))}]
+
+        def sample(**kwargs):
+            examples = selector.select_worst_slice_errors(slices, y_true, y_pred, y_proba, n=10, **kwargs)
+            return [e['index'] for e in examples]
+
+        assert sample(seed=1) == sample(seed=1)
+        assert sample(seed=1) == sample(rng=np.random.default_rng(1))
+        assert sample(seed=1) != sample(seed=2)
+        assert_global_state_unchanged(global_state)
+
+
+class TestEvaluationDeterminism:
+    """Tests for reproducible and thread-safe evaluations"""
+
+    CONFIG = {
+        'seed': 11,
+        'n_bootstrap': 50,
+        'n_failures_per_type': 5,
+        'generate_plots': False,
+        'numeric_features': [0, 1]
+    }
+
+    def _summary(self, outputs, seed):
+        """Run one evaluation and keep its random-dependent results"""
+        y_true, y_pred, y_proba, data = outputs
+        report = evaluate(
+            'classification', y_pred, y_true, data=data,
+            config={**self.CONFIG, 'seed': seed}, predictions_proba=y_proba
+        )
+        return (
+            report.confidence_intervals,
+            [(f['failure_type'], f['index']) for f in report.failure_examples]
+        )
+
+    def test_same_seed_same_report(self, outputs, global_state):
+        """Test two evaluations with the same seed agree"""
+        assert self._summary(outputs, 11) == self._summary(outputs, 11)
+        assert_global_state_unchanged(global_state)
+
+    def test_seed_changes_resamples(self, outputs):
+        """Test the seed drives the bootstrap resamples"""
+        assert self._summary(outputs, 11)[0] != self._summary(outputs, 12)[0]
+
+    def test_concurrent_evaluations(self, outputs):
+        """Test evaluations running in threads match sequential ones"""
+        seeds = [11, 12, 11, 12]
+        expected = {seed: self._summary(outputs, seed) for seed in set(seeds)}
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda seed: self._summary(outputs, seed), seeds))
+        for seed, result in zip(seeds, results):
+            assert result == expected[seed]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,67 @@
+"""
+Tests for automatic slice discovery
+"""
+
+import pytest
+import numpy as np
+from evalharness.slicing import discovery
+from evalharness.evaluators.classification import ClassificationEvaluator
+
+
+@pytest.fixture
+def planted_slice():
+    """Errors concentrated in the cross feature_0=1 AND feature_2=3"""
+    rng = np.random.default_rng(8)
+    n_samples = 20_000
+
+    X = np.column_stack([
+        rng.integers(0, 3, n_samples),
+        rng.integers(0, 5, n_samples),
+        rng.integers(0, 4, n_samples),
+        rng.normal(size=n_samples)  # continuous, crossed by quantile bucket
+    ]).astype(float)
+    bad = (X[:, 0] == 1) & (X[:, 2] == 3)
+    correct = rng.random(n_samples) > np.where(bad, 0.5, 0.1)
+
+    return X, correct, bad
+
+
+class TestSliceDiscovery:
+
+    def test_finds_planted_cross(self, planted_slice):
+        """Test the worst feature cross is found and ranked first"""
+        X, correct, bad = planted_slice
+
+        found = discovery.find_problematic_slices(X, correct, max_depth=2, min_support=0.01)
+
+        assert found[0]['slice_name'] == 'feature_0=1.0 AND feature_2=3.0'
+        assert found[0]['sample_count'] == bad.sum()
+        assert found[0]['error_rate'] == pytest.approx(1 - correct[bad].mean())
+        assert all(s['z_score'] >= 1.96 for s in found)
+
+    def test_support_and_effect_pruning(self, planted_slice):
+        """Test slices below the support or effect-size bounds are not reported"""
+        X, correct, bad = planted_slice
+
+        min_support = int(bad.sum()) + 1
+        found = discovery.find_problematic_slices(X, correct, min_support=min_support, max_depth=3)
+        assert all(s['sample_count'] >= min_support for s in found)
+
+        assert discovery.find_problematic_slices(X, correct, min_effect=0.9) == []
+
+    def test_evaluator_reports_discovered_slices(self, planted_slice):
+        """Test discovered slices are evaluated alongside the standard slices"""
+        X, correct, bad = planted_slice
+        y_true = np.zeros(len(X), dtype=int)
+        y_pred = (~correct).astype(int)
+
+        evaluator = ClassificationEvaluator(y_pred, y_true, X, config={'discover_slices': True})
+        slices = evaluator.compute_slices()
+
+        worst = slices[-1]
+        assert worst['slice_name'] == 'feature_0=1.0 AND feature_2=3.0'
+        np.testing.assert_array_equal(evaluator.slice_indices[worst['slice_name']], np.flatnonzero(bad))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,139 @@
+"""
+Tests for failure clustering.
+"""
+
+import json
+import os
+import tempfile
+import pytest
+import numpy as np
+import pandas as pd
+from evalharness.failures import clustering
+from evalharness.evaluators.classification import ClassificationEvaluator
+
+
+@pytest.fixture
+def blobs():
+    """Create three feature blobs; errors concentrate in the blob at (10, 10)"""
+    rng = np.random.RandomState(0)
+    centers = np.array([[0.0, 0.0], [10.0, 10.0], [-10.0, 10.0]])
+    group = rng.randint(0, 3, 3000)
+    data = centers[group] + rng.randn(3000, 2)
+
+    labels = rng.randint(0, 2, 3000)
+    error_rate = np.array([0.05, 0.6, 0.05])[group]
+    predictions = np.where(rng.rand(3000) < error_rate, 1 - labels, labels)
+    return data, labels, predictions, group
+
+
+class TestAssignClusters:
+    """Tests for nearest-centroid assignment"""
+
+    def test_matches_brute_force(self):
+        """Test blocked assignment equals pairwise distances"""
+        rng = np.random.RandomState(1)
+        points = rng.randn(1000, 5)
+        centroids = rng.randn(7, 5)
+
+        labels, distances = clustering.assign_clusters(points, centroids)
+        pairwise = np.linalg.norm(points[:, None, :] - centroids[None, :, :], axis=2)
+        np.testing.assert_array_equal(labels, pairwise.argmin(axis=1))
+        np.testing.assert_allclose(distances, pairwise.min(axis=1), atol=1e-9)
+
+
+class TestClusterFailures:
+    """Tests for clustering misclassified rows"""
+
+    def test_finds_error_region(self, blobs):
+        """Test the largest cluster covers the high-error blob"""
+        data, labels, predictions, group = blobs
+        points, center, scale = clustering.standardize(data)
+        clusters = clustering.cluster_failures(
+            points, labels != predictions, labels, predictions, n_clusters=3,
+            center=center, scale=scale, dimension_names=['x', 'y']
+        )
+
+        assert len(clusters) == 3
+        assert sum(c['size'] for c in clusters) == np.count_nonzero(labels != predictions)
+        assert sum(c['n_samples'] for c in clusters) == len(labels)
+
+        worst = clusters[0]
+        assert worst['centroid']['x'] == pytest.approx(10, abs=0.5)
+        assert worst['centroid']['y'] == pytest.approx(10, abs=0.5)
+        assert worst['error_rate'] == pytest.approx(0.6, abs=0.05)
+
+        reps = worst['representatives']
+        assert len(reps) == 3
+        assert all(labels[r['index']] != predictions[r['index']] for r in reps)
+        assert [r['distance'] for r in reps] == sorted(r['distance'] for r in reps)
+
+    def test_fewer_errors_than_clusters(self):
+        """Test the number of clusters is capped by the number of errors"""
+        points = np.arange(10, dtype=float).reshape(-1, 1)
+        labels = np.zeros(10, dtype=int)
+        predictions = labels.copy()
+        predictions[[2, 7]] = 1
+
+        clusters = clustering.cluster_failures(points, labels != predictions, labels, predictions, n_clusters=8)
+        assert sorted(c['size'] for c in clusters) == [1, 1]
+        assert clustering.cluster_failures(points, labels != labels, labels, labels) == []
+
+    def test_frame_features(self):
+        """Test non-numeric DataFrame columns are left out"""
+        frame = pd.DataFrame({'a': [1.0, np.nan, 3.0], 'b': ['x', 'y', 'z'], 'c': [1, 2, 3]})
+        matrix, names = clustering.feature_matrix(frame)
+        assert names == ['a', 'c']
+        assert matrix.shape == (3, 2)
+
+        scaled, _, _ = clustering.standardize(matrix)
+        assert not np.isnan(scaled).any()
+
+    def test_memmap_embedding(self, blobs):
+        """Test a float32 memmap with NaN clusters like the cleaned float64 array"""
+        _, labels, predictions, group = blobs
+        embedding = (np.eye(3)[group] + 0.01 * np.random.RandomState(2).randn(len(group), 3)).astype(np.float32)
+        embedding[::50, 0] = np.nan
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'embedding.npy')
+            np.save(path, embedding)
+            mapped = np.load(path, mmap_mode='r')
+            clusters = clustering.cluster_failures(mapped, labels != predictions, labels, predictions, n_clusters=3)
+            del mapped
+
+        cleaned = np.nan_to_num(embedding.astype(float))
+        assert clusters == clustering.cluster_failures(cleaned, labels != predictions, labels, predictions, n_clusters=3)
+
+
+class TestClusteringStage:
+    """Tests for the evaluator's failure clustering stage"""
+
+    def test_disabled_by_default(self, blobs):
+        """Test no clusters are computed unless configured"""
+        data, labels, predictions, _ = blobs
+        report = ClassificationEvaluator(predictions, labels, data, config={'generate_plots': False}).evaluate()
+        assert report.failure_clusters == []
+
+    def test_embedding_and_artifact(self, blobs):
+        """Test clusters in a supplied embedding space are written to disk"""
+        data, labels, predictions, group = blobs
+        embedding = np.eye(3)[group] + 0.01 * np.random.RandomState(2).randn(len(group), 3)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'embedding.npy')
+            np.save(path, embedding)
+            report = ClassificationEvaluator(
+                predictions, labels, data, output_dir=tmpdir,
+                config={'generate_plots': False, 'compute_cis': False, 'cluster_failures': 3, 'cluster_embedding': path}
+            ).evaluate()
+
+            assert len(report.failure_clusters) == 3
+            assert isinstance(report.failure_clusters[0]['centroid'], list)
+            assert np.argmax(report.failure_clusters[0]['centroid']) == 1
+
+            with open(os.path.join(tmpdir, 'eval', 'failure_clusters.json')) as f:
+                assert json.load(f) == report.failure_clusters
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,120 @@
+"""
+Tests for the columnar failure example store.
+"""
+
+import json
+import os
+import tempfile
+import pytest
+import numpy as np
+import pandas as pd
+from evalharness.failures import selector
+from evalharness.failures.store import FailureStore
+from evalharness.evaluators.classification import ClassificationEvaluator
+
+
+@pytest.fixture
+def outputs():
+    """Create labels, predictions, probabilities and wide features"""
+    rng = np.random.RandomState(0)
+    n = 500
+    y_true = rng.randint(0, 3, n)
+    y_pred = np.where(rng.rand(n) < 0.7, y_true, rng.randint(0, 3, n))
+    y_proba = rng.dirichlet(np.ones(3), n)
+    data = rng.randn(n, 64)
+    return y_true, y_pred, y_proba, data
+
+
+class TestFailureStore:
+    """Tests for FailureStore"""
+
+    def test_selection_gathers_features_once(self, outputs):
+        """Test the store holds one feature block aligned with its columns"""
+        y_true, y_pred, y_proba, data = outputs
+        store = selector.select_failure_store(y_true, y_pred, y_proba, data=data, n_per_type=5)
+
+        assert len(store) == 10
+        assert store.features.shape == (10, 64)
+        np.testing.assert_array_equal(store.features, data[store.columns['index']])
+        np.testing.assert_array_equal(store.columns['true_label'], y_true[store.columns['index']])
+
+    def test_examples_round_trip(self, outputs):
+        """Test the store matches the example dictionaries"""
+        y_true, y_pred, y_proba, data = outputs
+        examples = selector.select_all_failure_examples(y_true, y_pred, y_proba, data=data, n_per_type=5)
+        store = FailureStore.from_examples(examples)
+
+        assert store.to_examples() == examples
+        assert all('features' not in e for e in store.to_examples(include_features=False))
+
+    def test_concat_fills_missing_columns(self):
+        """Test concatenated stores keep absent confidences and slice names absent"""
+        y_true = np.array([0, 1, 1, 0])
+        y_pred = np.array([1, 1, 0, 0])
+        first = FailureStore.from_selection('worst_slice_error', [0, 2], y_true, y_pred, slice_name='a=1')
+        second = FailureStore.from_selection('high_confidence_wrong', [2], y_true, y_pred, np.full(4, 0.9))
+
+        examples = FailureStore.concat([first, second]).to_examples()
+        assert examples[0] == {'index': 0, 'true_label': 0, 'predicted_label': 1,
+                               'failure_type': 'worst_slice_error', 'slice_name': 'a=1'}
+        assert examples[2] == {'index': 2, 'true_label': 1, 'predicted_label': 0,
+                               'confidence': 0.9, 'failure_type': 'high_confidence_wrong'}
+
+    def test_save_and_load(self, outputs):
+        """Test the store is written as .npy files and read back"""
+        y_true, y_pred, y_proba, data = outputs
+        store = selector.select_failure_store(y_true, y_pred, y_proba, data=data, n_per_type=5)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            references = store.save(os.path.join(tmpdir, 'failures'), base_dir=tmpdir)
+            assert references['features'] == os.path.join('failures', 'features.npy')
+            assert references['columns']['index'] == os.path.join('failures', 'index.npy')
+
+            loaded = FailureStore.load(os.path.join(tmpdir, 'failures'))
+            assert loaded.to_examples() == store.to_examples()
+
+    def test_mixed_frame_saved_as_parquet(self):
+        """Test mixed-type DataFrame rows are written as Parquet"""
+        pytest.importorskip('pyarrow')
+        frame = pd.DataFrame({'country': ['US', 'BR', 'DE'], 'age': [30.0, 41.0, np.nan]})
+        store = FailureStore.from_selection('worst_slice_error', [2, 0], np.array([0, 1, 0]), np.array([1, 1, 1]), data=frame)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            references = store.save(tmpdir)
+            assert references['features'] == 'features.parquet'
+            assert references['feature_names'] == ['country', 'age']
+            loaded = FailureStore.load(tmpdir)
+            pd.testing.assert_frame_equal(loaded.features, store.features)
+
+
+class TestFailureArtifacts:
+    """Tests for the failure store in written reports"""
+
+    def test_report_references_store(self, outputs):
+        """Test JSON files carry references instead of feature rows"""
+        y_true, y_pred, y_proba, data = outputs
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            evaluator = ClassificationEvaluator(
+                y_pred, y_true, data, output_dir=tmpdir, predictions_proba=y_proba,
+                config={'generate_plots': False, 'n_failures_per_type': 5}
+            )
+            report = evaluator.evaluate()
+            eval_dir = os.path.join(tmpdir, 'eval')
+
+            with open(os.path.join(eval_dir, 'eval_summary.json')) as f:
+                summary = json.load(f)
+            with open(os.path.join(eval_dir, 'failure_examples.json')) as f:
+                examples = json.load(f)
+
+            assert summary['failure_artifacts']['features'] == os.path.join('failures', 'features.npy')
+            assert all('features' not in e for e in examples + summary['failure_examples'])
+            assert 'failure_store' not in summary
+
+            features = np.load(os.path.join(eval_dir, summary['failure_artifacts']['features']))
+            np.testing.assert_array_equal(features, data[[e['index'] for e in examples]])
+            assert len(examples) == len(report.failure_examples)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,98 @@
+"""
+Tests for lazy imports and import time.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import pytest
+import evalharness
+
+
+# Libraries that must not be loaded just by importing the package
+HEAVY_MODULES = ('sklearn', 'pandas', 'scipy', 'matplotlib', 'seaborn', 'pydantic', 'pyarrow')
+
+# Generous wall-clock budgets (seconds); eager imports took over 2s
+PACKAGE_IMPORT_BUDGET_S = 0.5
+MODULE_IMPORT_BUDGET_S = 1.0
+
+
+def import_in_fresh_interpreter(module):
+    """Import a module in a new interpreter; return (seconds taken, heavy modules loaded)"""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps([elapsed, loaded]))\n"
+    )
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(p for p in sys.path if p)}
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True, env=env).stdout
+    elapsed, loaded = json.loads(output.strip().splitlines()[-1])
+    return elapsed, loaded
+
+
+class TestImportTime:
+    """Benchmarks guarding fast imports"""
+
+    def test_package_import(self):
+        """Test importing the package loads no heavy library"""
+        elapsed, loaded = import_in_fresh_interpreter('evalharness')
+        assert loaded == []
+        assert elapsed < PACKAGE_IMPORT_BUDGET_S
+
+    @pytest.mark.parametrize('module', [
+        'evalharness.metrics.regression',
+        'evalharness.core.context',
+        'evalharness.ci.bootstrap',
+        'evalharness.stress.corruption'
+    ])
+    def test_module_import(self, module):
+        """Test modules that need only numpy load no heavy library"""
+        elapsed, loaded = import_in_fresh_interpreter(module)
+        assert loaded == []
+        assert elapsed < MODULE_IMPORT_BUDGET_S
+
+    def test_evaluator_skips_plotting_libraries(self):
+        """Test matplotlib and seaborn load only when plots are generated"""
+        _, loaded = import_in_fresh_interpreter('evalharness.evaluators.classification')
+        assert 'matplotlib' not in loaded
+        assert 'seaborn' not in loaded
+
+
+class TestLazyAttributes:
+    """Tests for attributes loaded on first access"""
+
+    def test_exports_resolve(self):
+        """Test every exported name of the package and subpackages resolves"""
+        from evalharness import ci, core, failures, metrics, plots, slicing, stress
+        for package in (evalharness, ci, core, failures, metrics, plots, slicing, stress):
+            for name in package.__all__:
+                assert getattr(package, name) is not None
+                assert name in dir(package)
+
+    def test_aliases(self):
+        """Test top-level aliases point at the subpackage modules"""
+        from evalharness.failures import selector
+        from evalharness.metrics import classification
+        assert evalharness.selector is selector
+        assert evalharness.classification is classification
+        assert evalharness.BaseEvaluator is evalharness.core.BaseEvaluator
+
+    def test_optional_regression_evaluator(self):
+        """Test the missing regression evaluator is exported as None"""
+        from evalharness import evaluators
+        assert evaluators.RegressionEvaluator is None or isinstance(evaluators.RegressionEvaluator, type)
+
+    def test_unknown_attribute(self):
+        """Test unknown names still raise AttributeError"""
+        with pytest.raises(AttributeError):
+            evalharness.not_a_module
+        with pytest.raises(AttributeError):
+            evalharness.failures.not_a_module
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,76 @@
+"""
+Tests for two-way interaction slices
+"""
+
+import pytest
+import numpy as np
+from evalharness.slicing import engine, interactions
+from evalharness.evaluators.classification import ClassificationEvaluator
+
+
+@pytest.fixture
+def crossed():
+    """Three categorical features; errors concentrated in region=2 AND device=1"""
+    rng = np.random.RandomState(0)
+    n = 4000
+    data = np.column_stack([rng.randint(0, 4, n), rng.randint(0, 3, n), rng.randint(0, 5, n)]).astype(float)
+    labels = rng.randint(0, 3, n)
+    error_rate = np.where((data[:, 0] == 2) & (data[:, 1] == 1), 0.6, 0.1)
+    predictions = np.where(rng.rand(n) < error_rate, (labels + 1) % 3, labels)
+    return data, labels, predictions
+
+
+class TestInteractions:
+
+    def test_counts_match_explicit_slices(self, crossed):
+        """Test pair counts equal counting the intersections directly"""
+        data, labels, predictions = crossed
+        label_codes = engine.encode_labels(labels, predictions)
+        names, tp, pred_count, true_count, slices = interactions.evaluate_feature_pairs(
+            data, [0, 1, 2], *label_codes, feature_names=['region', 'device', 'plan']
+        )
+
+        assert len(names) == 4 * 3 + 4 * 5 + 3 * 5
+        i = names.index('region=2.0 AND device=1.0')
+        rows = np.flatnonzero((data[:, 0] == 2) & (data[:, 1] == 1))
+        np.testing.assert_array_equal(slices['region=2.0 AND device=1.0'], rows)
+        expected = engine.slice_confusion_counts(np.zeros(len(rows), dtype=int), rows, 1, *label_codes)
+        for counts, expected_counts in zip((tp, pred_count, true_count), expected):
+            np.testing.assert_array_equal(counts[i], expected_counts[0])
+
+    def test_large_class_count_path(self, crossed, monkeypatch):
+        """Test the per-class bincount path gives the same counts"""
+        data, labels, predictions = crossed
+        label_codes = engine.encode_labels(labels, predictions)
+        full = interactions.evaluate_feature_pairs(data, [0, 1], *label_codes)
+        monkeypatch.setattr(interactions, 'MAX_CONFUSION_COUNTERS', 0)
+        split = interactions.evaluate_feature_pairs(data, [0, 1], *label_codes)
+
+        for full_counts, split_counts in zip(full[1:4], split[1:4]):
+            np.testing.assert_array_equal(full_counts, split_counts)
+
+    def test_cardinality_guard(self, crossed):
+        """Test pairs with too many cells are skipped"""
+        data, labels, predictions = crossed
+        names, *_ = interactions.evaluate_feature_pairs(
+            data, [0, 1, 2], *engine.encode_labels(labels, predictions), max_cells=15
+        )
+
+        # region x plan (20 cells) is skipped; region x device and device x plan are kept
+        assert len(names) == 4 * 3 + 3 * 5
+        assert not any(name.startswith('feature_0') and 'feature_2' in name for name in names)
+
+    def test_evaluator_ranks_planted_pair_worst(self, crossed):
+        """Test the planted interaction is the worst slice of the report"""
+        data, labels, predictions = crossed
+        evaluator = ClassificationEvaluator(
+            predictions, labels, data, config={'categorical_features': [0, 1, 2], 'slice_pairs': True}
+        )
+        slices = evaluator.compute_slices()
+
+        assert slices[-1]['slice_name'] == 'feature_0=2.0 AND feature_1=1.0'
+        assert len(evaluator.slice_indices[slices[-1]['slice_name']]) == slices[-1]['sample_count']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
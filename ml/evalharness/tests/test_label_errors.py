@@ -0,0 +1,105 @@
+"""
+Tests for confident-learning label error detection.
+"""
+
+import pytest
+import numpy as np
+from evalharness.failures import label_errors, taxonomy
+from evalharness.stress.corruption import inject_label_noise
+from evalharness.evaluators.classification import ClassificationEvaluator
+
+
+@pytest.fixture
+def noisy_labels():
+    """Create a good model's probabilities and labels with 5% of them flipped"""
+    rng = np.random.RandomState(0)
+    n, n_classes = 4000, 5
+    clean = rng.randint(0, n_classes, n)
+    logits = rng.randn(n, n_classes)
+    logits[np.arange(n), clean] += 6.0
+    proba = np.exp(logits) / np.exp(logits).sum(axis=1, keepdims=True)
+    noisy = inject_label_noise(clean, fraction=0.05, seed=1)
+    return clean, noisy, proba
+
+
+def reference_joint(labels, proba, thresholds):
+    """Confident joint computed row by row"""
+    n_classes = proba.shape[1]
+    joint = np.zeros((n_classes, n_classes), dtype=int)
+    for y, p in zip(labels, proba):
+        candidates = [j for j in range(n_classes) if p[j] >= thresholds[j]]
+        if candidates:
+            joint[y, max(candidates, key=lambda j: p[j])] += 1
+    return joint
+
+
+class TestConfidentLearning:
+    """Tests for find_label_errors"""
+
+    def test_thresholds(self, noisy_labels):
+        """Test thresholds are the mean self-confidence per class"""
+        _, noisy, proba = noisy_labels
+        thresholds = label_errors.class_thresholds(noisy, proba)
+        expected = [proba[noisy == j, j].mean() for j in range(proba.shape[1])]
+        np.testing.assert_allclose(thresholds, expected)
+
+    def test_confident_joint(self, noisy_labels):
+        """Test the bincount confident joint equals a row-by-row count"""
+        _, noisy, proba = noisy_labels
+        found = label_errors.find_label_errors(noisy, proba)
+        np.testing.assert_array_equal(found['confident_joint'], reference_joint(noisy, proba, found['thresholds']))
+
+    def test_finds_flipped_labels(self, noisy_labels):
+        """Test the flagged rows are mostly the flipped ones, most suspicious first"""
+        clean, noisy, proba = noisy_labels
+        found = label_errors.find_label_errors(noisy, proba)
+        flipped = set(np.flatnonzero(clean != noisy))
+        flagged = set(found['indices'].tolist())
+
+        assert len(flagged & flipped) / len(flipped) > 0.9
+        assert len(flagged & flipped) / len(flagged) > 0.8
+        assert np.all(np.diff(found['margins']) >= 0)
+        np.testing.assert_array_equal(found['suggested_labels'][:20], clean[found['indices'][:20]])
+
+    def test_chunking_invariant(self, noisy_labels):
+        """Test small chunks give the same result"""
+        _, noisy, proba = noisy_labels
+        full = label_errors.find_label_errors(noisy, proba)
+        chunked = label_errors.find_label_errors(noisy, proba, chunk_elements=37)
+        for key in full:
+            np.testing.assert_allclose(full[key], chunked[key])
+
+    def test_binary_probabilities(self):
+        """Test 1-D probabilities of the positive class"""
+        labels = np.array([1, 1, 1, 0, 0, 0, 0])
+        proba = np.array([0.9, 0.8, 0.05, 0.1, 0.2, 0.1, 0.98])
+        found = label_errors.find_label_errors(labels, proba)
+        assert found['indices'].tolist() == [6, 2]
+        assert found['suggested_labels'].tolist() == [1, 0]
+
+    def test_invalid_labels(self):
+        """Test labels outside the probability columns are rejected"""
+        with pytest.raises(ValueError):
+            label_errors.find_label_errors(np.array([0, 3]), np.full((2, 3), 1 / 3))
+
+
+class TestLabelErrorExamples:
+    """Tests for label errors in the failures stage"""
+
+    def test_reported_as_data_failures(self, noisy_labels):
+        """Test label errors become DATA failure examples"""
+        _, noisy, proba = noisy_labels
+        report = ClassificationEvaluator(
+            proba.argmax(axis=1), noisy, predictions_proba=proba,
+            config={'generate_plots': False, 'compute_cis': False, 'detect_label_errors': True,
+                    'n_label_errors': 15, 'categorize_failures': True}
+        ).evaluate()
+
+        found = [f for f in report.failure_examples if f['failure_type'] == 'label_error']
+        assert len(found) == 15
+        assert all(f['taxonomy_category'] == taxonomy.FailureCategory.DATA.value for f in found)
+        assert found[0]['index'] == label_errors.find_label_errors(noisy, proba)['indices'][0]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
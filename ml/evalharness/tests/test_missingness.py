@@ -0,0 +1,81 @@
+"""
+Tests for missingness-pattern slicing
+"""
+
+import pytest
+import numpy as np
+from evalharness.slicing import missingness, slicer
+from evalharness.slicing.streaming import StreamingSliceStats
+
+
+@pytest.fixture
+def patterned_data():
+    """Data with three planted missingness patterns"""
+    rng = np.random.RandomState(0)
+    data = rng.randn(1000, 12)
+    data[:300, [1, 4]] = np.nan
+    data[300:400, 7] = np.nan
+    data[400:420, :] = np.nan
+    return data
+
+
+class TestMissingPatterns:
+
+    def test_top_patterns(self, patterned_data):
+        """Test patterns are found with their rows, most frequent first"""
+        patterns = missingness.missing_patterns(patterned_data, top_n=2)
+
+        assert [p['missing_columns'] for p in patterns] == [[1, 4], [7]]
+        np.testing.assert_array_equal(patterns[0]['indices'], np.arange(300))
+        np.testing.assert_array_equal(patterns[1]['indices'], np.arange(300, 400))
+        assert patterns[0]['slice_name'] == 'missing_pattern=[feature_1,feature_4]'
+
+    def test_matches_exact_grouping(self):
+        """Test hashed groups equal grouping the raw NaN masks"""
+        rng = np.random.RandomState(1)
+        data = np.where(rng.rand(2000, 530) < 0.002, np.nan, 1.0)
+        patterns = missingness.missing_patterns(data, top_n=1000, include_complete=True)
+
+        _, inverse, counts = np.unique(np.isnan(data), axis=0, return_inverse=True, return_counts=True)
+        assert sorted(p['sample_count'] for p in patterns) == sorted(counts.tolist())
+        for p in patterns:
+            assert len(np.unique(inverse.reshape(-1)[p['indices']])) == 1
+
+    def test_hash_collision_falls_back(self, patterned_data, monkeypatch):
+        """Test colliding hashes are still grouped by exact pattern"""
+        monkeypatch.setattr(missingness, 'hash_rows', lambda packed: np.zeros(len(packed), dtype=np.uint64))
+        patterns = missingness.missing_patterns(patterned_data, top_n=3)
+
+        assert [p['sample_count'] for p in patterns] == [300, 100, 20]
+
+    def test_long_pattern_names_stay_unique(self, patterned_data):
+        """Test names elide columns but keep a pattern hash"""
+        name = missingness.pattern_name(np.arange(12), pattern_hash=0xabc)
+
+        assert name == 'missing_pattern=[feature_0,feature_1,feature_2,feature_3,feature_4,+7 more,#00000abc]'
+
+    def test_one_dimensional_missingness(self):
+        """Test level slicing works on 1-D data"""
+        slices = slicer.slice_by_missingness(np.array([1.0, np.nan, 2.0, np.nan]))
+
+        np.testing.assert_array_equal(slices['missingness_low'], [0, 2])
+        np.testing.assert_array_equal(slices['missingness_high'], [1, 3])
+
+    def test_streaming_matches_batch(self, patterned_data):
+        """Test streaming pattern counts equal the in-memory slices"""
+        y_true = np.zeros(1000, dtype=int)
+        y_pred = np.zeros(1000, dtype=int)
+        y_pred[::3] = 1
+        stats = StreamingSliceStats(missing_patterns=3)
+        for start in range(0, 1000, 256):
+            stats.update(y_true[start:start + 256], y_pred[start:start + 256],
+                         data=patterned_data[start:start + 256], offset=start)
+
+        streamed = {r['slice_name']: r['sample_count'] for r in stats.compute(alpha=None)}
+        batch = slicer.slice_by_missing_pattern(patterned_data, top_n=3)
+        for name, indices in batch.items():
+            assert streamed[name] == len(indices)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,82 @@
+"""
+Tests for multi-model evaluation
+"""
+
+import os
+import json
+import tempfile
+
+import pytest
+import numpy as np
+from evalharness import evaluate, evaluate_many
+from evalharness.core.context import LabelContext
+
+
+@pytest.fixture
+def model_zoo():
+    """Three binary models of increasing accuracy on one test set"""
+    rng = np.random.default_rng(0)
+    n_samples = 400
+
+    y_true = rng.integers(0, 2, n_samples)
+    X = rng.normal(size=(n_samples, 3))
+    X[:, 0] = rng.integers(0, 3, n_samples)
+
+    models = {}
+    for name, accuracy in [('weak', 0.6), ('medium', 0.75), ('strong', 0.9)]:
+        y_pred = np.where(rng.random(n_samples) < accuracy, y_true, 1 - y_true)
+        p1 = np.clip(0.7 * y_pred + 0.3 * rng.random(n_samples), 0, 1)
+        models[name] = (y_pred, np.column_stack([1 - p1, p1]))
+
+    return X, y_true, models
+
+
+class TestEvaluateMany:
+
+    def test_reports_match_single_evaluation(self, model_zoo):
+        """Test shared precomputation gives the same results as separate runs"""
+        X, y_true, models = model_zoo
+        config = {'categorical_features': [0], 'n_bootstrap': 50}
+
+        result = evaluate_many(models, y_true, X, config=config)
+
+        y_pred, y_proba = models['medium']
+        single = evaluate('classification', y_pred, y_true, X, config=config, predictions_proba=y_proba)
+
+        assert result.reports['medium'].metrics == single.metrics
+        assert result.reports['medium'].confidence_intervals == single.confidence_intervals
+        assert result.reports['medium'].slices == single.slices
+
+    def test_comparison_table(self, model_zoo):
+        """Test the comparison table ranks models and is written to disk"""
+        X, y_true, models = model_zoo
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = evaluate_many(models, y_true, X, output_dir=tmpdir, config={'n_bootstrap': 20})
+
+            assert [row['model'] for row in result.comparison] == ['strong', 'medium', 'weak']
+            assert result.get_best_model() == 'strong'
+            assert 'accuracy_lower' in result.comparison[0]
+
+            with open(os.path.join(tmpdir, 'eval', 'comparison.json')) as f:
+                assert len(json.load(f)['models']) == 3
+            for name in models:
+                assert os.path.exists(os.path.join(tmpdir, 'models', name, 'eval', 'metrics.json'))
+
+
+class TestLabelContext:
+
+    def test_bootstrap_indices_cached(self):
+        """Test bootstrap indices are generated once and bounded in size"""
+        context = LabelContext(np.arange(100) % 3)
+
+        indices = context.bootstrap_indices(10, seed=1)
+        assert indices.shape == (10, 100)
+        assert context.bootstrap_indices(10, seed=1) is indices
+
+        large = LabelContext(np.zeros(10 ** 6))
+        assert large.bootstrap_indices(1000) is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,70 @@
+"""
+Tests for process-parallel slice evaluation over shared memory
+"""
+
+import pytest
+import numpy as np
+from evalharness.slicing import engine, parallel, slicer
+from evalharness.evaluators.classification import ClassificationEvaluator
+
+
+@pytest.fixture
+def inputs():
+    """Labels, predictions, probabilities and mixed categorical/numeric data"""
+    rng = np.random.RandomState(0)
+    n = 3000
+    labels = rng.randint(0, 3, n)
+    predictions = np.where(rng.rand(n) < 0.75, labels, rng.randint(0, 3, n))
+    proba = rng.dirichlet(np.ones(3), n)
+    data = np.column_stack([
+        rng.randint(0, 4, n), rng.randint(0, 6, n), rng.randn(n), rng.exponential(size=n)
+    ]).astype(float)
+    data[rng.rand(n) < 0.05, 2] = np.nan
+    return labels, predictions, proba, data
+
+
+class TestParallelSlicing:
+
+    def test_shared_arrays_roundtrip(self):
+        """Test attached views see the shared contents"""
+        array = np.arange(12, dtype=np.int32).reshape(3, 4)
+        with parallel.SharedArrays({'a': array, 'skipped': None}) as shared:
+            views, blocks = parallel.attach(shared.spec)
+            np.testing.assert_array_equal(views['a'], array)
+            assert 'skipped' not in views
+            del views
+            for block in blocks:
+                block.close()
+
+    def test_matches_serial(self, inputs):
+        """Test parallel results equal the serial slice engine"""
+        labels, predictions, proba, data = inputs
+        features = {'categorical_features': [0, 1], 'numeric_features': [2, 3]}
+        label_codes = engine.encode_labels(labels, predictions)
+
+        results, index = parallel.evaluate_slices_parallel(
+            label_codes, data=data, predictions_proba=proba, n_workers=2, missing_patterns=3, **features
+        )
+        slices = slicer.create_all_slices(data, proba, missing_patterns=3, **features)
+        expected = engine.evaluate_slices_by_counts(slices, labels, predictions, label_codes=label_codes)
+
+        assert results == expected
+        assert list(index) == list(slices)
+        np.testing.assert_array_equal(index['feature_1=2.0'], slices['feature_1=2.0'])
+
+    def test_evaluator_mode(self, inputs):
+        """Test the evaluator's slice_workers mode gives the serial slices"""
+        labels, predictions, proba, data = inputs
+        config = {'categorical_features': [0, 1], 'discover_slices': True}
+
+        serial = ClassificationEvaluator(predictions, labels, data, config=config, predictions_proba=proba)
+        pooled = ClassificationEvaluator(
+            predictions, labels, data, config={**config, 'slice_workers': 2}, predictions_proba=proba
+        )
+
+        assert pooled.compute_slices() == serial.compute_slices()
+        assert list(pooled.slice_indices) == list(serial.slice_indices)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
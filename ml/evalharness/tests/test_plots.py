@@ -0,0 +1,253 @@
+"""
+Tests for pyplot-free plot rendering.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import pytest
+import numpy as np
+import matplotlib
+import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+from sklearn.metrics import roc_curve
+from evalharness.plots import classification as plots
+from evalharness.plots import data as plot_data
+from evalharness.plots import regression as regression_plots
+from evalharness.plots.figures import render_plots
+from evalharness.evaluators.classification import ClassificationEvaluator
+
+
+@pytest.fixture
+def outputs():
+    """Create binary labels and probabilities"""
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, 500)
+    y_proba = np.clip(y_true * 0.6 + rng.random(500) * 0.4, 0, 1)
+    return y_true, y_proba
+
+
+def render_all(y_true, y_proba, directory, n_plots=None):
+    """Render every classification and regression plot (or the first n_plots) into a directory"""
+    cm = np.array([[200, 40], [30, 230]])
+    plot_fns = [
+        lambda: plots.plot_confusion_matrix(cm, output_path=os.path.join(directory, 'cm.png')),
+        lambda: plots.plot_roc_curve(y_true, y_proba, output_path=os.path.join(directory, 'roc.png')),
+        lambda: plots.plot_pr_curve(y_true, y_proba, output_path=os.path.join(directory, 'pr.png')),
+        lambda: plots.plot_calibration_curve(
+            np.array([0.1, np.nan, 0.5, 0.9]), np.array([0.2, np.nan, 0.5, 0.8]),
+            output_path=os.path.join(directory, 'calibration.png')
+        ),
+        lambda: plots.plot_confidence_histogram(y_true, y_proba, output_path=os.path.join(directory, 'confidence.png')),
+        lambda: regression_plots.plot_residuals(y_proba, y_true, output_path=os.path.join(directory, 'residuals.png')),
+    ]
+    contents = {}
+    for plot_fn in plot_fns[:n_plots]:
+        path = plot_fn()
+        with open(path, 'rb') as f:
+            contents[os.path.basename(path)] = f.read()
+    return contents
+
+
+class TestPlotRendering:
+    """Tests for rendering plots without global matplotlib state"""
+
+    def test_import_leaves_global_style(self):
+        """Test importing the plot modules changes no rcParams"""
+        code = (
+            "import matplotlib; before = dict(matplotlib.rcParams); "
+            "import evalharness.plots; "
+            "changed = [k for k, v in matplotlib.rcParams.items() if before[k] != v]; "
+            "assert not changed, changed"
+        )
+        subprocess.run([sys.executable, '-c', code], check=True, env=os.environ.copy())
+
+    def test_no_pyplot_figures(self, outputs):
+        """Test saved plots are not registered with pyplot"""
+        plt.close('all')
+        before = dict(matplotlib.rcParams)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contents = render_all(*outputs, tmpdir)
+
+        assert all(data.startswith(b'\x89PNG') for data in contents.values())
+        assert plt.get_fignums() == []
+        assert dict(matplotlib.rcParams) == before
+
+    def test_parallel_threads_match_sequential(self, outputs):
+        """Test plots rendered in parallel threads equal sequential renders"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            expected = render_all(*outputs, tmpdir, n_plots=2)
+
+        def render(i):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                return render_all(*outputs, tmpdir, n_plots=2)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            results = list(pool.map(render, range(3)))
+        for result in results:
+            assert result == expected
+
+
+
+class TestParallelRendering:
+    """Tests for rendering precomputed plot data in a process pool"""
+
+    def _plot_files(self, predictions, labels, proba, plot_workers):
+        """Generate the evaluator's plots and read them back"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            evaluator = ClassificationEvaluator(
+                predictions, labels, output_dir=tmpdir, predictions_proba=proba,
+                config={'plot_workers': plot_workers, 'compute_cis': False}
+            )
+            paths = evaluator.generate_plots()
+            contents = {}
+            for path in paths:
+                with open(path, 'rb') as f:
+                    contents[os.path.basename(path)] = f.read()
+            return contents
+
+    def test_workers_match_serial(self, outputs):
+        """Test plots rendered by worker processes equal in-process renders"""
+        y_true, y_proba = outputs
+        predictions = (y_proba > 0.5).astype(int)
+        serial = self._plot_files(predictions, y_true, y_proba, None)
+        parallel = self._plot_files(predictions, y_true, y_proba, 2)
+
+        assert sorted(serial) == sorted([
+            'confusion_matrix.png', 'roc_curve.png', 'pr_curve.png', 'calibration_curve.png', 'confidence_histogram.png'
+        ])
+        assert parallel == serial
+
+    def test_multiclass_skips_calibration(self):
+        """Test multiclass probabilities plot without the binary calibration curve"""
+        rng = np.random.default_rng(1)
+        proba = rng.dirichlet(np.ones(3), 300)
+        labels = rng.integers(0, 3, 300)
+        files = self._plot_files(proba.argmax(axis=1), labels, proba, None)
+        assert 'calibration_curve.png' not in files
+        assert 'roc_curve.png' in files
+
+    def test_plot_data_is_small(self, outputs):
+        """Test plot data is reduced to bins, not the raw rows"""
+        y_true, y_proba = outputs
+        data = plots.confidence_histogram_data(y_true, y_proba)
+        assert len(data['correct']) == len(data['bins']) - 1
+        assert data['correct'].sum() + data['incorrect'].sum() == len(y_true)
+
+    def test_curve_data_bounded(self):
+        """Test curve data stays small for many rows and within a grid cell of the full curve"""
+        rng = np.random.default_rng(2)
+        y_true = rng.integers(0, 2, 200_000)
+        scores = np.clip(y_true * 0.3 + rng.random(200_000) * 0.7, 0, 1)
+
+        curve = plots.roc_curve_data(y_true, scores)['curves'][0]
+        fpr, tpr = curve['x'], curve['y']
+        full_fpr, full_tpr, _ = roc_curve(y_true, scores)
+        assert len(fpr) < 20_000 < len(full_fpr)
+        assert (fpr[0], tpr[0], fpr[-1], tpr[-1]) == (full_fpr[0], full_tpr[0], full_fpr[-1], full_tpr[-1])
+        # Every dropped point is within one cell of the last kept point before it
+        last_kept = np.searchsorted(fpr, full_fpr, side='right') - 1
+        assert np.all(np.abs(fpr[last_kept] - full_fpr) <= 1.0 / plot_data.CURVE_RESOLUTION)
+
+    def test_render_plots_order(self, outputs):
+        """Test rendered paths come back in job order"""
+        y_true, y_proba = outputs
+        with tempfile.TemporaryDirectory() as tmpdir:
+            jobs = [
+                (plots.render_roc_curve, plots.roc_curve_data(y_true, y_proba), os.path.join(tmpdir, 'a.png')),
+                (plots.render_pr_curve, plots.pr_curve_data(y_true, y_proba), os.path.join(tmpdir, 'b.png'))
+            ]
+            assert render_plots(jobs, n_workers=2) == [job[2] for job in jobs]
+            assert all(os.path.exists(job[2]) for job in jobs)
+
+
+class TestPlotDataFormat:
+    """Tests for writing plot data as JSON (plot_format='data')"""
+
+    def _evaluate(self, tmpdir, labels, proba, plot_format):
+        """Generate the evaluator's plots in the given format"""
+        evaluator = ClassificationEvaluator(
+            proba.argmax(axis=1) if proba.ndim == 2 else (proba > 0.5).astype(int), labels,
+            output_dir=tmpdir, predictions_proba=proba,
+            config={'plot_format': plot_format, 'compute_cis': False}
+        )
+        return evaluator.generate_plots()
+
+    def test_writes_json_not_images(self, outputs):
+        """Test data mode writes one JSON file per plot and no images"""
+        y_true, y_proba = outputs
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._evaluate(tmpdir, y_true, y_proba, 'data')
+            names = sorted(os.path.basename(path) for path in paths)
+            assert names == sorted([
+                'confusion_matrix.json', 'roc_curve.json', 'pr_curve.json',
+                'calibration_curve.json', 'confidence_histogram.json'
+            ])
+            assert sorted(os.listdir(os.path.dirname(paths[0]))) == names
+
+            data = {}
+            for path in paths:
+                with open(path) as f:
+                    data[os.path.basename(path)[:-5]] = json.load(f)
+
+        cm = data['confusion_matrix']['confusion_matrix']
+        assert np.sum(cm) == len(y_true)
+        assert data['confidence_histogram']['plot'] == 'confidence_histogram'
+        assert sum(data['confidence_histogram']['correct']) + sum(data['confidence_histogram']['incorrect']) == len(y_true)
+        roc = data['roc_curve']['curves'][0]
+        assert len(roc['x']) == len(roc['y'])
+        assert (roc['x'][0], roc['x'][-1]) == (0.0, 1.0)
+        assert roc['auc'] == pytest.approx(plots.roc_curve_data(y_true, y_proba)['curves'][0]['auc'])
+        assert 0 < data['pr_curve']['baseline'] < 1
+        # Empty calibration bins are written as null
+        assert len(data['calibration_curve']['mean_predicted_probs']) == 10
+
+    def test_skips_matplotlib(self):
+        """Test data mode never imports matplotlib"""
+        code = (
+            "import sys, tempfile, numpy as np\n"
+            "from evalharness.evaluators.classification import ClassificationEvaluator\n"
+            "rng = np.random.default_rng(0)\n"
+            "labels = rng.integers(0, 2, 1000)\n"
+            "proba = rng.random(1000)\n"
+            "with tempfile.TemporaryDirectory() as tmpdir:\n"
+            "    ClassificationEvaluator((proba > 0.5).astype(int), labels, output_dir=tmpdir, predictions_proba=proba,\n"
+            "        config={'plot_format': 'data', 'compute_cis': False}).generate_plots()\n"
+            "assert 'matplotlib' not in sys.modules and 'seaborn' not in sys.modules\n"
+        )
+        env = {**os.environ, 'PYTHONPATH': os.pathsep.join(p for p in sys.path if p)}
+        subprocess.run([sys.executable, '-c', code], check=True, env=env)
+
+    def test_artifacts_small(self):
+        """Test the plot data stays small for many rows"""
+        rng = np.random.default_rng(3)
+        labels = rng.integers(0, 2, 200_000)
+        proba = np.clip(labels * 0.3 + rng.random(200_000) * 0.7, 0, 1)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._evaluate(tmpdir, labels, proba, 'data')
+            assert sum(os.path.getsize(path) for path in paths) < 50_000
+
+    def test_multiclass(self):
+        """Test multiclass data mode writes one curve per class"""
+        rng = np.random.default_rng(1)
+        proba = rng.dirichlet(np.ones(3), 300)
+        labels = rng.integers(0, 3, 300)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._evaluate(tmpdir, labels, proba, 'data')
+            with open(os.path.join(os.path.dirname(paths[0]), 'roc_curve.json')) as f:
+                roc = json.load(f)
+        assert [curve['name'] for curve in roc['curves']] == ['Class 0', 'Class 1', 'Class 2']
+        assert not any(path.endswith('calibration_curve.json') for path in paths)
+
+    def test_unknown_format(self, outputs):
+        """Test an unknown plot format is rejected"""
+        y_true, y_proba = outputs
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError, match='plot_format'):
+                self._evaluate(tmpdir, y_true, y_proba, 'svg')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,134 @@
+"""
+Tests for failure example selection.
+"""
+
+import pytest
+import numpy as np
+from evalharness.failures import selector
+from evalharness.core.context import EvalContext
+
+
+@pytest.fixture
+def multiclass_outputs():
+    """Create labels, predictions and probabilities with tied confidences"""
+    rng = np.random.RandomState(3)
+    n = 2000
+    y_true = rng.randint(0, 4, n)
+    y_pred = np.where(rng.rand(n) < 0.7, y_true, rng.randint(0, 4, n))
+    # Rounded probabilities give many tied confidences
+    y_proba = np.round(rng.dirichlet(np.ones(4), n), 2)
+    return y_true, y_pred, y_proba
+
+
+class TestTopK:
+    """Tests for argpartition top-k selection"""
+
+    @pytest.mark.parametrize('largest', [True, False])
+    @pytest.mark.parametrize('k', [0, 1, 10, 100, 5000])
+    def test_matches_stable_sort(self, multiclass_outputs, largest, k):
+        """Test top-k equals a full stable sort with ties broken by index"""
+        _, _, y_proba = multiclass_outputs
+        values = y_proba.max(axis=1)
+        mask = np.arange(len(values)) % 3 != 0
+
+        rows = np.flatnonzero(mask)
+        keys = -values[rows] if largest else values[rows]
+        expected = rows[np.argsort(keys, kind='stable')][:k]
+
+        np.testing.assert_array_equal(selector.top_k_indices(values, k, largest, mask), expected)
+
+    def test_without_mask(self):
+        """Test selection over all rows"""
+        values = np.array([0.3, 0.9, 0.1, 0.9, 0.5])
+        np.testing.assert_array_equal(selector.top_k_indices(values, 3), [1, 3, 4])
+        np.testing.assert_array_equal(selector.top_k_indices(values, 2, largest=False), [2, 0])
+
+    def test_empty_candidates(self):
+        """Test an all-False mask selects nothing"""
+        values = np.array([0.3, 0.9])
+        assert len(selector.top_k_indices(values, 5, mask=np.zeros(2, dtype=bool))) == 0
+
+
+class TestConfidenceSelectors:
+    """Tests for confidence-based failure selection"""
+
+    def test_confident_wrong(self, multiclass_outputs):
+        """Test the most confident errors are selected in order"""
+        y_true, y_pred, y_proba = multiclass_outputs
+        examples = selector.select_top_confident_wrong(y_true, y_pred, y_proba, n=20)
+
+        wrong = np.flatnonzero(y_true != y_pred)
+        confidences = y_proba.max(axis=1)
+        expected = wrong[np.argsort(-confidences[wrong], kind='stable')][:20]
+
+        assert [e['index'] for e in examples] == expected.tolist()
+        assert all(e['true_label'] != e['predicted_label'] for e in examples)
+        assert [e['confidence'] for e in examples] == confidences[expected].tolist()
+
+    def test_low_confidence_correct(self, multiclass_outputs):
+        """Test the least confident correct predictions are selected in order"""
+        y_true, y_pred, y_proba = multiclass_outputs
+        examples = selector.select_low_confidence_correct(y_true, y_pred, y_proba, n=20)
+
+        right = np.flatnonzero(y_true == y_pred)
+        confidences = y_proba.max(axis=1)
+        expected = right[np.argsort(confidences[right], kind='stable')][:20]
+
+        assert [e['index'] for e in examples] == expected.tolist()
+
+    def test_binary_probabilities(self):
+        """Test 1-D probabilities are used as confidences"""
+        y_true = np.array([0, 1, 1, 0, 1])
+        y_pred = np.array([1, 1, 0, 0, 0])
+        y_proba = np.array([0.9, 0.8, 0.2, 0.1, 0.6])
+
+        examples = selector.select_top_confident_wrong(y_true, y_pred, y_proba, n=2)
+        assert [e['index'] for e in examples] == [0, 4]
+
+    def test_shared_context(self, multiclass_outputs):
+        """Test all failure types reuse one context"""
+        y_true, y_pred, y_proba = multiclass_outputs
+        ctx = EvalContext(y_true, y_pred, y_proba)
+
+        examples = selector.select_all_failure_examples(y_true, y_pred, y_proba, n_per_type=5, ctx=ctx)
+        assert len(examples) == 10
+        assert set(ctx._cache) >= {'confidences', 'correct'}
+
+    def test_without_probabilities(self, multiclass_outputs):
+        """Test confidence selection needs probabilities"""
+        y_true, y_pred, _ = multiclass_outputs
+        assert selector.select_top_confident_wrong(y_true, y_pred, None) == []
+        assert selector.select_low_confidence_correct(y_true, y_pred, None) == []
+
+
+class TestWorstSliceSelector:
+    """Tests for sampling errors from the worst slice"""
+
+    def _slices(self, n, significant):
+        """Two slices ranked as by rank_slices, the worst (tiny) slice last"""
+        return [
+            {'slice_name': 'large', 'indices': np.arange(5, n), 'significantly_worse': False},
+            {'slice_name': 'small', 'indices': np.arange(5), 'significantly_worse': significant}
+        ]
+
+    def test_no_significant_slice(self, multiclass_outputs):
+        """Test no errors are sampled when no slice is significantly worse"""
+        y_true, y_pred, y_proba = multiclass_outputs
+        slices = self._slices(len(y_true), significant=False)
+        assert selector.select_worst_slice_errors(slices, y_true, y_pred, y_proba) == []
+        examples = selector.select_all_failure_examples(y_true, y_pred, y_proba, slices=slices, n_per_type=5)
+        assert 'worst_slice_error' not in {e['failure_type'] for e in examples}
+
+    def test_significant_slice(self, multiclass_outputs):
+        """Test errors are sampled from a significantly worse slice"""
+        y_true, y_pred, y_proba = multiclass_outputs
+        y_pred = y_pred.copy()
+        y_pred[:5] = (y_true[:5] + 1) % 4
+        slices = self._slices(len(y_true), significant=True)
+        examples = selector.select_worst_slice_errors(slices, y_true, y_pred, y_proba)
+        assert sorted(e['index'] for e in examples) == list(range(5))
+        assert all(e['slice_name'] == 'small' for e in examples)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
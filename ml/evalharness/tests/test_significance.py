@@ -0,0 +1,58 @@
+"""
+Tests for statistically controlled slice ranking
+"""
+
+import pytest
+import numpy as np
+from scipy import stats
+from evalharness.slicing import engine, significance
+
+
+class TestSignificance:
+
+    def test_benjamini_hochberg(self):
+        """Test q-values match the step-up procedure"""
+        p_values = np.array([0.01, 0.04, 0.03, 0.2, 0.001])
+        q_values = significance.benjamini_hochberg(p_values)
+
+        np.testing.assert_allclose(q_values, [0.025, 0.05, 0.05, 0.2, 0.005])
+
+    def test_binomial_p_values(self):
+        """Test exact p-values against scipy's binomial test"""
+        p_values = significance.worse_than_rest_p_values(
+            np.array([8]), np.array([20]), total_errors=108, n=1020
+        )
+        expected = stats.binomtest(8, 20, 100 / 1000, alternative='greater').pvalue
+
+        assert p_values[0] == pytest.approx(expected)
+
+    def test_tiny_noisy_slice_not_worst(self):
+        """Test a large, clearly worse slice ranks below a tiny slice with a lower raw accuracy"""
+        rng = np.random.default_rng(1)
+        n_samples = 5000
+        y_true = rng.integers(0, 2, n_samples)
+        error_rate = np.full(n_samples, 0.1)
+        error_rate[:1000] = 0.25  # large slice, truly worse
+        y_pred = np.where(rng.random(n_samples) < error_rate, 1 - y_true, y_true)
+        y_pred[4990:4994] = 1 - y_true[4990:4994]
+        y_pred[4994:5000] = y_true[4994:5000]
+
+        slices = {
+            'large': np.arange(1000),
+            'tiny': np.arange(4990, 5000),  # 40% errors on 10 rows
+            'rest': np.arange(1000, 4990)
+        }
+        results = engine.evaluate_slices_by_counts(slices, y_true, y_pred, min_samples=5)
+
+        assert results[-1]['slice_name'] == 'large'
+        assert results[-1]['significantly_worse']
+        by_name = {r['slice_name']: r for r in results}
+        assert not by_name['tiny']['significantly_worse']
+        assert by_name['tiny']['accuracy'] < by_name['large']['accuracy']
+
+        unranked = engine.evaluate_slices_by_counts(slices, y_true, y_pred, min_samples=5, alpha=None)
+        assert unranked[-1]['slice_name'] == 'tiny'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,78 @@
+"""
+Tests for vectorized per-slice bootstrap confidence intervals
+"""
+
+import pytest
+import numpy as np
+from sklearn.metrics import f1_score
+from evalharness.ci import bootstrap
+from evalharness.slicing import engine
+from evalharness.evaluators.classification import ClassificationEvaluator
+
+
+@pytest.fixture
+def labelled():
+    """Three-class labels with ~70% accuracy"""
+    rng = np.random.RandomState(0)
+    y_true = rng.randint(0, 3, 600)
+    y_pred = np.where(rng.rand(600) < 0.7, y_true, rng.randint(0, 3, 600))
+    return y_true, y_pred
+
+
+class TestSliceBootstrap:
+
+    def test_matches_per_slice_resampling(self, labelled):
+        """Test every slice column equals bootstrapping the slice on the same resamples"""
+        y_true, y_pred = labelled
+        n = len(y_true)
+        slices = {'head': np.arange(100), 'class_1': np.flatnonzero(y_true == 1), 'tiny': np.array([3, 7])}
+
+        names, replicates = bootstrap.bootstrap_slice_metrics(
+            slices, *engine.encode_labels(y_true, y_pred),
+            n_iterations=30, seed=5, metric_names=('accuracy', 'f1_score')
+        )
+        indices = np.random.default_rng(5).integers(0, n, size=(30, n))
+
+        assert replicates['accuracy'].shape == (30, 3)
+        for j, name in enumerate(names):
+            member = np.zeros(n, dtype=bool)
+            member[slices[name]] = True
+            for i in range(30):
+                rows = indices[i][member[indices[i]]]
+                if len(rows) == 0:
+                    assert np.isnan(replicates['accuracy'][i, j])
+                    continue
+                assert replicates['accuracy'][i, j] == pytest.approx(np.mean(y_true[rows] == y_pred[rows]))
+                assert replicates['f1_score'][i, j] == pytest.approx(
+                    f1_score(y_true[rows], y_pred[rows], average='weighted', zero_division=0)
+                )
+
+    def test_blocks_match_precomputed_indices(self, labelled, monkeypatch):
+        """Test blockwise resampling reproduces the shared resample matrix"""
+        y_true, y_pred = labelled
+        codes = engine.encode_labels(y_true, y_pred)
+        slices = {'even': np.arange(0, 600, 2)}
+        indices = np.random.default_rng(1).integers(0, 600, size=(20, 600))
+
+        monkeypatch.setattr(bootstrap, 'SLICE_BOOTSTRAP_BLOCK_ELEMENTS', 1500)
+        _, blocked = bootstrap.bootstrap_slice_metrics(slices, *codes, n_iterations=20, seed=1)
+        _, shared = bootstrap.bootstrap_slice_metrics(slices, *codes, n_iterations=20, seed=1, indices=indices)
+
+        np.testing.assert_allclose(blocked['accuracy'], shared['accuracy'])
+
+    def test_evaluator_adds_slice_intervals(self, labelled):
+        """Test slice results carry intervals around their point estimates"""
+        y_true, y_pred = labelled
+        proba = np.eye(3)[y_pred] * 0.6 + 0.4 / 3
+        evaluator = ClassificationEvaluator(
+            y_pred, y_true, predictions_proba=proba,
+            config={'slice_cis': True, 'n_bootstrap': 200, 'min_slice_samples': 20}
+        )
+
+        for result in evaluator.compute_slices():
+            ci = result['confidence_intervals']['accuracy']
+            assert ci['lower'] <= result['accuracy'] <= ci['upper']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,127 @@
+"""
+Tests for the group-by slice evaluation engine
+"""
+
+import pytest
+import numpy as np
+from evalharness.metrics.classification import compute_all_metrics
+from evalharness.slicing import engine, slicer
+from evalharness.slicing.index import SliceIndex
+
+
+@pytest.fixture
+def sliced_outputs():
+    """Multiclass predictions with a high-cardinality feature and overlapping slices"""
+    rng = np.random.default_rng(11)
+    n_samples = 2000
+
+    y_true = rng.integers(0, 3, n_samples)
+    y_pred = np.where(rng.random(n_samples) < 0.7, y_true, rng.integers(0, 3, n_samples))
+    X = np.column_stack([rng.integers(0, 200, n_samples), rng.normal(size=n_samples)])
+
+    slices = slicer.slice_by_feature(X, 0)
+    slices['overlap_a'] = np.arange(0, 1500)
+    slices['overlap_b'] = np.arange(1000, 2000)
+
+    return y_true, y_pred, slices
+
+
+class TestSliceEngine:
+
+    def test_matches_per_slice_metrics(self, sliced_outputs):
+        """Test count-based slice metrics equal per-slice sklearn metrics"""
+        y_true, y_pred, slices = sliced_outputs
+
+        results = engine.evaluate_slices_by_counts(slices, y_true, y_pred, min_samples=5)
+
+        for result in results:
+            indices = slices[result['slice_name']]
+            expected = compute_all_metrics(y_true[indices], y_pred[indices])
+            for name in ('accuracy', 'precision', 'recall', 'f1_score'):
+                assert result[name] == pytest.approx(expected[name]), (result['slice_name'], name)
+            assert result['sample_count'] == len(indices)
+
+    def test_high_cardinality_feature(self, sliced_outputs):
+        """Test every value of the 200-value feature is its own slice"""
+        _, _, slices = sliced_outputs
+
+        feature_slices = [name for name in slices if name.startswith('feature_0=')]
+        assert len(feature_slices) == 200
+        assert sum(len(slices[name]) for name in feature_slices) == 2000
+
+    def test_order_and_min_samples(self, sliced_outputs):
+        """Test results are sorted by accuracy and small slices are dropped"""
+        y_true, y_pred, slices = sliced_outputs
+
+        results = engine.evaluate_slices_by_counts(slices, y_true, y_pred, min_samples=12)
+
+        accuracies = [r['accuracy'] for r in results]
+        assert accuracies == sorted(accuracies, reverse=True)
+        assert len(results) == sum(len(indices) >= 12 for indices in slices.values())
+
+    def test_feature_slices_from_group_ids(self):
+        """Test feature slices built from group ids equal per-value masks"""
+        values = np.array([3, 1, 3, 2, 1, 3])
+        slices = slicer.slice_by_feature(values, 0, 'f')
+
+        assert list(slices) == ['f=1', 'f=2', 'f=3']
+        np.testing.assert_array_equal(slices['f=3'], [0, 2, 5])
+
+
+class TestSliceIndex:
+
+    @pytest.fixture
+    def index(self):
+        """Dense and sparse slices over 10,000 rows"""
+        rng = np.random.default_rng(5)
+        n_rows = 10_000
+        country = rng.integers(0, 3, n_rows)
+        missing = rng.random(n_rows) < 0.4
+        rare = rng.choice(n_rows, 50, replace=False)
+
+        index = SliceIndex(n_rows)
+        index.update({f'country={c}': np.flatnonzero(country == c) for c in range(3)})
+        index.add('missingness_high', missing)
+        index.add('rare', rare)
+        return index, country, missing, rare
+
+    def test_round_trip_and_storage(self, index):
+        """Test slices decode to their sorted rows and dense slices are bitmaps"""
+        index, country, missing, rare = index
+
+        np.testing.assert_array_equal(index['country=1'], np.flatnonzero(country == 1))
+        np.testing.assert_array_equal(index['rare'], np.sort(rare))
+        assert index.count('missingness_high') == missing.sum()
+        assert index._entries['missingness_high'][0] == 'bits'
+        assert index._entries['rare'][0] == 'rows'
+        assert index.nbytes < 4 * 10_000
+
+    def test_intersections_and_unions(self, index):
+        """Test AND/OR queries across bitmap and row-array slices"""
+        index, country, missing, rare = index
+        rare_mask = np.zeros(len(country), dtype=bool)
+        rare_mask[rare] = True
+
+        expected = np.flatnonzero((country == 2) & missing)
+        np.testing.assert_array_equal(index.intersect('country=2', 'missingness_high'), expected)
+        assert index.intersection_count('country=2', 'missingness_high') == len(expected)
+
+        expected = np.flatnonzero(rare_mask & missing & (country == 0))
+        np.testing.assert_array_equal(index.intersect('rare', 'missingness_high', 'country=0'), expected)
+
+        assert index.union_count('rare', 'missingness_high') == (rare_mask | missing).sum()
+        np.testing.assert_array_equal(index.union('country=0', 'country=1'), np.flatnonzero(country < 2))
+
+    def test_row_ids_past_int32(self):
+        """Test row ids above 2^31 are stored without overflow"""
+        n_rows = 2 ** 31 + 10
+        rows = np.array([5, 2 ** 31 + 3, n_rows - 1])
+
+        index = SliceIndex(n_rows)
+        index.add('tail', rows)
+        np.testing.assert_array_equal(index['tail'], rows)
+        assert SliceIndex(10_000).row_dtype == np.int32
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
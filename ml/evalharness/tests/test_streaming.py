@@ -0,0 +1,186 @@
+"""
+Tests for chunked (out-of-core) evaluation
+"""
+
+import os
+import tempfile
+
+import pytest
+import numpy as np
+from evalharness import evaluate
+from evalharness.core.sources import ArraySource, iter_aligned_batches
+from evalharness.evaluators.classification import ClassificationEvaluator
+from evalharness.metrics.streaming import StreamingClassificationMetrics
+from evalharness.failures.reservoir import TopK, GroupedReservoir
+
+
+@pytest.fixture
+def multiclass_data():
+    """Multiclass predictions with probabilities and features"""
+    rng = np.random.default_rng(0)
+    n_samples, n_classes = 5000, 3
+
+    y_true = rng.integers(0, n_classes, n_samples)
+    logits = rng.normal(size=(n_samples, n_classes))
+    logits[np.arange(n_samples), y_true] += 1.5
+    y_proba = np.exp(logits) / np.exp(logits).sum(axis=1, keepdims=True)
+    y_pred = y_proba.argmax(axis=1)
+
+    X = rng.normal(size=(n_samples, 4))
+    X[rng.random(X.shape) < 0.1] = np.nan
+    X[:, 0] = rng.integers(0, 4, n_samples)
+
+    return X, y_true, y_pred, y_proba
+
+
+class TestArraySource:
+
+    def test_rechunks_iterator(self):
+        """Test iterator batches are re-chunked to a fixed size"""
+        source = ArraySource(iter([np.arange(3), np.arange(3, 10), np.arange(10, 11)]))
+        batches = list(source.iter_batches(4))
+
+        assert [len(b) for b in batches] == [4, 4, 3]
+        assert np.array_equal(np.concatenate(batches), np.arange(11))
+
+    def test_npy_is_memory_mapped(self):
+        """Test .npy inputs are memory-mapped rather than loaded"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'labels.npy')
+            np.save(path, np.arange(100))
+            source = ArraySource(path)
+
+            assert isinstance(source._array, np.memmap)
+            assert len(source) == 100
+
+    def test_misaligned_lengths(self):
+        """Test inputs of different lengths are rejected"""
+        sources = {'a': ArraySource(np.arange(10)), 'b': ArraySource(iter([np.arange(7)]))}
+        with pytest.raises(ValueError):
+            list(iter_aligned_batches(sources, 4))
+
+
+class TestStreamingMetrics:
+
+    def test_matches_in_memory_metrics(self, multiclass_data):
+        """Test streaming counts reproduce the in-memory metrics"""
+        _, y_true, y_pred, y_proba = multiclass_data
+
+        streaming = StreamingClassificationMetrics()
+        for chunk in np.array_split(np.arange(len(y_true)), 7):
+            streaming.update(y_true[chunk], y_pred[chunk], y_proba[chunk])
+        result = streaming.compute()
+
+        evaluator = ClassificationEvaluator(y_pred, y_true, predictions_proba=y_proba)
+        expected = evaluator.compute_metrics()
+
+        for name in ['accuracy', 'precision', 'recall', 'f1_score', 'matthews_corr_coef',
+                     'cohen_kappa', 'log_loss', 'expected_calibration_error']:
+            assert result[name] == pytest.approx(expected[name])
+        assert result['roc_auc'] == pytest.approx(expected['roc_auc'], abs=1e-3)
+
+    def test_bootstrap_interval(self, multiclass_data):
+        """Test Poisson bootstrap CIs bracket the point estimate"""
+        _, y_true, y_pred, _ = multiclass_data
+
+        streaming = StreamingClassificationMetrics(n_bootstrap=50)
+        streaming.update(y_true, y_pred)
+        ci = streaming.compute_confidence_intervals(['accuracy'])['accuracy']
+
+        assert ci['lower'] <= streaming.compute()['accuracy'] <= ci['upper']
+
+
+class TestFailureTrackers:
+
+    def test_topk_across_batches(self):
+        """Test top-k keeps the globally highest scores"""
+        rng = np.random.default_rng(0)
+        scores = rng.random(1000)
+        tracker = TopK(5)
+        for chunk in np.array_split(np.arange(1000), 9):
+            tracker.update(scores[chunk], index=chunk)
+
+        assert np.array_equal(tracker.result()['index'], np.argsort(-scores)[:5])
+
+    def test_grouped_reservoir_bounded(self):
+        """Test the reservoir keeps at most k rows per group"""
+        reservoir = GroupedReservoir(3)
+        for start in range(0, 1000, 100):
+            rows = np.arange(start, start + 100)
+            reservoir.update(rows % 4, index=rows)
+
+        assert len(reservoir.groups) == 12
+        assert len(reservoir.sample([0, 1])['index']) == 3
+
+
+class TestChunkedEvaluation:
+
+    def test_npy_files(self, multiclass_data):
+        """Test evaluating from .npy files matches in-memory evaluation"""
+        X, y_true, y_pred, y_proba = multiclass_data
+        config = {'categorical_features': [0], 'compute_cis': False, 'batch_size': 700}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = {}
+            for name, array in [('pred', y_pred), ('true', y_true), ('proba', y_proba), ('X', X)]:
+                paths[name] = os.path.join(tmpdir, f'{name}.npy')
+                np.save(paths[name], array)
+
+            report = evaluate(
+                'classification', paths['pred'], paths['true'], data=paths['X'],
+                output_dir=tmpdir, config=config, predictions_proba=paths['proba']
+            )
+            in_memory = evaluate('classification', y_pred, y_true, data=X,
+                                 config=config, predictions_proba=y_proba)
+
+            assert report.metrics['accuracy'] == in_memory.metrics['accuracy']
+            assert os.path.exists(os.path.join(tmpdir, 'eval', 'plots', 'confusion_matrix.png'))
+
+        streamed_slices = {s['slice_name']: s for s in report.slices}
+        for expected in in_memory.slices:
+            if expected['slice_name'].startswith(('feature_0', 'missingness')):
+                assert streamed_slices[expected['slice_name']]['accuracy'] == pytest.approx(expected['accuracy'])
+
+        types = {f['failure_type'] for f in report.failure_examples}
+        assert types == {'high_confidence_wrong', 'low_confidence_correct', 'worst_slice_error'}
+
+    def test_nan_categories(self, multiclass_data):
+        """Test NaN categorical values form one slice across batches, as in memory"""
+        X, y_true, y_pred, y_proba = multiclass_data
+        X = X.copy()
+        X[np.random.default_rng(1).random(len(X)) < 0.1, 0] = np.nan
+        config = {'categorical_features': [0], 'compute_cis': False, 'batch_size': 500}
+
+        report = evaluate(
+            'classification', iter(np.array_split(y_pred, 10)), iter(np.array_split(y_true, 10)),
+            data=iter(np.array_split(X, 10)), config=config, predictions_proba=iter(np.array_split(y_proba, 10))
+        )
+        in_memory = evaluate('classification', y_pred, y_true, data=X, config=config, predictions_proba=y_proba)
+
+        streamed = [s for s in report.slices if s['slice_name'] == 'feature_0=nan']
+        expected = [s for s in in_memory.slices if s['slice_name'] == 'feature_0=nan']
+        assert len(streamed) == len(expected) == 1
+        assert streamed[0]['sample_count'] == expected[0]['sample_count'] == np.isnan(X[:, 0]).sum()
+        assert streamed[0]['accuracy'] == pytest.approx(expected[0]['accuracy'])
+
+    def test_iterator_batches(self, multiclass_data):
+        """Test evaluating from iterators of batches"""
+        _, y_true, y_pred, _ = multiclass_data
+
+        report = evaluate(
+            'classification',
+            iter(np.array_split(y_pred, 3)),
+            iter(np.array_split(y_true, 11)),
+            config={'compute_cis': False}
+        )
+
+        assert report.metrics['accuracy'] == pytest.approx(np.mean(y_true == y_pred))
+
+    def test_regression_not_supported(self):
+        """Test chunked mode is rejected for regression"""
+        with pytest.raises(ValueError):
+            evaluate('regression', iter([np.zeros(3)]), np.zeros(3))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,115 @@
+"""
+Tests for vectorized failure categorization.
+"""
+
+import pytest
+import numpy as np
+from evalharness.core.context import EvalContext, LabelContext, uncertainty
+from evalharness.failures import taxonomy
+from evalharness.failures.taxonomy import FailureCategory, CATEGORY_CODES, NO_FAILURE
+from evalharness.evaluators.classification import ClassificationEvaluator
+
+
+@pytest.fixture
+def outputs():
+    """Create labels, probabilities and features with some missing values"""
+    rng = np.random.RandomState(0)
+    n = 3000
+    labels = rng.randint(0, 4, n)
+    logits = rng.randn(n, 4) * 2
+    logits[np.arange(n), labels] += rng.choice([0.0, 3.0], n)
+    proba = np.exp(logits) / np.exp(logits).sum(axis=1, keepdims=True)
+    data = rng.randn(n, 3)
+    data[rng.rand(n) < 0.05, 1] = np.nan
+    return labels, proba.argmax(axis=1), proba, data
+
+
+def reference_category(correct, margin, entropy, data_signal):
+    """Per-row categorization"""
+    uncertain = margin < taxonomy.DEFAULT_MARGIN_THRESHOLD or entropy >= taxonomy.DEFAULT_ENTROPY_THRESHOLD
+    if not correct and data_signal:
+        return FailureCategory.DATA
+    if uncertain:
+        return FailureCategory.OPTIMIZATION
+    if not correct:
+        return FailureCategory.MODEL
+    return None
+
+
+class TestUncertainty:
+    """Tests for margins and entropies"""
+
+    def test_matches_direct(self, outputs):
+        """Test chunked margins and entropies equal a direct computation"""
+        _, _, proba, _ = outputs
+        margins, entropies = uncertainty(proba, chunk_elements=100)
+
+        top = np.sort(proba, axis=1)
+        np.testing.assert_allclose(margins, top[:, -1] - top[:, -2])
+        np.testing.assert_allclose(entropies, -(proba * np.log(proba)).sum(axis=1) / np.log(4))
+
+    def test_binary(self):
+        """Test 1-D probabilities"""
+        margins, entropies = uncertainty(np.array([0.5, 1.0, 0.9]))
+        np.testing.assert_allclose(margins, [0.0, 1.0, 0.8])
+        np.testing.assert_allclose(entropies[:2], [1.0, 0.0])
+
+
+class TestCategorizeFailures:
+    """Tests for taxonomy.categorize_failures"""
+
+    def test_matches_per_row_rules(self, outputs):
+        """Test every row gets the category of the per-row rules"""
+        labels, predictions, proba, data = outputs
+        ctx = EvalContext(labels, predictions, proba, LabelContext(labels, data))
+        slice_rows = np.arange(0, 300)
+        label_error_rows = np.array([500, 501, 2999])
+
+        codes, counts = taxonomy.categorize_failures(ctx, slice_rows, label_error_rows)
+        assert codes.dtype == np.int8
+
+        data_signal = np.isnan(data).any(axis=1)
+        data_signal[slice_rows] = True
+        data_signal[label_error_rows] = True
+        expected = [
+            reference_category(c, m, e, d)
+            for c, m, e, d in zip(labels == predictions, ctx.margins, ctx.entropies, data_signal)
+        ]
+        assert [taxonomy.category_of(code) for code in codes] == expected
+
+        assert counts == {
+            category.value: sum(e == category for e in expected) for category in FailureCategory
+        }
+        assert sum(counts.values()) == np.count_nonzero(codes != NO_FAILURE)
+
+    def test_without_probabilities(self, outputs):
+        """Test errors are MODEL failures without uncertainty signals"""
+        labels, predictions, _, _ = outputs
+        codes, _ = taxonomy.categorize_failures(EvalContext(labels, predictions))
+
+        assert np.all(codes[labels != predictions] == CATEGORY_CODES[FailureCategory.MODEL])
+        assert np.all(codes[labels == predictions] == NO_FAILURE)
+
+
+class TestTaxonomyStage:
+    """Tests for taxonomy counts in the report"""
+
+    def test_report_counts(self, outputs):
+        """Test the report carries category counts and examples their categories"""
+        labels, predictions, proba, data = outputs
+        evaluator = ClassificationEvaluator(
+            predictions, labels, data, predictions_proba=proba,
+            config={'generate_plots': False, 'compute_cis': False, 'categorize_failures': True}
+        )
+        report = evaluator.evaluate()
+
+        assert set(report.failure_category_counts) == {c.value for c in FailureCategory}
+        assert sum(report.failure_category_counts.values()) == np.count_nonzero(evaluator.failure_codes != NO_FAILURE)
+        for failure in report.failure_examples:
+            code = evaluator.failure_codes[failure['index']]
+            if code != NO_FAILURE:
+                assert failure['taxonomy_category'] == taxonomy.category_of(code).value
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])